@@ -0,0 +1,25 @@
+"""
+Reproducible performance benchmarks for MindWeaver.
+
+Suites:
+    ingest  End-to-end ingestion from a local synthetic feed server
+    micro   feedparser, parsing, dedup and filter micro-benchmarks
+    api     Endpoint latency on seeded 100k/1M-entry databases
+    sqlite  Insert and read throughput per SQLite performance profile
+
+Every suite is deterministic for a given configuration and seed. Results are
+written as JSON (see benchmarks.harness) so two commits can be compared:
+
+    python -m benchmarks run --output results/base.json
+    git checkout my-branch
+    python -m benchmarks run --output results/head.json
+    python -m benchmarks compare results/base.json results/head.json
+"""
+
+import sys
+from pathlib import Path
+
+# Make the package importable without installing it, like scripts/
+_SRC = str(Path(__file__).resolve().parent.parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
@@ -0,0 +1,213 @@
+"""
+Command line entry point of the benchmark suite.
+
+Usage:
+    python -m benchmarks run                      # all suites, default sizes
+    python -m benchmarks run --quick              # small corpus, 2k-entry API database
+    python -m benchmarks run --suite ingest --feeds 200 --cjk-ratio 0.8 --etag-mode none
+    python -m benchmarks run --suite sqlite       # insert/read throughput per SQLite profile
+    python -m benchmarks compare base.json head.json --fail-on-regression
+    python -m benchmarks serve --port 8765        # synthetic feeds for manual testing
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import benchmarks  # noqa: F401  (puts src/ on sys.path)
+from benchmarks.corpus import ETAG_MODES, CorpusConfig
+from benchmarks.harness import (
+    REPO_ROOT,
+    compare,
+    environment,
+    format_comparison,
+    format_results,
+    load_results,
+    write_results,
+)
+
+SUITES = ("ingest", "micro", "api", "sqlite")
+DEFAULT_CACHE_DIR = REPO_ROOT / "benchmarks" / ".cache"
+
+QUICK = {
+    "feeds": 10,
+    "entries_per_feed": 20,
+    "api_sizes": [2000],
+    "api_requests": 10,
+    "dedup_rows": 2000,
+    "sqlite_rows": 2000,
+    "repeat": 2,
+}
+
+
+def _add_corpus_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = CorpusConfig()
+    group = parser.add_argument_group("corpus")
+    group.add_argument("--feeds", type=int, default=defaults.feeds)
+    group.add_argument("--entries-per-feed", type=int, default=defaults.entries_per_feed)
+    group.add_argument("--content-bytes", type=int, default=defaults.content_bytes)
+    group.add_argument(
+        "--cjk-ratio", type=float, default=defaults.cjk_ratio, help="Share of Chinese entries"
+    )
+    group.add_argument(
+        "--atom-ratio", type=float, default=defaults.atom_ratio, help="Share of Atom feeds"
+    )
+    group.add_argument("--etag-mode", choices=ETAG_MODES, default=defaults.etag_mode)
+    group.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def _corpus_config(args: argparse.Namespace) -> CorpusConfig:
+    return CorpusConfig(
+        feeds=args.feeds,
+        entries_per_feed=args.entries_per_feed,
+        content_bytes=args.content_bytes,
+        cjk_ratio=args.cjk_ratio,
+        atom_ratio=args.atom_ratio,
+        etag_mode=args.etag_mode,
+        seed=args.seed,
+    )
+
+
+def run_command(args: argparse.Namespace) -> int:
+    """Run the selected suites and write a result file."""
+    from spider_aggregation.logger import setup_logger
+
+    setup_logger(level="WARNING")
+    if args.quick:
+        for key, value in QUICK.items():
+            setattr(args, key, value)
+    config = _corpus_config(args)
+
+    results = []
+    for suite in args.suite:
+        started = time.perf_counter()
+        print(f"Running {suite} ...", file=sys.stderr)
+        if suite == "ingest":
+            from benchmarks import ingest
+
+            results += ingest.run(config, new_entries=args.new_entries)
+        elif suite == "micro":
+            from benchmarks import micro
+
+            results += micro.run(
+                config,
+                dedup_rows=args.dedup_rows,
+                filter_rules=args.filter_rules,
+                repeat=args.repeat,
+            )
+        elif suite == "api":
+            from benchmarks import api
+
+            results += api.run(
+                config,
+                sizes=args.api_sizes,
+                requests=args.api_requests,
+                cache_dir=None if args.no_cache else args.cache_dir,
+            )
+        elif suite == "sqlite":
+            from benchmarks import sqlite_profiles
+
+            results += sqlite_profiles.run(
+                config,
+                rows=args.sqlite_rows,
+                txn_rows=args.sqlite_txn_rows,
+                repeat=args.repeat,
+            )
+        print(f"  {suite} finished in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+    output = args.output
+    if output is None:
+        commit = environment()["git_commit"] or "local"
+        output = REPO_ROOT / "benchmarks" / "results" / f"{commit[:12]}.json"
+    run_config = {
+        "suites": args.suite,
+        "corpus": config.to_dict(),
+        "new_entries": args.new_entries,
+        "dedup_rows": args.dedup_rows,
+        "filter_rules": args.filter_rules,
+        "repeat": args.repeat,
+        "api_sizes": args.api_sizes,
+        "api_requests": args.api_requests,
+        "sqlite_rows": args.sqlite_rows,
+        "sqlite_txn_rows": args.sqlite_txn_rows,
+    }
+    write_results(Path(output), run_config, results)
+
+    print(format_results(results))
+    print(f"\nResults written to {output}")
+    return 0
+
+
+def compare_command(args: argparse.Namespace) -> int:
+    """Compare two result files."""
+    base, head = load_results(args.base), load_results(args.head)
+    if base["config"] != head["config"]:
+        print("warning: the runs used different configurations", file=sys.stderr)
+
+    comparisons = compare(base, head)
+    print(f"base: {base['environment']['git_commit']}  head: {head['environment']['git_commit']}")
+    print(format_comparison(comparisons, args.threshold))
+
+    regressions = [item for item in comparisons if item.regressed(args.threshold)]
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+def serve_command(args: argparse.Namespace) -> int:
+    """Serve a synthetic corpus until interrupted."""
+    from benchmarks.feed_server import SyntheticFeedServer
+
+    with SyntheticFeedServer(_corpus_config(args), host=args.host, port=args.port) as server:
+        for url in server.feed_urls():
+            print(url)
+        print(f"Serving {args.feeds} feeds on {server.base_url} (Ctrl+C to stop)", file=sys.stderr)
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run benchmark suites")
+    run.add_argument("--suite", nargs="+", choices=SUITES, default=list(SUITES))
+    run.add_argument("--quick", action="store_true", help="Small sizes for a fast smoke run")
+    run.add_argument("--output", type=Path, help="Result file (default: results/<commit>.json)")
+    _add_corpus_arguments(run)
+    run.add_argument("--new-entries", type=int, default=5, help="Per feed, incremental pass")
+    run.add_argument("--dedup-rows", type=int, default=10000)
+    run.add_argument("--filter-rules", type=int, default=20)
+    run.add_argument("--repeat", type=int, default=3, help="Timing rounds per micro-benchmark")
+    run.add_argument("--api-sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    run.add_argument("--api-requests", type=int, default=30, help="Timed requests per endpoint")
+    run.add_argument("--sqlite-rows", type=int, default=20000, help="Inserts per SQLite profile")
+    run.add_argument("--sqlite-txn-rows", type=int, default=20, help="Inserts per transaction")
+    run.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR)
+    run.add_argument("--no-cache", action="store_true", help="Reseed API databases every run")
+    run.set_defaults(handler=run_command)
+
+    cmp = commands.add_parser("compare", help="Compare two result files")
+    cmp.add_argument("base", type=Path)
+    cmp.add_argument("head", type=Path)
+    cmp.add_argument("--threshold", type=float, default=0.10, help="Relative change to flag")
+    cmp.add_argument("--fail-on-regression", action="store_true")
+    cmp.set_defaults(handler=compare_command)
+
+    serve = commands.add_parser("serve", help="Serve a synthetic corpus over HTTP")
+    _add_corpus_arguments(serve)
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.set_defaults(handler=serve_command)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
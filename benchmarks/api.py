@@ -0,0 +1,115 @@
+"""
+API latency on seeded databases.
+
+For every requested size a database is seeded with that many entries (see
+benchmarks.seed) and common read endpoints are requested through the Flask
+test client, so the numbers cover routing, queries and serialization but no
+network. Seeded databases can be kept in a cache directory because seeding
+1M entries takes minutes.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from benchmarks.corpus import CorpusConfig
+from benchmarks.harness import BenchmarkResult, latency_summary
+from benchmarks.seed import cached_database
+
+# Entries per feed in seeded API databases
+ENTRIES_PER_FEED = 500
+
+
+def endpoints(entries: int) -> dict[str, str]:
+    """Benchmarked endpoints by name for a database of ``entries`` entries."""
+    deep_page = max(entries // 20 // 2, 1)
+    return {
+        "entries.first_page": "/api/entries?page=1&page_size=20",
+        "entries.deep_page": f"/api/entries?page={deep_page}&page_size=20",
+        "entries.by_feed": "/api/entries?feed_id=1&page_size=20",
+        "entries.search": "/api/entries?q=latency&page_size=20",
+        "entries.by_category": "/api/entries/by-category/1?page_size=20",
+        "stats": "/api/stats",
+        "dashboard.activity": "/api/dashboard/activity?limit=20",
+        "dashboard.feed_health": "/api/dashboard/feed-health",
+        "feeds.list": "/api/feeds",
+        "page.index": "/",
+    }
+
+
+def run(
+    config: CorpusConfig,
+    sizes: list[int],
+    requests: int = 30,
+    warmup: int = 3,
+    cache_dir: Optional[Path] = None,
+) -> list[BenchmarkResult]:
+    """Measure endpoint latencies for each database size.
+
+    Args:
+        config: Corpus shape (content size, language mix, seed); the feed
+            count is derived from the size
+        sizes: Entry counts of the seeded databases
+        requests: Timed requests per endpoint
+        warmup: Untimed requests per endpoint
+        cache_dir: Directory to keep seeded databases in between runs
+
+    Returns:
+        One BenchmarkResult per endpoint and size
+    """
+    from spider_aggregation.web.app import create_app
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            size_config = CorpusConfig(
+                feeds=max(size // ENTRIES_PER_FEED, 1),
+                entries_per_feed=config.entries_per_feed,
+                content_bytes=config.content_bytes,
+                cjk_ratio=config.cjk_ratio,
+                seed=config.seed,
+            )
+            started = time.perf_counter()
+            db_path, reused = cached_database(cache_dir, size_config, size, Path(tmp))
+            seed_seconds = time.perf_counter() - started
+
+            client = create_app(db_path=str(db_path)).test_client()
+            for name, url in endpoints(size).items():
+                for _ in range(warmup):
+                    _get(client, url)
+                samples = []
+                for _ in range(requests):
+                    started = time.perf_counter()
+                    _get(client, url)
+                    samples.append(time.perf_counter() - started)
+                results.append(
+                    BenchmarkResult(
+                        name=f"api.{_size_label(size)}.{name}",
+                        metrics=latency_summary(samples),
+                        info={
+                            "url": url,
+                            "entries": size,
+                            "requests": requests,
+                            "seed_s": round(seed_seconds, 2),
+                            "seed_reused": reused,
+                        },
+                    )
+                )
+    return results
+
+
+def _get(client, url: str) -> None:
+    """Request ``url`` and fail loudly on errors (a fast 500 is not a result)."""
+    response = client.get(url)
+    if response.status_code != 200:
+        raise RuntimeError(f"GET {url} returned {response.status_code}")
+
+
+def _size_label(size: int) -> str:
+    """Compact size label (100000 -> "100k", 1000000 -> "1m")."""
+    if size >= 1_000_000 and size % 1_000_000 == 0:
+        return f"{size // 1_000_000}m"
+    if size >= 1000 and size % 1000 == 0:
+        return f"{size // 1000}k"
+    return str(size)
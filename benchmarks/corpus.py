@@ -0,0 +1,242 @@
+"""
+Deterministic synthetic RSS/Atom corpora.
+
+Every entry is derived from ``(seed, feed, index)`` alone, so the same
+configuration produces byte-identical feeds on every run and machine, which
+keeps results comparable between commits.
+"""
+
+import random
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from html import escape
+from typing import Optional
+
+ETAG_MODES = ("conditional", "unconditional", "none")
+
+# Publication time of entry 0; later entries are spaced INTERVAL apart
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+INTERVAL = timedelta(minutes=17)
+
+ENGLISH_WORDS = (
+    "data system model network cloud python release security update research market "
+    "policy energy climate design language learning service platform storage query "
+    "index cache latency throughput kernel compiler browser mobile server client "
+    "protocol privacy startup funding open source community benchmark performance "
+    "memory thread process vector search ranking feature analysis report study team "
+    "product launch hardware chip battery robot vehicle health science space orbit "
+    "mission survey economy trade growth budget review guide tutorial interview"
+).split()
+
+# Frequent Chinese characters, paired into pseudo-words
+CJK_CHARACTERS = (
+    "的一是在不了有和人这中大为上个国我以要他时来用们生到作地于出就分对成会可主发年动"
+    "同工也能下过子说产种面而方后多定行学法所民得经十三之进着等部度家电力里如水化高自二"
+    "理起小物现实加量都两体制机当使点从业本去把性好应开它合还因由其些然前外天政四日那社义"
+    "事平形相全表间样与关各重新线内数正心反你明看原又么利比或但质气第向道命此变条只没结解"
+    "问意建月公无系军很情者最立代想已通并提直题党程展五果料象员革位入常文总次品式活设及管"
+    "特件长求老头基资边流路级少图山统接知较将组见计别她手角期根论运农指几九区强放决西被干"
+    "做必战先回则任取据处队南给色光门即保治北造百规热领七海口东导器压志世金增争济阶油思术"
+    "极交受联什认六共权收证改清美再采转更单风切打白教速花带安场身车例真务具万每目至达走积"
+    "示议声报斗完类八离华名确才科张信马节话米整空元况今集温传土许步群广石记需段研界拉林律"
+)
+
+
+@dataclass
+class CorpusConfig:
+    """Shape of a synthetic corpus."""
+
+    feeds: int = 50
+    entries_per_feed: int = 50
+    content_bytes: int = 2000
+    cjk_ratio: float = 0.3
+    atom_ratio: float = 0.5
+    etag_mode: str = "conditional"
+    seed: int = 42
+
+    def __post_init__(self):
+        """Validate the configuration."""
+        if self.etag_mode not in ETAG_MODES:
+            raise ValueError(f"etag_mode must be one of {ETAG_MODES}")
+        if not 0.0 <= self.cjk_ratio <= 1.0 or not 0.0 <= self.atom_ratio <= 1.0:
+            raise ValueError("cjk_ratio and atom_ratio must be between 0 and 1")
+
+    def to_dict(self) -> dict:
+        """Serialize the configuration for result files."""
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class SyntheticEntry:
+    """One generated feed entry."""
+
+    title: str
+    link: str
+    summary: str
+    content: str
+    published: datetime
+    language: str
+
+
+@dataclass(frozen=True)
+class FeedDocument:
+    """A rendered feed and its validators."""
+
+    body: bytes
+    content_type: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class SyntheticCorpus:
+    """Generates entries and renders feed documents.
+
+    Each feed shows its ``entries_per_feed`` newest entries. ``publish``
+    appends new entries to a feed, which changes its document and validators
+    the way a real feed update would.
+    """
+
+    def __init__(self, config: CorpusConfig, base_url: str = "https://bench.example.com"):
+        """Initialize the corpus.
+
+        Args:
+            config: Corpus shape
+            base_url: Origin used in entry links (independent of the serving
+                address, so documents do not change with the port)
+        """
+        self.config = config
+        self.base_url = base_url.rstrip("/")
+        self._published = [config.entries_per_feed] * config.feeds
+
+    def is_atom(self, feed: int) -> bool:
+        """Whether the feed is rendered as Atom (otherwise RSS 2.0)."""
+        return random.Random(f"{self.config.seed}:format:{feed}").random() < self.config.atom_ratio
+
+    def feed_path(self, feed: int) -> str:
+        """URL path of a feed."""
+        return f"/feeds/{feed}.{'atom' if self.is_atom(feed) else 'rss'}"
+
+    def entry(self, feed: int, index: int) -> SyntheticEntry:
+        """Generate one entry deterministically.
+
+        Args:
+            feed: Feed number
+            index: Entry number within the feed (0 is the oldest)
+
+        Returns:
+            SyntheticEntry
+        """
+        rng = random.Random(f"{self.config.seed}:{feed}:{index}")
+        cjk = rng.random() < self.config.cjk_ratio
+        words = self._cjk_words if cjk else self._english_words
+
+        title = words(rng, rng.randint(5, 10))
+        if not cjk:
+            title = title.capitalize()
+        summary = words(rng, 30)
+        paragraphs = []
+        size = 0
+        while size < self.config.content_bytes:
+            paragraph = words(rng, 60)
+            paragraphs.append(f"<p>{paragraph}</p>")
+            size += len(paragraph.encode("utf-8")) + 7
+
+        return SyntheticEntry(
+            title=f"{title} #{feed}-{index}",
+            link=f"{self.base_url}/posts/{feed}/{index}",
+            summary=summary,
+            content="".join(paragraphs),
+            published=EPOCH + INTERVAL * index,
+            language="zh" if cjk else "en",
+        )
+
+    def entries(self, feed: int) -> list[SyntheticEntry]:
+        """Entries currently in a feed, newest first."""
+        end = self._published[feed]
+        start = max(end - self.config.entries_per_feed, 0)
+        return [self.entry(feed, index) for index in range(end - 1, start - 1, -1)]
+
+    def publish(self, feed: int, count: int = 1) -> None:
+        """Add ``count`` new entries to a feed."""
+        self._published[feed] += count
+
+    def render(self, feed: int) -> FeedDocument:
+        """Render a feed document.
+
+        Args:
+            feed: Feed number
+
+        Returns:
+            FeedDocument with ETag/Last-Modified unless etag_mode is "none"
+        """
+        entries = self.entries(feed)
+        updated = entries[0].published if entries else EPOCH
+        if self.is_atom(feed):
+            body = self._render_atom(feed, entries, updated)
+            content_type = "application/atom+xml; charset=utf-8"
+        else:
+            body = self._render_rss(feed, entries, updated)
+            content_type = "application/rss+xml; charset=utf-8"
+
+        etag = last_modified = None
+        if self.config.etag_mode != "none":
+            etag = f'"{self.config.seed}-{feed}-{self._published[feed]}"'
+            last_modified = format_datetime(updated, usegmt=True)
+        return FeedDocument(body.encode("utf-8"), content_type, etag, last_modified)
+
+    def _render_rss(self, feed: int, entries: list[SyntheticEntry], updated: datetime) -> str:
+        items = "".join(
+            "<item>"
+            f"<title>{escape(e.title)}</title>"
+            f"<link>{e.link}</link>"
+            f'<guid isPermaLink="true">{e.link}</guid>'
+            f"<pubDate>{format_datetime(e.published, usegmt=True)}</pubDate>"
+            f"<description>{escape(e.summary)}</description>"
+            f"<content:encoded><![CDATA[{e.content}]]></content:encoded>"
+            "</item>"
+            for e in entries
+        )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+            f"<channel><title>Synthetic feed {feed}</title>"
+            f"<link>{self.base_url}/posts/{feed}</link>"
+            f"<description>Benchmark corpus feed {feed}</description>"
+            f"<lastBuildDate>{format_datetime(updated, usegmt=True)}</lastBuildDate>"
+            f"{items}</channel></rss>"
+        )
+
+    def _render_atom(self, feed: int, entries: list[SyntheticEntry], updated: datetime) -> str:
+        items = "".join(
+            "<entry>"
+            f"<title>{escape(e.title)}</title>"
+            f'<link href="{e.link}"/>'
+            f"<id>{e.link}</id>"
+            f"<updated>{e.published.isoformat()}</updated>"
+            f"<summary>{escape(e.summary)}</summary>"
+            f'<content type="html">{escape(e.content)}</content>'
+            "</entry>"
+            for e in entries
+        )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<feed xmlns="http://www.w3.org/2005/Atom">'
+            f"<title>Synthetic feed {feed}</title>"
+            f'<link href="{self.base_url}/posts/{feed}"/>'
+            f"<id>{self.base_url}/feeds/{feed}</id>"
+            f"<updated>{updated.isoformat()}</updated>"
+            f"{items}</feed>"
+        )
+
+    @staticmethod
+    def _english_words(rng: random.Random, count: int) -> str:
+        return " ".join(rng.choice(ENGLISH_WORDS) for _ in range(count))
+
+    @staticmethod
+    def _cjk_words(rng: random.Random, count: int) -> str:
+        words = ("".join(rng.choices(CJK_CHARACTERS, k=2)) for _ in range(count))
+        text = ""
+        for n, word in enumerate(words, 1):
+            text += word + ("，" if n % 8 == 0 else "")
+        return text + "。"
@@ -0,0 +1,144 @@
+"""
+Local HTTP server for synthetic feeds.
+
+Serves ``SyntheticCorpus`` documents at ``/feeds/<n>.rss`` and
+``/feeds/<n>.atom`` from a background thread. Depending on the corpus'
+``etag_mode`` it sends ETag/Last-Modified validators and answers conditional
+requests with 304 ("conditional"), sends validators but always answers 200
+("unconditional"), or sends no validators at all ("none").
+"""
+
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from benchmarks.corpus import CorpusConfig, FeedDocument, SyntheticCorpus
+
+_FEED_PATH = re.compile(r"^/feeds/(\d+)\.(?:rss|atom)$")
+
+
+class SyntheticFeedServer:
+    """Threaded HTTP server for a synthetic corpus.
+
+    Example:
+        >>> with SyntheticFeedServer(CorpusConfig(feeds=10)) as server:
+        ...     urls = server.feed_urls()
+    """
+
+    def __init__(self, config: CorpusConfig, host: str = "127.0.0.1", port: int = 0):
+        """Initialize the server.
+
+        Args:
+            config: Corpus shape
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+        """
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self.host, self.port = self._httpd.server_address[:2]
+        self.corpus = SyntheticCorpus(config)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._documents: dict[int, FeedDocument] = {}
+        self.requests = 0
+        self.not_modified = 0
+
+    @property
+    def base_url(self) -> str:
+        """Origin of the server."""
+        return f"http://{self.host}:{self.port}"
+
+    def feed_url(self, feed: int) -> str:
+        """Absolute URL of a feed."""
+        return self.base_url + self.corpus.feed_path(feed)
+
+    def feed_urls(self) -> list[str]:
+        """URLs of all feeds in the corpus."""
+        return [self.feed_url(feed) for feed in range(self.corpus.config.feeds)]
+
+    def publish(self, feed: int, count: int = 1) -> None:
+        """Add new entries to a feed (changing its validators)."""
+        with self._lock:
+            self.corpus.publish(feed, count)
+            self._documents.pop(feed, None)
+
+    def document(self, feed: int) -> FeedDocument:
+        """Get the rendered document of a feed (rendered once per revision)."""
+        with self._lock:
+            document = self._documents.get(feed)
+            if document is None:
+                document = self._documents[feed] = self.corpus.render(feed)
+            return document
+
+    def start(self) -> "SyntheticFeedServer":
+        """Serve requests from a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="synthetic-feed-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "SyntheticFeedServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+def _make_handler(server: SyntheticFeedServer) -> type:
+    """Build a request handler bound to ``server``."""
+
+    class FeedHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            match = _FEED_PATH.match(self.path)
+            if not match or int(match.group(1)) >= server.corpus.config.feeds:
+                self.send_error(404)
+                return
+
+            document = server.document(int(match.group(1)))
+            with server._lock:
+                server.requests += 1
+
+            if server.corpus.config.etag_mode == "conditional" and self._not_modified(document):
+                with server._lock:
+                    server.not_modified += 1
+                self.send_response(304)
+                self._send_validators(document)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", document.content_type)
+            self.send_header("Content-Length", str(len(document.body)))
+            self._send_validators(document)
+            self.end_headers()
+            self.wfile.write(document.body)
+
+        def _not_modified(self, document: FeedDocument) -> bool:
+            if_none_match = self.headers.get("If-None-Match")
+            if if_none_match is not None:
+                return if_none_match == document.etag
+            return self.headers.get("If-Modified-Since") == document.last_modified
+
+        def _send_validators(self, document: FeedDocument) -> None:
+            if document.etag:
+                self.send_header("ETag", document.etag)
+            if document.last_modified:
+                self.send_header("Last-Modified", document.last_modified)
+
+        def log_message(self, format, *args):
+            """Silence per-request logging."""
+
+    return FeedHandler
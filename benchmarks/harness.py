@@ -0,0 +1,232 @@
+"""
+Timing helpers, result files and comparison between runs.
+
+A result file is JSON::
+
+    {
+      "schema": 1,
+      "environment": {"git_commit": ..., "python": ..., ...},
+      "config": {...},
+      "results": [{"name": "ingest.cold", "metrics": {...}, "info": {...}}, ...]
+    }
+
+Metric names carry their unit and direction: ``*_per_s`` values are
+throughputs (higher is better), everything else (``*_s``, ``*_ms``,
+``*_us``) is a duration (lower is better). ``info`` holds counts and other
+context that is not compared.
+"""
+
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+SCHEMA_VERSION = 1
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one benchmark."""
+
+    name: str
+    metrics: dict[str, float]
+    info: dict = field(default_factory=dict)
+
+
+def measure(func: Callable[[], object], number: int, repeat: int = 3) -> dict[str, float]:
+    """Time ``func`` like ``timeit``: ``repeat`` rounds of ``number`` calls.
+
+    The best round is reported, which is the least noisy estimate of the
+    code's cost on an otherwise idle machine.
+
+    Args:
+        func: Callable to time
+        number: Calls per round
+        repeat: Number of rounds
+
+    Returns:
+        Dictionary with ops_per_s and best/mean microseconds per call
+    """
+    rounds = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        rounds.append((time.perf_counter() - started) / number)
+    best = min(rounds)
+    return {
+        "ops_per_s": round(1.0 / best, 2) if best else float("inf"),
+        "best_us": round(best * 1e6, 3),
+        "mean_us": round(statistics.fmean(rounds) * 1e6, 3),
+    }
+
+
+def latency_summary(samples: Sequence[float]) -> dict[str, float]:
+    """Summarize request latencies given in seconds.
+
+    Args:
+        samples: Latencies in seconds
+
+    Returns:
+        Dictionary with p50/p95/p99/max milliseconds
+    """
+    ordered = sorted(samples)
+
+    def percentile(p: float) -> float:
+        index = min(int(round(p * (len(ordered) - 1))), len(ordered) - 1)
+        return round(ordered[index] * 1000, 3)
+
+    return {
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def environment() -> dict:
+    """Describe the code and machine the benchmarks ran on."""
+
+    def git(*args: str) -> Optional[str]:
+        try:
+            return subprocess.run(
+                ["git", *args], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    status = git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": git("rev-parse", "HEAD"),
+        "git_subject": git("log", "-1", "--format=%s"),
+        "git_dirty": bool(status) if status is not None else None,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "sqlite": sqlite3.sqlite_version,
+    }
+
+
+def write_results(path: Path, config: dict, results: list[BenchmarkResult]) -> dict:
+    """Write a result file.
+
+    Args:
+        path: Output file
+        config: Benchmark configuration
+        results: Measurements
+
+    Returns:
+        The written document
+    """
+    document = {
+        "schema": SCHEMA_VERSION,
+        "environment": environment(),
+        "config": config,
+        "results": [asdict(result) for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return document
+
+
+def load_results(path: Path) -> dict:
+    """Read a result file.
+
+    Raises:
+        ValueError: If the file uses an unsupported schema
+    """
+    document = json.loads(Path(path).read_text(encoding="utf-8"))
+    if document.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"{path}: unsupported result schema {document.get('schema')}")
+    return document
+
+
+def higher_is_better(metric: str) -> bool:
+    """Whether larger values of ``metric`` are improvements."""
+    return metric.endswith("_per_s")
+
+
+@dataclass
+class Comparison:
+    """Change of one metric between two runs."""
+
+    benchmark: str
+    metric: str
+    base: float
+    head: float
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change from base to head (None when base is 0)."""
+        if not self.base:
+            return None
+        return (self.head - self.base) / self.base
+
+    def regressed(self, threshold: float) -> bool:
+        """Whether head is worse than base by more than ``threshold``."""
+        change = self.change
+        if change is None:
+            return False
+        return -change > threshold if higher_is_better(self.metric) else change > threshold
+
+
+def compare(base: dict, head: dict) -> list[Comparison]:
+    """Pair up the metrics present in both result documents.
+
+    Args:
+        base: Baseline result document
+        head: Result document to compare against the baseline
+
+    Returns:
+        List of Comparison in head's order
+    """
+    base_metrics = {result["name"]: result["metrics"] for result in base["results"]}
+    comparisons = []
+    for result in head["results"]:
+        previous = base_metrics.get(result["name"])
+        if previous is None:
+            continue
+        for metric, value in result["metrics"].items():
+            if metric in previous:
+                comparisons.append(Comparison(result["name"], metric, previous[metric], value))
+    return comparisons
+
+
+def format_comparison(comparisons: list[Comparison], threshold: float) -> str:
+    """Render comparisons as a text table, flagging regressions and improvements."""
+    lines = [f"{'benchmark':<32} {'metric':<16} {'base':>12} {'head':>12} {'change':>9}"]
+    for item in comparisons:
+        change = item.change
+        if change is None:
+            marker, text = "", "n/a"
+        else:
+            text = f"{change:+.1%}"
+            gain = change if higher_is_better(item.metric) else -change
+            improved = gain > threshold
+            marker = "  REGRESSION" if item.regressed(threshold) else ("  faster" if improved else "")
+        lines.append(
+            f"{item.benchmark:<32} {item.metric:<16} {item.base:>12.4g} {item.head:>12.4g}"
+            f" {text:>9}{marker}"
+        )
+    return "\n".join(lines)
+
+
+def format_results(results: list[BenchmarkResult]) -> str:
+    """Render results as a text table."""
+    lines = []
+    for result in results:
+        metrics = "  ".join(f"{key}={value:.4g}" for key, value in result.metrics.items())
+        lines.append(f"{result.name:<32} {metrics}")
+    return "\n".join(lines)
@@ -0,0 +1,100 @@
+"""
+End-to-end ingestion benchmark.
+
+Serves a synthetic corpus over local HTTP and runs every feed through
+``IngestionPipeline`` (fetch, feedparser, parse, dedup, filter, store) into a
+fresh SQLite database, in three passes:
+
+- ``ingest.cold``: first fetch, every entry is new
+- ``ingest.unchanged``: refetch without changes (304s in "conditional" mode,
+  otherwise full downloads where every entry is a duplicate)
+- ``ingest.incremental``: refetch after ``new_entries`` were published to
+  every feed
+
+Per-stage totals come from the pipeline traces (see spider_aggregation.tracing).
+Stages of different feeds overlap, so with more than one fetch worker the
+stage totals can add up to more than the wall time.
+"""
+
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from benchmarks.corpus import CorpusConfig
+from benchmarks.feed_server import SyntheticFeedServer
+from benchmarks.harness import BenchmarkResult
+from spider_aggregation.application.ingestion import IngestionPipeline
+from spider_aggregation.models import FeedCreate, FeedModel
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+
+
+def run(config: CorpusConfig, new_entries: int = 5) -> list[BenchmarkResult]:
+    """Run the ingestion passes.
+
+    Args:
+        config: Corpus shape
+        new_entries: Entries published to each feed before the incremental pass
+
+    Returns:
+        One BenchmarkResult per pass
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp, SyntheticFeedServer(config) as server:
+        db_manager = DatabaseManager(str(Path(tmp) / "ingest.db"))
+        db_manager.init_db()
+        with db_manager.session() as session:
+            repo = FeedRepository(session)
+            for url in server.feed_urls():
+                repo.create(FeedCreate(url=url, max_entries_per_fetch=0))
+
+        results.append(_ingest_pass("ingest.cold", db_manager, server))
+        results.append(_ingest_pass("ingest.unchanged", db_manager, server))
+        for feed in range(config.feeds):
+            server.publish(feed, new_entries)
+        results.append(_ingest_pass("ingest.incremental", db_manager, server))
+        db_manager.close()
+    return results
+
+
+def _ingest_pass(
+    name: str, db_manager: DatabaseManager, server: SyntheticFeedServer
+) -> BenchmarkResult:
+    """Ingest every feed once in a single pipeline run, like a manual fetch-all."""
+    feeds = server.corpus.config.feeds
+    requests, not_modified = server.requests, server.not_modified
+    stages: dict[str, float] = defaultdict(float)
+    entries_seen = entries_created = failures = 0
+
+    started = time.perf_counter()
+    with db_manager.session() as session:
+        feeds_to_ingest = session.query(FeedModel).order_by(FeedModel.id).all()
+        for result in IngestionPipeline(session).run(feeds_to_ingest):
+            if not result.success:
+                failures += 1
+            entries_created += result.entries_created
+            for stage, stats in (result.timings or {}).get("stages", {}).items():
+                stages[stage] += stats["seconds"]
+                if stage == "parse":
+                    entries_seen += stats["count"]
+    seconds = time.perf_counter() - started
+
+    metrics = {
+        "wall_s": round(seconds, 4),
+        "feeds_per_s": round(feeds / seconds, 2),
+        "entries_per_s": round(entries_seen / seconds, 2),
+    }
+    metrics.update({f"{stage}_s": round(total, 4) for stage, total in stages.items()})
+    return BenchmarkResult(
+        name=name,
+        metrics=metrics,
+        info={
+            "feeds": feeds,
+            "entries_seen": entries_seen,
+            "entries_created": entries_created,
+            "failures": failures,
+            "http_requests": server.requests - requests,
+            "http_not_modified": server.not_modified - not_modified,
+        },
+    )
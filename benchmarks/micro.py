@@ -0,0 +1,237 @@
+"""
+Micro-benchmarks of the per-entry ingestion stages.
+
+- ``feedparser.rss`` / ``feedparser.atom``: parsing one feed document
+- ``parse.en`` / ``parse.zh``: ``ParserService.parse_entry`` per language
+- ``dedup.<strategy>``: ``DeduplicatorService.check_duplicate`` against a
+  seeded database, half hits and half misses
+- ``filter.engine``: evaluating the rule set against one entry
+- ``filter.service``: ``FilterService.apply`` as called by the pipeline
+  (rules are reloaded from the database on every call)
+- ``summarize.<method>.<language>``: summarizing one 100 KB article with the
+  heuristic extractive scorer and with TextRank (when NumPy is installed);
+  sentence splitting is cached by the shared text analysis, so this times
+  the sentence ranking
+"""
+
+import itertools
+import re
+import tempfile
+from pathlib import Path
+
+import feedparser
+
+from benchmarks.corpus import CorpusConfig, SyntheticCorpus
+from benchmarks.harness import BenchmarkResult, measure
+from benchmarks.seed import seed_database
+from spider_aggregation.core.deduplicator import DedupStrategy
+from spider_aggregation.core.filter_engine import FilterEngine
+from spider_aggregation.core.services import DeduplicatorService, FilterService, ParserService
+from spider_aggregation.core.services.filter_service import EntryData
+from spider_aggregation.core.summarizer import TEXTRANK_AVAILABLE, ExtractiveSummarizer
+from spider_aggregation.models.filter_rule import FilterRuleModel
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.repositories.filter_rule_repo import FilterRuleRepository
+
+# Feeds rendered for the parsing benchmarks
+SAMPLE_FEEDS = 8
+
+# Size of the articles summarized by the summarizer benchmarks
+ARTICLE_BYTES = 100_000
+# English corpus paragraphs have no punctuation: end a sentence every N words
+SENTENCE_WORDS = 15
+
+
+def run(
+    config: CorpusConfig, dedup_rows: int = 10000, filter_rules: int = 20, repeat: int = 3
+) -> list[BenchmarkResult]:
+    """Run the micro-benchmarks.
+
+    Args:
+        config: Corpus shape (content size, language mix, seed)
+        dedup_rows: Entries in the database the dedup checks run against
+        filter_rules: Number of filter rules
+        repeat: Timing rounds per benchmark
+
+    Returns:
+        List of BenchmarkResult
+    """
+    corpus = SyntheticCorpus(config)
+    feeds = range(min(config.feeds, SAMPLE_FEEDS))
+    documents = {feed: corpus.render(feed).body for feed in feeds}
+    results = []
+
+    for kind in ("rss", "atom"):
+        bodies = [
+            body for feed, body in documents.items() if corpus.is_atom(feed) == (kind == "atom")
+        ]
+        if bodies:
+            cycle = itertools.cycle(bodies)
+            results.append(
+                BenchmarkResult(
+                    name=f"feedparser.{kind}",
+                    metrics=measure(lambda: feedparser.parse(next(cycle)), len(bodies), repeat),
+                    info={"entries_per_document": config.entries_per_feed},
+                )
+            )
+
+    raw_entries = [e for body in documents.values() for e in feedparser.parse(body).entries]
+    parser = ParserService()
+    parsed_entries = [parser.parse_entry(entry, feed_id=1) for entry in raw_entries]
+    for language in ("en", "zh"):
+        sample = [
+            raw
+            for raw, parsed in zip(raw_entries, parsed_entries)
+            if (parsed.get("language") or "").startswith(language)
+        ]
+        if sample:
+            cycle = itertools.cycle(sample)
+            results.append(
+                BenchmarkResult(
+                    name=f"parse.{language}",
+                    metrics=measure(
+                        lambda: parser.parse_entry(next(cycle), feed_id=1), len(sample), repeat
+                    ),
+                    info={"entries": len(sample)},
+                )
+            )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(str(Path(tmp) / "micro.db"))
+        seeded = seed_database(db_manager, config, dedup_rows)
+        with db_manager.session() as session:
+            results.extend(_dedup_benchmarks(session, corpus, seeded, repeat))
+            results.extend(_filter_benchmarks(session, parsed_entries, filter_rules, repeat))
+        db_manager.close()
+
+    results.extend(_summarize_benchmarks(corpus, repeat))
+    return results
+
+
+def _article(corpus: SyntheticCorpus, language: str) -> str:
+    """Concatenate the corpus entries of one language into a ~100 KB article."""
+    sentences = []
+    size = 0
+    for index in itertools.count():
+        if size >= ARTICLE_BYTES or index >= 10000:
+            break
+        entry = corpus.entry(0, index)
+        if entry.language != language:
+            continue
+        for paragraph in re.findall(r"<p>(.*?)</p>", entry.content):
+            if language == "en":
+                words = paragraph.split()
+                paragraph = " ".join(
+                    " ".join(words[i : i + SENTENCE_WORDS]).capitalize() + "."
+                    for i in range(0, len(words), SENTENCE_WORDS)
+                )
+            sentences.append(paragraph)
+            size += len(paragraph.encode("utf-8"))
+    return "\n".join(sentences)
+
+
+def _summarize_benchmarks(corpus: SyntheticCorpus, repeat: int) -> list:
+    """Time extractive summarization of long articles per method and language."""
+    summarizers = {"extractive": ExtractiveSummarizer()}
+    if TEXTRANK_AVAILABLE:
+        from spider_aggregation.core.textrank import TextRankSummarizer
+
+        summarizers["textrank"] = TextRankSummarizer()
+
+    results = []
+    for language in ("en", "zh"):
+        article = _article(corpus, language)
+        if not article:
+            continue
+        for method, summarizer in summarizers.items():
+            results.append(
+                BenchmarkResult(
+                    name=f"summarize.{method}.{language}",
+                    metrics=measure(lambda: summarizer.summarize(article), 5, repeat),
+                    info={"article_bytes": len(article.encode("utf-8"))},
+                )
+            )
+    return results
+
+
+def _dedup_benchmarks(session, corpus: SyntheticCorpus, seeded: dict, repeat: int) -> list:
+    """Time duplicate checks, alternating seeded (hit) and unseen (miss) entries."""
+    parser = ParserService()
+    per_feed = -(-seeded["entries"] // seeded["feeds"])
+    candidates = []
+    for n in range(200):
+        feed = n % seeded["feeds"]
+        # Even candidates were seeded, odd ones are newer than anything seeded
+        index = n % per_feed if n % 2 == 0 else per_feed + n
+        entry = corpus.entry(feed, index)
+        raw = {
+            "title": entry.title,
+            "link": entry.link,
+            "summary": entry.summary,
+            "content": [{"value": entry.content}],
+        }
+        candidates.append((parser.parse_entry(raw, feed_id=feed + 1), feed + 1))
+
+    results = []
+    for strategy in DedupStrategy:
+        service = DeduplicatorService(session=session, strategy=strategy.value)
+        cycle = itertools.cycle(candidates)
+
+        def check():
+            parsed, feed_id = next(cycle)
+            return service.check_duplicate(parsed, None, feed_id=feed_id)
+
+        hits = sum(check().is_duplicate for _ in candidates)
+        results.append(
+            BenchmarkResult(
+                name=f"dedup.{strategy.value}",
+                metrics=measure(check, len(candidates), repeat),
+                info={"database_entries": seeded["entries"], "hit_ratio": hits / len(candidates)},
+            )
+        )
+    return results
+
+
+def _filter_benchmarks(session, parsed_entries: list, rule_count: int, repeat: int) -> list:
+    """Time filter evaluation with a mix of keyword, regex and tag rules."""
+    kinds = [
+        ("keyword", "include", "python"),
+        ("keyword", "exclude", "advertisement"),
+        ("regex", "include", r"\b(cloud|kernel|compiler)\w*"),
+        ("regex", "exclude", r"(?i)sponsored|promo(tion)?"),
+        ("tag", "include", "tech"),
+    ]
+    for n in range(rule_count):
+        rule_type, match_type, pattern = kinds[n % len(kinds)]
+        session.add(
+            FilterRuleModel(
+                name=f"rule {n}",
+                enabled=True,
+                rule_type=rule_type,
+                match_type=match_type,
+                pattern=f"{pattern}{n}" if rule_type == "keyword" else pattern,
+                priority=n,
+            )
+        )
+    session.flush()
+
+    repo = FilterRuleRepository(session)
+    engine = FilterEngine(repo.list(enabled_only=True))
+    service = FilterService()
+    entries = itertools.cycle(parsed_entries)
+    number = min(len(parsed_entries), 200)
+    info = {"rules": rule_count}
+    return [
+        BenchmarkResult(
+            name="filter.engine",
+            metrics=measure(
+                lambda: engine.filter_entry(EntryData.from_dict(next(entries))), number, repeat
+            ),
+            info=info,
+        ),
+        BenchmarkResult(
+            name="filter.service",
+            metrics=measure(lambda: service.apply(next(entries), repo), number, repeat),
+            info=info,
+        ),
+    ]
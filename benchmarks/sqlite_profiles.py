@@ -0,0 +1,121 @@
+"""
+SQLite profile benchmarks.
+
+For every profile in ``SQLITE_PROFILES`` a fresh database is filled with
+synthetic entries and timed on:
+
+- ``insert_rows_per_s``: entry inserts committed ``txn_rows`` at a time, the
+  shape of per-feed ingestion commits (where ``synchronous`` matters most)
+- ``point_reads_per_s``: entries fetched by primary key
+- ``page_reads_per_s``: the newest 20 entries of one feed, like the entry list
+
+Results are named ``sqlite.<profile>``.
+"""
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import bindparam, insert, select
+
+from benchmarks.corpus import CorpusConfig, SyntheticCorpus
+from benchmarks.harness import BenchmarkResult, measure
+from benchmarks.seed import entry_row
+from spider_aggregation.config import DatabaseConfig
+from spider_aggregation.models import EntryModel, FeedModel
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.dialects.sqlite import SQLITE_PROFILES
+
+# Timed reads per round
+READS = 2000
+
+
+def run(
+    config: CorpusConfig, rows: int = 20000, txn_rows: int = 20, repeat: int = 3
+) -> list[BenchmarkResult]:
+    """Run the profile benchmarks.
+
+    Args:
+        config: Corpus shape (feed count, content size, language mix, seed)
+        rows: Entries inserted per profile
+        txn_rows: Entries per committed transaction
+        repeat: Timing rounds of the read benchmarks
+
+    Returns:
+        List of BenchmarkResult
+    """
+    corpus = SyntheticCorpus(config)
+    feeds = max(config.feeds, 1)
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix="mw-bench-sqlite-") as scratch:
+        for name in SQLITE_PROFILES:
+            db_config = DatabaseConfig(path=str(Path(scratch) / f"{name}.db"), sqlite_profile=name)
+            db_manager = DatabaseManager(db_config=db_config)
+            try:
+                metrics = _run_profile(db_manager, corpus, feeds, rows, txn_rows, repeat)
+            finally:
+                db_manager.close()
+            results.append(
+                BenchmarkResult(
+                    name=f"sqlite.{name}",
+                    metrics=metrics,
+                    info={"rows": rows, "txn_rows": txn_rows, "reads": READS},
+                )
+            )
+
+    return results
+
+
+def _run_profile(
+    db_manager: DatabaseManager,
+    corpus: SyntheticCorpus,
+    feeds: int,
+    rows: int,
+    txn_rows: int,
+    repeat: int,
+) -> dict[str, float]:
+    db_manager.init_db()
+    with db_manager.session() as session:
+        session.execute(
+            insert(FeedModel),
+            [{"url": f"{corpus.base_url}/feeds/{feed}", "enabled": True} for feed in range(feeds)],
+        )
+        feed_ids = [row[0] for row in session.query(FeedModel.id).order_by(FeedModel.id)]
+
+    now = corpus.entry(0, 0).published.replace(tzinfo=None)
+    pending = [
+        entry_row(corpus, n % feeds, feed_ids[n % feeds], n // feeds, now) for n in range(rows)
+    ]
+    started = time.perf_counter()
+    for offset in range(0, rows, txn_rows):
+        with db_manager.session() as session:
+            session.execute(insert(EntryModel), pending[offset : offset + txn_rows])
+    insert_seconds = time.perf_counter() - started
+
+    rng = random.Random(corpus.config.seed)
+    with db_manager.engine.connect() as conn:
+        entry_ids = conn.execute(select(EntryModel.id)).scalars().all()
+        point = select(EntryModel).where(EntryModel.id == bindparam("entry_id"))
+        page = (
+            select(EntryModel.id, EntryModel.title, EntryModel.published_at)
+            .where(EntryModel.feed_id == bindparam("feed_id"))
+            .order_by(EntryModel.published_at.desc())
+            .limit(20)
+        )
+
+        def read_point():
+            conn.execute(point, {"entry_id": rng.choice(entry_ids)}).all()
+
+        def read_page():
+            conn.execute(page, {"feed_id": rng.choice(feed_ids)}).all()
+
+        point_reads = measure(read_point, READS, repeat)
+        page_reads = measure(read_page, READS, repeat)
+
+    return {
+        "insert_rows_per_s": round(rows / insert_seconds, 2),
+        "point_reads_per_s": point_reads["ops_per_s"],
+        "page_reads_per_s": page_reads["ops_per_s"],
+    }
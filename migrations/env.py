@@ -6,6 +6,7 @@ This file is configured to work with MindWeaver's:
 - Multi-database dialect support (SQLite, PostgreSQL, MySQL)
 """
 
+import logging
 import os
 import sys
 from logging.config import fileConfig
@@ -101,7 +102,19 @@ def run_migrations_online() -> None:
     connectable = engine_from_config(configuration, prefix="sqlalchemy.", **engine_kwargs)
 
     # Set up dialect-specific events (e.g., SQLite PRAGMA)
-    dialect.setup_engine_events(connectable)
+    dialect.setup_engine_events(connectable, db_config)
+
+    sqlite = connectable.dialect.name == "sqlite"
+    if sqlite:
+
+        @event.listens_for(connectable, "connect")
+        def disable_foreign_keys(dbapi_conn, connection_record):
+            # Batch mode recreates tables on SQLite (copy, DROP, rename); with
+            # foreign keys on, the DROP would cascade-delete the rows of every
+            # table referencing the recreated one. The pragma is a no-op inside
+            # a transaction, so it is set on connect, after the dialect's
+            # listener turned foreign keys on.
+            dbapi_conn.execute("PRAGMA foreign_keys=OFF")
 
     with connectable.connect() as connection:
         context.configure(
@@ -116,6 +129,13 @@ def run_migrations_online() -> None:
         with context.begin_transaction():
             context.run_migrations()
 
+        if sqlite:
+            violations = connection.exec_driver_sql("PRAGMA foreign_key_check").all()
+            if violations:
+                logging.getLogger("alembic.env").warning(
+                    f"Foreign key violations after migration: {violations[:10]}"
+                )
+
 
 if context.is_offline_mode():
     run_migrations_offline()
@@ -0,0 +1,63 @@
+"""Add near-duplicate index tables
+
+This migration adds the side tables used by the near_duplicate
+deduplication strategy:
+- entry_signatures: MinHash signature per entry
+- entry_lsh_bands: LSH band keys per entry, indexed for bucket probes
+
+Entries stored before this migration are not indexed; they become
+visible to near-duplicate lookup once re-indexed.
+
+Migration ID: 004
+Created: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, Sequence[str], None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Apply schema changes to upgrade database."""
+    op.create_table(
+        'entry_signatures',
+        sa.Column('entry_id', sa.Integer(), nullable=False),
+        sa.Column('feed_id', sa.Integer(), nullable=False),
+        sa.Column('signature', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['entry_id'], ['entries.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('entry_id')
+    )
+    op.create_index('ix_entry_signatures_feed_id', 'entry_signatures', ['feed_id'], unique=False)
+
+    op.create_table(
+        'entry_lsh_bands',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('entry_id', sa.Integer(), nullable=False),
+        sa.Column('feed_id', sa.Integer(), nullable=False),
+        sa.Column('band', sa.Integer(), nullable=False),
+        sa.Column('bucket', sa.String(length=16), nullable=False),
+        sa.ForeignKeyConstraint(['entry_id'], ['entries.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_entry_lsh_bands_entry_id', 'entry_lsh_bands', ['entry_id'], unique=False)
+    op.create_index(
+        'ix_entry_lsh_bands_band_bucket', 'entry_lsh_bands', ['band', 'bucket'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Revert schema changes to downgrade database."""
+    op.drop_index('ix_entry_lsh_bands_band_bucket', table_name='entry_lsh_bands')
+    op.drop_index('ix_entry_lsh_bands_entry_id', table_name='entry_lsh_bands')
+    op.drop_table('entry_lsh_bands')
+    op.drop_index('ix_entry_signatures_feed_id', table_name='entry_signatures')
+    op.drop_table('entry_signatures')
@@ -0,0 +1,36 @@
+"""Add entries.cluster_id for story clustering
+
+- Add nullable column cluster_id referencing entries.id (ON DELETE SET NULL)
+- Create index on cluster_id
+
+Existing entries keep cluster_id NULL and are listed as standalone stories.
+
+Migration ID: 005
+Created: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "005"
+down_revision: Union[str, Sequence[str], None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("entries") as batch_op:
+        batch_op.add_column(sa.Column("cluster_id", sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            "fk_entries_cluster_id", "entries", ["cluster_id"], ["id"], ondelete="SET NULL"
+        )
+        batch_op.create_index("ix_entries_cluster_id", ["cluster_id"], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("entries") as batch_op:
+        batch_op.drop_index("ix_entries_cluster_id")
+        batch_op.drop_constraint("fk_entries_cluster_id", type_="foreignkey")
+        batch_op.drop_column("cluster_id")
@@ -0,0 +1,50 @@
+"""Add entry_stats rollup table
+
+- Create entry_stats (entry counts per feed, fetch day and language)
+- Backfill it from the existing entries in a single grouped INSERT ... SELECT
+
+Migration ID: 006
+Created: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "006"
+down_revision: Union[str, Sequence[str], None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "entry_stats",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("feed_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("language", sa.String(length=10), nullable=False),
+        sa.Column("entry_count", sa.Integer(), nullable=False),
+        sa.Column("latest_published_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["feed_id"], ["feeds.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "feed_id", "day", "language", name="uq_entry_stats_feed_day_language"
+        ),
+    )
+    op.create_index("ix_entry_stats_feed_id", "entry_stats", ["feed_id"], unique=False)
+    op.create_index("ix_entry_stats_day", "entry_stats", ["day"], unique=False)
+
+    op.execute(
+        "INSERT INTO entry_stats (feed_id, day, language, entry_count, latest_published_at) "
+        "SELECT feed_id, DATE(fetched_at), COALESCE(language, ''), COUNT(id), MAX(published_at) "
+        "FROM entries "
+        "GROUP BY feed_id, DATE(fetched_at), COALESCE(language, '')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_entry_stats_day", table_name="entry_stats")
+    op.drop_index("ix_entry_stats_feed_id", table_name="entry_stats")
+    op.drop_table("entry_stats")
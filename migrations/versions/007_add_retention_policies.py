@@ -0,0 +1,35 @@
+"""Add per-feed and per-category entry retention policies
+
+- Add nullable column retention_days to feeds
+- Add nullable column retention_days to categories
+
+NULL inherits the next policy (feed -> categories -> RETENTION_DEFAULT_DAYS),
+so existing feeds keep their entries until a policy is configured.
+
+Migration ID: 007
+Created: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "007"
+down_revision: Union[str, Sequence[str], None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("feeds") as batch_op:
+        batch_op.add_column(sa.Column("retention_days", sa.Integer(), nullable=True))
+    with op.batch_alter_table("categories") as batch_op:
+        batch_op.add_column(sa.Column("retention_days", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("categories") as batch_op:
+        batch_op.drop_column("retention_days")
+    with op.batch_alter_table("feeds") as batch_op:
+        batch_op.drop_column("retention_days")
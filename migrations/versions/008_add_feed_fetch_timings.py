@@ -0,0 +1,27 @@
+"""Store the per-stage timing breakdown of each feed's last fetch
+
+- Add nullable column last_fetch_timings (JSON text) to feeds
+
+Migration ID: 008
+Created: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "008"
+down_revision: Union[str, Sequence[str], None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("feeds") as batch_op:
+        batch_op.add_column(sa.Column("last_fetch_timings", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("feeds") as batch_op:
+        batch_op.drop_column("last_fetch_timings")
@@ -0,0 +1,44 @@
+"""Add fetch_jobs table for background fetch-all sweeps
+
+- Create fetch_jobs (status, progress counters and cancellation flag of
+  each sweep)
+
+Migration ID: 009
+Created: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "009"
+down_revision: Union[str, Sequence[str], None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fetch_jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("cancel_requested", sa.Boolean(), nullable=False),
+        sa.Column("feeds_total", sa.Integer(), nullable=False),
+        sa.Column("feeds_done", sa.Integer(), nullable=False),
+        sa.Column("feeds_failed", sa.Integer(), nullable=False),
+        sa.Column("entries_created", sa.Integer(), nullable=False),
+        sa.Column("failures", sa.Text(), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_fetch_jobs_status", "fetch_jobs", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fetch_jobs_status", table_name="fetch_jobs")
+    op.drop_table("fetch_jobs")
@@ -0,0 +1,46 @@
+"""Add corpus statistics tables for BM25 keyword scoring
+
+- Create corpus_stats (document and token totals per language)
+- Create term_stats (document frequency per language and term)
+
+The tables start empty and fill in as entries are ingested; keyword
+extraction falls back to per-document scoring until enough documents are
+counted.
+
+Migration ID: 010
+Created: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "010"
+down_revision: Union[str, Sequence[str], None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "corpus_stats",
+        sa.Column("language", sa.String(length=10), nullable=False),
+        sa.Column("document_count", sa.Integer(), nullable=False),
+        sa.Column("token_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("language"),
+    )
+    op.create_table(
+        "term_stats",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("language", sa.String(length=10), nullable=False),
+        sa.Column("term", sa.String(length=100), nullable=False),
+        sa.Column("document_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("language", "term", name="uq_term_stats_language_term"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("term_stats")
+    op.drop_table("corpus_stats")
@@ -0,0 +1,28 @@
+"""Add entries.text_analysis for the stored compact text analysis
+
+- Add the nullable entries.text_analysis column (JSON written when
+  ingestion.persist_text_analysis is enabled)
+
+Migration ID: 011
+Created: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "011"
+down_revision: Union[str, Sequence[str], None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("entries") as batch_op:
+        batch_op.add_column(sa.Column("text_analysis", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("entries") as batch_op:
+        batch_op.drop_column("text_analysis")
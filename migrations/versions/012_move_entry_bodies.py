@@ -0,0 +1,135 @@
+"""Move entries.content into the compressed entry_bodies table
+
+- Create entry_bodies (codec, uncompressed size and compressed data of the
+  content of each entry)
+- Backfill it from entries.content in keyset-paginated batches, compressing
+  with the configured database.body_codec, and log the size before and after
+- Drop entries.content
+
+SQLite only reuses the freed pages for new rows; run VACUUM (or
+``PRAGMA incremental_vacuum``) afterwards to shrink the file.
+
+Migration ID: 012
+Created: 2026-10-19
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from spider_aggregation.config import get_config
+from spider_aggregation.utils.compression import compress_text, decompress_text, resolve_codec
+
+
+revision: str = "012"
+down_revision: Union[str, Sequence[str], None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+BATCH_SIZE = 500
+
+entry_bodies = sa.table(
+    "entry_bodies",
+    sa.column("entry_id", sa.Integer()),
+    sa.column("codec", sa.String()),
+    sa.column("size", sa.Integer()),
+    sa.column("data", sa.LargeBinary()),
+)
+
+
+def _sqlite_size(conn) -> Union[tuple[int, int], None]:
+    """Size and free space of the SQLite database in bytes (None on other databases)."""
+    if conn.dialect.name != "sqlite":
+        return None
+    page_size = conn.exec_driver_sql("PRAGMA page_size").scalar()
+    page_count = conn.exec_driver_sql("PRAGMA page_count").scalar()
+    free_pages = conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+    return page_count * page_size, free_pages * page_size
+
+
+def upgrade() -> None:
+    op.create_table(
+        "entry_bodies",
+        sa.Column("entry_id", sa.Integer(), nullable=False),
+        sa.Column("codec", sa.String(length=16), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(["entry_id"], ["entries.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("entry_id"),
+    )
+
+    conn = op.get_bind()
+    codec = resolve_codec(get_config().database.body_codec)
+    size_before = _sqlite_size(conn)
+    bodies = text_bytes = stored_bytes = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.text(
+                "SELECT id, content FROM entries "
+                "WHERE id > :last_id AND content IS NOT NULL "
+                "ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+
+        values = []
+        for entry_id, content in rows:
+            data = compress_text(content, codec)
+            size = len(content.encode("utf-8"))
+            values.append({"entry_id": entry_id, "codec": codec, "size": size, "data": data})
+            text_bytes += size
+            stored_bytes += len(data)
+        conn.execute(entry_bodies.insert(), values)
+        bodies += len(rows)
+        last_id = rows[-1][0]
+
+    with op.batch_alter_table("entries") as batch_op:
+        batch_op.drop_column("content")
+
+    ratio = f"{stored_bytes / text_bytes:.1%}" if text_bytes else "-"
+    logger.info(
+        f"entry_bodies: {bodies} bodies, {text_bytes} bytes of text stored in "
+        f"{stored_bytes} bytes ({codec}, {ratio})"
+    )
+    size_after = _sqlite_size(conn)
+    if size_before is not None:
+        logger.info(
+            f"Database size: {size_before[0]} bytes before, {size_after[0]} bytes after "
+            f"({size_after[1]} bytes free); run VACUUM to return the free pages to the "
+            "file system"
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("entries") as batch_op:
+        batch_op.add_column(sa.Column("content", sa.Text(), nullable=True))
+
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.text(
+                "SELECT entry_id, codec, data FROM entry_bodies "
+                "WHERE entry_id > :last_id ORDER BY entry_id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+
+        conn.execute(
+            sa.text("UPDATE entries SET content = :content WHERE id = :id"),
+            [
+                {"id": entry_id, "content": decompress_text(codec, data)}
+                for entry_id, codec, data in rows
+            ],
+        )
+        last_id = rows[-1][0]
+
+    op.drop_table("entry_bodies")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark digest entry collection.
+
+Seeds a temporary SQLite database with synthetic feeds and entries, then times
+the single ranked (ROW_NUMBER) query used by DigestService against the
+one-query-per-feed fallback.
+
+Usage:
+    python scripts/benchmark_digest_collect.py
+    python scripts/benchmark_digest_collect.py --feeds 1000 10000 --entries-per-feed 20
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlalchemy import insert
+
+from spider_aggregation.models import EntryModel, FeedModel
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+
+
+def seed(db_manager: DatabaseManager, feeds: int, entries_per_feed: int) -> None:
+    """Insert synthetic feeds and entries with bulk core inserts."""
+    now = datetime.utcnow()
+    with db_manager.session() as session:
+        session.execute(
+            insert(FeedModel),
+            [
+                {"url": f"https://feed{i}.example.com/rss", "name": f"Feed {i}", "enabled": True}
+                for i in range(feeds)
+            ],
+        )
+        feed_ids = [row[0] for row in session.query(FeedModel.id).all()]
+
+        rows = []
+        for feed_id in feed_ids:
+            for n in range(entries_per_feed):
+                link = f"https://feed{feed_id}.example.com/{n}"
+                rows.append(
+                    {
+                        "feed_id": feed_id,
+                        "title": f"Entry {n} of feed {feed_id}",
+                        "link": link,
+                        "summary": "Lorem ipsum dolor sit amet. " * 20,
+                        "published_at": now - timedelta(minutes=n * 30),
+                        "fetched_at": now,
+                        "link_hash": f"{feed_id:08d}{n:08d}",
+                        "title_hash": f"{feed_id:08d}{n:08d}",
+                    }
+                )
+            if len(rows) >= 10000:
+                session.execute(insert(EntryModel.__table__), rows)
+                rows = []
+        if rows:
+            session.execute(insert(EntryModel.__table__), rows)
+
+
+def time_collect(db_manager: DatabaseManager, per_feed: int, since: datetime, window: bool) -> tuple:
+    """Time one full pass over iter_latest_per_feed."""
+    with db_manager.session() as session:
+        repo = EntryRepository(session)
+        with patch.object(EntryRepository, "_supports_window_functions", return_value=window):
+            start = time.perf_counter()
+            count = sum(1 for _ in repo.iter_latest_per_feed(per_feed, since=since))
+            elapsed = time.perf_counter() - start
+    return elapsed, count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark digest entry collection")
+    parser.add_argument("--feeds", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--entries-per-feed", type=int, default=20)
+    parser.add_argument("--per-feed", type=int, default=5, help="Entries kept per feed")
+    args = parser.parse_args()
+
+    since = datetime.utcnow() - timedelta(hours=24)
+    print(f"{'feeds':>8} {'rows':>8} {'ranked (s)':>12} {'per-feed (s)':>14} {'speedup':>8}")
+
+    for feeds in args.feeds:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_manager = DatabaseManager(str(Path(tmp) / "bench.db"))
+            db_manager.init_db()
+            seed(db_manager, feeds, args.entries_per_feed)
+
+            ranked, count = time_collect(db_manager, args.per_feed, since, window=True)
+            fallback, fallback_count = time_collect(db_manager, args.per_feed, since, window=False)
+            assert count == fallback_count
+
+            print(f"{feeds:>8} {count:>8} {ranked:>12.3f} {fallback:>14.3f} {fallback / ranked:>7.1f}x")
+            db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Profile the ingestion pipeline for a single feed URL.
+
+Runs fetch -> feedparser -> parse -> dedup -> filter -> store for one URL
+under cProfile, prints the per-stage timing breakdown and writes the profile
+report to a file (text listing or a pstats dump for snakeviz/pstats).
+
+By default a throwaway SQLite database is used. With --db the feed is
+ingested against an existing database (so its filter rules and dedup index
+apply); changes are rolled back unless --commit is given.
+
+Usage:
+    python scripts/profile_feed.py https://example.com/feed.xml
+    python scripts/profile_feed.py https://example.com/feed.xml --format pstats -o feed.prof
+    python scripts/profile_feed.py https://example.com/feed.xml --db data/spider_aggregation.db
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from spider_aggregation.application.ingestion import IngestionPipeline
+from spider_aggregation.models import FeedCreate
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+from spider_aggregation.tracing import (
+    PROFILE_FORMATS,
+    PipelineProfiler,
+    format_trace,
+    start_trace,
+)
+
+
+def profile_feed(db_manager: DatabaseManager, url: str, profile_format: str, commit: bool):
+    """Ingest one feed under the profiler.
+
+    Returns:
+        Tuple of (IngestResult, Trace, report bytes)
+    """
+    profiler = PipelineProfiler()
+    with db_manager.session() as session:
+        repo = FeedRepository(session)
+        feed = repo.get_by_url(url) or repo.create(FeedCreate(url=url))
+
+        with start_trace(url) as trace, profiler:
+            result = IngestionPipeline(session).ingest(feed)
+
+        if not commit:
+            session.rollback()
+
+    header = f"Profile of {url}: {result.entries_created} new entries\n{format_trace(trace)}"
+    return result, trace, profiler.render(profile_format, header=header)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("url", help="Feed URL to profile")
+    parser.add_argument("--db", help="Existing database file (default: a temporary one)")
+    parser.add_argument("--format", choices=sorted(PROFILE_FORMATS), default="text")
+    parser.add_argument("-o", "--output", help="Report file (default: profile-feed.<ext>)")
+    parser.add_argument("--commit", action="store_true", help="Keep the ingested entries")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(args.db or str(Path(tmp) / "profile.db"))
+        if not args.db:
+            db_manager.init_db()
+        try:
+            result, trace, report = profile_feed(db_manager, args.url, args.format, args.commit)
+        finally:
+            db_manager.close()
+
+    output = Path(args.output or f"profile-feed.{PROFILE_FORMATS[args.format][1]}")
+    output.write_bytes(report)
+
+    print(format_trace(trace))
+    if not result.success:
+        print(f"Fetch failed: {result.error}")
+    else:
+        print(f"{result.entries_created} new entries")
+    print(f"Profile written to {output}")
+    return 0 if result.success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
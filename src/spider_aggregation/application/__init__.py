@@ -8,6 +8,11 @@ the domain service facades in core/services/.
 Services here:
 - EmailService: SMTP email sending (infrastructure)
 - DigestService: Digest generation and email workflow (application workflow)
+- MapReduceSummarizer: Token-budgeted parallel LLM summarization for digests
+- BatchEntryProcessor / BatchJobManager: Background batch jobs over entries
+- RetentionEngine: Chunked entry retention and SQLite space reclamation
+- IngestionPipeline: Streaming fetch -> parse -> dedup -> filter -> store with bounded queues
+- FetchJobManager: Background fetch-all sweeps with progress and cancellation
 
 Architecture:
     Web Layer -> Application Services -> (Domain Services + Repositories)
@@ -30,12 +35,38 @@ Example:
     digest_service.generate_and_send()
 """
 
+from spider_aggregation.application.batch_jobs import (
+    BatchEntryProcessor,
+    BatchJob,
+    BatchJobManager,
+    get_batch_job_manager,
+)
 from spider_aggregation.application.digest_service import DigestService, create_digest_service
+from spider_aggregation.application.digest_summarizer import MapReduceSummarizer
 from spider_aggregation.application.email_service import EmailService, create_email_service
+from spider_aggregation.application.fetch_jobs import FetchJobManager, get_fetch_job_manager
+from spider_aggregation.application.ingestion import IngestionPipeline, IngestResult
+from spider_aggregation.application.retention import (
+    RetentionEngine,
+    RetentionPolicy,
+    RetentionResult,
+)
 
 __all__ = [
+    "BatchEntryProcessor",
+    "BatchJob",
+    "BatchJobManager",
+    "get_batch_job_manager",
     "DigestService",
     "create_digest_service",
+    "MapReduceSummarizer",
     "EmailService",
     "create_email_service",
+    "FetchJobManager",
+    "get_fetch_job_manager",
+    "IngestionPipeline",
+    "IngestResult",
+    "RetentionEngine",
+    "RetentionPolicy",
+    "RetentionResult",
 ]
@@ -0,0 +1,379 @@
+"""
+Background batch jobs over entries.
+
+Batch summarization and keyword extraction run as background jobs so the
+web request returns immediately with a job ID to poll. Summaries are run
+concurrently through an LLMRequestScheduler (which enforces the LLM rate
+limit budgets); keywords are extracted a batch at a time. Entry texts are
+loaded and results committed one batch of entry IDs at a time, so a job
+never holds more than a batch of (decompressed) entry contents.
+"""
+
+import json
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Iterator, Optional
+
+from sqlalchemy import update
+
+from spider_aggregation.core.llm_client import estimate_tokens
+from spider_aggregation.core.llm_scheduler import LLMRequestScheduler, create_llm_scheduler
+from spider_aggregation.core.text_analysis import analyze_text
+from spider_aggregation.logger import get_logger
+from spider_aggregation.models import EntryModel
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.repositories.base import chunked
+from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class BatchJob:
+    """State of a background batch job."""
+
+    id: str
+    kind: str
+    total: int
+    status: str = "pending"  # pending, running, completed, failed
+    succeeded: int = 0
+    failed: int = 0
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+
+    @property
+    def processed(self) -> int:
+        """Number of items processed so far."""
+        return self.succeeded + self.failed
+
+    def to_dict(self) -> dict:
+        """Convert the job state to a dictionary for API responses."""
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "total": self.total,
+            "processed": self.processed,
+            "success": self.succeeded,
+            "failed": self.failed,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class BatchJobManager:
+    """Registry running batch jobs on background threads."""
+
+    # Finished jobs kept for polling
+    MAX_JOBS = 100
+
+    def __init__(self) -> None:
+        self._jobs: OrderedDict[str, BatchJob] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, total: int, target: Callable[[BatchJob], None]) -> BatchJob:
+        """Create a job and start it on a background thread.
+
+        Args:
+            kind: Job kind (e.g. "summarize")
+            total: Number of items to process
+            target: Function processing the job; it updates the job counters
+
+        Returns:
+            The created job
+        """
+        job = BatchJob(id=uuid.uuid4().hex, kind=kind, total=total)
+        with self._lock:
+            self._jobs[job.id] = job
+            finished = [j for j in self._jobs.values() if j.status in ("completed", "failed")]
+            for old in finished[: max(len(self._jobs) - self.MAX_JOBS, 0)]:
+                del self._jobs[old.id]
+
+        thread = threading.Thread(
+            target=self._run, args=(job, target), name=f"batch-{kind}-{job.id[:8]}", daemon=True
+        )
+        thread.start()
+        return job
+
+    @staticmethod
+    def _run(job: BatchJob, target: Callable[[BatchJob], None]) -> None:
+        """Run a job and record its final status."""
+        job.status = "running"
+        try:
+            target(job)
+            job.status = "completed"
+        except Exception as e:
+            logger.exception(f"Batch job {job.id} failed: {e}")
+            job.error = str(e)
+            job.status = "failed"
+        finally:
+            job.finished_at = datetime.utcnow()
+
+    def get(self, job_id: str) -> Optional[BatchJob]:
+        """Get a job by ID.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            BatchJob or None if unknown
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+
+_job_manager: Optional[BatchJobManager] = None
+_job_manager_lock = threading.Lock()
+
+
+def get_batch_job_manager() -> BatchJobManager:
+    """Get the process-wide batch job manager."""
+    global _job_manager
+
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = BatchJobManager()
+    return _job_manager
+
+
+def _reuse_text_analysis(row) -> None:
+    """Prime the text analysis cache with the analysis stored at ingestion."""
+    if row.content and row.text_analysis:
+        analyze_text(row.content, compact=row.text_analysis)
+
+
+class BatchEntryProcessor:
+    """Process batches of entries concurrently and commit results in batches."""
+
+    COMMIT_BATCH_SIZE = 20
+
+    # Characters of entry text sent to the AI summarizer (see AISummarizer)
+    SUMMARY_INPUT_CHARS = 3000
+
+    def __init__(self, db_manager: DatabaseManager, commit_batch_size: Optional[int] = None):
+        """Initialize the processor.
+
+        Args:
+            db_manager: Database manager (a session is opened per commit batch)
+            commit_batch_size: Number of results written per commit
+        """
+        self.db_manager = db_manager
+        self.commit_batch_size = commit_batch_size or self.COMMIT_BATCH_SIZE
+
+    def summarize(
+        self,
+        job: BatchJob,
+        entry_ids: list[int],
+        summarizer_service: Optional[Any] = None,
+        scheduler: Optional[LLMRequestScheduler] = None,
+    ) -> None:
+        """Generate summaries for entries.
+
+        AI summaries go through the request scheduler. Local (extractive or
+        TextRank) summaries are CPU bound: each commit batch goes through one
+        ``summarize_batch`` call instead.
+
+        Args:
+            job: Job whose counters are updated
+            entry_ids: Entry IDs to summarize
+            summarizer_service: SummarizerService (created from config if not provided)
+            scheduler: Request scheduler (created from the LLM config if not provided)
+        """
+        if summarizer_service is None:
+            from spider_aggregation.core.services import SummarizerService
+
+            summarizer_service = SummarizerService(fallback_on_rate_limit=False)
+
+        if not summarizer_service.uses_llm and scheduler is None:
+            self._summarize_batches(job, entry_ids, summarizer_service)
+            return
+
+        if scheduler is None:
+            scheduler = create_llm_scheduler()
+
+        def work(row) -> Optional[dict]:
+            _reuse_text_analysis(row)
+            summary = summarizer_service.summarize(row.content or row.summary)
+            return {"id": row.id, "summary": summary} if summary else None
+
+        def tokens(row) -> int:
+            if not summarizer_service.uses_llm:
+                return 0
+            text = (row.content or row.summary)[: self.SUMMARY_INPUT_CHARS]
+            return estimate_tokens(text) + summarizer_service.max_tokens
+
+        self._process(
+            job,
+            entry_ids,
+            is_eligible=lambda row: bool(row.content or row.summary),
+            work=work,
+            tokens=tokens,
+            scheduler=scheduler,
+        )
+
+    def _summarize_batches(
+        self, job: BatchJob, entry_ids: list[int], summarizer_service: Any
+    ) -> None:
+        """Generate local summaries one commit batch at a time."""
+        for chunk, rows in self._iter_texts(entry_ids):
+            batch = [row for row in rows if row.content or row.summary]
+            # Missing or ineligible entries count as failed
+            job.failed += len(chunk) - len(batch)
+            if not batch:
+                continue
+
+            for row in batch:
+                _reuse_text_analysis(row)
+            try:
+                summaries = summarizer_service.summarize_batch(
+                    [row.content or row.summary for row in batch]
+                )
+            except Exception as e:
+                logger.warning(f"Batch {job.kind} items failed: {e}")
+                job.failed += len(batch)
+                continue
+
+            values = [
+                {"id": row.id, "summary": summary}
+                for row, summary in zip(batch, summaries)
+                if summary
+            ]
+            job.failed += len(batch) - len(values)
+            if values:
+                self._commit(values)
+                job.succeeded += len(values)
+
+        logger.info(
+            f"Batch {job.kind} job {job.id}: {job.succeeded} succeeded, {job.failed} failed"
+        )
+
+    def extract_keywords(
+        self,
+        job: BatchJob,
+        entry_ids: list[int],
+        keyword_service: Optional[Any] = None,
+    ) -> None:
+        """Extract keywords for entries and store them as tags.
+
+        Extraction is local and CPU bound, so entries are not spread over a
+        request scheduler: each commit batch goes through one
+        ``extract_batch`` call, which reads the corpus statistics once.
+
+        Args:
+            job: Job whose counters are updated
+            entry_ids: Entry IDs to process
+            keyword_service: KeywordService (created from config if not provided)
+        """
+        if keyword_service is None:
+            from spider_aggregation.core.services import KeywordService
+
+            keyword_service = KeywordService()
+
+        for chunk, batch in self._iter_texts(entry_ids):
+            # Missing entries count as failed
+            job.failed += len(chunk) - len(batch)
+            if not batch:
+                continue
+
+            texts = [f"{row.title or ''} {row.content or ''}" for row in batch]
+            try:
+                with self.db_manager.session() as session:
+                    keywords = keyword_service.extract_batch(texts, session=session)
+            except Exception as e:
+                logger.warning(f"Batch {job.kind} items failed: {e}")
+                job.failed += len(batch)
+                continue
+
+            values = [
+                {"id": row.id, "tags": json.dumps(found)}
+                for row, found in zip(batch, keywords)
+                if found
+            ]
+            job.failed += len(batch) - len(values)
+            if values:
+                self._commit(values)
+                job.succeeded += len(values)
+
+        logger.info(
+            f"Batch {job.kind} job {job.id}: {job.succeeded} succeeded, {job.failed} failed"
+        )
+
+    def _process(
+        self,
+        job: BatchJob,
+        entry_ids: list[int],
+        is_eligible: Callable[[Any], bool],
+        work: Callable[[Any], Optional[dict]],
+        tokens: Callable[[Any], int],
+        scheduler: LLMRequestScheduler,
+    ) -> None:
+        """Run work items through the scheduler and commit results in batches.
+
+        Each commit batch of entry IDs is loaded, run concurrently and
+        committed before the next one is loaded.
+
+        Args:
+            job: Job whose counters are updated
+            entry_ids: Entry IDs to process
+            is_eligible: Whether a loaded row should be processed
+            work: Computes the update values of a row (None counts as failed)
+            tokens: Estimated LLM tokens of a row's request
+            scheduler: Request scheduler
+        """
+        try:
+            for chunk, rows in self._iter_texts(entry_ids):
+                eligible = [row for row in rows if is_eligible(row)]
+                # Missing or ineligible entries count as failed, as before
+                job.failed += len(chunk) - len(eligible)
+
+                pending: list[dict] = []
+                futures = [scheduler.submit(work, row, tokens=tokens(row)) for row in eligible]
+                for future in as_completed(futures):
+                    try:
+                        values = future.result()
+                    except Exception as e:
+                        logger.warning(f"Batch {job.kind} item failed: {e}")
+                        values = None
+
+                    if values is None:
+                        job.failed += 1
+                    else:
+                        pending.append(values)
+
+                if pending:
+                    self._commit(pending)
+                    job.succeeded += len(pending)
+        finally:
+            scheduler.shutdown(wait=False)
+
+        logger.info(
+            f"Batch {job.kind} job {job.id}: {job.succeeded} succeeded, {job.failed} failed "
+            f"({scheduler.get_stats()})"
+        )
+
+    def _iter_texts(self, entry_ids: list[int]) -> Iterator[tuple[list[int], list]]:
+        """Load entry texts one commit batch of IDs at a time.
+
+        Yields:
+            Tuples of the batch's entry IDs and the texts of those that exist
+            (see EntryRepository.get_texts)
+        """
+        for chunk in chunked(entry_ids, self.commit_batch_size):
+            with self.db_manager.session() as session:
+                rows = EntryRepository(session).get_texts(chunk)
+            yield chunk, rows
+
+    def _commit(self, values: list[dict]) -> None:
+        """Write a batch of entry updates in one transaction.
+
+        Args:
+            values: Update dictionaries keyed by entry "id"
+        """
+        with self.db_manager.session() as session:
+            session.execute(update(EntryModel), values)
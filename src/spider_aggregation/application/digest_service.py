@@ -18,9 +18,15 @@ from typing import Optional
 from sqlalchemy.orm import Session
 
 from spider_aggregation.config import get_config
-from spider_aggregation.core.llm_client import BaseLLMClient, LLMResponse, create_llm_client
+from spider_aggregation.core.llm_client import (
+    BaseLLMClient,
+    CachedLLMClient,
+    LLMResponse,
+    create_llm_client,
+)
 from spider_aggregation.logger import get_logger
-from spider_aggregation.models import DigestLogCreate, DigestLogModel, EntryModel, FeedModel
+from spider_aggregation.models import DigestLogCreate, DigestLogModel, FeedModel
+from spider_aggregation.application.digest_summarizer import MapReduceSummarizer
 from spider_aggregation.application.email_service import EmailResult, create_email_service
 from spider_aggregation.storage.repositories.entry_repo import EntryRepository
 from spider_aggregation.storage.repositories.feed_repo import FeedRepository
@@ -28,12 +34,27 @@ from spider_aggregation.storage.repositories.feed_repo import FeedRepository
 logger = get_logger(__name__)
 
 
+@dataclass
+class DigestEntry:
+    """Entry fields needed to build a digest."""
+
+    id: int
+    feed_id: int
+    title: str
+    link: str
+    excerpt: str = ""
+    published_at: Optional[datetime] = None
+    cluster_id: Optional[int] = None
+
+
 @dataclass
 class FeedEntries:
     """Entries from a single feed."""
 
     feed: FeedModel
-    entries: list[EntryModel] = field(default_factory=list)
+    entries: list[DigestEntry] = field(default_factory=list)
+    # Story cluster member counts keyed by entry ID (only for clusters of 2+)
+    cluster_sizes: dict[int, int] = field(default_factory=dict)
 
 
 @dataclass
@@ -66,6 +87,9 @@ class DigestService:
 - 要点：列出3-5个关键要点，每个要点包含简要说明
 - 重点文章：如果有特别重要的文章，单独提及标题和核心内容"""
 
+    # Characters of summary/content included per article in the prompt
+    EXCERPT_LENGTH = 1000
+
     def __init__(
         self,
         session: Session,
@@ -119,67 +143,135 @@ class DigestService:
     def _collect_entries(self) -> list[FeedEntries]:
         """Collect recent entries from all enabled feeds.
 
+        The newest entries of every feed are streamed from a single ranked
+        query instead of one query per feed.
+
         Returns:
             List of FeedEntries grouped by feed
         """
-        feed_repo = FeedRepository(self.session)
         entry_repo = EntryRepository(self.session)
-
-        # Get all enabled feeds
-        feeds = feed_repo.list(enabled=True, limit=1000)
-
         cutoff_time = datetime.utcnow() - timedelta(hours=self.max_age_hours)
 
-        result = []
-        for feed in feeds:
-            # Get recent entries for this feed
-            entries = (
-                self.session.query(EntryModel)
-                .filter(
-                    EntryModel.feed_id == feed.id,
-                    EntryModel.published_at >= cutoff_time,
+        entries_by_feed: dict[int, list[DigestEntry]] = {}
+        for row in entry_repo.iter_latest_per_feed(
+            per_feed=self.entries_per_feed,
+            since=cutoff_time,
+            excerpt_length=self.EXCERPT_LENGTH,
+        ):
+            entries_by_feed.setdefault(row.feed_id, []).append(
+                DigestEntry(
+                    id=row.id,
+                    feed_id=row.feed_id,
+                    title=row.title,
+                    link=row.link,
+                    excerpt=row.excerpt or "",
+                    published_at=row.published_at,
+                    cluster_id=row.cluster_id,
                 )
-                .order_by(EntryModel.published_at.desc())
-                .limit(self.entries_per_feed)
-                .all()
             )
 
+        if not entries_by_feed:
+            return []
+
+        result = []
+        for feed in FeedRepository(self.session).list_enabled_brief():
+            entries = entries_by_feed.get(feed.id)
             if entries:
                 result.append(FeedEntries(feed=feed, entries=entries))
                 logger.debug(f"Collected {len(entries)} entries from feed '{feed.name}'")
 
-        return result
+        return self._collapse_clusters(result)
 
-    def _build_aggregation_prompt(self, feed_entries: list[FeedEntries]) -> str:
-        """Build prompt for aggregation mode.
+    def _collapse_clusters(self, feed_entries: list[FeedEntries]) -> list[FeedEntries]:
+        """Keep one entry per story cluster across all feeds.
+
+        The first entry seen for a cluster represents it; the cluster's total
+        member count is recorded so the digest can mention related coverage.
 
         Args:
-            feed_entries: List of feed entries to summarize
+            feed_entries: Entries grouped by feed
 
         Returns:
-            Prompt string
+            Feed entries with duplicate cluster members removed
         """
-        lines = ["请将以下RSS订阅文章进行聚合总结：\n"]
+        if not self.config.clustering.enabled:
+            return feed_entries
 
+        seen_clusters: set[int] = set()
+        result = []
         for fe in feed_entries:
-            lines.append(f"\n## {fe.feed.name or fe.feed.url}\n")
+            kept = []
+            for entry in fe.entries:
+                if entry.cluster_id is not None:
+                    if entry.cluster_id in seen_clusters:
+                        continue
+                    seen_clusters.add(entry.cluster_id)
+                kept.append(entry)
+            if kept:
+                result.append(FeedEntries(feed=fe.feed, entries=kept))
+
+        sizes = EntryRepository(self.session).get_cluster_sizes(list(seen_clusters))
+        for fe in result:
+            for entry in fe.entries:
+                size = sizes.get(entry.cluster_id, 1)
+                if size > 1:
+                    fe.cluster_sizes[entry.id] = size
+
+        return result
+
+    def _build_article_sections(self, feed_entries: list[FeedEntries]) -> list[str]:
+        """Build one prompt section per article.
+
+        Each section names its feed so that it stands on its own when the
+        articles are split across several LLM calls.
+
+        Args:
+            feed_entries: List of feed entries to summarize
 
-            for i, entry in enumerate(fe.entries, 1):
-                lines.append(f"\n### 文章{i}: {entry.title}")
-                lines.append(f"链接: {entry.link}")
+        Returns:
+            List of article sections
+        """
+        sections = []
+        for fe in feed_entries:
+            feed_name = fe.feed.name or fe.feed.url
+            for entry in fe.entries:
+                lines = [f"### {entry.title}", f"来源: {feed_name}", f"链接: {entry.link}"]
+                if entry.id in fe.cluster_sizes:
+                    lines.append(f"相关报道: {fe.cluster_sizes[entry.id]} 篇")
 
                 # Use summary or content, truncated
-                content = entry.summary or entry.content or ""
-                if len(content) > 1000:
-                    content = content[:1000] + "..."
-                lines.append(f"内容: {content}\n")
+                content = entry.excerpt
+                if len(content) > self.EXCERPT_LENGTH:
+                    content = content[: self.EXCERPT_LENGTH] + "..."
+                lines.append(f"内容: {content}")
+                sections.append("\n".join(lines))
 
-        lines.append("\n请根据以上文章生成聚合总结。")
-        return "\n".join(lines)
+        return sections
+
+    def _build_aggregation_prompt(self, feed_entries: list[FeedEntries]) -> str:
+        """Build prompt for aggregation mode.
+
+        Args:
+            feed_entries: List of feed entries to summarize
+
+        Returns:
+            Prompt string
+        """
+        return self._wrap_aggregation_prompt(self._build_article_sections(feed_entries))
+
+    @staticmethod
+    def _wrap_aggregation_prompt(sections: list[str]) -> str:
+        """Wrap article sections in the single-call aggregation prompt."""
+        body = "\n\n".join(sections)
+        return f"请将以下RSS订阅文章进行聚合总结：\n\n{body}\n\n请根据以上文章生成聚合总结。"
 
     def _generate_summary(self, feed_entries: list[FeedEntries]) -> LLMResponse:
         """Generate aggregated summary using LLM.
 
+        Digests that fit the token budget are summarized in a single call;
+        larger ones are split into chunks summarized in parallel and merged
+        (see MapReduceSummarizer).
+
         Args:
             feed_entries: List of feed entries
 
@@ -189,14 +281,29 @@ class DigestService:
         if not self._ensure_llm():
             return LLMResponse(success=False, error="LLM client not available")
 
-        prompt = self._build_aggregation_prompt(feed_entries)
+        sections = self._build_article_sections(feed_entries)
+        summarizer = MapReduceSummarizer(
+            llm_client=self.llm_client,
+            system_prompt=self.AGGREGATION_SYSTEM_PROMPT,
+            token_budget=self.digest_config.token_budget,
+            max_concurrency=self.digest_config.max_concurrency,
+        )
 
         logger.info(f"Generating aggregated summary for {len(feed_entries)} feeds")
-        return self.llm_client.chat(
-            prompt=prompt,
-            system_prompt=self.AGGREGATION_SYSTEM_PROMPT,
+        response = summarizer.summarize(
+            sections, single_prompt=self._wrap_aggregation_prompt(sections)
         )
 
+        if isinstance(self.llm_client, CachedLLMClient):
+            logger.info(f"LLM cache stats: {self.llm_client.cache.get_stats()}")
+        return response
+
+    @staticmethod
+    def _cluster_note(fe: FeedEntries, entry: DigestEntry) -> str:
+        """Build the related-coverage suffix for an entry title."""
+        size = fe.cluster_sizes.get(entry.id)
+        return f"（{size} 篇相关报道）" if size else ""
+
     def _build_email_content(
         self, feed_entries: list[FeedEntries], summary: str
     ) -> tuple[str, str]:
@@ -231,7 +338,7 @@ class DigestService:
         for fe in feed_entries:
             text_lines.append(f"\n### {fe.feed.name or fe.feed.url}")
             for entry in fe.entries:
-                text_lines.append(f"- {entry.title}")
+                text_lines.append(f"- {entry.title}{self._cluster_note(fe, entry)}")
                 text_lines.append(f"  {entry.link}")
             text_lines.append("")
 
@@ -275,7 +382,9 @@ class DigestService:
 
             for entry in fe.entries:
                 html_parts.append('<div class="entry">')
-                html_parts.append(f'<div class="entry-title">{entry.title}</div>')
+                html_parts.append(
+                    f'<div class="entry-title">{entry.title}{self._cluster_note(fe, entry)}</div>'
+                )
                 html_parts.append(f'<a class="entry-link" href="{entry.link}">{entry.link}</a>')
                 html_parts.append("</div>")
 
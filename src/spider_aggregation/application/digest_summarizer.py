@@ -0,0 +1,210 @@
+"""
+Map-reduce summarizer for large digests.
+
+Articles are packed into prompts under a token budget (map), the chunks are
+summarized concurrently, and the partial summaries are merged into one
+digest summary (reduce). Partial summaries that do not fit a single reduce
+prompt are merged in further rounds until they do.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from spider_aggregation.core.llm_client import (
+    BaseLLMClient,
+    LLMResponse,
+    estimate_tokens,
+    truncate_to_tokens,
+)
+from spider_aggregation.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Prompt tokens always left for article content, however small the budget
+MIN_CONTENT_TOKENS = 200
+
+
+class MapReduceSummarizer:
+    """Summarize article sections with parallel, token-budgeted LLM calls."""
+
+    # System prompt for chunk (map) and intermediate merge calls
+    MAP_SYSTEM_PROMPT = """你是一位专业的信息摘要助手。你将收到一批RSS订阅文章（或其分段总结），它们只是全部内容的一部分。
+
+请遵循以下要求：
+1. 提取核心主题、关键信息和重要的技术细节
+2. 保留文章标题，以便后续合并时引用
+3. 内容简洁，不要写总览或结束语
+4. 使用中文输出"""
+
+    MAP_INSTRUCTION = "请总结以下RSS订阅文章（第{index}/{total}批）：\n\n{content}"
+    MERGE_INSTRUCTION = "请合并以下同一批RSS订阅文章的分段总结（第{index}/{total}组）：\n\n{content}"
+    REDUCE_INSTRUCTION = (
+        "以下是同一批RSS订阅文章的分段总结，请将它们合并为一份完整的聚合总结：\n\n{content}"
+    )
+
+    def __init__(
+        self,
+        llm_client: BaseLLMClient,
+        system_prompt: str,
+        token_budget: int = 6000,
+        max_concurrency: int = 4,
+    ):
+        """Initialize the summarizer.
+
+        Args:
+            llm_client: LLM client used for all calls
+            system_prompt: System prompt of the final (reduce) call
+            token_budget: Max estimated tokens of a prompt, system prompt included
+            max_concurrency: Max number of LLM calls running at once
+        """
+        self.llm_client = llm_client
+        self.system_prompt = system_prompt
+        self.token_budget = token_budget
+        self.max_concurrency = max(1, max_concurrency)
+
+    def content_budget(self, system_prompt: str, instruction: str) -> int:
+        """Get the tokens left for content in a prompt.
+
+        Args:
+            system_prompt: System prompt of the call
+            instruction: Instruction template wrapping the content
+
+        Returns:
+            Token budget for the content
+        """
+        overhead = estimate_tokens(system_prompt) + estimate_tokens(instruction) + 16
+        return max(self.token_budget - overhead, MIN_CONTENT_TOKENS)
+
+    @staticmethod
+    def pack(sections: list[str], budget: int) -> list[list[str]]:
+        """Greedily pack sections into chunks under a token budget.
+
+        Sections keep their order. A section larger than the budget is
+        truncated and placed in a chunk of its own.
+
+        Args:
+            sections: Text sections (e.g. one per article)
+            budget: Max estimated tokens per chunk
+
+        Returns:
+            List of chunks, each a list of sections
+        """
+        chunks: list[list[str]] = []
+        current: list[str] = []
+        current_tokens = 0
+
+        for section in sections:
+            section = truncate_to_tokens(section, budget)
+            # Sections are joined with a blank line
+            tokens = estimate_tokens(section) + 1
+            if current and current_tokens + tokens > budget:
+                chunks.append(current)
+                current, current_tokens = [], 0
+            current.append(section)
+            current_tokens += tokens
+
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def summarize(self, sections: list[str], single_prompt: Optional[str] = None) -> LLMResponse:
+        """Summarize sections, splitting the work when it exceeds the budget.
+
+        Args:
+            sections: Article sections to summarize
+            single_prompt: Prompt to use when everything fits in one call
+                (defaults to the sections joined by blank lines)
+
+        Returns:
+            LLMResponse with the merged summary and total tokens used
+        """
+        if not sections:
+            return LLMResponse(success=False, error="Nothing to summarize")
+
+        prompt = single_prompt or "\n\n".join(sections)
+        if estimate_tokens(self.system_prompt) + estimate_tokens(prompt) <= self.token_budget:
+            return self._call(prompt, self.system_prompt)
+
+        budget = self.content_budget(self.MAP_SYSTEM_PROMPT, self.MAP_INSTRUCTION)
+        chunks = self.pack(sections, budget)
+        logger.info(f"Summarizing {len(sections)} sections in {len(chunks)} chunks")
+
+        summaries, tokens_used, error = self._map(chunks, self.MAP_INSTRUCTION)
+        if not summaries:
+            return LLMResponse(success=False, error=error, tokens_used=tokens_used)
+
+        response = self._reduce(summaries)
+        response.tokens_used = (response.tokens_used or 0) + tokens_used
+        return response
+
+    def _reduce(self, summaries: list[str]) -> LLMResponse:
+        """Merge partial summaries until they fit one final call."""
+        tokens_used = 0
+        reduce_budget = self.content_budget(self.system_prompt, self.REDUCE_INSTRUCTION)
+        merge_budget = self.content_budget(self.MAP_SYSTEM_PROMPT, self.MERGE_INSTRUCTION)
+
+        while len(self.pack(summaries, reduce_budget)) > 1:
+            chunks = self.pack(summaries, merge_budget)
+            if len(chunks) >= len(summaries):
+                # Every summary fills a chunk on its own: merge pairs of halves
+                chunks = self.pack(summaries, merge_budget // 2)
+                chunks = [sum(chunks[i : i + 2], []) for i in range(0, len(chunks), 2)]
+
+            merged, used, error = self._map(chunks, self.MERGE_INSTRUCTION)
+            tokens_used += used
+            if not merged:
+                return LLMResponse(success=False, error=error, tokens_used=tokens_used)
+            summaries = merged
+
+        content = "\n\n".join(self.pack(summaries, reduce_budget)[0])
+        response = self._call(self.REDUCE_INSTRUCTION.format(content=content), self.system_prompt)
+        response.tokens_used = (response.tokens_used or 0) + tokens_used
+        return response
+
+    def _map(
+        self, chunks: list[list[str]], instruction: str
+    ) -> tuple[list[str], int, Optional[str]]:
+        """Summarize chunks concurrently.
+
+        Failed chunks are logged and skipped so one slow or failing call does
+        not lose the whole digest.
+
+        Args:
+            chunks: Chunks of sections
+            instruction: Instruction template for each chunk
+
+        Returns:
+            Tuple of (summaries in chunk order, tokens used, last error)
+        """
+        total = len(chunks)
+        prompts = [
+            instruction.format(index=i, total=total, content="\n\n".join(chunk))
+            for i, chunk in enumerate(chunks, 1)
+        ]
+
+        workers = min(self.max_concurrency, total)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            responses = list(
+                executor.map(lambda p: self._call(p, self.MAP_SYSTEM_PROMPT), prompts)
+            )
+
+        summaries = []
+        tokens_used = 0
+        error = None
+        for i, response in enumerate(responses, 1):
+            tokens_used += response.tokens_used or 0
+            if response.success and response.content:
+                summaries.append(f"### 第{i}部分\n{response.content.strip()}")
+            else:
+                error = response.error or "Empty response"
+                logger.warning(f"Chunk {i}/{total} summary failed: {error}")
+
+        return summaries, tokens_used, error
+
+    def _call(self, prompt: str, system_prompt: str) -> LLMResponse:
+        """Make one LLM call, turning exceptions into failed responses."""
+        try:
+            return self.llm_client.chat(prompt=prompt, system_prompt=system_prompt)
+        except Exception as e:
+            logger.error(f"LLM call failed: {e}")
+            return LLMResponse(success=False, error=str(e))
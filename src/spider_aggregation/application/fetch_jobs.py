@@ -0,0 +1,198 @@
+"""
+Background fetch-all jobs.
+
+A sweep over all due feeds can take minutes, so it runs on a background
+thread instead of inside the web request. Its state lives in the fetch_jobs
+table: the sweep ingests feeds in batches through the ingestion pipeline and
+commits each batch together with the job's progress counters, so the SQLite
+write lock is only held for one batch at a time and the progress polled by
+clients always matches the stored entries. On SQLite the entries go through
+the group commit writer (shared with the scheduler jobs) and the progress is
+committed right after them.
+
+Only one sweep runs at a time: triggering a sweep while one is pending or
+running returns the existing job. Cancellation is a flag on the row, checked
+between batches.
+"""
+
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+
+from spider_aggregation.config import get_config
+from spider_aggregation.logger import get_logger
+from spider_aggregation.models import FeedModel
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.group_commit import get_group_commit_writer
+from spider_aggregation.storage.repositories.base import chunked
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+from spider_aggregation.storage.repositories.fetch_job_repo import FetchJobRepository
+
+logger = get_logger(__name__)
+
+
+class FetchJobManager:
+    """Start, run and cancel fetch-all jobs.
+
+    Example:
+        >>> manager = get_fetch_job_manager()
+        >>> job_id, created = manager.start(db_path)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # (database path, job ID) of the sweeps running in this process
+        self._running: set[tuple[str, int]] = set()
+
+    def start(self, db_path: str, batch_size: Optional[int] = None) -> tuple[int, bool]:
+        """Start a sweep unless one is already in progress.
+
+        An active job that is not running in this process and has made no
+        progress for ``sweep_stale_minutes`` (e.g. its process exited) is
+        marked as failed and no longer blocks new sweeps.
+
+        Args:
+            db_path: Database file
+            batch_size: Feeds per transaction (default from config)
+
+        Returns:
+            Tuple of (job ID, whether a new job was created)
+        """
+        config = get_config().ingestion
+        batch_size = batch_size or config.sweep_batch_size
+        stale_before = datetime.utcnow() - timedelta(minutes=config.sweep_stale_minutes)
+
+        db_manager = DatabaseManager(db_path)
+        try:
+            with self._lock:
+                with db_manager.session() as session:
+                    repo = FetchJobRepository(session)
+                    active = repo.get_active()
+                    if (
+                        active is not None
+                        and (db_path, active.id) not in self._running
+                        and active.updated_at < stale_before
+                    ):
+                        logger.warning(f"Abandoning stale fetch job {active.id}")
+                        repo.finish(active, "failed", error_message="任务中断")
+                        active = None
+                    if active is not None:
+                        return active.id, False
+                    job_id = repo.create().id
+                self._running.add((db_path, job_id))
+        finally:
+            db_manager.close()
+
+        thread = threading.Thread(
+            target=self._run,
+            args=(db_path, job_id, batch_size),
+            name=f"fetch-job-{job_id}",
+            daemon=True,
+        )
+        thread.start()
+        return job_id, True
+
+    def cancel(self, db_path: str, job_id: int) -> Optional[bool]:
+        """Ask a job to stop after its current batch.
+
+        Args:
+            db_path: Database file
+            job_id: Job ID
+
+        Returns:
+            True if cancellation was requested, False if the job already
+            finished, None if the job does not exist
+        """
+        db_manager = DatabaseManager(db_path)
+        try:
+            with db_manager.session() as session:
+                repo = FetchJobRepository(session)
+                job = repo.get_by_id(job_id)
+                if job is None:
+                    return None
+                return repo.request_cancel(job)
+        finally:
+            db_manager.close()
+
+    def _run(self, db_path: str, job_id: int, batch_size: int) -> None:
+        """Run a sweep and record its final status (background thread)."""
+        db_manager = DatabaseManager(db_path)
+        try:
+            status = self._sweep(db_manager, job_id, batch_size)
+            error = None
+        except Exception as e:
+            logger.exception(f"Fetch job {job_id} failed: {e}")
+            status, error = "failed", f"{type(e).__name__}: {e}"
+
+        try:
+            with db_manager.session() as session:
+                repo = FetchJobRepository(session)
+                job = repo.get_by_id(job_id)
+                repo.finish(job, status, error_message=error)
+                logger.info(
+                    f"Fetch job {job_id} {status}: {job.feeds_done}/{job.feeds_total} feeds, "
+                    f"{job.entries_created} entries created, {job.feeds_failed} failed"
+                )
+        finally:
+            with self._lock:
+                self._running.discard((db_path, job_id))
+            db_manager.close()
+
+    @staticmethod
+    def _sweep(db_manager: DatabaseManager, job_id: int, batch_size: int) -> str:
+        """Ingest the due feeds batch by batch.
+
+        Returns:
+            Final status ("completed" or "cancelled")
+        """
+        from spider_aggregation.application.ingestion import IngestionPipeline
+
+        with db_manager.session() as session:
+            feed_ids = [feed.id for feed in FeedRepository(session).get_feeds_to_fetch(None)]
+            repo = FetchJobRepository(session)
+            repo.start(repo.get_by_id(job_id), feeds_total=len(feed_ids))
+
+        writer = get_group_commit_writer(db_manager.engine)
+        for batch in chunked(feed_ids, batch_size):
+            with db_manager.session() as session:
+                repo = FetchJobRepository(session)
+                if repo.get_by_id(job_id).cancel_requested:
+                    return "cancelled"
+
+                position = {feed_id: n for n, feed_id in enumerate(batch)}
+                feeds = session.query(FeedModel).filter(FeedModel.id.in_(batch)).all()
+                feeds.sort(key=lambda feed: position[feed.id])
+                results = IngestionPipeline(session, writer=writer).run(feeds)
+                if writer is not None:
+                    # The writer committed on its own connection; end this read
+                    # transaction so the progress update does not start from a
+                    # stale snapshot (SQLite rejects that write as locked)
+                    session.commit()
+
+                # Committed with the batch's entries (after them with a writer)
+                repo.record_progress(
+                    repo.get_by_id(job_id),
+                    feeds_done=len(batch),
+                    entries_created=sum(result.entries_created for result in results),
+                    failures=[
+                        {"feed_id": result.feed_id, "error": result.error}
+                        for result in results
+                        if not result.success
+                    ],
+                )
+
+        return "completed"
+
+
+_fetch_job_manager: Optional[FetchJobManager] = None
+_fetch_job_manager_lock = threading.Lock()
+
+
+def get_fetch_job_manager() -> FetchJobManager:
+    """Get the process-wide fetch job manager."""
+    global _fetch_job_manager
+
+    with _fetch_job_manager_lock:
+        if _fetch_job_manager is None:
+            _fetch_job_manager = FetchJobManager()
+    return _fetch_job_manager
@@ -0,0 +1,513 @@
+"""
+Streaming feed ingestion pipeline.
+
+Feeds flow through three stages connected by bounded queues:
+
+- fetch: HTTP download and feedparser (I/O bound, ``fetch_workers`` threads)
+- parse: entry normalization (CPU bound, ``parse_workers`` threads)
+- store: dedup, filter, store and index (the calling thread, which owns the
+  database session and is the only writer)
+
+Downloads, parsing and database writes of different feeds therefore overlap,
+while the queue bounds keep at most a few feeds' entries in memory: a slow
+writer blocks the parsers, which block the fetchers (backpressure).
+
+With a group commit writer (SQLite, see spider_aggregation.storage.group_commit)
+the store stage runs on the writer thread instead, so pipelines running in
+several threads do not compete for the database lock; their stores are
+committed in groups and the calling session is only read from.
+
+Every feed carries its own trace (see spider_aggregation.tracing) across the
+stages; the breakdown is returned with the result and stored on the feed
+alongside the other last-fetch fields. Runs of a single feed, or with
+``fetch_workers=0``, execute inline in the calling thread.
+"""
+
+import queue
+import threading
+from collections import deque
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional
+
+from sqlalchemy.orm import Session
+
+from spider_aggregation.config import get_config
+from spider_aggregation.core.fetcher import FeedFetcher, FetchResult
+from spider_aggregation.logger import get_logger
+from spider_aggregation.models import EntryCreate, FeedModel
+from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+from spider_aggregation.storage.repositories.filter_rule_repo import FilterRuleRepository
+from spider_aggregation.tracing import (
+    STAGE_DEDUP,
+    STAGE_FILTER,
+    STAGE_INDEX,
+    STAGE_PARSE,
+    STAGE_STORE,
+    Trace,
+    current_trace,
+    span,
+    use_trace,
+)
+
+if TYPE_CHECKING:
+    from spider_aggregation.storage.group_commit import GroupCommitWriter
+
+logger = get_logger(__name__)
+
+# End-of-stream marker passed down the stage queues
+_DONE = object()
+
+# Session.info key of the pipeline storing entries on a group commit session
+_WRITER_PIPELINE_KEY = "ingestion_pipeline"
+
+
+@dataclass
+class IngestResult:
+    """Outcome of ingesting one feed."""
+
+    feed_id: int
+    success: bool
+    entries_created: int = 0
+    error: Optional[str] = None
+    http_status: Optional[int] = None
+    timings: Optional[dict] = None
+    entries_count: int = 0
+
+
+@dataclass
+class _FeedJob:
+    """A feed travelling through the stages.
+
+    ``feed`` is bound to the session and only touched by the store stage;
+    the fetch stage reads the detached ``snapshot``.
+    """
+
+    index: int
+    feed: FeedModel
+    snapshot: FeedModel
+    trace: Trace
+    owns_trace: bool
+    fetch_result: Optional[FetchResult] = None
+    parsed: list[dict] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+class IngestionPipeline:
+    """Fetch feeds and store their new entries.
+
+    The service facades are created once, so one pipeline can process many
+    feeds within the same session.
+
+    Example:
+        >>> pipeline = IngestionPipeline(session, fetch_workers=8)
+        >>> results = pipeline.run(feed_repo.get_feeds_to_fetch())
+        >>> results[0].timings["stages"]["dedup"]["seconds"]
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        fetch_workers: Optional[int] = None,
+        parse_workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        fetcher_factory: Optional[Callable[[], FeedFetcher]] = None,
+        writer: Optional["GroupCommitWriter"] = None,
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            session: Database session (used from the calling thread only)
+            fetch_workers: Concurrent downloads, 0 runs inline (default from config)
+            parse_workers: Concurrent entry parsers (default from config)
+            queue_size: Feeds buffered between two stages (default from config)
+            fetcher_factory: Creates the session-less fetcher of each fetch worker
+            writer: Group commit writer running the store stage; the session
+                must then have no uncommitted writes, as the writer waits for
+                the database lock
+        """
+        from spider_aggregation.core.factories import create_fetcher
+        from spider_aggregation.core.services import (
+            ClusteringService,
+            DeduplicatorService,
+            FilterService,
+            KeywordService,
+            ParserService,
+        )
+
+        config = get_config().ingestion
+        self.fetch_workers = config.fetch_workers if fetch_workers is None else fetch_workers
+        self.parse_workers = max(
+            config.parse_workers if parse_workers is None else parse_workers, 1
+        )
+        self.queue_size = max(config.queue_size if queue_size is None else queue_size, 1)
+        self._fetcher_factory = fetcher_factory or create_fetcher
+        self.writer = writer
+        self._local = threading.local()
+
+        self.session = session
+        self.feed_repo = FeedRepository(session)
+        self.entry_repo = EntryRepository(session)
+        self.filter_rule_repo = FilterRuleRepository(session)
+
+        self.parser = ParserService()
+        self.deduplicator = DeduplicatorService(session=session)
+        self.clustering = ClusteringService(session=session)
+        self.filter_service = FilterService()
+        self.keywords = KeywordService()
+
+    def ingest(self, feed: FeedModel) -> IngestResult:
+        """Fetch one feed and store its new entries.
+
+        Args:
+            feed: FeedModel instance
+
+        Returns:
+            IngestResult with the per-stage timings
+        """
+        return self.run([feed])[0]
+
+    def run(self, feeds: Iterable[FeedModel]) -> list[IngestResult]:
+        """Fetch feeds and store their new entries.
+
+        When running inline and a trace is already active (e.g. a profiled
+        request), stages are added to it; otherwise every feed gets its own
+        trace.
+
+        Args:
+            feeds: FeedModel instances bound to the pipeline's session
+
+        Returns:
+            IngestResult per feed, in input order
+        """
+        feeds = list(feeds)
+        inline = self.fetch_workers == 0 or len(feeds) < 2
+        outer = current_trace() if inline else None
+        jobs = [
+            _FeedJob(
+                index=index,
+                feed=feed,
+                snapshot=_snapshot(feed),
+                trace=outer or Trace(feed.url),
+                owns_trace=outer is None,
+            )
+            for index, feed in enumerate(feeds)
+        ]
+
+        return self._store_all(self._inline(jobs) if inline else self._stream(jobs), len(jobs))
+
+    # ------------------------------------------------------------------
+    # Stage wiring
+    # ------------------------------------------------------------------
+
+    def _inline(self, jobs: list[_FeedJob]) -> Iterator[_FeedJob]:
+        """Run the fetch and parse stages in the calling thread."""
+        for job in jobs:
+            _apply_step(self._fetch, job)
+            _apply_step(self._parse, job)
+            yield job
+
+    def _store_all(self, jobs: Iterator[_FeedJob], count: int) -> list[IngestResult]:
+        """Run the store stage of each job as it arrives.
+
+        With a writer, up to ``queue_size`` stores are in flight on the writer
+        thread while later feeds are still being fetched and parsed.
+
+        Returns:
+            IngestResult per job, in job order
+        """
+        ordered: list[Optional[IngestResult]] = [None] * count
+        if self.writer is None:
+            for job in jobs:
+                ordered[job.index] = self._store(job)
+            return ordered
+
+        pending: deque = deque()
+
+        def collect():
+            job, future = pending.popleft()
+            ordered[job.index] = future.result()
+            # Written by the writer's session; reload on next access
+            self.session.expire(job.feed)
+
+        for job in jobs:
+            pending.append((job, self.writer.submit(partial(_store_in_writer, job))))
+            if len(pending) > self.queue_size:
+                collect()
+        while pending:
+            collect()
+        return ordered
+
+    def _stream(self, jobs: list[_FeedJob]) -> Iterator[_FeedJob]:
+        """Run the fetch and parse stages in worker threads.
+
+        Yields jobs ready for the store stage as they complete. If the
+        consumer stops early, the workers are cancelled and drained so no
+        thread stays blocked on a full queue.
+        """
+        fetch_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        parse_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        store_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        cancelled = threading.Event()
+
+        def feed_jobs():
+            for job in jobs:
+                if cancelled.is_set():
+                    break
+                fetch_queue.put(job)
+            for _ in range(self.fetch_workers):
+                fetch_queue.put(_DONE)
+
+        threads = [threading.Thread(target=feed_jobs, name="ingest-feeder", daemon=True)]
+        threads += _stage_threads(
+            "ingest-fetch",
+            self._fetch,
+            self.fetch_workers,
+            inbox=fetch_queue,
+            outbox=parse_queue,
+            downstream_workers=self.parse_workers,
+            cancelled=cancelled,
+        )
+        threads += _stage_threads(
+            "ingest-parse",
+            self._parse,
+            self.parse_workers,
+            inbox=parse_queue,
+            outbox=store_queue,
+            downstream_workers=1,
+            cancelled=cancelled,
+        )
+        for thread in threads:
+            thread.start()
+
+        finished = False
+        try:
+            while True:
+                job = store_queue.get()
+                if job is _DONE:
+                    finished = True
+                    break
+                yield job
+        finally:
+            if not finished:
+                cancelled.set()
+                while store_queue.get() is not _DONE:
+                    pass
+            for thread in threads:
+                thread.join()
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    def _fetch(self, job: _FeedJob) -> None:
+        """Download and feedparse a feed (fetch stage, worker thread)."""
+        fetcher = getattr(self._local, "fetcher", None)
+        if fetcher is None:
+            fetcher = self._local.fetcher = self._fetcher_factory()
+        with use_trace(job.trace):
+            job.fetch_result = fetcher.fetch_feed(job.snapshot)
+        if not job.fetch_result.success:
+            job.error = job.fetch_result.error or "Fetch failed"
+
+    def _parse(self, job: _FeedJob) -> None:
+        """Normalize the fetched entries (parse stage, worker thread)."""
+        feed_id = job.snapshot.id
+        with use_trace(job.trace):
+            for entry_data in job.fetch_result.entries:
+                with span(STAGE_PARSE):
+                    job.parsed.append(self.parser.parse_entry(entry_data, feed_id=feed_id))
+
+    def _store(self, job: _FeedJob) -> IngestResult:
+        """Dedup, filter, store and index a feed's entries (store stage, calling thread)."""
+        feed = job.feed
+        fetch_result = job.fetch_result
+        http_status = fetch_result.http_status if fetch_result else None
+        entries_count = fetch_result.entries_count if fetch_result else 0
+
+        with use_trace(job.trace):
+            if job.error is None:
+                try:
+                    # A failed flush only rolls back this feed's savepoint and
+                    # leaves the session usable for the others
+                    with self.session.begin_nested():
+                        entries_created = self._store_entries(feed, job.parsed)
+                except Exception as e:
+                    logger.exception(f"Storing entries of feed {feed.id} failed: {e}")
+                    job.error = f"{type(e).__name__}: {e}"
+
+            if job.owns_trace:
+                job.trace.finish()
+            timings = job.trace.to_dict()
+
+            if job.error is not None:
+                self._record_failure(feed, job.error, timings)
+                return IngestResult(
+                    feed_id=feed.id,
+                    success=False,
+                    error=job.error,
+                    http_status=http_status,
+                    timings=timings,
+                    entries_count=entries_count,
+                )
+
+            self._record_success(feed, fetch_result, timings)
+
+        logger.info(
+            f"Ingested feed {feed.id}: {entries_created} new entries "
+            f"in {timings['total_seconds']:.2f}s"
+        )
+        return IngestResult(
+            feed_id=feed.id,
+            success=True,
+            entries_created=entries_created,
+            http_status=http_status,
+            timings=timings,
+            entries_count=entries_count,
+        )
+
+    def _store_entries(self, feed: FeedModel, parsed_entries: list[dict]) -> int:
+        """Store the new, allowed entries of a feed.
+
+        Returns:
+            Number of entries created
+        """
+        entries_created = 0
+        documents = []
+        for parsed in parsed_entries:
+            with span(STAGE_DEDUP):
+                duplicate = self.deduplicator.check_duplicate(
+                    parsed, self.entry_repo, feed_id=feed.id
+                )
+            if duplicate.is_duplicate:
+                continue
+
+            with span(STAGE_FILTER):
+                filter_result = self.filter_service.apply(parsed, self.filter_rule_repo)
+            if not filter_result.allowed:
+                continue
+
+            with span(STAGE_STORE):
+                entry = self.entry_repo.create(EntryCreate(**parsed))
+            with span(STAGE_INDEX):
+                self.deduplicator.index_entry(entry)
+                self.clustering.assign(entry)
+            documents.append(f"{entry.title or ''} {entry.content or entry.summary or ''}")
+            entries_created += 1
+
+        if documents:
+            with span(STAGE_INDEX):
+                self.keywords.record_documents(documents, self.session)
+        return entries_created
+
+    def _record_success(self, feed: FeedModel, result: FetchResult, timings: dict) -> None:
+        """Update the feed's fetch info and fill in missing metadata."""
+        self.feed_repo.update_fetch_info(
+            feed,
+            last_fetched_at=datetime.utcnow(),
+            reset_errors=True,
+            etag=result.etag,
+            last_modified=result.last_modified,
+            timings=timings,
+        )
+        if result.feed_info:
+            if result.feed_info.get("title") and not feed.name:
+                feed.name = result.feed_info["title"]
+            if result.feed_info.get("description") and not feed.description:
+                feed.description = result.feed_info["description"]
+
+    def _record_failure(self, feed: FeedModel, error: str, timings: dict) -> None:
+        """Count the error and disable feeds that keep failing."""
+        self.feed_repo.update_fetch_info(
+            feed,
+            last_fetched_at=datetime.utcnow(),
+            increment_error=True,
+            last_error=error,
+            timings=timings,
+        )
+        if feed.fetch_error_count >= get_config().feed.max_consecutive_errors:
+            logger.warning(f"Disabling feed due to errors: {feed.url}")
+            self.feed_repo.disable_feed(feed, reason=f"Too many errors: {error}")
+
+
+def _stage_threads(
+    name: str,
+    step: Callable[[_FeedJob], None],
+    workers: int,
+    inbox: queue.Queue,
+    outbox: queue.Queue,
+    downstream_workers: int,
+    cancelled: threading.Event,
+) -> list[threading.Thread]:
+    """Create the worker threads of one stage.
+
+    Each worker applies ``step`` to jobs from ``inbox`` and passes them on to
+    ``outbox``; jobs that already failed (or all jobs, once cancelled) are
+    passed on untouched. When the
+    last worker sees the end of the stream, it sends one end marker per
+    downstream worker.
+    """
+    remaining = [workers]
+    lock = threading.Lock()
+
+    def work():
+        while True:
+            job = inbox.get()
+            if job is _DONE:
+                break
+            if not cancelled.is_set():
+                _apply_step(step, job)
+            outbox.put(job)
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            for _ in range(downstream_workers):
+                outbox.put(_DONE)
+
+    return [
+        threading.Thread(target=work, name=f"{name}-{n}", daemon=True) for n in range(workers)
+    ]
+
+
+def _apply_step(step: Callable[[_FeedJob], None], job: _FeedJob) -> None:
+    """Run a fetch or parse step, recording an exception as the job's error."""
+    if job.error is not None:
+        return
+    try:
+        step(job)
+    except Exception as e:
+        logger.exception(f"Ingestion of {job.snapshot.url} failed: {e}")
+        job.error = f"{type(e).__name__}: {e}"
+
+
+def _store_in_writer(job: _FeedJob, session: Session) -> IngestResult:
+    """Run the store stage of a job on the group commit writer's session."""
+    pipeline = session.info.get(_WRITER_PIPELINE_KEY)
+    if pipeline is None:
+        pipeline = session.info[_WRITER_PIPELINE_KEY] = IngestionPipeline(
+            session, fetch_workers=0
+        )
+    feed = session.get(FeedModel, job.snapshot.id)
+    if feed is None:
+        return IngestResult(feed_id=job.snapshot.id, success=False, error="Feed not found")
+    return pipeline._store(replace(job, feed=feed))
+
+
+def _snapshot(feed: FeedModel) -> FeedModel:
+    """Copy the fields the fetcher reads into a detached FeedModel.
+
+    Worker threads must not touch session-bound instances: an expired
+    attribute would be lazy-loaded through the session from the wrong thread.
+    """
+    return FeedModel(
+        id=feed.id,
+        url=feed.url,
+        name=feed.name,
+        etag=feed.etag,
+        last_modified=feed.last_modified,
+        max_entries_per_fetch=feed.max_entries_per_fetch,
+        fetch_only_recent=feed.fetch_only_recent,
+    )
@@ -0,0 +1,259 @@
+"""
+Entry retention engine.
+
+Deletes entries past their retention period in bounded ID-range chunks,
+each in its own short transaction with a pause in between, so fetch workers
+are never blocked for long on SQLite's single write lock. Afterwards the
+freed pages are returned to the filesystem with an incremental (or, in
+``full`` mode, a complete) VACUUM.
+
+Retention periods are resolved per feed: the feed's own ``retention_days``,
+else the longest ``retention_days`` of its categories, else
+``RETENTION_DEFAULT_DAYS``. A period of 0 keeps entries forever.
+"""
+
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from spider_aggregation.config import get_config
+from spider_aggregation.logger import get_logger
+from spider_aggregation.models import CategoryModel, EntryModel, FeedModel, feed_categories
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+
+logger = get_logger(__name__)
+
+# SQLite PRAGMA auto_vacuum value of INCREMENTAL mode
+SQLITE_AUTO_VACUUM_INCREMENTAL = 2
+
+
+@dataclass
+class RetentionPolicy:
+    """Feeds sharing a retention period."""
+
+    days: int
+    feed_ids: list[int] = field(default_factory=list)
+
+
+@dataclass
+class RetentionResult:
+    """Outcome of a retention run."""
+
+    deleted: int = 0
+    chunks: int = 0
+    policies: int = 0
+    reclaimed_bytes: int = 0
+    duration_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Convert the result to a dictionary for API responses."""
+        return {
+            "deleted_count": self.deleted,
+            "chunks": self.chunks,
+            "policies": self.policies,
+            "reclaimed_bytes": self.reclaimed_bytes,
+            "duration_seconds": round(self.duration_seconds, 3),
+        }
+
+
+class RetentionEngine:
+    """Apply entry retention policies in chunks and reclaim disk space."""
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        default_days: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        pause_seconds: Optional[float] = None,
+        vacuum: Optional[str] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            db_manager: Database manager (a session is opened per chunk)
+            default_days: Retention of feeds without a policy (defaults to config)
+            chunk_size: Entries deleted per transaction (defaults to config)
+            pause_seconds: Pause between chunks (defaults to config)
+            vacuum: SQLite space reclamation: none/incremental/full (defaults to config)
+            sleep: Sleep function (injectable for tests)
+        """
+        retention_config = get_config().retention
+
+        self.db_manager = db_manager
+        self.default_days = (
+            default_days if default_days is not None else retention_config.default_days
+        )
+        self.chunk_size = chunk_size or retention_config.chunk_size
+        self.pause_seconds = (
+            pause_seconds if pause_seconds is not None else retention_config.pause_seconds
+        )
+        self.vacuum = vacuum or retention_config.vacuum
+        self._sleep = sleep
+
+    def resolve_policies(self, session: Session) -> list[RetentionPolicy]:
+        """Resolve the effective retention period of every feed.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Policies grouping feeds by retention days (feeds kept forever omitted)
+        """
+        category_days: dict[int, int] = {}
+        rows = (
+            session.query(feed_categories.c.feed_id, CategoryModel.retention_days)
+            .join(CategoryModel, CategoryModel.id == feed_categories.c.category_id)
+            .filter(CategoryModel.retention_days.isnot(None))
+            .all()
+        )
+        for feed_id, days in rows:
+            # The most generous category wins so no category loses entries it keeps
+            category_days[feed_id] = max(days, category_days.get(feed_id, 0))
+
+        policies: dict[int, RetentionPolicy] = {}
+        for feed_id, feed_days in session.query(FeedModel.id, FeedModel.retention_days).all():
+            if feed_days is not None:
+                days = feed_days
+            else:
+                days = category_days.get(feed_id, self.default_days)
+            if days > 0:
+                policies.setdefault(days, RetentionPolicy(days=days)).feed_ids.append(feed_id)
+
+        return [policies[days] for days in sorted(policies)]
+
+    def run(self, now: Optional[datetime] = None) -> RetentionResult:
+        """Apply all retention policies, then reclaim the freed space.
+
+        Args:
+            now: Reference time (defaults to the current UTC time)
+
+        Returns:
+            RetentionResult
+        """
+        started = time.monotonic()
+        now = now or datetime.utcnow()
+
+        with self.db_manager.session() as session:
+            policies = self.resolve_policies(session)
+
+        result = RetentionResult(policies=len(policies))
+        for policy in policies:
+            cutoff = now - timedelta(days=policy.days)
+            self._purge(
+                [EntryModel.fetched_at < cutoff, EntryModel.feed_id.in_(policy.feed_ids)], result
+            )
+
+        if result.deleted:
+            result.reclaimed_bytes = self.reclaim_space()
+
+        result.duration_seconds = time.monotonic() - started
+        logger.info(
+            f"Retention removed {result.deleted} entries in {result.chunks} chunks "
+            f"({len(policies)} policies), reclaimed {result.reclaimed_bytes} bytes"
+        )
+        return result
+
+    def purge_older_than(
+        self, days: int, feed_id: Optional[int] = None, now: Optional[datetime] = None
+    ) -> RetentionResult:
+        """Delete entries fetched more than ``days`` ago regardless of policies.
+
+        Args:
+            days: Number of days to keep
+            feed_id: Optional feed ID filter
+            now: Reference time (defaults to the current UTC time)
+
+        Returns:
+            RetentionResult
+        """
+        started = time.monotonic()
+        cutoff = (now or datetime.utcnow()) - timedelta(days=days)
+
+        criteria = [EntryModel.fetched_at < cutoff]
+        if feed_id is not None:
+            criteria.append(EntryModel.feed_id == feed_id)
+
+        result = RetentionResult(policies=1)
+        self._purge(criteria, result)
+        if result.deleted:
+            result.reclaimed_bytes = self.reclaim_space()
+
+        result.duration_seconds = time.monotonic() - started
+        return result
+
+    def _purge(self, criteria: list, result: RetentionResult) -> None:
+        """Delete matching entries chunk by chunk, one transaction per chunk.
+
+        Args:
+            criteria: SQLAlchemy filter expressions on EntryModel
+            result: Result whose counters are updated
+        """
+        while True:
+            with self.db_manager.session() as session:
+                deleted = EntryRepository(session).delete_chunk(
+                    *criteria, chunk_size=self.chunk_size
+                )
+            if not deleted:
+                return
+
+            result.deleted += deleted
+            result.chunks += 1
+            if deleted < self.chunk_size:
+                return
+            # Let waiting writers take the lock between chunks
+            self._sleep(self.pause_seconds)
+
+    def reclaim_space(self) -> int:
+        """Return free database pages to the filesystem (SQLite only).
+
+        ``incremental`` runs ``PRAGMA incremental_vacuum`` on databases in
+        incremental auto-vacuum mode (new databases are created in it).
+        ``full`` switches the database to incremental auto-vacuum and runs a
+        complete ``VACUUM``; it rewrites the whole file, so it belongs in an
+        idle window.
+
+        Returns:
+            Number of bytes the database shrank by
+        """
+        engine = self.db_manager.engine
+        if engine.dialect.name != "sqlite" or self.vacuum == "none":
+            return 0
+
+        # The driver connection autocommits outside transactions (see
+        # SQLiteDialect.setup_engine_events), which VACUUM requires
+        conn = engine.raw_connection()
+        cursor = conn.cursor()
+
+        def pragma(statement: str):
+            return cursor.execute(f"PRAGMA {statement}").fetchone()[0]
+
+        try:
+            page_size = pragma("page_size")
+            pages_before = pragma("page_count")
+
+            if self.vacuum == "full":
+                cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                cursor.execute("VACUUM")
+            else:
+                if pragma("auto_vacuum") != SQLITE_AUTO_VACUUM_INCREMENTAL:
+                    logger.info(
+                        "Database is not in incremental auto-vacuum mode; set "
+                        "RETENTION_VACUUM=full once to convert it"
+                    )
+                    return 0
+                # Each step of the pragma frees one page, so run it to completion
+                cursor.execute("PRAGMA incremental_vacuum").fetchall()
+
+            # Shrink the file itself, not just the logical page count, in WAL mode
+            cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+            pages_after = pragma("page_count")
+        finally:
+            cursor.close()
+            conn.close()
+
+        return max(pages_before - pages_after, 0) * page_size
@@ -7,7 +7,7 @@ Uses Pydantic for validation and pydantic-settings for environment variable supp
 from pathlib import Path
 from typing import Optional
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -56,6 +56,36 @@ class DatabaseConfig(BaseSettings):
     pool_size: int = Field(default=5, ge=1, le=100, description="Connection pool size")
     max_overflow: int = Field(default=10, ge=0, description="Max overflow connections")
 
+    # SQLite connection tuning (see storage.dialects.sqlite.SQLITE_PROFILES).
+    # "durable" keeps SQLite's synchronous=FULL; "balanced" is much faster but a
+    # power loss can drop the last commits, so it is opt-in
+    sqlite_profile: str = Field(
+        default="durable", description="SQLite PRAGMA profile: durable/balanced/throughput"
+    )
+    busy_timeout_ms: int = Field(
+        default=30000, ge=0, description="Milliseconds to wait for the SQLite write lock"
+    )
+
+    # SQLite group commits (see spider_aggregation.storage.group_commit)
+    group_commit: bool = Field(
+        default=True, description="Serialize ingestion writes through one writer thread (SQLite)"
+    )
+    group_commit_max_rows: int = Field(
+        default=500, ge=1, le=100000, description="Rows after which a group is committed"
+    )
+    group_commit_max_delay_ms: int = Field(
+        default=50, ge=0, le=10000, description="Milliseconds after which a group is committed"
+    )
+
+    # Compression of new entry bodies (see spider_aggregation.utils.compression).
+    # Only SQLite can decompress bodies in SQL (content search, digest excerpts),
+    # so compression is SQLite-only: default zlib there, none (required) elsewhere
+    body_codec: str | None = Field(
+        default=None,
+        description="Entry body compression: none, zlib, zstd (Python 3.14+; SQLite only); "
+        "default zlib on SQLite, none otherwise",
+    )
+
     @field_validator("type")
     @classmethod
     def normalize_type(cls, v: str) -> str:
@@ -74,6 +104,43 @@ class DatabaseConfig(BaseSettings):
             raise ValueError(f"Invalid database type: {v!r}. Must be one of {valid_types}")
         return v
 
+    @field_validator("sqlite_profile")
+    @classmethod
+    def validate_sqlite_profile(cls, v: str) -> str:
+        """Validate SQLite profile name."""
+        v = v.lower().strip()
+        valid_profiles = ["durable", "balanced", "throughput"]
+        if v not in valid_profiles:
+            raise ValueError(f"Invalid SQLite profile: {v!r}. Must be one of {valid_profiles}")
+        return v
+
+    @field_validator("body_codec")
+    @classmethod
+    def validate_body_codec(cls, v: str | None) -> str | None:
+        """Validate entry body codec (None picks the database's default)."""
+        if v is None:
+            return None
+        v = v.lower().strip()
+        valid_codecs = ["none", "zlib", "zstd"]
+        if v not in valid_codecs:
+            raise ValueError(f"Invalid body codec: {v!r}. Must be one of {valid_codecs}")
+        return v
+
+    @model_validator(mode="after")
+    def resolve_body_codec(self) -> "DatabaseConfig":
+        """Compress bodies only where SQL can decompress them (SQLite).
+
+        Other databases would read compressed bodies as NULL, so content
+        search and digest excerpts would silently miss them.
+        """
+        if self.body_codec is None:
+            self.body_codec = "zlib" if self.type == "sqlite" else "none"
+        elif self.body_codec != "none" and self.type != "sqlite":
+            raise ValueError(
+                f"Body codec {self.body_codec!r} requires SQLite; use 'none' on {self.type}"
+            )
+        return self
+
     @field_validator("path")
     @classmethod
     def ensure_directory_exists(cls, v: str) -> str:
@@ -129,6 +196,16 @@ class SchedulerConfig(BaseSettings):
     max_retries: int = Field(default=3, ge=0, le=10, description="Maximum retry attempts")
     retry_backoff_seconds: int = Field(default=60, ge=1, description="Retry backoff in seconds")
 
+    # Maintenance jobs
+    stats_reconcile_interval_hours: int = Field(
+        default=24, ge=0, description="Statistics rollup reconciliation interval (0 disables)"
+    )
+    db_maintenance_interval_minutes: int = Field(
+        default=60,
+        ge=0,
+        description="Database optimize/WAL checkpoint interval (0 disables)",
+    )
+
 
 class FetcherConfig(BaseSettings):
     """RSS/Atom fetcher configuration."""
@@ -170,6 +247,10 @@ class DeduplicatorConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="DEDUP_")
 
     enabled: bool = Field(default=True, description="Enable deduplication")
+    strategy: str = Field(
+        default="medium",
+        description="Deduplication strategy (strict, medium, relaxed, near_duplicate)",
+    )
 
     # Hash methods: md5, sha256
     link_hash_method: str = Field(default="sha256", description="Hash method for links")
@@ -186,6 +267,59 @@ class DeduplicatorConfig(BaseSettings):
     check_by_title: bool = Field(default=True, description="Deduplicate by title similarity")
     check_by_content: bool = Field(default=False, description="Deduplicate by content hash")
 
+    # Near-duplicate index (MinHash LSH)
+    minhash_permutations: int = Field(
+        default=64, ge=8, le=512, description="MinHash signature length"
+    )
+    lsh_bands: int = Field(
+        default=16, ge=1, le=512, description="LSH bands (must divide minhash_permutations)"
+    )
+    lsh_max_candidates: int = Field(
+        default=50, ge=1, le=1000, description="Maximum candidates verified per lookup"
+    )
+    near_duplicate_across_feeds: bool = Field(
+        default=True,
+        description="Probe near duplicates in all feeds (syndicated copies), not just the feed",
+    )
+
+    @field_validator("strategy")
+    @classmethod
+    def validate_strategy(cls, v: str) -> str:
+        """Validate deduplication strategy."""
+        valid_strategies = {"strict", "medium", "relaxed", "near_duplicate"}
+        if v.lower() not in valid_strategies:
+            raise ValueError(f"Invalid strategy: {v}. Must be one of {valid_strategies}")
+        return v.lower()
+
+    @model_validator(mode="after")
+    def validate_lsh_bands(self) -> "DeduplicatorConfig":
+        """Validate that the MinHash signature splits evenly into LSH bands."""
+        if self.minhash_permutations % self.lsh_bands:
+            raise ValueError(
+                f"minhash_permutations ({self.minhash_permutations}) must be divisible "
+                f"by lsh_bands ({self.lsh_bands})"
+            )
+        return self
+
+
+class ClusteringConfig(BaseSettings):
+    """Cross-feed story clustering configuration."""
+
+    model_config = SettingsConfigDict(env_prefix="CLUSTER_")
+
+    # Clustering indexes every new entry in the near-duplicate index tables,
+    # whatever deduplicator.strategy is
+    enabled: bool = Field(default=True, description="Group related entries into story clusters")
+    similarity_threshold: float = Field(
+        default=0.5, ge=0.0, le=1.0, description="Minimum similarity to join a cluster"
+    )
+    window_hours: int = Field(
+        default=48, ge=1, le=720, description="Only cluster with entries indexed within N hours"
+    )
+    max_candidates: int = Field(
+        default=50, ge=1, le=1000, description="Maximum candidates compared per entry"
+    )
+
 
 class LoggingConfig(BaseSettings):
     """Logging configuration."""
@@ -281,6 +415,25 @@ class KeywordExtractorConfig(BaseSettings):
     max_keywords: int = Field(default=10, ge=1, le=50, description="Maximum keywords to extract")
     min_keyword_length: int = Field(default=2, ge=1, description="Minimum keyword length")
     language: str = Field(default="auto", description="Language: auto, en, zh")
+    nltk_download: bool = Field(
+        default=False,
+        description="Download missing NLTK data on first use (needs network access)",
+    )
+    lemma_cache_size: int = Field(
+        default=50000, ge=0, description="Tokens whose lemma is cached process-wide"
+    )
+    preload: bool = Field(
+        default=True,
+        description="Load NLP resources and jieba's dictionary in the background on startup",
+    )
+    corpus_stats: bool = Field(
+        default=True, description="Count ingested entries in the BM25 corpus statistics"
+    )
+    corpus_min_documents: int = Field(
+        default=20,
+        ge=0,
+        description="Documents per language needed before keywords are scored with BM25",
+    )
 
 
 class SummarizerConfig(BaseSettings):
@@ -289,9 +442,12 @@ class SummarizerConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="SUMMARIZER_")
 
     enabled: bool = Field(default=True, description="Enable summarization")
-    method: str = Field(default="extractive", description="Method: extractive or ai")
+    method: str = Field(default="extractive", description="Method: extractive, textrank or ai")
     max_sentences: int = Field(default=3, ge=1, le=10, description="Maximum sentences in summary")
     min_sentence_length: int = Field(default=10, ge=5, description="Minimum sentence length")
+    textrank_top_k: int = Field(
+        default=10, ge=1, le=100, description="Most similar sentences linked per sentence"
+    )
 
     # AI summarization (optional)
     ai_model: str = Field(default="gpt-3.5-turbo", description="OpenAI model for summarization")
@@ -312,6 +468,30 @@ class LLMConfig(BaseSettings):
     max_tokens: int = Field(default=1000, ge=100, le=4000, description="Max tokens per request")
     timeout_seconds: int = Field(default=60, ge=10, le=300, description="Request timeout")
 
+    # Request scheduling for batch jobs (0 disables a budget)
+    max_concurrency: int = Field(default=4, ge=1, le=64, description="Max concurrent requests")
+    requests_per_minute: int = Field(default=60, ge=0, description="Request budget per minute")
+    tokens_per_minute: int = Field(default=100000, ge=0, description="Token budget per minute")
+    max_retries: int = Field(default=3, ge=0, le=10, description="Retries after rate limiting")
+    retry_backoff_seconds: float = Field(
+        default=2.0, ge=0.0, le=60.0, description="Initial backoff after rate limiting"
+    )
+
+
+class LLMCacheConfig(BaseSettings):
+    """Persistent cache of LLM responses keyed by prompt fingerprint."""
+
+    model_config = SettingsConfigDict(env_prefix="LLM_CACHE_")
+
+    enabled: bool = Field(default=True, description="Cache LLM responses on disk")
+    path: str = Field(default="data/llm_cache.db", description="SQLite cache file path")
+    ttl_hours: int = Field(
+        default=168, ge=1, le=8760, description="Discard cached responses older than N hours"
+    )
+    max_entries: int = Field(
+        default=5000, ge=1, description="Evict least recently used responses beyond N entries"
+    )
+
 
 class EmailConfig(BaseSettings):
     """Email configuration for digest delivery.
@@ -354,6 +534,71 @@ class DigestConfig(BaseSettings):
     # Aggregation mode: aggregate (all feeds in one summary) or individual (per-feed summary)
     mode: str = Field(default="aggregate", description="Mode: aggregate or individual")
     subject_prefix: str = Field(default="[MindWeaver]", description="Email subject prefix")
+    # Map-reduce summarization: articles are packed into prompts of at most
+    # token_budget estimated tokens, summarized in parallel, then merged
+    token_budget: int = Field(
+        default=6000, ge=500, le=128000, description="Max estimated prompt tokens per LLM call"
+    )
+    max_concurrency: int = Field(
+        default=4, ge=1, le=32, description="Max concurrent LLM calls for chunk summaries"
+    )
+
+
+class RetentionConfig(BaseSettings):
+    """Entry retention and database space reclamation."""
+
+    model_config = SettingsConfigDict(env_prefix="RETENTION_")
+
+    enabled: bool = Field(default=True, description="Run the scheduled retention job")
+    default_days: int = Field(
+        default=0, ge=0, description="Days to keep entries without a feed policy (0=forever)"
+    )
+    schedule: str = Field(
+        default="30 3 * * *", description="Cron expression of the retention job (an idle window)"
+    )
+    chunk_size: int = Field(
+        default=500, ge=1, le=10000, description="Entries deleted per transaction"
+    )
+    pause_seconds: float = Field(
+        default=0.05, ge=0, description="Pause between chunks so other writers can run"
+    )
+    vacuum: str = Field(
+        default="incremental", description="SQLite space reclamation: none/incremental/full"
+    )
+
+    @field_validator("vacuum")
+    @classmethod
+    def validate_vacuum(cls, v: str) -> str:
+        """Validate vacuum mode."""
+        v = v.lower().strip()
+        valid_modes = ["none", "incremental", "full"]
+        if v not in valid_modes:
+            raise ValueError(f"Invalid vacuum mode: {v!r}. Must be one of {valid_modes}")
+        return v
+
+
+class IngestionConfig(BaseSettings):
+    """Ingestion pipeline stage concurrency and queue bounds."""
+
+    model_config = SettingsConfigDict(env_prefix="INGESTION_")
+
+    fetch_workers: int = Field(
+        default=4, ge=0, le=32, description="Concurrent feed downloads (0=run inline)"
+    )
+    parse_workers: int = Field(default=2, ge=1, le=16, description="Concurrent entry parsers")
+    queue_size: int = Field(
+        default=8, ge=1, le=256, description="Feeds buffered between two stages"
+    )
+    sweep_batch_size: int = Field(
+        default=10, ge=1, le=500, description="Feeds committed per transaction by fetch-all jobs"
+    )
+    sweep_stale_minutes: int = Field(
+        default=30, ge=1, description="Minutes without progress before a running job is abandoned"
+    )
+    persist_text_analysis: bool = Field(
+        default=False,
+        description="Store the compact text analysis of new entries (reused by batch summaries)",
+    )
 
 
 class FilterConfig(BaseSettings):
@@ -388,6 +633,7 @@ class Config(BaseSettings):
     scheduler: SchedulerConfig = Field(default_factory=SchedulerConfig)
     fetcher: FetcherConfig = Field(default_factory=FetcherConfig)
     deduplicator: DeduplicatorConfig = Field(default_factory=DeduplicatorConfig)
+    clustering: ClusteringConfig = Field(default_factory=ClusteringConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     feed: FeedConfig = Field(default_factory=FeedConfig)
     web: WebConfig = Field(default_factory=WebConfig)
@@ -396,8 +642,11 @@ class Config(BaseSettings):
     summarizer: SummarizerConfig = Field(default_factory=SummarizerConfig)
     filter: FilterConfig = Field(default_factory=FilterConfig)
     llm: LLMConfig = Field(default_factory=LLMConfig)
+    llm_cache: LLMCacheConfig = Field(default_factory=LLMCacheConfig)
     email: EmailConfig = Field(default_factory=EmailConfig)
     digest: DigestConfig = Field(default_factory=DigestConfig)
+    retention: RetentionConfig = Field(default_factory=RetentionConfig)
+    ingestion: IngestionConfig = Field(default_factory=IngestionConfig)
 
     # Paths
     config_dir: str = Field(default="config", description="Configuration directory")
@@ -458,6 +707,7 @@ def load_config_from_yaml(yaml_path: str) -> Config:
             "scheduler",
             "fetcher",
             "deduplicator",
+            "clustering",
             "logging",
             "feed",
             "web",
@@ -466,8 +716,11 @@ def load_config_from_yaml(yaml_path: str) -> Config:
             "summarizer",
             "filter",
             "llm",
+            "llm_cache",
             "email",
             "digest",
+            "retention",
+            "ingestion",
         ]:
             nested_configs[key] = value
         else:
@@ -479,6 +732,7 @@ def load_config_from_yaml(yaml_path: str) -> Config:
         "scheduler": SchedulerConfig,
         "fetcher": FetcherConfig,
         "deduplicator": DeduplicatorConfig,
+        "clustering": ClusteringConfig,
         "logging": LoggingConfig,
         "feed": FeedConfig,
         "web": WebConfig,
@@ -487,8 +741,11 @@ def load_config_from_yaml(yaml_path: str) -> Config:
         "summarizer": SummarizerConfig,
         "filter": FilterConfig,
         "llm": LLMConfig,
+        "llm_cache": LLMCacheConfig,
         "email": EmailConfig,
         "digest": DigestConfig,
+        "retention": RetentionConfig,
+        "ingestion": IngestionConfig,
     }
 
     for key, config_class in config_classes.items():
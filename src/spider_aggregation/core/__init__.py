@@ -26,6 +26,7 @@ Available Services:
     - FetcherService: HTTP feed fetching
     - ParserService: Content parsing
     - DeduplicatorService: Duplicate detection
+    - ClusteringService: Cross-feed story clustering
     - FilterService: Content filtering
     - SchedulerService: Task scheduling
     - ContentService: Full content fetching
@@ -35,6 +36,7 @@ Available Services:
 
 # Service Facades (ONLY public interface for external code)
 from spider_aggregation.core.services import (
+    ClusteringService,
     ContentService,
     DeduplicatorService,
     FetcherService,
@@ -43,6 +45,7 @@ from spider_aggregation.core.services import (
     ParserService,
     SchedulerService,
     SummarizerService,
+    create_clustering_service,
     create_content_service,
     create_deduplicator_service,
     create_fetcher_service,
@@ -59,16 +62,21 @@ from spider_aggregation.core.deduplicator import DedupResult
 from spider_aggregation.core.filter_engine import FilterResult
 from spider_aggregation.core.content_fetcher import ContentFetchResult
 from spider_aggregation.core.summarizer import SummaryResult
+from spider_aggregation.core.text_analysis import TextAnalysis, analyze_text
 
 # Enum types (allowed for configuration)
 from spider_aggregation.core.deduplicator import DedupStrategy
 from spider_aggregation.core.scheduler import JobStatus
 
+# Startup helpers
+from spider_aggregation.core.warmup import warm_up
+
 __all__ = [
     # Service Facades (USE THESE)
     "FetcherService",
     "ParserService",
     "DeduplicatorService",
+    "ClusteringService",
     "FilterService",
     "SchedulerService",
     "ContentService",
@@ -78,6 +86,7 @@ __all__ = [
     "create_fetcher_service",
     "create_parser_service",
     "create_deduplicator_service",
+    "create_clustering_service",
     "create_filter_service",
     "create_scheduler_service",
     "create_content_service",
@@ -90,9 +99,13 @@ __all__ = [
     "FilterResult",
     "ContentFetchResult",
     "SummaryResult",
+    "TextAnalysis",
+    "analyze_text",
     # Enum types (for configuration)
     "DedupStrategy",
     "JobStatus",
+    # Startup helpers
+    "warm_up",
 ]
 
 
@@ -103,6 +116,7 @@ _forbidden_imports = {
     "ContentParser": "Use ParserService instead",
     "FeedMetadataParser": "Use ParserService instead",
     "Deduplicator": "Use DeduplicatorService instead",
+    "StoryClusterer": "Use ClusteringService instead",
     "FilterEngine": "Use FilterService instead",
     "FeedScheduler": "Use SchedulerService instead",
     "ContentFetcher": "Use ContentService instead",
@@ -0,0 +1,158 @@
+"""
+Cross-feed story clustering.
+
+Groups entries that report the same story into clusters as they are stored.
+Each new entry is compared only against recent entries sharing an LSH band
+key (see the near-duplicate index), so assignment cost does not grow with the
+size of the entries table and clusters never need a global recompute.
+
+A cluster is identified by the ID of its first entry (the representative);
+every member stores that ID in ``EntryModel.cluster_id``.
+
+Assigning an entry indexes it (MinHash signature and LSH band rows) if the
+near_duplicate deduplication strategy has not already done so, whatever
+strategy is configured; disable clustering to avoid these writes.
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from spider_aggregation.config import get_config
+from spider_aggregation.logger import get_logger
+from spider_aggregation.models import EntryModel
+from spider_aggregation.storage.repositories.signature_repo import EntrySignatureRepository
+from spider_aggregation.utils.hash_utils import (
+    compute_entry_signature,
+    compute_lsh_bands,
+    estimate_jaccard,
+)
+
+logger = get_logger(__name__)
+
+
+class StoryClusterer:
+    """Incremental story clusterer backed by the MinHash LSH index."""
+
+    def __init__(
+        self,
+        session: Session,
+        similarity_threshold: Optional[float] = None,
+        window_hours: Optional[int] = None,
+        max_candidates: Optional[int] = None,
+    ):
+        """Initialize story clusterer.
+
+        Args:
+            session: Database session
+            similarity_threshold: Minimum estimated Jaccard similarity to join a cluster
+            window_hours: Only entries indexed within this many hours are candidates
+            max_candidates: Maximum number of candidates compared per entry
+        """
+        config = get_config()
+
+        self.session = session
+        self.similarity_threshold = (
+            similarity_threshold
+            if similarity_threshold is not None
+            else config.clustering.similarity_threshold
+        )
+        self.window_hours = window_hours or config.clustering.window_hours
+        self.max_candidates = max_candidates or config.clustering.max_candidates
+        self.minhash_permutations = config.deduplicator.minhash_permutations
+        self.lsh_bands = config.deduplicator.lsh_bands
+
+        self.signature_repo = EntrySignatureRepository(session)
+
+        # Statistics
+        self.stats = {"assigned": 0, "joined": 0, "created": 0}
+
+    def _get_signature(self, entry: EntryModel) -> Optional[list[int]]:
+        """Get the indexed signature of an entry, indexing it if needed.
+
+        Args:
+            entry: Persisted EntryModel instance
+
+        Returns:
+            MinHash signature, or None if the entry has no text
+        """
+        signature = self.signature_repo.get(entry.id)
+        if signature is not None:
+            return signature
+
+        signature = compute_entry_signature(
+            entry.title, entry.content or entry.summary, num_perm=self.minhash_permutations
+        )
+        if signature is None:
+            return None
+
+        self.signature_repo.save(
+            entry_id=entry.id,
+            feed_id=entry.feed_id,
+            signature=signature,
+            bands=compute_lsh_bands(signature, bands=self.lsh_bands),
+        )
+        return signature
+
+    def assign(self, entry: EntryModel) -> Optional[int]:
+        """Assign a newly stored entry to a story cluster.
+
+        The entry joins the cluster of its most similar recent candidate
+        above the threshold; otherwise it starts a new cluster of its own.
+
+        Args:
+            entry: Persisted EntryModel instance
+
+        Returns:
+            Cluster ID, or None if the entry has no text to compare
+        """
+        if entry.cluster_id is not None:
+            return entry.cluster_id
+
+        signature = self._get_signature(entry)
+        if signature is None:
+            return None
+
+        since = datetime.utcnow() - timedelta(hours=self.window_hours)
+        candidates = self.signature_repo.find_candidates(
+            compute_lsh_bands(signature, bands=self.lsh_bands),
+            exclude_entry_id=entry.id,
+            limit=self.max_candidates,
+            since=since,
+        )
+
+        best_id, best_similarity = None, 0.0
+        for candidate_id, _, candidate_signature in candidates:
+            similarity = estimate_jaccard(signature, candidate_signature)
+            if similarity > best_similarity:
+                best_id, best_similarity = candidate_id, similarity
+
+        match = None
+        if best_id is not None and best_similarity >= self.similarity_threshold:
+            match = self.session.get(EntryModel, best_id)
+
+        if match is not None:
+            # Entries stored before clustering was enabled start their own cluster
+            if match.cluster_id is None:
+                match.cluster_id = match.id
+            entry.cluster_id = match.cluster_id
+            self.stats["joined"] += 1
+            logger.debug(
+                f"Entry {entry.id} joined cluster {entry.cluster_id} ({best_similarity:.2f})"
+            )
+        else:
+            entry.cluster_id = entry.id
+            self.stats["created"] += 1
+
+        self.stats["assigned"] += 1
+        self.session.flush()
+        return entry.cluster_id
+
+    def get_stats(self) -> dict:
+        """Get clustering statistics.
+
+        Returns:
+            Dictionary with clustering stats
+        """
+        return self.stats.copy()
@@ -4,26 +4,23 @@ Content fetcher for extracting full article content from URLs.
 Uses trafilatura as primary extractor with readability-lxml as fallback.
 """
 
+import importlib.util
 import re
 from dataclasses import dataclass
 from typing import Optional
 from urllib.parse import urlparse
 
 import httpx
-from readability.readability import Document
 
 from spider_aggregation.config import get_config
 from spider_aggregation.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Try to import trafilatura
-try:
-    import trafilatura
-
-    TRAFILATURA_AVAILABLE = True
-except ImportError:
-    TRAFILATURA_AVAILABLE = False
+# trafilatura and readability-lxml are imported on first extraction: together
+# they take a few hundred milliseconds, paid by every process importing core
+TRAFILATURA_AVAILABLE = importlib.util.find_spec("trafilatura") is not None
+if not TRAFILATURA_AVAILABLE:
     logger.warning("trafilatura not available, using readability-lxml only")
 
 
@@ -149,6 +146,8 @@ class ContentFetcher:
         if not TRAFILATURA_AVAILABLE:
             return ContentFetchResult(success=False, error="trafilatura not available")
 
+        import trafilatura
+
         try:
             # Extract content
             content = trafilatura.extract(
@@ -187,6 +186,8 @@ class ContentFetcher:
         Returns:
             ContentFetchResult with extracted content
         """
+        from readability.readability import Document
+
         try:
             doc = Document(html, url=url)
 
@@ -5,6 +5,7 @@ Detects and prevents duplicate entries using multiple strategies:
 - Link-based deduplication (exact URL matching)
 - Title-based deduplication (exact/similar title matching)
 - Content-based deduplication (fingerprint matching)
+- Near-duplicate detection (MinHash signatures with an LSH band index)
 """
 
 from enum import Enum
@@ -14,13 +15,17 @@ from sqlalchemy.orm import Session
 
 from spider_aggregation.config import get_config
 from spider_aggregation.logger import get_logger
+from spider_aggregation.metrics import DEDUP_CHECKS, DEDUP_HITS
 from spider_aggregation.models import EntryModel
 from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+from spider_aggregation.storage.repositories.signature_repo import EntrySignatureRepository
 from spider_aggregation.utils.hash_utils import (
     compute_content_hash,
+    compute_entry_signature,
     compute_link_hash,
-    compute_similarity_hash,
+    compute_lsh_bands,
     compute_title_hash,
+    estimate_jaccard,
 )
 
 logger = get_logger(__name__)
@@ -32,6 +37,7 @@ class DedupStrategy(str, Enum):
     STRICT = "strict"  # Match on link, title, AND content
     MEDIUM = "medium"  # Match on link OR (title AND content)
     RELAXED = "relaxed"  # Match on link OR title
+    NEAR_DUPLICATE = "near_duplicate"  # Match on link OR title OR similar title+content
 
 
 class DedupResult:
@@ -42,6 +48,7 @@ class DedupResult:
         is_duplicate: bool,
         reason: Optional[str] = None,
         existing_entry: Optional[EntryModel] = None,
+        similarity: Optional[float] = None,
     ):
         """Initialize deduplication result.
 
@@ -49,10 +56,12 @@ class DedupResult:
             is_duplicate: Whether the entry is a duplicate
             reason: Reason for deduplication decision
             existing_entry: The existing duplicate entry (if found)
+            similarity: Estimated similarity for near-duplicate matches
         """
         self.is_duplicate = is_duplicate
         self.reason = reason
         self.existing_entry = existing_entry
+        self.similarity = similarity
 
     def __repr__(self) -> str:
         return f"DedupResult(is_duplicate={self.is_duplicate}, reason={self.reason})"
@@ -75,20 +84,44 @@ class Deduplicator:
         config = get_config()
 
         self.session = session
-        self.strategy = strategy or config.deduplicator.strategy
+        self.strategy = DedupStrategy(strategy or config.deduplicator.strategy)
         self.enable_title_check = config.deduplicator.check_by_title
         self.enable_content_check = config.deduplicator.check_by_content
         self.similarity_threshold = config.deduplicator.title_similarity_threshold
+        self.minhash_permutations = config.deduplicator.minhash_permutations
+        self.lsh_bands = config.deduplicator.lsh_bands
+        self.lsh_max_candidates = config.deduplicator.lsh_max_candidates
+        self.near_duplicate_across_feeds = config.deduplicator.near_duplicate_across_feeds
+
+        # Last (link_hash, signature) computed during a check, reused by index_entry
+        self._last_signature: Optional[tuple[str, list[int]]] = None
 
         # Statistics
-        self.stats = {
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> dict:
+        """Create an empty statistics dictionary."""
+        return {
             "checks": 0,
             "duplicates_found": 0,
             "link_matches": 0,
             "title_matches": 0,
             "content_matches": 0,
+            "near_duplicate_matches": 0,
         }
 
+    def _count_match(self, *fields: str) -> None:
+        """Count a duplicate found by matching the given fields.
+
+        Args:
+            *fields: Matched fields (link, title, content or near_duplicate)
+        """
+        self.stats["duplicates_found"] += 1
+        for name in fields:
+            self.stats[f"{name}_matches"] += 1
+        DEDUP_HITS.labels(strategy=self.strategy.value, match="_".join(fields)).inc()
+
     def check_duplicate(
         self,
         entry: dict,
@@ -96,6 +129,10 @@ class Deduplicator:
     ) -> DedupResult:
         """Check if an entry is a duplicate.
 
+        Exact matches are looked up within the feed. The near-duplicate probe
+        covers all feeds unless ``deduplicator.near_duplicate_across_feeds``
+        is disabled.
+
         Args:
             entry: Parsed entry dictionary
             feed_id: Feed ID to check within
@@ -104,6 +141,7 @@ class Deduplicator:
             DedupResult with duplicate status
         """
         self.stats["checks"] += 1
+        DEDUP_CHECKS.labels(strategy=self.strategy.value).inc()
 
         if not self.session:
             logger.debug("No database session - skipping duplicate check")
@@ -120,8 +158,7 @@ class Deduplicator:
         if link_hash:
             existing = repo.get_by_link_hash(link_hash, feed_id)
             if existing:
-                self.stats["duplicates_found"] += 1
-                self.stats["link_matches"] += 1
+                self._count_match("link")
                 logger.info(f"Duplicate found by link: {entry.get('link')}")
                 return DedupResult(
                     is_duplicate=True,
@@ -135,9 +172,7 @@ class Deduplicator:
             if title_hash and content_hash:
                 existing = repo.get_by_title_and_content(title_hash, content_hash, feed_id)
                 if existing:
-                    self.stats["duplicates_found"] += 1
-                    self.stats["title_matches"] += 1
-                    self.stats["content_matches"] += 1
+                    self._count_match("title", "content")
                     logger.info(f"Duplicate found by title+content: {entry.get('title')}")
                     return DedupResult(
                         is_duplicate=True,
@@ -150,8 +185,7 @@ class Deduplicator:
             if self.enable_title_check and title_hash:
                 existing = repo.get_by_title_hash(title_hash, feed_id)
                 if existing:
-                    self.stats["duplicates_found"] += 1
-                    self.stats["title_matches"] += 1
+                    self._count_match("title")
                     logger.info(f"Duplicate found by title: {entry.get('title')}")
                     return DedupResult(
                         is_duplicate=True,
@@ -162,8 +196,7 @@ class Deduplicator:
             if self.enable_content_check and content_hash:
                 existing = repo.get_by_content_hash(content_hash, feed_id)
                 if existing:
-                    self.stats["duplicates_found"] += 1
-                    self.stats["content_matches"] += 1
+                    self._count_match("content")
                     logger.info(f"Duplicate found by content hash")
                     return DedupResult(
                         is_duplicate=True,
@@ -176,8 +209,7 @@ class Deduplicator:
             if self.enable_title_check and title_hash:
                 existing = repo.get_by_title_hash(title_hash, feed_id)
                 if existing:
-                    self.stats["duplicates_found"] += 1
-                    self.stats["title_matches"] += 1
+                    self._count_match("title")
                     logger.info(f"Duplicate found by title (relaxed): {entry.get('title')}")
                     return DedupResult(
                         is_duplicate=True,
@@ -185,6 +217,25 @@ class Deduplicator:
                         existing_entry=existing,
                     )
 
+        elif self.strategy == DedupStrategy.NEAR_DUPLICATE:
+            # Near duplicate: exact title first, then MinHash LSH probe
+            if self.enable_title_check and title_hash:
+                existing = repo.get_by_title_hash(title_hash, feed_id)
+                if existing:
+                    self._count_match("title")
+                    logger.info(f"Duplicate found by title: {entry.get('title')}")
+                    return DedupResult(
+                        is_duplicate=True,
+                        reason=f"Duplicate title (Entry ID: {existing.id})",
+                        existing_entry=existing,
+                    )
+
+            # Syndicated copies of a story arrive through other feeds
+            near_feed_ids = None if self.near_duplicate_across_feeds else [feed_id]
+            near_result = self.find_near_duplicate(entry, feed_ids=near_feed_ids)
+            if near_result.is_duplicate:
+                return near_result
+
         # No duplicate found
         logger.debug(f"No duplicate found for: {entry.get('title') or entry.get('link')}")
         return DedupResult(is_duplicate=False, reason="No duplicate")
@@ -229,8 +280,122 @@ class Deduplicator:
                     existing_entry=existing,
                 )
 
+        if self.strategy == DedupStrategy.NEAR_DUPLICATE:
+            near_result = self.find_near_duplicate(entry, feed_ids=feed_ids)
+            if near_result.is_duplicate:
+                return near_result
+
         return DedupResult(is_duplicate=False, reason="No duplicate across feeds")
 
+    def compute_signature(self, entry: dict) -> Optional[list[int]]:
+        """Compute the MinHash signature used for near-duplicate lookup.
+
+        Args:
+            entry: Parsed entry dictionary
+
+        Returns:
+            MinHash signature, or None if the entry has no text
+        """
+        return compute_entry_signature(
+            entry.get("title"),
+            entry.get("content") or entry.get("summary"),
+            num_perm=self.minhash_permutations,
+        )
+
+    def find_near_duplicate(
+        self,
+        entry: dict,
+        feed_ids: Optional[list[int]] = None,
+    ) -> DedupResult:
+        """Look up a near-duplicate entry through the LSH band index.
+
+        Candidates sharing at least one band key are verified against
+        ``title_similarity_threshold`` using the estimated Jaccard similarity.
+
+        Args:
+            entry: Parsed entry dictionary
+            feed_ids: List of feed IDs to search (None = all feeds)
+
+        Returns:
+            DedupResult with the most similar entry above the threshold
+        """
+        if not self.session:
+            return DedupResult(is_duplicate=False, reason="No database session")
+
+        signature = self.compute_signature(entry)
+        if signature is None:
+            return DedupResult(is_duplicate=False, reason="No text for similarity check")
+
+        link_hash = compute_link_hash(entry.get("link"))
+        self._last_signature = (link_hash, signature) if link_hash else None
+
+        signature_repo = EntrySignatureRepository(self.session)
+        candidates = signature_repo.find_candidates(
+            compute_lsh_bands(signature, bands=self.lsh_bands),
+            feed_ids=feed_ids,
+            limit=self.lsh_max_candidates,
+        )
+
+        best_id, best_similarity = None, 0.0
+        for candidate_id, _, candidate_signature in candidates:
+            similarity = estimate_jaccard(signature, candidate_signature)
+            if similarity > best_similarity:
+                best_id, best_similarity = candidate_id, similarity
+
+        if best_id is None or best_similarity < self.similarity_threshold:
+            return DedupResult(is_duplicate=False, reason="No near duplicate")
+
+        existing = EntryRepository(self.session).get_by_id(best_id)
+        if not existing:
+            return DedupResult(is_duplicate=False, reason="No near duplicate")
+
+        self._count_match("near_duplicate")
+        logger.info(
+            f"Near duplicate found ({best_similarity:.2f}): {entry.get('title')} "
+            f"~ Entry ID {existing.id}"
+        )
+        return DedupResult(
+            is_duplicate=True,
+            reason=f"Near duplicate {best_similarity:.2f} (Entry ID: {existing.id})",
+            existing_entry=existing,
+            similarity=best_similarity,
+        )
+
+    def index_entry(self, entry: EntryModel) -> bool:
+        """Add a stored entry to the near-duplicate index.
+
+        Only entries handled with the NEAR_DUPLICATE strategy are indexed
+        here. Story clustering (``clustering.enabled``, on by default) indexes
+        every entry it assigns in the same tables, so other strategies only
+        avoid the signature and band writes with clustering disabled.
+
+        Args:
+            entry: Persisted EntryModel instance
+
+        Returns:
+            True if the entry was indexed
+        """
+        if self.strategy != DedupStrategy.NEAR_DUPLICATE or not self.session:
+            return False
+
+        signature = None
+        if self._last_signature and self._last_signature[0] == entry.link_hash:
+            signature = self._last_signature[1]
+        if signature is None:
+            signature = self.compute_signature(
+                {"title": entry.title, "content": entry.content, "summary": entry.summary}
+            )
+        if signature is None:
+            return False
+
+        EntrySignatureRepository(self.session).save(
+            entry_id=entry.id,
+            feed_id=entry.feed_id,
+            signature=signature,
+            bands=compute_lsh_bands(signature, bands=self.lsh_bands),
+        )
+        return True
+
     def compute_hashes(self, entry: dict) -> dict:
         """Compute all hashes for an entry.
 
@@ -256,13 +421,7 @@ class Deduplicator:
 
     def reset_stats(self) -> None:
         """Reset deduplication statistics."""
-        self.stats = {
-            "checks": 0,
-            "duplicates_found": 0,
-            "link_matches": 0,
-            "title_matches": 0,
-            "content_matches": 0,
-        }
+        self.stats = self._empty_stats()
 
 
 def create_deduplicator(
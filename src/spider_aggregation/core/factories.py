@@ -14,6 +14,7 @@ Usage:
         create_fetcher,
         create_parser,
         create_deduplicator,
+        create_story_clusterer,
         create_filter_engine,
         create_keyword_extractor,
         create_content_fetcher,
@@ -36,6 +37,7 @@ from spider_aggregation.config import get_config
 from spider_aggregation.core.fetcher import FeedFetcher
 from spider_aggregation.core.parser import ContentParser
 from spider_aggregation.core.deduplicator import Deduplicator, DedupStrategy
+from spider_aggregation.core.clusterer import StoryClusterer
 from spider_aggregation.core.filter_engine import FilterEngine
 from spider_aggregation.core.keyword_extractor import KeywordExtractor
 from spider_aggregation.core.content_fetcher import ContentFetcher
@@ -96,13 +98,15 @@ def create_deduplicator(
 
     Args:
         session: Optional database session
-        strategy: Override deduplication strategy ("strict", "medium", "relaxed")
+        strategy: Override deduplication strategy
+            ("strict", "medium", "relaxed", "near_duplicate")
 
     Returns:
         Configured Deduplicator instance
     """
-    # Map string to enum (default to MEDIUM)
-    strategy_value = strategy or "medium"
+    # Map string to enum (default to configured strategy)
+    config = get_config()
+    strategy_value = strategy or config.deduplicator.strategy
     strategy_enum = DedupStrategy(strategy_value) if strategy_value else DedupStrategy.MEDIUM
 
     return Deduplicator(
@@ -111,6 +115,34 @@ def create_deduplicator(
     )
 
 
+def create_story_clusterer(
+    session: Session,
+    similarity_threshold: Optional[float] = None,
+    window_hours: Optional[int] = None,
+) -> StoryClusterer:
+    """Create a configured StoryClusterer instance.
+
+    Args:
+        session: Database session
+        similarity_threshold: Override minimum similarity to join a cluster
+        window_hours: Override candidate time window
+
+    Returns:
+        Configured StoryClusterer instance
+    """
+    config = get_config()
+    return StoryClusterer(
+        session=session,
+        similarity_threshold=(
+            similarity_threshold
+            if similarity_threshold is not None
+            else config.clustering.similarity_threshold
+        ),
+        window_hours=window_hours or config.clustering.window_hours,
+        max_candidates=config.clustering.max_candidates,
+    )
+
+
 def create_filter_engine(
     rules: Optional[list] = None,
     cache_size: Optional[int] = None,
@@ -150,6 +182,7 @@ def create_keyword_extractor(
     return KeywordExtractor(
         max_keywords=max_keywords or config.keyword_extractor.max_keywords,
         language=language or config.keyword_extractor.language,
+        corpus_min_documents=config.keyword_extractor.corpus_min_documents,
     )
 
 
@@ -183,16 +216,18 @@ def create_summarizer(
     ai_api_key: Optional[str] = None,
     ai_model: Optional[str] = None,
     ai_max_tokens: Optional[int] = None,
+    fallback_on_rate_limit: bool = True,
 ) -> Summarizer:
     """Create a configured Summarizer instance.
 
     Args:
-        method: Summarization method (extractive or ai)
+        method: Summarization method (extractive, textrank or ai)
         max_sentences: Maximum sentences in summary
         min_sentence_length: Minimum sentence length
         ai_api_key: Zhipu AI API key
         ai_model: AI model name
         ai_max_tokens: Maximum tokens for AI summary
+        fallback_on_rate_limit: Fall back to extractive when rate limited
 
     Returns:
         Configured Summarizer instance
@@ -205,6 +240,8 @@ def create_summarizer(
         ai_api_key=ai_api_key,
         ai_model=ai_model or config.summarizer.ai_model,
         ai_max_tokens=ai_max_tokens or config.summarizer.ai_max_tokens,
+        fallback_on_rate_limit=fallback_on_rate_limit,
+        textrank_top_k=config.summarizer.textrank_top_k,
     )
 
 
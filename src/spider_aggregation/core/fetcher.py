@@ -14,8 +14,16 @@ from sqlalchemy.orm import Session
 
 from spider_aggregation.config import get_config
 from spider_aggregation.logger import get_logger
+from spider_aggregation.metrics import FETCH_BYTES, FETCH_DURATION, FETCH_RESULTS
 from spider_aggregation.models import FeedModel
 from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+from spider_aggregation.tracing import (
+    STAGE_FEEDPARSER,
+    STAGE_HTTP,
+    current_trace,
+    span,
+    start_trace,
+)
 
 logger = get_logger(__name__)
 
@@ -39,6 +47,9 @@ class FetchResult:
     feed_data: Optional[dict] = None
     feed_info: Optional[dict] = None
 
+    # Per-stage timing breakdown (see spider_aggregation.tracing)
+    timings: Optional[dict] = None
+
     def __post_init__(self):
         """Validate fetch result."""
         if self.success and self.error:
@@ -66,6 +77,7 @@ class FetchStats:
         """
         self.total_feeds += 1
         self.total_time_seconds += result.fetch_time_seconds
+        FETCH_RESULTS.labels(outcome="success" if result.success else "failure").inc()
 
         if result.success:
             self.successful_fetches += 1
@@ -90,6 +102,12 @@ class FetchStats:
         return self.total_time_seconds / self.total_feeds
 
 
+def _trace_snapshot() -> Optional[dict]:
+    """Get the active trace's breakdown so far, if a trace is active."""
+    trace = current_trace()
+    return trace.to_dict() if trace is not None else None
+
+
 class FeedFetcher:
     """RSS/Atom feed fetcher with retry logic and error handling."""
 
@@ -181,7 +199,8 @@ class FeedFetcher:
                     )
 
                 # Parse with feedparser
-                parsed = feedparser.parse(http_result.content)
+                with span(STAGE_FEEDPARSER):
+                    parsed = feedparser.parse(http_result.content)
                 entries = parsed.get("entries", [])
 
                 # Apply max entries limit
@@ -267,12 +286,28 @@ class FeedFetcher:
     def fetch_feed(self, feed: FeedModel) -> FetchResult:
         """Fetch a single feed.
 
+        The fetch is traced: when no trace is active (e.g. scheduled
+        fetches) a new one is started, otherwise its stages are added to
+        the caller's trace. The breakdown so far is returned in
+        ``FetchResult.timings`` and stored on the feed.
+
         Args:
             feed: FeedModel instance to fetch
 
         Returns:
             FetchResult with entries or error
         """
+        trace = current_trace()
+        if trace is not None:
+            result = self._fetch_feed(feed)
+        else:
+            with start_trace(feed.url) as trace:
+                result = self._fetch_feed(feed)
+        result.timings = trace.to_dict()
+        return result
+
+    def _fetch_feed(self, feed: FeedModel) -> FetchResult:
+        """Fetch a single feed with retries (see fetch_feed)."""
         start_time = time.time()
         feed_id = feed.id
         feed_url = feed.url
@@ -313,7 +348,8 @@ class FeedFetcher:
                     )
 
                 # Parse with feedparser
-                parsed = feedparser.parse(http_result.content)
+                with span(STAGE_FEEDPARSER):
+                    parsed = feedparser.parse(http_result.content)
                 entries = parsed.get("entries", [])
 
                 # Apply max entries limit from feed settings
@@ -472,14 +508,23 @@ class FeedFetcher:
         if last_modified:
             headers["If-Modified-Since"] = last_modified
 
-        with httpx.Client(
-            timeout=self.timeout_seconds,
-            follow_redirects=self.follow_redirects,
-            max_redirects=self.max_redirects,
-        ) as client:
-            response = client.get(url, headers=headers)
-            response.raise_for_status()
-            return response
+        started = time.perf_counter()
+        status = "error"
+        try:
+            with span(STAGE_HTTP), httpx.Client(
+                timeout=self.timeout_seconds,
+                follow_redirects=self.follow_redirects,
+                max_redirects=self.max_redirects,
+            ) as client:
+                response = client.get(url, headers=headers)
+                status = f"{response.status_code // 100}xx"
+                FETCH_BYTES.inc(len(response.content))
+                # 304 is the expected answer to a conditional request, not an error
+                if response.status_code != 304:
+                    response.raise_for_status()
+                return response
+        finally:
+            FETCH_DURATION.labels(status=status).observe(time.perf_counter() - started)
 
     def _update_feed_after_success(
         self,
@@ -507,6 +552,7 @@ class FeedFetcher:
             reset_errors=True,
             etag=etag,
             last_modified=last_modified,
+            timings=_trace_snapshot(),
         )
 
         # Update feed metadata from response
@@ -533,6 +579,7 @@ class FeedFetcher:
             last_fetched_at=datetime.utcnow(),
             increment_error=True,
             last_error=result.error,
+            timings=_trace_snapshot(),
         )
 
         # Check if feed should be disabled
@@ -6,10 +6,11 @@ Supports keyword, regex, tag, and language filtering with include/exclude logic.
 
 import json
 import re
-from functools import lru_cache
 from typing import Optional
 
+from spider_aggregation.core.text_analysis import analyze_text
 from spider_aggregation.logger import get_logger
+from spider_aggregation.metrics import FILTER_DURATION
 from spider_aggregation.models.filter_rule import FilterRuleModel
 from spider_aggregation.models.entry import EntryModel
 
@@ -88,22 +89,12 @@ class FilterEngine:
             return False
         return pattern.search(text) is not None
 
-    @lru_cache(maxsize=100)
-    def _match_keyword_cached(self, pattern: str, text_lower: str) -> bool:
-        """Match a keyword pattern (cached version).
-
-        Args:
-            pattern: Keyword pattern to match
-            text_lower: Lowercase text to search in
-
-        Returns:
-            True if keyword is found
-        """
-        return pattern.lower() in text_lower
-
     def _match_keyword(self, pattern: str, text: Optional[str]) -> bool:
         """Match a keyword pattern against text.
 
+        The lowercased text comes from the shared TextAnalysis, so it is
+        computed once per text rather than once per keyword rule.
+
         Args:
             pattern: Keyword pattern to match
             text: Text to search in
@@ -113,7 +104,7 @@ class FilterEngine:
         """
         if not text:
             return False
-        return self._match_keyword_cached(pattern, text.lower())
+        return pattern.lower() in analyze_text(text).lower
 
     def _match_tag(self, pattern: str, tags_json: Optional[str]) -> bool:
         """Match a tag pattern against entry tags.
@@ -204,6 +195,11 @@ class FilterEngine:
         Returns:
             FilterResult with pass/fail status
         """
+        with FILTER_DURATION.time():
+            return self._evaluate(entry)
+
+    def _evaluate(self, entry: EntryModel) -> FilterResult:
+        """Evaluate the rules against an entry (see filter_entry)."""
         matched_rules = []
         has_include_rules = any(r.match_type == "include" for r in self.rules)
         matched_include = False
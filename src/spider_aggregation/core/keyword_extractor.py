@@ -2,82 +2,39 @@
 Keyword extractor for automatic keyword/tag extraction from article content.
 
 Supports English (NLTK) and Chinese (jieba) text processing.
-Uses TF-IDF for keyword scoring.
+
+Single documents are scored by term frequency (English) or jieba's built-in
+TF-IDF (Chinese). Given the corpus statistics (see CorpusStatsRepository),
+extract_batch() scores terms with BM25 against the document frequencies of
+everything ingested, reading the statistics once per batch.
 """
 
+import math
 import re
 from collections import Counter
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from spider_aggregation.config import get_config
+from spider_aggregation.core.nlp_resources import (
+    JIEBA_AVAILABLE,
+    get_jieba,
+    get_nlp_resources,
+    preload,
+)
+from spider_aggregation.core.text_analysis import analyze_text
 from spider_aggregation.logger import get_logger
 
+if TYPE_CHECKING:
+    from spider_aggregation.storage.repositories.term_stats_repo import (
+        CorpusSnapshot,
+        CorpusStatsRepository,
+    )
+
 logger = get_logger(__name__)
 
-# Try to import optional dependencies
-try:
-    import jieba
-    import jieba.analyse
-
-    JIEBA_AVAILABLE = True
-except ImportError:
-    JIEBA_AVAILABLE = False
-    logger.warning("jieba not available, Chinese keyword extraction limited")
-
-# NLTK imports - lazy loaded to avoid startup issues
-NLTK_AVAILABLE = False
-_nltk_modules = None
-
-
-def _ensure_nltk():
-    """Lazy-load NLTK modules only when needed."""
-    global NLTK_AVAILABLE, _nltk_modules
-    if _nltk_modules is not None:
-        return _nltk_modules
-
-    try:
-        import nltk
-        from nltk.corpus import stopwords
-        from nltk.tokenize import word_tokenize
-        from nltk.stem import WordNetLemmatizer
-
-        # Download required NLTK data (silently ignore errors)
-        try:
-            nltk.data.find("tokenizers/punkt")
-        except LookupError:
-            try:
-                nltk.download("punkt", quiet=True)
-            except Exception:
-                pass
-        try:
-            nltk.data.find("corpora/stopwords")
-        except LookupError:
-            try:
-                nltk.download("stopwords", quiet=True)
-            except Exception:
-                pass
-        try:
-            nltk.data.find("corpora/wordnet")
-        except LookupError:
-            try:
-                nltk.download("wordnet", quiet=True)
-            except Exception:
-                pass
-
-        NLTK_AVAILABLE = True
-        _nltk_modules = {
-            "nltk": nltk,
-            "stopwords": stopwords,
-            "word_tokenize": word_tokenize,
-            "WordNetLemmatizer": WordNetLemmatizer,
-        }
-        return _nltk_modules
-    except ImportError:
-        logger.warning("NLTK not available, English keyword extraction limited")
-        return None
-    except Exception as e:
-        logger.warning(f"NLTK initialization failed: {e}")
-        return None
+# BM25 term frequency saturation and document length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
 
 
 class KeywordExtractor:
@@ -88,6 +45,7 @@ class KeywordExtractor:
         max_keywords: int = 10,
         min_keyword_length: int = 2,
         language: str = "auto",
+        corpus_min_documents: int = 20,
     ) -> None:
         """Initialize the keyword extractor.
 
@@ -95,34 +53,19 @@ class KeywordExtractor:
             max_keywords: Maximum number of keywords to extract
             min_keyword_length: Minimum keyword length
             language: Language setting (auto, en, zh)
+            corpus_min_documents: Documents a language needs in the corpus
+                statistics before BM25 scoring replaces per-document scoring
         """
         self.max_keywords = max_keywords
         self.min_keyword_length = min_keyword_length
         self.language = language
+        self.corpus_min_documents = corpus_min_documents
 
-        # Initialize NLTK components for English (lazy load)
-        self._lemmatizer = None
-        self._stopwords = set()
-        self._nltk_loaded = False
-
-        logger.info(f"KeywordExtractor initialized (NLTK=lazy, jieba={JIEBA_AVAILABLE})")
-
-    def _load_nltk_if_needed(self):
-        """Load NLTK modules on first use."""
-        if self._nltk_loaded:
-            return True
-
-        nltk_modules = _ensure_nltk()
-        if nltk_modules:
-            try:
-                self._lemmatizer = nltk_modules["WordNetLemmatizer"]()
-                self._stopwords = set(nltk_modules["stopwords"].words("english"))
-                self._nltk_loaded = True
-                return True
-            except Exception:
-                self._nltk_loaded = True
-                return False
-        return False
+        # Tokenizer, stopwords, lemmatizer and jieba are shared process-wide
+        if get_config().keyword_extractor.preload:
+            preload()
+
+        logger.info(f"KeywordExtractor initialized (jieba={JIEBA_AVAILABLE})")
 
     def _detect_language(self, text: str) -> str:
         """Detect the primary language of text.
@@ -131,13 +74,10 @@ class KeywordExtractor:
             text: Text to analyze
 
         Returns:
-            Language code (zh, en, or other)
+            Language code (zh or en)
         """
-        # Count Chinese characters
-        chinese_chars = len(re.findall(r"[\u4e00-\u9fff]", text))
-        total_chars = len(text)
-
-        if total_chars > 0 and chinese_chars / total_chars > 0.3:
+        # Share of Chinese characters, from the shared TextAnalysis
+        if analyze_text(text).cjk_ratio > 0.3:
             return "zh"
 
         return "en"
@@ -168,52 +108,79 @@ class KeywordExtractor:
 
         return text.strip()
 
-    def _extract_keywords_en(self, text: str) -> list[tuple[str, float]]:
-        """Extract keywords from English text.
+    def _english_terms(self, text: str) -> list[str]:
+        """Tokenize English text into lemmatized candidate terms.
 
         Args:
             text: English text
 
         Returns:
-            List of (keyword, score) tuples
+            Terms in document order (with repetitions)
         """
-        # Try to load NLTK on first use
-        if not self._load_nltk_if_needed():
-            # Fallback: simple word frequency
-            words = re.findall(
-                r"\b[a-zA-Z]{" + str(self.min_keyword_length) + r",}\b", text.lower()
-            )
-            word_freq = Counter(words)
-            return [(word, freq) for word, freq in word_freq.most_common(self.max_keywords * 2)]
-
-        nltk_modules = _ensure_nltk()
-        if not nltk_modules:
-            # Fallback if NLTK load failed
-            words = re.findall(
-                r"\b[a-zA-Z]{" + str(self.min_keyword_length) + r",}\b", text.lower()
-            )
-            word_freq = Counter(words)
-            return [(word, freq) for word, freq in word_freq.most_common(self.max_keywords * 2)]
-
-        word_tokenize = nltk_modules["word_tokenize"]
+        resources = get_nlp_resources()
 
         # Tokenize and preprocess
-        tokens = word_tokenize(text.lower())
+        tokens = resources.tokenize(text.lower())
 
         # Filter stopwords and short words
-        keywords = []
+        terms = []
         for token in tokens:
             if (
                 len(token) >= self.min_keyword_length
-                and token not in self._stopwords
+                and token not in resources.stopwords
                 and token.isalpha()
             ):
                 # Lemmatize
-                lemma = self._lemmatizer.lemmatize(token)
-                keywords.append(lemma)
+                terms.append(resources.lemmatize(token))
+        return terms
+
+    def _chinese_terms(self, text: str) -> list[str]:
+        """Segment Chinese text into candidate terms.
+
+        Args:
+            text: Chinese text
+
+        Returns:
+            Terms in document order (with repetitions)
+        """
+        jieba_analyse = get_jieba()
+        if jieba_analyse is None:
+            return re.findall(r"[\u4e00-\u9fff]{2,}", text)
+
+        stopwords = jieba_analyse.default_tfidf.stop_words
+        terms = []
+        for word in jieba_analyse.default_tfidf.tokenizer.lcut(text):
+            word = word.strip().lower()
+            if (
+                len(word) >= self.min_keyword_length
+                and word not in stopwords
+                and (word.isalpha() or re.search(r"[\u4e00-\u9fff]", word))
+                and word not in get_nlp_resources().stopwords
+            ):
+                terms.append(word)
+        return terms
+
+    def _terms(self, text: str, lang: str) -> list[str]:
+        """Get the candidate terms of preprocessed text in a language."""
+        if lang == "zh":
+            return self._chinese_terms(text)
+        if lang == "en":
+            return self._english_terms(text)
+        english = " ".join(re.findall(r"[a-zA-Z\s]+", text))
+        chinese = " ".join(re.findall(r"[\u4e00-\u9fff\s]+", text))
+        return self._english_terms(english) + self._chinese_terms(chinese)
+
+    def _extract_keywords_en(self, text: str) -> list[tuple[str, float]]:
+        """Extract keywords from English text.
+
+        Args:
+            text: English text
 
+        Returns:
+            List of (keyword, score) tuples
+        """
         # Calculate TF-IDF-like scores
-        keyword_freq = Counter(keywords)
+        keyword_freq = Counter(self._english_terms(text))
 
         # Normalize by max frequency
         if keyword_freq:
@@ -236,9 +203,10 @@ class KeywordExtractor:
         Returns:
             List of (keyword, score) tuples
         """
-        if JIEBA_AVAILABLE:
+        jieba_analyse = get_jieba()
+        if jieba_analyse is not None:
             # Use jieba's TF-IDF extractor
-            keywords = jieba.analyse.extract_tags(
+            keywords = jieba_analyse.extract_tags(
                 text,
                 topK=self.max_keywords * 2,
                 withWeight=True,
@@ -300,30 +268,7 @@ class KeywordExtractor:
         Returns:
             List of keywords (no scores)
         """
-        if not text:
-            return []
-
-        # Preprocess
-        text = self._preprocess_text(text)
-
-        if len(text) < 50:
-            return []
-
-        # Determine language
-        lang = language or self.language
-        if lang == "auto":
-            lang = self._detect_language(text)
-
-        # Extract keywords
-        if lang == "zh":
-            keywords_with_scores = self._extract_keywords_zh(text)
-        elif lang == "en":
-            keywords_with_scores = self._extract_keywords_en(text)
-        else:
-            keywords_with_scores = self._extract_keywords_mixed(text)
-
-        # Return just the keywords
-        return [kw for kw, _ in keywords_with_scores[: self.max_keywords]]
+        return [kw for kw, _ in self.extract_with_scores(text, language)]
 
     def extract_with_scores(
         self, text: Optional[str], language: Optional[str] = None
@@ -337,27 +282,144 @@ class KeywordExtractor:
         Returns:
             List of (keyword, score) tuples
         """
-        if not text:
+        prepared = self._prepare(text, language)
+        if prepared is None:
             return []
+        return self._score_document(*prepared)[: self.max_keywords]
+
+    def extract_batch(
+        self,
+        texts: list[Optional[str]],
+        language: Optional[str] = None,
+        corpus: Optional["CorpusStatsRepository"] = None,
+    ) -> list[list[str]]:
+        """Extract keywords from many texts.
+
+        With corpus statistics, terms are scored with BM25; the document
+        frequencies of all the batch's terms are read in one pass per
+        language. Languages with fewer than ``corpus_min_documents`` counted
+        documents are scored per document, as by extract().
+
+        Args:
+            texts: Texts to extract keywords from
+            language: Override detected language (en, zh, auto)
+            corpus: Corpus statistics repository (None scores per document)
+
+        Returns:
+            List of keywords for each text
+        """
+        prepared = [self._prepare(text, language) for text in texts]
+        if corpus is None:
+            return [
+                [kw for kw, _ in self._score_document(*item)[: self.max_keywords]] if item else []
+                for item in prepared
+            ]
+
+        terms = [self._terms(*item) if item else [] for item in prepared]
+        batch_terms: dict[str, set[str]] = {}
+        for item, document_terms in zip(prepared, terms):
+            if item:
+                batch_terms.setdefault(item[1], set()).update(document_terms)
+        snapshots = {lang: corpus.snapshot(lang, words) for lang, words in batch_terms.items()}
+
+        results = []
+        for item, document_terms in zip(prepared, terms):
+            if item is None:
+                results.append([])
+                continue
+            snapshot = snapshots[item[1]]
+            if snapshot.documents < self.corpus_min_documents:
+                scored = self._score_document(*item)
+            else:
+                scored = self._score_bm25(document_terms, snapshot)
+            results.append([kw for kw, _ in scored[: self.max_keywords]])
+        return results
+
+    def record_documents(
+        self,
+        texts: list[Optional[str]],
+        corpus: "CorpusStatsRepository",
+        language: Optional[str] = None,
+    ) -> int:
+        """Count texts in the corpus statistics.
+
+        Texts too short for keyword extraction are skipped.
+
+        Args:
+            texts: Document texts
+            corpus: Corpus statistics repository
+            language: Override detected language (en, zh, auto)
+
+        Returns:
+            Number of documents counted
+        """
+        documents: dict[str, list[list[str]]] = {}
+        for text in texts:
+            prepared = self._prepare(text, language)
+            if prepared is not None:
+                documents.setdefault(prepared[1], []).append(self._terms(*prepared))
+
+        for lang, terms in documents.items():
+            corpus.add_documents(lang, terms)
+        return sum(len(terms) for terms in documents.values())
+
+    def _prepare(
+        self, text: Optional[str], language: Optional[str]
+    ) -> Optional[tuple[str, str]]:
+        """Preprocess text and determine its language.
+
+        The language is detected on the original text, whose analysis other
+        stages may already have cached.
+
+        Returns:
+            (preprocessed text, language), or None if the text is too short
+        """
+        if not text:
+            return None
 
         # Preprocess
-        text = self._preprocess_text(text)
+        preprocessed = self._preprocess_text(text)
 
-        if len(text) < 50:
-            return []
+        if len(preprocessed) < 50:
+            return None
 
         # Determine language
         lang = language or self.language
         if lang == "auto":
             lang = self._detect_language(text)
+        return preprocessed, lang
 
-        # Extract keywords
+    def _score_document(self, text: str, lang: str) -> list[tuple[str, float]]:
+        """Score the keywords of preprocessed text on its own."""
         if lang == "zh":
-            return self._extract_keywords_zh(text)[: self.max_keywords]
+            return self._extract_keywords_zh(text)
         elif lang == "en":
-            return self._extract_keywords_en(text)[: self.max_keywords]
+            return self._extract_keywords_en(text)
         else:
-            return self._extract_keywords_mixed(text)[: self.max_keywords]
+            return self._extract_keywords_mixed(text)
+
+    def _score_bm25(self, terms: list[str], corpus: "CorpusSnapshot") -> list[tuple[str, float]]:
+        """Score the terms of a document with BM25.
+
+        Args:
+            terms: Terms of the document (with repetitions)
+            corpus: Corpus statistics of the document's language
+
+        Returns:
+            List of (keyword, score) tuples, best first
+        """
+        length_norm = BM25_K1
+        if corpus.average_length:
+            length_norm *= 1 - BM25_B + BM25_B * len(terms) / corpus.average_length
+
+        scores = {}
+        for term, tf in Counter(terms).items():
+            df = corpus.document_frequencies.get(term, 0)
+            idf = math.log(1 + (corpus.documents - df + 0.5) / (df + 0.5))
+            scores[term] = idf * tf * (BM25_K1 + 1) / (tf + length_norm)
+
+        sorted_keywords = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        return sorted_keywords[: self.max_keywords * 2]
 
     def extract_from_entry(self, title: str, content: Optional[str] = None) -> list[str]:
         """Extract keywords from an entry (title + content).
@@ -402,4 +464,5 @@ def create_keyword_extractor(
         max_keywords=max_keywords or config.keyword_extractor.max_keywords,
         min_keyword_length=min_keyword_length or config.keyword_extractor.min_keyword_length,
         language=language or config.keyword_extractor.language,
+        corpus_min_documents=config.keyword_extractor.corpus_min_documents,
     )
@@ -1,13 +1,24 @@
 """
 Unified LLM client supporting multiple providers (OpenAI, ZhipuAI, DeepSeek, etc.)
+
+Responses can be cached on disk (LLMResponseCache) so that identical prompts,
+e.g. from a retried digest or an article shared by several feeds, are only
+sent once.
 """
 
+import hashlib
+import re
+import sqlite3
+import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Union
 
 from spider_aggregation.config import get_config
 from spider_aggregation.logger import get_logger
+from spider_aggregation.metrics import LLM_CACHE_REQUESTS, LLM_REQUEST_DURATION
 
 logger = get_logger(__name__)
 
@@ -20,6 +31,274 @@ class LLMResponse:
     content: Optional[str] = None
     error: Optional[str] = None
     tokens_used: Optional[int] = None
+    # True if served from the response cache (no tokens were spent)
+    cached: bool = False
+
+
+class RateLimitError(Exception):
+    """Raised when a provider rejects a request for exceeding its rate limit (HTTP 429)."""
+
+    def __init__(self, message: str = "Rate limit exceeded", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# HTTP 429 in SDK/HTTP error messages ("Error code: 429", "status 429",
+# "HTTP/1.1 429", "429 Too Many Requests"); a bare 429 may be an ID or a count
+_RATE_LIMIT_STATUS = re.compile(
+    r"\b(?:error[ _]code|status(?:[ _]code)?|http(?:/[\d.]+)?)\W{0,3}429\b"
+    r"|\b429 too many requests\b"
+)
+
+
+def is_rate_limit_error(error: Union[BaseException, str, None]) -> bool:
+    """Check whether an exception or error message reports rate limiting.
+
+    Args:
+        error: Exception raised by a provider SDK, or an error message
+
+    Returns:
+        True for HTTP 429 / rate limit errors
+    """
+    if error is None:
+        return False
+    if isinstance(error, RateLimitError):
+        return True
+    if getattr(error, "status_code", None) == 429:
+        return True
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+
+    message = str(error).lower()
+    return (
+        _RATE_LIMIT_STATUS.search(message) is not None
+        or "rate limit" in message
+        or "rate_limit" in message
+    )
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in a text without a tokenizer.
+
+    CJK characters are counted as one token each and other text as one token
+    per four characters, which slightly overestimates for common BPE
+    tokenizers and so keeps prompts safely within budget.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated token count
+    """
+    if not text:
+        return 0
+
+    cjk = sum(1 for ch in text if "\u2e80" <= ch <= "\u9fff" or "\uac00" <= ch <= "\ud7af")
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def truncate_to_tokens(text: str, max_tokens: int, suffix: str = "...") -> str:
+    """Truncate a text so its estimated token count fits a budget.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Maximum estimated tokens, including the suffix
+        suffix: Marker appended when the text is cut
+
+    Returns:
+        The text itself if it fits, otherwise its longest fitting prefix plus suffix
+    """
+    tokens = estimate_tokens(text)
+    if tokens <= max_tokens:
+        return text
+
+    budget = max(max_tokens - estimate_tokens(suffix), 0)
+    keep = len(text) * budget // tokens
+    while keep > 0 and estimate_tokens(text[:keep]) > budget:
+        keep = keep * 9 // 10
+    return text[:keep] + suffix
+
+
+class LLMResponseCache:
+    """On-disk cache of successful LLM responses.
+
+    Responses are stored in a SQLite file keyed by a fingerprint of the
+    provider, model, temperature, system prompt and prompt. Entries expire
+    after ``ttl_seconds`` and the least recently used entries are evicted
+    beyond ``max_entries``. The cache is safe to share between threads.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = 7 * 24 * 3600, max_entries: int = 5000):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite file path (":memory:" for a process-local cache)
+            ttl_seconds: Time to live of a cached response
+            max_entries: Maximum number of cached responses
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses ("
+            "key TEXT PRIMARY KEY, "
+            "content TEXT NOT NULL, "
+            "tokens_used INTEGER, "
+            "created_at REAL NOT NULL, "
+            "accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_llm_responses_accessed_at "
+            "ON llm_responses (accessed_at)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        temperature: float,
+        system_prompt: Optional[str],
+        prompt: str,
+    ) -> str:
+        """Compute the cache key of a request.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            temperature: Sampling temperature
+            system_prompt: System prompt (if any)
+            prompt: User prompt
+
+        Returns:
+            Hex SHA-256 fingerprint
+        """
+        digest = hashlib.sha256()
+        for part in (provider.lower(), model, f"{temperature:.3f}", system_prompt or "", prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from ``make_key``
+
+        Returns:
+            Cached LLMResponse, or None on a miss or expired entry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, created_at FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row and row[1] >= now - self.ttl_seconds:
+                self._conn.execute(
+                    "UPDATE llm_responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+                self._conn.commit()
+                self.hits += 1
+                return LLMResponse(success=True, content=row[0], tokens_used=0, cached=True)
+
+            if row:
+                self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.evictions += 1
+            self.misses += 1
+            return None
+
+    def set(self, key: str, response: LLMResponse) -> None:
+        """Store a successful response and evict expired or excess entries.
+
+        Args:
+            key: Cache key from ``make_key``
+            response: Response to store (ignored unless successful)
+        """
+        if not response.success or response.content is None:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(key, content, tokens_used, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, response.content, response.tokens_used, now, now),
+            )
+            self.evictions += self._conn.execute(
+                "DELETE FROM llm_responses WHERE created_at < ?", (now - self.ttl_seconds,)
+            ).rowcount
+            self.evictions += self._conn.execute(
+                "DELETE FROM llm_responses WHERE key IN ("
+                "SELECT key FROM llm_responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+
+    def get_stats(self) -> dict:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entries, hits, misses, evictions and hit_rate
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        """Close the cache file."""
+        with self._lock:
+            self._conn.close()
+
+
+_llm_cache: Optional[LLMResponseCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Get the shared LLM response cache.
+
+    Returns:
+        The process-wide cache, or None if caching is disabled in config
+    """
+    global _llm_cache
+
+    cache_config = get_config().llm_cache
+    if not cache_config.enabled:
+        return None
+
+    with _llm_cache_lock:
+        if _llm_cache is None:
+            _llm_cache = LLMResponseCache(
+                path=cache_config.path,
+                ttl_seconds=cache_config.ttl_hours * 3600,
+                max_entries=cache_config.max_entries,
+            )
+    return _llm_cache
 
 
 class BaseLLMClient(ABC):
@@ -57,6 +336,22 @@ class BaseLLMClient(ABC):
         if self._client is None:
             self._init_client()
 
+    def _observe(self, started: float, response: LLMResponse) -> LLMResponse:
+        """Record the latency of a request started at ``started`` (perf_counter).
+
+        Args:
+            started: ``time.perf_counter()`` value when the request started
+            response: Response of the request
+
+        Returns:
+            The response, unchanged
+        """
+        outcome = "success" if response.success else "error"
+        LLM_REQUEST_DURATION.labels(model=self.model, outcome=outcome).observe(
+            time.perf_counter() - started
+        )
+        return response
+
 
 class OpenAIClient(BaseLLMClient):
     """OpenAI-compatible client (works with OpenAI, DeepSeek, and other compatible APIs)."""
@@ -84,6 +379,7 @@ class OpenAIClient(BaseLLMClient):
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
+        started = time.perf_counter()
         try:
             response = self._client.chat.completions.create(
                 model=self.model,
@@ -96,14 +392,17 @@ class OpenAIClient(BaseLLMClient):
             content = response.choices[0].message.content
             tokens_used = response.usage.total_tokens if response.usage else None
 
-            return LLMResponse(
-                success=True,
-                content=content,
-                tokens_used=tokens_used,
+            return self._observe(
+                started,
+                LLMResponse(
+                    success=True,
+                    content=content,
+                    tokens_used=tokens_used,
+                ),
             )
         except Exception as e:
             logger.error(f"OpenAI API error: {e}")
-            return LLMResponse(success=False, error=str(e))
+            return self._observe(started, LLMResponse(success=False, error=str(e)))
 
 
 class ZhipuAIClient(BaseLLMClient):
@@ -128,6 +427,7 @@ class ZhipuAIClient(BaseLLMClient):
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
+        started = time.perf_counter()
         try:
             response = self._client.chat.completions.create(
                 model=self.model,
@@ -139,14 +439,62 @@ class ZhipuAIClient(BaseLLMClient):
             content = response.choices[0].message.content
             tokens_used = response.usage.total_tokens if response.usage else None
 
-            return LLMResponse(
-                success=True,
-                content=content,
-                tokens_used=tokens_used,
+            return self._observe(
+                started,
+                LLMResponse(
+                    success=True,
+                    content=content,
+                    tokens_used=tokens_used,
+                ),
             )
         except Exception as e:
             logger.error(f"ZhipuAI API error: {e}")
-            return LLMResponse(success=False, error=str(e))
+            return self._observe(started, LLMResponse(success=False, error=str(e)))
+
+
+class CachedLLMClient(BaseLLMClient):
+    """Client wrapper serving repeated prompts from an LLMResponseCache."""
+
+    def __init__(self, client: BaseLLMClient, cache: LLMResponseCache, provider: str) -> None:
+        """Wrap a client.
+
+        Args:
+            client: Client that answers cache misses
+            cache: Response cache
+            provider: Provider name used in cache keys
+        """
+        super().__init__(
+            api_key=client.api_key,
+            api_base=client.api_base,
+            model=client.model,
+            temperature=client.temperature,
+            max_tokens=client.max_tokens,
+            timeout_seconds=client.timeout_seconds,
+        )
+        self.client = client
+        self.cache = cache
+        self.provider = provider
+
+    def _init_client(self) -> None:
+        """The wrapped client initializes itself on first use."""
+        self._client = self.client
+
+    def chat(self, prompt: str, system_prompt: Optional[str] = None) -> LLMResponse:
+        """Return the cached response for the prompt, or ask the wrapped client."""
+        key = self.cache.make_key(
+            self.provider, self.model, self.temperature, system_prompt, prompt
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            LLM_CACHE_REQUESTS.labels(result="hit").inc()
+            logger.debug(f"LLM cache hit: {key[:12]}")
+            return cached
+
+        LLM_CACHE_REQUESTS.labels(result="miss").inc()
+
+        response = self.client.chat(prompt=prompt, system_prompt=system_prompt)
+        self.cache.set(key, response)
+        return response
 
 
 class LLMClientFactory:
@@ -168,9 +516,13 @@ class LLMClientFactory:
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         timeout_seconds: Optional[int] = None,
+        use_cache: bool = True,
     ) -> BaseLLMClient:
         """Create an LLM client based on configuration.
 
+        Unless disabled, the client is wrapped in a CachedLLMClient backed by
+        the shared response cache.
+
         Args:
             provider: LLM provider name (openai, zhipuai, deepseek)
             api_key: API key (defaults to config)
@@ -179,6 +531,7 @@ class LLMClientFactory:
             temperature: Temperature (defaults to config)
             max_tokens: Max tokens (defaults to config)
             timeout_seconds: Timeout (defaults to config)
+            use_cache: Cache responses (when the cache is enabled in config)
 
         Returns:
             Configured LLM client
@@ -207,7 +560,7 @@ class LLMClientFactory:
         if provider.lower() == "deepseek" and not api_base:
             api_base = "https://api.deepseek.com/v1"
 
-        return client_class(
+        client = client_class(
             api_key=api_key,
             api_base=api_base,
             model=model,
@@ -216,6 +569,11 @@ class LLMClientFactory:
             timeout_seconds=timeout_seconds,
         )
 
+        cache = get_llm_cache() if use_cache else None
+        if cache is not None:
+            return CachedLLMClient(client, cache, provider=provider)
+        return client
+
     @classmethod
     def register(cls, name: str, client_class: type[BaseLLMClient]) -> None:
         """Register a new LLM client type.
@@ -0,0 +1,235 @@
+"""
+Rate-aware request scheduler for LLM calls.
+
+Runs requests on a bounded thread pool while keeping within requests-per-minute
+and tokens-per-minute budgets, and retries rate-limited (HTTP 429) requests
+with exponential backoff.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from spider_aggregation.config import get_config
+from spider_aggregation.core.llm_client import RateLimitError, is_rate_limit_error
+from spider_aggregation.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Length of the sliding rate limit window in seconds
+RATE_WINDOW_SECONDS = 60.0
+
+
+class LLMRequestScheduler:
+    """Run LLM requests concurrently within rate limit budgets."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrency: Max number of requests running at once
+            requests_per_minute: Request budget per minute (0 for unlimited)
+            tokens_per_minute: Token budget per minute (0 for unlimited)
+            max_retries: Retries of a rate-limited request before giving up
+            retry_backoff_seconds: Backoff before the first retry (doubles each retry)
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self._clock = clock
+        self._sleep = sleep
+
+        # (timestamp, tokens) of requests started within the window
+        self._window: deque[tuple[float, int]] = deque()
+        self._window_tokens = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.retries = 0
+        self.throttled_seconds = 0.0
+
+    def _prune(self, now: float) -> None:
+        """Drop requests that left the rate limit window."""
+        while self._window and self._window[0][0] <= now - RATE_WINDOW_SECONDS:
+            _, tokens = self._window.popleft()
+            self._window_tokens -= tokens
+
+    def _reserve(self, tokens: int) -> float:
+        """Reserve budget for a request.
+
+        Returns:
+            0 if the request may start now, otherwise seconds to wait
+        """
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+
+            over_requests = (
+                self.requests_per_minute and len(self._window) >= self.requests_per_minute
+            )
+            # A request larger than the whole token budget may run alone in the window
+            over_tokens = (
+                self.tokens_per_minute
+                and self._window
+                and self._window_tokens + tokens > self.tokens_per_minute
+            )
+            if not over_requests and not over_tokens:
+                self._window.append((now, tokens))
+                self._window_tokens += tokens
+                return 0.0
+
+            if over_tokens:
+                # Wait until enough tokens leave the window
+                freed = 0
+                needed = self._window_tokens + tokens - self.tokens_per_minute
+                for started, used in self._window:
+                    freed += used
+                    if freed >= needed:
+                        break
+            else:
+                started = self._window[0][0]
+            wait = max(started + RATE_WINDOW_SECONDS - now, 0.01)
+            self.throttled_seconds += wait
+            return wait
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until a request of the given size fits the budgets.
+
+        Args:
+            tokens: Estimated tokens of the request (prompt plus completion)
+        """
+        while True:
+            wait = self._reserve(tokens)
+            if not wait:
+                return
+            self._sleep(wait)
+
+    def call(self, fn: Callable[..., Any], *args: Any, tokens: int = 0, **kwargs: Any) -> Any:
+        """Run one request on the calling thread, honouring budgets and retries.
+
+        Args:
+            fn: Function making the request
+            *args: Positional arguments for fn
+            tokens: Estimated tokens of the request
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Return value of fn
+
+        Raises:
+            RateLimitError: If the request is still rate limited after all retries
+            Exception: Any other exception raised by fn
+        """
+        attempt = 0
+        while True:
+            self.acquire(tokens)
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                if not is_rate_limit_error(e):
+                    raise
+                if attempt >= self.max_retries:
+                    if isinstance(e, RateLimitError):
+                        raise
+                    raise RateLimitError(str(e)) from e
+
+                retry_after = getattr(e, "retry_after", None)
+                delay = retry_after or self.retry_backoff_seconds * (2**attempt)
+                delay *= 1 + random.random() * 0.1
+                attempt += 1
+                with self._lock:
+                    self.retries += 1
+                logger.warning(f"Rate limited, retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                self._sleep(delay)
+
+    def submit(self, fn: Callable[..., Any], *args: Any, tokens: int = 0, **kwargs: Any) -> Future:
+        """Schedule a request on the worker pool.
+
+        Args:
+            fn: Function making the request
+            *args: Positional arguments for fn
+            tokens: Estimated tokens of the request
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future resolving to the return value of fn
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix="llm"
+                )
+            executor = self._executor
+        return executor.submit(self.call, fn, *args, tokens=tokens, **kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool.
+
+        Args:
+            wait: Wait for scheduled requests to finish
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def get_stats(self) -> dict:
+        """Get scheduler statistics.
+
+        Returns:
+            Dictionary with retries and total throttled seconds
+        """
+        return {"retries": self.retries, "throttled_seconds": round(self.throttled_seconds, 3)}
+
+    def __enter__(self) -> "LLMRequestScheduler":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+
+def create_llm_scheduler(
+    max_concurrency: Optional[int] = None,
+    requests_per_minute: Optional[int] = None,
+    tokens_per_minute: Optional[int] = None,
+) -> LLMRequestScheduler:
+    """Factory function to create an LLMRequestScheduler from config.
+
+    Args:
+        max_concurrency: Max concurrent requests (defaults to config)
+        requests_per_minute: Request budget (defaults to config)
+        tokens_per_minute: Token budget (defaults to config)
+
+    Returns:
+        Configured LLMRequestScheduler
+    """
+    llm_config = get_config().llm
+    return LLMRequestScheduler(
+        max_concurrency=max_concurrency or llm_config.max_concurrency,
+        requests_per_minute=(
+            requests_per_minute
+            if requests_per_minute is not None
+            else llm_config.requests_per_minute
+        ),
+        tokens_per_minute=(
+            tokens_per_minute if tokens_per_minute is not None else llm_config.tokens_per_minute
+        ),
+        max_retries=llm_config.max_retries,
+        retry_backoff_seconds=llm_config.retry_backoff_seconds,
+    )
@@ -0,0 +1,213 @@
+"""
+Process-wide NLP resources for keyword extraction.
+
+English extraction needs a tokenizer, a stopword list and a lemmatizer. They
+are loaded once per process and shared by every KeywordExtractor. NLTK data
+is used when it is installed; it is only downloaded when
+``keyword_extractor.nltk_download`` is enabled, so air-gapped deployments do
+not block on the network. Missing pieces fall back to the builtin regex
+tokenizer and stopword list below (and to no lemmatization).
+
+Lemmas are memoized per token in a bounded LRU cache, since feed text
+repeats the same words over and over.
+
+preload() loads everything, including jieba's dictionary, in a background
+thread so the first extraction is as fast as the following ones.
+"""
+
+import importlib.util
+import re
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Optional
+
+from spider_aggregation.config import get_config
+from spider_aggregation.logger import get_logger
+
+logger = get_logger(__name__)
+
+# NLTK's English stopword list, used when the NLTK corpus is not installed
+ENGLISH_STOPWORDS = frozenset(
+    """
+    a about above after again against ain all am an and any are aren aren't as at be
+    because been before being below between both but by can couldn couldn't d did didn
+    didn't do does doesn doesn't doing don don't down during each few for from further
+    had hadn hadn't has hasn hasn't have haven haven't having he her here hers herself
+    him himself his how i if in into is isn isn't it it's its itself just ll m ma me
+    mightn mightn't more most mustn mustn't my myself needn needn't no nor not now o of
+    off on once only or other our ours ourselves out over own re s same shan shan't she
+    she's should should've shouldn shouldn't so some such t than that that'll the their
+    theirs them themselves then there these they this those through to too under until
+    up ve very was wasn wasn't we were weren weren't what when where which while who whom
+    why will with won won't wouldn wouldn't y you you'd you'll you're you've your yours
+    yourself yourselves
+    """.split()
+)
+
+# Runs of letters; matches what word_tokenize + isalpha() keeps
+_WORD_RE = re.compile(r"[^\W\d_]+")
+
+JIEBA_AVAILABLE = importlib.util.find_spec("jieba") is not None
+if not JIEBA_AVAILABLE:
+    logger.warning("jieba not available, Chinese keyword extraction limited")
+
+_jieba_analyse = None
+_jieba_lock = threading.Lock()
+
+_resources: Optional["NLPResources"] = None
+_resources_lock = threading.Lock()
+_preload_thread: Optional[threading.Thread] = None
+_preload_lock = threading.Lock()
+
+
+def _builtin_tokenize(text: str) -> list[str]:
+    """Split text into runs of letters."""
+    return _WORD_RE.findall(text)
+
+
+@dataclass(frozen=True)
+class NLPResources:
+    """Loaded English NLP resources.
+
+    Attributes:
+        tokenize: Function splitting text into tokens
+        stopwords: Stopwords to drop
+        lemmatize: Memoized lemmatizer (``lemmatize.cache_info()`` reports hits)
+        source: Where each resource came from, e.g. ``{"tokenizer": "nltk"}``
+    """
+
+    tokenize: Callable[[str], list[str]]
+    stopwords: frozenset[str]
+    lemmatize: Callable[[str], str]
+    source: dict[str, str]
+
+
+def _find_nltk_data(nltk, resource: str, package: str, download: bool) -> bool:
+    """Check for an NLTK data package, downloading it if allowed."""
+    try:
+        nltk.data.find(resource)
+        return True
+    except LookupError:
+        pass
+    if not download:
+        return False
+    try:
+        return bool(nltk.download(package, quiet=True))
+    except Exception as e:
+        logger.warning(f"NLTK download of {package} failed: {e}")
+        return False
+
+
+def _load_resources() -> NLPResources:
+    """Load the NLTK resources that are available, falling back per resource."""
+    config = get_config().keyword_extractor
+    tokenize: Callable[[str], list[str]] = _builtin_tokenize
+    stopwords = ENGLISH_STOPWORDS
+    lemmatize: Callable[[str], str] = str
+    source = {"tokenizer": "builtin", "stopwords": "builtin", "lemmatizer": "none"}
+
+    try:
+        import nltk
+    except ImportError:
+        nltk = None
+        logger.info("NLTK not available, using builtin English tokenizer and stopwords")
+
+    if nltk is not None:
+        download = config.nltk_download
+        try:
+            if _find_nltk_data(nltk, "tokenizers/punkt_tab", "punkt_tab", download):
+                from nltk.tokenize import word_tokenize
+
+                word_tokenize("probe")
+                tokenize = word_tokenize
+                source["tokenizer"] = "nltk"
+        except LookupError as e:
+            logger.warning(f"NLTK tokenizer unavailable, using builtin: {e}")
+        try:
+            if _find_nltk_data(nltk, "corpora/stopwords", "stopwords", download):
+                from nltk.corpus import stopwords as nltk_stopwords
+
+                stopwords = frozenset(nltk_stopwords.words("english"))
+                source["stopwords"] = "nltk"
+        except LookupError as e:
+            logger.warning(f"NLTK stopwords unavailable, using builtin: {e}")
+        try:
+            if _find_nltk_data(nltk, "corpora/wordnet", "wordnet", download):
+                from nltk.stem import WordNetLemmatizer
+
+                lemmatizer = WordNetLemmatizer()
+                # Reads the WordNet corpus now instead of on the first token
+                lemmatizer.lemmatize("probe")
+                lemmatize = lemmatizer.lemmatize
+                source["lemmatizer"] = "nltk"
+        except LookupError as e:
+            logger.warning(f"NLTK lemmatizer unavailable, lemmatization disabled: {e}")
+
+    logger.info(f"NLP resources loaded: {source}")
+    return NLPResources(
+        tokenize=tokenize,
+        stopwords=stopwords,
+        lemmatize=lru_cache(maxsize=config.lemma_cache_size)(lemmatize),
+        source=source,
+    )
+
+
+def get_nlp_resources() -> NLPResources:
+    """Get the process-wide English NLP resources, loading them on first use.
+
+    Returns:
+        Shared NLPResources instance
+    """
+    global _resources
+    if _resources is None:
+        with _resources_lock:
+            if _resources is None:
+                _resources = _load_resources()
+    return _resources
+
+
+def get_jieba():
+    """Get ``jieba.analyse`` with its dictionary loaded, importing it on first use.
+
+    Returns:
+        The jieba.analyse module, or None if jieba is not installed
+    """
+    global JIEBA_AVAILABLE, _jieba_analyse
+    if _jieba_analyse is not None or not JIEBA_AVAILABLE:
+        return _jieba_analyse
+
+    with _jieba_lock:
+        if _jieba_analyse is None and JIEBA_AVAILABLE:
+            try:
+                import jieba.analyse
+            except ImportError:
+                JIEBA_AVAILABLE = False
+                logger.warning("jieba not available, Chinese keyword extraction limited")
+                return None
+            # The word dictionary is otherwise read on the first segmentation
+            jieba.analyse.default_tfidf.tokenizer.initialize()
+            _jieba_analyse = jieba.analyse
+    return _jieba_analyse
+
+
+def preload() -> threading.Thread:
+    """Load the English resources and jieba in a background thread (once per process).
+
+    Returns:
+        The preload thread
+    """
+    global _preload_thread
+    with _preload_lock:
+        if _preload_thread is None:
+            _preload_thread = threading.Thread(target=_preload, name="nlp-preload", daemon=True)
+            _preload_thread.start()
+    return _preload_thread
+
+
+def _preload() -> None:
+    try:
+        get_nlp_resources()
+        get_jieba()
+    except Exception as e:
+        logger.warning(f"NLP resource preload failed: {e}")
@@ -12,7 +12,9 @@ from typing import Optional
 from bs4 import BeautifulSoup
 
 from spider_aggregation.config import get_config
+from spider_aggregation.core.text_analysis import analyze_text
 from spider_aggregation.logger import get_logger
+from spider_aggregation.metrics import PARSE_ENTRY_DURATION
 
 logger = get_logger(__name__)
 
@@ -38,6 +40,7 @@ class ContentParser:
         self.max_content_length = max_content_length or config.fetcher.max_content_length
         self.strip_html = strip_html
         self.preserve_paragraphs = preserve_paragraphs
+        self.persist_text_analysis = config.ingestion.persist_text_analysis
 
     def parse_entry(self, raw_entry: dict) -> dict:
         """Parse and normalize a raw feed entry.
@@ -48,25 +51,34 @@ class ContentParser:
         Returns:
             Normalized entry dictionary
         """
+        with PARSE_ENTRY_DURATION.time():
+            return self._parse_entry(raw_entry)
+
+    def _parse_entry(self, raw_entry: dict) -> dict:
+        """Normalize a raw feed entry (see parse_entry).
+
+        The content's TextAnalysis (shared with the filter, keyword and
+        summary stages) provides the reading time; the language is still
+        guessed from the feed's summary (see _detect_language).
+        """
+        content = self._normalize_content(raw_entry.get("content") or raw_entry.get("summary"))
+        analysis = analyze_text(content) if content else None
         parsed = {
             "title": self._normalize_title(raw_entry.get("title")),
             "link": self._normalize_link(raw_entry.get("link")),
             "author": self._normalize_author(raw_entry.get("author")),
             "summary": self._normalize_summary(raw_entry.get("summary")),
-            "content": self._normalize_content(
-                raw_entry.get("content") or raw_entry.get("summary")
-            ),
+            "content": content,
             "published_at": self._parse_date(raw_entry.get("published")),
             "updated_at": self._parse_date(raw_entry.get("updated")),
             "tags": self._extract_tags(raw_entry),
             "language": self._detect_language(raw_entry),
-            "reading_time_seconds": None,
+            "reading_time_seconds": analysis.reading_time_seconds if analysis else None,
+            "text_analysis": (
+                analysis.to_compact() if analysis and self.persist_text_analysis else None
+            ),
         }
 
-        # Calculate reading time
-        if parsed["content"]:
-            parsed["reading_time_seconds"] = self._calculate_reading_time(parsed["content"])
-
         return parsed
 
     def _normalize_title(self, title: Optional[str]) -> Optional[str]:
@@ -415,6 +427,9 @@ class ContentParser:
     def _detect_language(self, raw_entry: dict) -> Optional[str]:
         """Detect entry language.
 
+        Without an explicit language field, the language is guessed from the
+        raw summary or description, not from the normalized content.
+
         Args:
             raw_entry: Raw entry from feedparser
 
@@ -430,47 +445,23 @@ class ContentParser:
                 if lang in ["en", "zh", "ja", "ko", "fr", "de", "es", "ru", "pt"]:
                     return lang
 
-        # Simple detection based on content
-        content = raw_entry.get("summary") or raw_entry.get("description") or ""
-        if content:
-            # Detect Japanese characters (Hiragana, Katakana)
-            if re.search(r"[\u3040-\u309f\u30a0-\u30ff]", content):
-                return "ja"
-            # Detect Chinese characters (after Japanese check to avoid overlap)
-            if re.search(r"[\u4e00-\u9fff]", content):
-                return "zh"
-            # Default to English if has Latin characters
-            if re.search(r"[a-zA-Z]", content):
-                return "en"
+        # Simple detection based on the characters used (Japanese kana, then
+        # Chinese ideographs, then Latin letters)
+        return analyze_text(raw_entry.get("summary") or raw_entry.get("description")).language
 
-        return None
-
-    def _calculate_reading_time(self, content: str) -> int:
+    def _calculate_reading_time(self, content: Optional[str]) -> int:
         """Calculate estimated reading time in seconds.
 
+        Assumes ~200 words per minute (whitespace-separated words, which
+        underestimates Chinese text), with a minimum of 10 seconds.
+
         Args:
             content: Content text
 
         Returns:
-            Reading time in seconds
+            Reading time in seconds (0 for empty content)
         """
-        if not content:
-            return 0
-
-        # Count words (approximate)
-        # Split by whitespace to get word count
-        words = content.split()
-        word_count = len(words)
-
-        # Average reading speed: ~200-250 words per minute
-        # For Chinese: ~400-500 characters per minute (we use word_count which underestimates)
-        # For English: ~200-250 words per minute
-        words_per_minute = 200
-
-        reading_time_minutes = word_count / words_per_minute
-        reading_time_seconds = int(reading_time_minutes * 60)
-
-        return max(10, reading_time_seconds)  # Minimum 10 seconds
+        return analyze_text(content).reading_time_seconds
 
 
 class FeedMetadataParser:
@@ -1,24 +1,39 @@
 """
 Task scheduler for automated feed fetching.
 
-Uses APScheduler to manage periodic jobs for fetching RSS/Atom feeds.
+Uses APScheduler to manage periodic jobs for fetching RSS/Atom feeds. Jobs
+run feeds through the ingestion pipeline, so scheduled fetches store new
+entries like manual ones.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Optional
-
-from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED, JobEvent
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_MISSED,
+    EVENT_JOB_SUBMITTED,
+    JobEvent,
+    JobSubmissionEvent,
+)
 from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from sqlalchemy.orm import Session
 
 from spider_aggregation.config import get_config
-from spider_aggregation.core.fetcher import FeedFetcher, FetchResult
+from spider_aggregation.core.fetcher import FeedFetcher
 from spider_aggregation.logger import get_logger
+from spider_aggregation.metrics import SCHEDULER_JOBS_IN_FLIGHT, SCHEDULER_LAG
+from spider_aggregation.storage.group_commit import get_group_commit_writer
 from spider_aggregation.storage.repositories.feed_repo import FeedRepository
 
+if TYPE_CHECKING:
+    from spider_aggregation.application.ingestion import IngestResult
+    from spider_aggregation.storage.group_commit import GroupCommitWriter
+
 logger = get_logger(__name__)
 
 
@@ -34,7 +49,7 @@ class JobStatus:
     trigger: str
     runs_count: int = 0
     errors_count: int = 0
-    last_result: Optional[FetchResult] = None
+    last_result: Optional["IngestResult"] = None
     last_error: Optional[str] = None
 
 
@@ -86,12 +101,14 @@ class FeedScheduler:
         self.start_time: Optional[datetime] = None
 
         # Job tracking
-        self._job_results: dict[str, FetchResult] = {}
+        self._job_results: dict[str, "IngestResult"] = {}
         self._job_errors: dict[str, str] = {}
 
         # Add event listeners
         self.scheduler.add_listener(self._on_job_executed, EVENT_JOB_EXECUTED)
         self.scheduler.add_listener(self._on_job_error, EVENT_JOB_ERROR)
+        self.scheduler.add_listener(self._on_job_submitted, EVENT_JOB_SUBMITTED)
+        self.scheduler.add_listener(self._on_job_missed, EVENT_JOB_MISSED)
 
     def start(self) -> None:
         """Start the scheduler."""
@@ -312,133 +329,137 @@ class FeedScheduler:
 
         return self.stats
 
-    def _fetch_feed_wrapper(self, feed_id: int) -> FetchResult:
-        """Wrapper for fetching a single feed.
+    def _fetch_feed_wrapper(self, feed_id: int) -> "IngestResult":
+        """Wrapper for ingesting a single feed.
 
         Args:
             feed_id: Feed ID to fetch
 
         Returns:
-            FetchResult
+            IngestResult
         """
-        # Use provided session or create a new one from db_manager
-        if self.session:
-            # Use the provided session (caller manages transaction)
-            session = self.session
-            manage_transaction = False
-        elif self.db_manager:
-            # Create a new session with proper transaction management
-            manage_transaction = True
-        else:
-            logger.error(f"No database session or db_manager for job feed_{feed_id}")
-            return FetchResult(
-                success=False,
-                feed_id=feed_id,
-                feed_url="",
-                error="No database session",
-            )
-
-        def _do_fetch(session: Session) -> FetchResult:
-            """Inner function that performs the actual fetch."""
-            repo = FeedRepository(session)
-            feed = repo.get_by_id(feed_id)
+        return self._ingest_feeds(f"feed_{feed_id}", [feed_id])[0]
 
-            if not feed:
-                logger.error(f"Feed {feed_id} not found")
-                return FetchResult(
-                    success=False,
-                    feed_id=feed_id,
-                    feed_url="",
-                    error="Feed not found",
-                )
+    def _fetch_feeds_wrapper(self, feed_ids: list[int]) -> list["IngestResult"]:
+        """Wrapper for ingesting multiple feeds through one pipeline run.
 
-            if not feed.enabled:
-                logger.debug(f"Feed {feed_id} is disabled, skipping")
-                return FetchResult(
-                    success=True,
-                    feed_id=feed_id,
-                    feed_url=feed.url,
-                    entries_count=0,
-                )
+        Args:
+            feed_ids: List of feed IDs to fetch
 
-            fetcher = FeedFetcher(session=session)
-            result = fetcher.fetch_feed(feed)
+        Returns:
+            List of IngestResult
+        """
+        return self._ingest_feeds(f"feeds_batch_{len(feed_ids)}", feed_ids)
 
-            return result
+    def _ingest_feeds(self, job_id: str, feed_ids: list[int]) -> list["IngestResult"]:
+        """Fetch feeds and store their new entries, recording job statistics.
 
-        if manage_transaction:
-            # Use context manager for proper transaction handling
-            try:
-                with self.db_manager.session() as session:
-                    result = _do_fetch(session)
+        Uses the provided session (the caller manages the transaction) or a
+        new session from db_manager. In the latter case the entries of SQLite
+        databases are stored through the group commit writer, so concurrent
+        jobs do not compete for the database lock.
 
-                    self.stats.total_executions += 1
-                    if result.success:
-                        self.stats.successful_executions += 1
-                    else:
-                        self.stats.failed_executions += 1
+        Args:
+            job_id: Job ID errors are recorded under
+            feed_ids: Feed IDs to fetch
 
-                    self.stats.last_execution_time = datetime.now()
-                    self._job_results[f"feed_{feed_id}"] = result
+        Returns:
+            IngestResult per feed ID
+        """
+        from spider_aggregation.application.ingestion import IngestResult
 
-                    return result
+        if not self.session and not self.db_manager:
+            logger.error(f"No database session or db_manager for job {job_id}")
+            return [
+                IngestResult(feed_id=feed_id, success=False, error="No database session")
+                for feed_id in feed_ids
+            ]
 
-            except Exception as e:
-                logger.exception(f"Error in job feed_{feed_id}: {e}")
+        try:
+            if self.session:
+                results = self._run_pipeline(self.session, feed_ids)
+            else:
+                with self.db_manager.session() as session:
+                    writer = get_group_commit_writer(session.get_bind())
+                    results = self._run_pipeline(session, feed_ids, writer=writer)
+        except Exception as e:
+            logger.exception(f"Error in job {job_id}: {e}")
+            self.stats.failed_executions += 1
+            self._job_errors[job_id] = str(e)
+            return [
+                IngestResult(feed_id=feed_id, success=False, error=str(e)) for feed_id in feed_ids
+            ]
+
+        for result in results:
+            self.stats.total_executions += 1
+            if result.success:
+                self.stats.successful_executions += 1
+            else:
                 self.stats.failed_executions += 1
-                self._job_errors[f"feed_{feed_id}"] = str(e)
-                return FetchResult(
-                    success=False,
-                    feed_id=feed_id,
-                    feed_url="",
-                    error=str(e),
-                )
-        else:
-            # Caller manages the session/transaction
-            try:
-                result = _do_fetch(self.session)
+            self._job_results[f"feed_{result.feed_id}"] = result
+        self.stats.last_execution_time = datetime.now()
 
-                self.stats.total_executions += 1
-                if result.success:
-                    self.stats.successful_executions += 1
-                else:
-                    self.stats.failed_executions += 1
+        return results
 
-                self.stats.last_execution_time = datetime.now()
-                self._job_results[f"feed_{feed_id}"] = result
+    def _run_pipeline(
+        self,
+        session: Session,
+        feed_ids: list[int],
+        writer: Optional["GroupCommitWriter"] = None,
+    ) -> list["IngestResult"]:
+        """Run the enabled feeds among ``feed_ids`` through the ingestion pipeline.
 
-                return result
+        Args:
+            session: Database session
+            feed_ids: Feed IDs to fetch
+            writer: Group commit writer storing the entries (None writes through session)
 
-            except Exception as e:
-                logger.exception(f"Error in job feed_{feed_id}: {e}")
-                self.stats.failed_executions += 1
-                self._job_errors[f"feed_{feed_id}"] = str(e)
-                return FetchResult(
-                    success=False,
-                    feed_id=feed_id,
-                    feed_url="",
-                    error=str(e),
+        Returns:
+            IngestResult per feed ID
+        """
+        from spider_aggregation.application.ingestion import IngestionPipeline, IngestResult
+
+        repo = FeedRepository(session)
+        results: dict[int, IngestResult] = {}
+        feeds = []
+        for feed_id in feed_ids:
+            feed = repo.get_by_id(feed_id)
+            if not feed:
+                logger.error(f"Feed {feed_id} not found")
+                results[feed_id] = IngestResult(
+                    feed_id=feed_id, success=False, error="Feed not found"
                 )
+            elif not feed.enabled:
+                logger.debug(f"Feed {feed_id} is disabled, skipping")
+                results[feed_id] = IngestResult(feed_id=feed_id, success=True)
+            else:
+                feeds.append(feed)
 
-    def _fetch_feeds_wrapper(self, feed_ids: list[int]) -> list[FetchResult]:
-        """Wrapper for fetching multiple feeds.
+        pipeline = IngestionPipeline(session, fetcher_factory=FeedFetcher, writer=writer)
+        for feed, result in zip(feeds, pipeline.run(feeds)):
+            results[feed.id] = result
 
-        Args:
-            feed_ids: List of feed IDs to fetch
+        return [results[feed_id] for feed_id in feed_ids]
 
-        Returns:
-            List of FetchResult
+    def _on_job_submitted(self, event: JobSubmissionEvent) -> None:
+        """Record how late a job was handed to the executor.
+
+        Args:
+            event: Job submission event
         """
-        if not self.session:
-            logger.error("No database session for batch job")
-            return []
+        # The executor reports each run time as executed, failed or missed
+        SCHEDULER_JOBS_IN_FLIGHT.inc(len(event.scheduled_run_times))
+        for scheduled in event.scheduled_run_times:
+            lag = (datetime.now(scheduled.tzinfo) - scheduled).total_seconds()
+            SCHEDULER_LAG.observe(max(lag, 0.0))
 
-        results = []
-        for feed_id in feed_ids:
-            result = self._fetch_feed_wrapper(feed_id)
-            results.append(result)
+    def _on_job_missed(self, event: JobEvent) -> None:
+        """Handle a run time the executor skipped as misfired.
 
-        return results
+        Args:
+            event: Job event
+        """
+        SCHEDULER_JOBS_IN_FLIGHT.dec()
 
     def _on_job_executed(self, event: JobEvent) -> None:
         """Handle job executed event.
@@ -446,6 +467,7 @@ class FeedScheduler:
         Args:
             event: Job event
         """
+        SCHEDULER_JOBS_IN_FLIGHT.dec()
         job_id = event.job_id
         if job_id and job_id in self._job_errors:
             # Clear previous error on successful execution
@@ -457,6 +479,7 @@ class FeedScheduler:
         Args:
             event: Job event
         """
+        SCHEDULER_JOBS_IN_FLIGHT.dec()
         job_id = event.job_id
         exception = event.exception
         if job_id and exception:
@@ -39,6 +39,10 @@ from spider_aggregation.core.services.deduplicator_service import (
     DeduplicatorService,
     create_deduplicator_service,
 )
+from spider_aggregation.core.services.clustering_service import (
+    ClusteringService,
+    create_clustering_service,
+)
 from spider_aggregation.core.services.filter_service import FilterService, create_filter_service
 from spider_aggregation.core.services.scheduler_service import (
     SchedulerService,
@@ -56,6 +60,7 @@ __all__ = [
     "FetcherService",
     "ParserService",
     "DeduplicatorService",
+    "ClusteringService",
     "FilterService",
     "SchedulerService",
     "ContentService",
@@ -65,6 +70,7 @@ __all__ = [
     "create_fetcher_service",
     "create_parser_service",
     "create_deduplicator_service",
+    "create_clustering_service",
     "create_filter_service",
     "create_scheduler_service",
     "create_content_service",
@@ -0,0 +1,83 @@
+"""
+Facade for story clustering operations.
+
+Provides unified interface for grouping related entries across feeds.
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy.orm import Session
+
+from spider_aggregation.config import get_config
+from spider_aggregation.logger import get_logger
+
+if TYPE_CHECKING:
+    from spider_aggregation.models import EntryModel
+
+
+class ClusteringService:
+    """Facade for story clustering operations.
+
+    Provides unified interface for assigning entries to story clusters.
+    """
+
+    def __init__(self, session: Session, similarity_threshold: Optional[float] = None):
+        """Initialize clustering service.
+
+        Args:
+            session: Database session
+            similarity_threshold: Override minimum similarity to join a cluster
+        """
+        from spider_aggregation.core.factories import create_story_clusterer
+
+        self.enabled = get_config().clustering.enabled
+        self._session = session
+        self._clusterer = create_story_clusterer(
+            session=session, similarity_threshold=similarity_threshold
+        )
+        self._logger = get_logger(__name__)
+
+    def assign(self, entry: "EntryModel") -> Optional[int]:
+        """Assign a newly stored entry to a story cluster.
+
+        Args:
+            entry: Persisted EntryModel instance
+
+        Returns:
+            Cluster ID, or None if clustering is disabled, the entry has no text
+            or clustering failed (its writes are rolled back, leaving the
+            session usable)
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            with self._session.begin_nested():
+                return self._clusterer.assign(entry)
+        except Exception as e:
+            self._logger.warning(f"Failed to cluster entry {entry.id}: {e}")
+            return None
+
+    def get_stats(self) -> dict:
+        """Get clustering statistics.
+
+        Returns:
+            Dictionary with clustering stats
+        """
+        return self._clusterer.get_stats()
+
+
+def create_clustering_service(
+    session: Session,
+    similarity_threshold: Optional[float] = None,
+) -> ClusteringService:
+    """Create a ClusteringService instance.
+
+    Args:
+        session: Database session
+        similarity_threshold: Override minimum similarity to join a cluster
+
+    Returns:
+        Configured ClusteringService
+    """
+    return ClusteringService(session=session, similarity_threshold=similarity_threshold)
@@ -12,6 +12,7 @@ from spider_aggregation.logger import get_logger
 
 if TYPE_CHECKING:
     from spider_aggregation.core.deduplicator import DedupResult
+    from spider_aggregation.models import EntryModel
 
 
 class DeduplicatorService:
@@ -20,12 +21,13 @@ class DeduplicatorService:
     Provides unified interface for checking duplicate entries.
     """
 
-    def __init__(self, session: Optional[Session] = None, strategy: str = "medium"):
+    def __init__(self, session: Optional[Session] = None, strategy: Optional[str] = None):
         """Initialize deduplicator service.
 
         Args:
             session: Database session for duplicate checking
-            strategy: Deduplication strategy (strict/medium/relaxed)
+            strategy: Deduplication strategy (strict/medium/relaxed/near_duplicate),
+                defaults to the configured strategy
         """
         from spider_aggregation.core.factories import create_deduplicator
 
@@ -45,10 +47,21 @@ class DeduplicatorService:
         """
         return self._deduplicator.check_duplicate(parsed_entry, feed_id)
 
+    def index_entry(self, entry: "EntryModel") -> bool:
+        """Add a newly stored entry to the near-duplicate index.
+
+        Args:
+            entry: Persisted EntryModel instance
+
+        Returns:
+            True if the entry was indexed (near_duplicate strategy only)
+        """
+        return self._deduplicator.index_entry(entry)
+
 
 def create_deduplicator_service(
     session: Optional[Session] = None,
-    strategy: str = "medium",
+    strategy: Optional[str] = None,
 ) -> DeduplicatorService:
     """Create a DeduplicatorService instance.
 
@@ -6,6 +6,9 @@ Provides unified interface for extracting keywords from content.
 
 from typing import Optional
 
+from sqlalchemy.orm import Session
+
+from spider_aggregation.config import get_config
 from spider_aggregation.logger import get_logger
 
 
@@ -41,6 +44,49 @@ class KeywordService:
         """
         return self._extractor.extract(text)
 
+    def extract_batch(
+        self, texts: list[Optional[str]], session: Optional[Session] = None
+    ) -> list[list[str]]:
+        """Extract keywords from many texts.
+
+        With a session (and corpus statistics enabled), keywords are scored
+        with BM25 against the corpus statistics.
+
+        Args:
+            texts: Input texts
+            session: Database session to read the corpus statistics with
+
+        Returns:
+            List of keyword strings for each text
+        """
+        from spider_aggregation.storage.repositories.term_stats_repo import (
+            CorpusStatsRepository,
+        )
+
+        corpus = None
+        if session is not None and get_config().keyword_extractor.corpus_stats:
+            corpus = CorpusStatsRepository(session)
+        return self._extractor.extract_batch(texts, corpus=corpus)
+
+    def record_documents(self, texts: list[Optional[str]], session: Session) -> int:
+        """Count new documents in the corpus statistics.
+
+        Args:
+            texts: Document texts
+            session: Database session (the counts are written in its transaction)
+
+        Returns:
+            Number of documents counted (0 if corpus statistics are disabled)
+        """
+        from spider_aggregation.storage.repositories.term_stats_repo import (
+            CorpusStatsRepository,
+        )
+
+        config = get_config().keyword_extractor
+        if not (config.enabled and config.corpus_stats):
+            return 0
+        return self._extractor.record_documents(texts, CorpusStatsRepository(session))
+
 
 def create_keyword_service(
     max_keywords: Optional[int] = None,
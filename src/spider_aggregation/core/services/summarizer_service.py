@@ -19,31 +19,58 @@ class SummarizerService:
         self,
         method: Optional[str] = None,
         max_sentences: Optional[int] = None,
+        fallback_on_rate_limit: bool = True,
     ):
         """Initialize summarizer service.
 
         Args:
-            method: Summarization method (extractive or ai)
+            method: Summarization method (extractive, textrank or ai)
             max_sentences: Maximum sentences in summary
+            fallback_on_rate_limit: Fall back to extractive when the AI API is
+                rate limited (otherwise RateLimitError is raised)
         """
         from spider_aggregation.core.factories import create_summarizer
 
         self._summarizer = create_summarizer(
             method=method,
             max_sentences=max_sentences,
+            fallback_on_rate_limit=fallback_on_rate_limit,
         )
         self._logger = get_logger(__name__)
 
-    def summarize(self, content: str) -> str:
+    @property
+    def uses_llm(self) -> bool:
+        """Whether summaries are generated by an LLM API."""
+        return self._summarizer.method == "ai"
+
+    @property
+    def max_tokens(self) -> int:
+        """Maximum tokens of an AI summary."""
+        return self._summarizer.ai_max_tokens
+
+    def summarize(self, content: str) -> Optional[str]:
         """Generate a summary of content.
 
         Args:
             content: Input content
 
         Returns:
-            Summary string
+            Summary string, or None if no summary could be generated
+        """
+        result = self._summarizer.summarize(content)
+        return result.summary if result.success else None
+
+    def summarize_batch(self, contents: list[str]) -> list[Optional[str]]:
+        """Generate summaries of many contents at once.
+
+        Args:
+            contents: Input contents
+
+        Returns:
+            Summary (or None) for each content, in order
         """
-        return self._summarizer.summarize(content)
+        results = self._summarizer.summarize_batch(contents)
+        return [result.summary if result.success else None for result in results]
 
 
 def create_summarizer_service(
@@ -53,7 +80,7 @@ def create_summarizer_service(
     """Create a SummarizerService instance.
 
     Args:
-        method: Summarization method (extractive or ai)
+        method: Summarization method (extractive, textrank or ai)
         max_sentences: Maximum sentences in summary
 
     Returns:
@@ -1,14 +1,23 @@
 """
 Summarizer for generating article summaries.
 
-Supports extractive summarization (rule-based) and AI summarization (Zhipu AI).
+Supports extractive summarization (rule-based or TextRank) and AI
+summarization (Zhipu AI).
 """
 
+import importlib.util
 import re
 from typing import Optional
 from dataclasses import dataclass
 
 from spider_aggregation.config import get_config
+from spider_aggregation.core.llm_client import (
+    LLMResponse,
+    RateLimitError,
+    get_llm_cache,
+    is_rate_limit_error,
+)
+from spider_aggregation.core.text_analysis import analyze_text
 from spider_aggregation.logger import get_logger
 
 logger = get_logger(__name__)
@@ -22,6 +31,9 @@ except ImportError:
     ZHIPUAI_AVAILABLE = False
     logger.warning("zhipuai not available, AI summarization disabled")
 
+# TextRank (core/textrank.py) needs NumPy, imported only when configured
+TEXTRANK_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
 
 @dataclass
 class SummaryResult:
@@ -29,7 +41,7 @@ class SummaryResult:
 
     success: bool
     summary: Optional[str] = None
-    method: str = ""  # "extractive" or "ai"
+    method: str = ""  # "extractive", "textrank" or "ai"
     error: Optional[str] = None
 
     def __repr__(self) -> str:
@@ -56,38 +68,16 @@ class ExtractiveSummarizer:
     def _split_sentences(self, text: str) -> list[str]:
         """Split text into sentences.
 
+        Uses the shared TextAnalysis, which handles Chinese and English
+        sentence boundaries.
+
         Args:
             text: Input text
 
         Returns:
             List of sentences
         """
-        # Simple sentence splitting using regex
-        # This handles English and basic Chinese sentence boundaries
-
-        # Chinese sentence boundaries
-        sentences = re.split(r"([。！？\n]+)", text)
-
-        # Rejoin punctuation with sentences
-        result = []
-        for i in range(0, len(sentences) - 1, 2):
-            sentence = sentences[i] + (sentences[i + 1] if i + 1 < len(sentences) else "")
-            sentence = sentence.strip()
-            if sentence:
-                result.append(sentence)
-
-        # Handle remaining text
-        if len(sentences) % 2 == 1:
-            remaining = sentences[-1].strip()
-            if remaining:
-                result.append(remaining)
-
-        # Also try English-style splitting
-        if len(result) <= 1:
-            result = re.split(r"[.!?]+\s+", text)
-            result = [s.strip() for s in result if s.strip()]
-
-        return result
+        return analyze_text(text).sentences
 
     def _score_sentence(self, sentence: str, position: int, total: int) -> float:
         """Score a sentence for importance.
@@ -160,16 +150,12 @@ class ExtractiveSummarizer:
             (s, self._score_sentence(s, i, len(sentences))) for i, s in enumerate(sentences)
         ]
 
-        # Sort by score and select top sentences
-        scored_sentences.sort(key=lambda x: x[1], reverse=True)
-        selected = scored_sentences[: self.max_sentences]
+        # Select the top sentences by score (earlier sentences win ties)
+        ranked = sorted(range(len(sentences)), key=lambda i: scored_sentences[i][1], reverse=True)
+        selected = sorted(ranked[: self.max_sentences])
 
-        # Re-sort by original position
-        selected_with_pos = [(s, sentences.index(s), score) for s, score in selected]
-        selected_with_pos.sort(key=lambda x: x[1])
-
-        # Join sentences
-        summary = " ".join(s for s, _, _ in selected_with_pos)
+        # Join sentences in their original order
+        summary = " ".join(sentences[i] for i in selected)
 
         return SummaryResult(success=True, summary=summary, method="extractive")
 
@@ -177,11 +163,14 @@ class ExtractiveSummarizer:
 class AISummarizer:
     """AI-based summarization using Zhipu AI."""
 
+    TEMPERATURE = 0.7
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         model: str = "glm-4-flash",
         max_tokens: int = 150,
+        use_cache: bool = True,
     ) -> None:
         """Initialize the AI summarizer.
 
@@ -189,12 +178,14 @@ class AISummarizer:
             api_key: Zhipu AI API key
             model: Model name to use
             max_tokens: Maximum tokens in summary
+            use_cache: Serve repeated prompts from the shared LLM response cache
         """
         if not ZHIPUAI_AVAILABLE:
             raise ImportError("zhipuai package is required for AI summarization")
 
         self.model = model
         self.max_tokens = max_tokens
+        self._cache = get_llm_cache() if use_cache else None
 
         # Get API key from parameter or environment
         if not api_key:
@@ -236,6 +227,9 @@ class AISummarizer:
 
         Returns:
             SummaryResult with generated summary
+
+        Raises:
+            RateLimitError: If the API rejected the request for rate limiting
         """
         if not self._client:
             return SummaryResult(
@@ -248,11 +242,20 @@ class AISummarizer:
         try:
             prompt = self._build_prompt(text)
 
+            cache_key = None
+            if self._cache is not None:
+                cache_key = self._cache.make_key(
+                    "zhipuai", self.model, self.TEMPERATURE, None, prompt
+                )
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    return SummaryResult(success=True, summary=cached.content, method="ai")
+
             response = self._client.chat.completions.create(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=self.max_tokens,
-                temperature=0.7,
+                temperature=self.TEMPERATURE,
             )
 
             summary = response.choices[0].message.content.strip()
@@ -260,9 +263,13 @@ class AISummarizer:
             if not summary:
                 return SummaryResult(success=False, error="AI returned empty summary")
 
+            if cache_key is not None:
+                self._cache.set(cache_key, LLMResponse(success=True, content=summary))
             return SummaryResult(success=True, summary=summary, method="ai")
 
         except Exception as e:
+            if is_rate_limit_error(e):
+                raise RateLimitError(str(e)) from e
             logger.error(f"AI summarization failed: {e}")
             return SummaryResult(success=False, error=f"AI error: {e}")
 
@@ -278,18 +285,27 @@ class Summarizer:
         ai_api_key: Optional[str] = None,
         ai_model: str = "glm-4-flash",
         ai_max_tokens: int = 150,
+        fallback_on_rate_limit: bool = True,
+        textrank_top_k: int = 10,
     ) -> None:
         """Initialize the summarizer.
 
         Args:
-            method: Summarization method (extractive or ai)
+            method: Summarization method (extractive, textrank or ai)
             max_sentences: Max sentences for extractive
             min_sentence_length: Min sentence length for extractive
             ai_api_key: API key for AI summarization
             ai_model: AI model to use
             ai_max_tokens: Max tokens for AI summary
+            fallback_on_rate_limit: Fall back to extractive when the AI API is
+                rate limited (otherwise RateLimitError is raised so the caller
+                can retry)
+            textrank_top_k: Most similar sentences each sentence is linked to
+                by TextRank
         """
         self.method = method
+        self.ai_max_tokens = ai_max_tokens
+        self.fallback_on_rate_limit = fallback_on_rate_limit
 
         self._extractive = ExtractiveSummarizer(
             max_sentences=max_sentences,
@@ -312,6 +328,20 @@ class Summarizer:
         else:
             self._ai = None
 
+        self._textrank = None
+        if method == "textrank":
+            if TEXTRANK_AVAILABLE:
+                from spider_aggregation.core.textrank import TextRankSummarizer
+
+                self._textrank = TextRankSummarizer(
+                    max_sentences=max_sentences,
+                    min_sentence_length=min_sentence_length,
+                    top_k=textrank_top_k,
+                )
+            else:
+                logger.warning("numpy not available, falling back to extractive summarization")
+                self.method = "extractive"
+
         logger.info(f"Summarizer initialized with method: {self.method}")
 
     def summarize(self, text: Optional[str], method: Optional[str] = None) -> SummaryResult:
@@ -330,7 +360,12 @@ class Summarizer:
         effective_method = method or self.method
 
         if effective_method == "ai" and self._ai:
-            result = self._ai.summarize(text)
+            try:
+                result = self._ai.summarize(text)
+            except RateLimitError as e:
+                if not self.fallback_on_rate_limit:
+                    raise
+                result = SummaryResult(success=False, error=f"AI error: {e}")
             # Fallback to extractive on AI failure
             if not result.success and result.error:
                 logger.warning(
@@ -338,9 +373,30 @@ class Summarizer:
                 )
                 return self._extractive.summarize(text)
             return result
+        elif effective_method == "textrank" and self._textrank:
+            return self._textrank.summarize(text)
         else:
             return self._extractive.summarize(text)
 
+    def summarize_batch(
+        self, texts: list[Optional[str]], method: Optional[str] = None
+    ) -> list[SummaryResult]:
+        """Generate summaries of many texts.
+
+        TextRank ranks all the texts in one pass; other methods summarize
+        them one by one.
+
+        Args:
+            texts: Input texts
+            method: Override default method
+
+        Returns:
+            SummaryResult for each text, in order
+        """
+        if (method or self.method) == "textrank" and self._textrank:
+            return self._textrank.summarize_batch(texts)
+        return [self.summarize(text, method) for text in texts]
+
     def summarize_entry(
         self,
         title: str,
@@ -393,4 +449,5 @@ def create_summarizer(
         ai_api_key=ai_api_key,
         ai_model=config.summarizer.ai_model,
         ai_max_tokens=config.summarizer.ai_max_tokens,
+        textrank_top_k=config.summarizer.textrank_top_k,
     )
@@ -0,0 +1,214 @@
+"""
+Shared text analysis of entry content.
+
+The parser, filter engine, keyword extractor and summarizer all need facts
+about the same (up to 100 KB) content: its language, lowercased form,
+sentences and length. analyze_text() returns one TextAnalysis per text from
+a small process-wide LRU cache, and each fact is computed on first access,
+so every stage reuses what an earlier stage already derived instead of
+re-scanning the text.
+
+to_compact() serializes the analysis into a short JSON string (sentence
+offsets rather than sentence text) that can be stored with the entry;
+analyze_text(text, compact=...) restores it without re-analyzing.
+"""
+
+import json
+import re
+import threading
+from collections import OrderedDict
+from functools import cached_property
+from typing import Optional
+
+from spider_aggregation.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Analyses kept in the process-wide cache
+CACHE_SIZE = 256
+
+# Average reading speed used for reading time estimates
+WORDS_PER_MINUTE = 200
+MIN_READING_SECONDS = 10
+
+# Version of the compact serialized form
+COMPACT_VERSION = 1
+
+_KANA_RE = re.compile(r"[\u3040-\u309f\u30a0-\u30ff]")
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+_LATIN_RE = re.compile(r"[a-zA-Z]")
+
+# Chinese sentence ends (and line breaks), kept with their sentence
+_CJK_SENTENCE_END_RE = re.compile(r"[。！？\n]+")
+# English sentence ends, dropped from the sentence
+_SENTENCE_END_RE = re.compile(r"[.!?]+\s+")
+
+
+class TextAnalysis:
+    """Lazily computed facts about one text.
+
+    Attributes are cached properties: each is computed once, on first use.
+    """
+
+    def __init__(self, text: str) -> None:
+        """Initialize the analysis.
+
+        Args:
+            text: Text to analyze (normally the parser's normalized content)
+        """
+        self.text = text
+
+    @cached_property
+    def lower(self) -> str:
+        """Lowercased text, for case-insensitive matching."""
+        return self.text.lower()
+
+    @cached_property
+    def language(self) -> Optional[str]:
+        """Language guessed from the script: ja, zh, en, or None."""
+        if _KANA_RE.search(self.text):
+            return "ja"
+        if self.cjk_ratio > 0:
+            return "zh"
+        if _LATIN_RE.search(self.text):
+            return "en"
+        return None
+
+    @cached_property
+    def cjk_ratio(self) -> float:
+        """Share of the text's characters that are CJK ideographs."""
+        if not self.text:
+            return 0.0
+        return len(_CJK_RE.findall(self.text)) / len(self.text)
+
+    @cached_property
+    def word_count(self) -> int:
+        """Number of whitespace-separated words."""
+        return len(self.text.split())
+
+    @property
+    def reading_time_seconds(self) -> int:
+        """Estimated reading time (0 for empty text)."""
+        if not self.text:
+            return 0
+        seconds = int(self.word_count / WORDS_PER_MINUTE * 60)
+        return max(MIN_READING_SECONDS, seconds)
+
+    @cached_property
+    def sentence_spans(self) -> list[tuple[int, int]]:
+        """(start, end) offsets of the sentences in the text.
+
+        Text is split after Chinese sentence punctuation and line breaks;
+        if that yields at most one sentence, it is split on English sentence
+        punctuation instead.
+        """
+        spans = self._split(_CJK_SENTENCE_END_RE, keep_separator=True)
+        if len(spans) <= 1:
+            spans = self._split(_SENTENCE_END_RE, keep_separator=False)
+        return spans
+
+    @property
+    def sentences(self) -> list[str]:
+        """Sentences of the text, stripped of surrounding whitespace."""
+        return [self.text[start:end] for start, end in self.sentence_spans]
+
+    def _split(self, separator: re.Pattern, keep_separator: bool) -> list[tuple[int, int]]:
+        """Split the text at a separator into stripped, non-empty spans."""
+        spans = []
+        start = 0
+        for match in separator.finditer(self.text):
+            self._add_span(spans, start, match.end() if keep_separator else match.start())
+            start = match.end()
+        self._add_span(spans, start, len(self.text))
+        return spans
+
+    def _add_span(self, spans: list[tuple[int, int]], start: int, end: int) -> None:
+        """Append the span of text[start:end] without surrounding whitespace, if any."""
+        piece = self.text[start:end]
+        stripped = piece.strip()
+        if stripped:
+            start += len(piece) - len(piece.lstrip())
+            spans.append((start, start + len(stripped)))
+
+    def to_compact(self) -> str:
+        """Serialize the analysis for storage.
+
+        Returns:
+            JSON string with the language, word count and sentence offsets
+        """
+        return json.dumps(
+            {
+                "v": COMPACT_VERSION,
+                "language": self.language,
+                "cjk_ratio": round(self.cjk_ratio, 4),
+                "words": self.word_count,
+                "sentences": [offset for span in self.sentence_spans for offset in span],
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_compact(cls, text: str, compact: str) -> "TextAnalysis":
+        """Restore an analysis from to_compact() output.
+
+        Args:
+            text: The analyzed text
+            compact: Serialized analysis of exactly this text
+
+        Returns:
+            TextAnalysis with the stored facts filled in
+
+        Raises:
+            ValueError: If the compact form is invalid or of another version
+        """
+        data = json.loads(compact)
+        if data.get("v") != COMPACT_VERSION:
+            raise ValueError(f"Unsupported text analysis version: {data.get('v')}")
+
+        analysis = cls(text)
+        offsets = data["sentences"]
+        analysis.__dict__.update(
+            language=data["language"],
+            cjk_ratio=data["cjk_ratio"],
+            word_count=data["words"],
+            sentence_spans=list(zip(offsets[::2], offsets[1::2])),
+        )
+        return analysis
+
+
+_cache: OrderedDict[str, TextAnalysis] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def analyze_text(text: Optional[str], compact: Optional[str] = None) -> TextAnalysis:
+    """Get the shared analysis of a text.
+
+    Args:
+        text: Text to analyze (None is treated as empty)
+        compact: Stored to_compact() form of this text's analysis, used
+            instead of analyzing it again
+
+    Returns:
+        TextAnalysis (the cached one if this text was analyzed recently)
+    """
+    text = text or ""
+    with _cache_lock:
+        analysis = _cache.get(text)
+        if analysis is not None:
+            _cache.move_to_end(text)
+            return analysis
+
+    analysis = None
+    if compact:
+        try:
+            analysis = TextAnalysis.from_compact(text, compact)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring stored text analysis: {e}")
+    if analysis is None:
+        analysis = TextAnalysis(text)
+
+    with _cache_lock:
+        _cache[text] = analysis
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return analysis
@@ -0,0 +1,43 @@
+"""
+Background warm-up of lazily imported libraries.
+
+The keyword extraction resources (jieba, NLTK data) and trafilatura/
+readability-lxml (full content extraction) are loaded on first use so that
+startup and CLI scripts do not pay for them. A long-running server calls warm_up() from a background
+thread once it is listening, so the first request that needs them does not
+pay either.
+"""
+
+import importlib
+
+from spider_aggregation.core.nlp_resources import get_jieba, get_nlp_resources
+from spider_aggregation.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Imported by ContentFetcher on first extraction
+_CONTENT_MODULES = ("trafilatura", "readability.readability")
+
+
+def warm_up() -> list[str]:
+    """Import the lazily loaded libraries and load the NLP resources.
+
+    Returns:
+        Names of the libraries that were loaded (missing ones are skipped)
+    """
+    loaded = []
+
+    get_nlp_resources()
+    loaded.append("nlp_resources")
+    if get_jieba() is not None:
+        loaded.append("jieba")
+
+    for name in _CONTENT_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        loaded.append(name)
+
+    logger.debug(f"Warmed up {', '.join(loaded) or 'nothing'}")
+    return loaded
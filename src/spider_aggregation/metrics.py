@@ -0,0 +1,514 @@
+"""
+Process-wide metrics registry with Prometheus text exposition.
+
+Counters and histograms keep one value cell per thread. A thread only ever
+writes its own cell, so recording a sample takes no lock; cells are merged
+when the registry is scraped. Cells of finished threads are folded into a
+single total, so short-lived threads (one per web request or job) do not
+accumulate. Gauges hold a single value (setting it is a
+plain attribute assignment).
+
+The hot-path metrics of the application are declared at the bottom of this
+module and exposed by the web app at ``/metrics``.
+
+Example:
+    >>> from spider_aggregation.metrics import FETCH_BYTES, FETCH_DURATION
+    >>> FETCH_BYTES.inc(2048)
+    >>> with FETCH_DURATION.labels(status="2xx").time():
+    ...     fetch()
+"""
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Sequence
+
+# Latency buckets in seconds, from sub-millisecond work to slow HTTP requests
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _ThreadCells:
+    """Per-thread value cells merged on read."""
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._local = threading.local()
+        # Cells of live threads, with the thread owning each
+        self._cells: list[tuple[threading.Thread, list[float]]] = []
+        # Sum of the cells of finished threads
+        self._retired = [0.0] * size
+        self._lock = threading.Lock()
+
+    def cell(self) -> list[float]:
+        """Get the calling thread's cell (the lock is only taken on first use)."""
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = [0.0] * self._size
+            with self._lock:
+                self._retire_finished()
+                self._cells.append((threading.current_thread(), cell))
+            self._local.cell = cell
+            return cell
+
+    def _retire_finished(self) -> None:
+        """Fold the cells of finished threads into the retired sum (lock held).
+
+        A finished thread can no longer write its cell, so its values are final.
+        """
+        live = []
+        for thread, cell in self._cells:
+            if thread.is_alive():
+                live.append((thread, cell))
+            else:
+                for index, value in enumerate(cell):
+                    self._retired[index] += value
+        self._cells = live
+
+    def totals(self) -> list[float]:
+        """Sum all threads' cells."""
+        with self._lock:
+            self._retire_finished()
+            totals = list(self._retired)
+            cells = [cell for _, cell in self._cells]
+        for cell in cells:
+            for index, value in enumerate(cell):
+                totals[index] += value
+        return totals
+
+
+class CounterChild:
+    """A monotonically increasing value."""
+
+    def __init__(self) -> None:
+        self._cells = _ThreadCells(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter.
+
+        Args:
+            amount: Non-negative increment
+        """
+        self._cells.cell()[0] += amount
+
+    @property
+    def value(self) -> float:
+        """Current total."""
+        return self._cells.totals()[0]
+
+    def _samples(self, name: str) -> Iterator[tuple[str, dict, float]]:
+        yield name, {}, self.value
+
+
+class GaugeChild:
+    """A value that can go up and down."""
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        """Set the gauge (lock-free)."""
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge (takes a lock; not meant for hot paths)."""
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge (takes a lock; not meant for hot paths)."""
+        with self._lock:
+            self._value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the gauge from a callback at scrape time."""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        """Current value."""
+        if self._function is not None:
+            return float(self._function())
+        return self._value
+
+    def _samples(self, name: str) -> Iterator[tuple[str, dict, float]]:
+        yield name, {}, self.value
+
+
+class HistogramChild:
+    """Distribution of observed values in cumulative buckets."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self._upper_bounds = list(buckets) + [math.inf]
+        # One count per bucket, then the sum of observed values
+        self._cells = _ThreadCells(len(self._upper_bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        cell = self._cells.cell()
+        cell[bisect_left(self._upper_bounds, value)] += 1
+        cell[-1] += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the duration of the ``with`` block in seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return int(sum(self._cells.totals()[:-1]))
+
+    @property
+    def sum(self) -> float:
+        """Sum of observed values."""
+        return self._cells.totals()[-1]
+
+    def _samples(self, name: str) -> Iterator[tuple[str, dict, float]]:
+        totals = self._cells.totals()
+        cumulative = 0.0
+        for bound, count in zip(self._upper_bounds, totals):
+            cumulative += count
+            yield f"{name}_bucket", {"le": _format_value(bound)}, cumulative
+        yield f"{name}_sum", {}, totals[-1]
+        yield f"{name}_count", {}, cumulative
+
+
+class Metric:
+    """A named metric family with optional labels."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        """Initialize the metric.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Label names (children are created per label value set)
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._default = self._new_child()
+            self._children[()] = self._default
+
+    def labels(self, *values: str, **labelvalues: str):
+        """Get the child for a set of label values.
+
+        Args:
+            *values: Label values in ``labelnames`` order
+            **labelvalues: Label values by name
+
+        Returns:
+            Child metric
+
+        Raises:
+            ValueError: If the label values do not match the label names
+        """
+        if labelvalues:
+            if values or set(labelvalues) != set(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            key = tuple(str(labelvalues[name]) for name in self.labelnames)
+        else:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            key = tuple(str(value) for value in values)
+
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _unlabeled(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use labels()")
+        return self._default
+
+    def render(self) -> list[str]:
+        """Render the metric family in Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {_escape_help(self.documentation)}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        with self._lock:
+            children = list(self._children.items())
+        for key, child in children:
+            base_labels = dict(zip(self.labelnames, key))
+            for sample_name, extra_labels, value in child._samples(self.name):
+                labels = {**base_labels, **extra_labels}
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    """Counter metric family."""
+
+    type_name = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the unlabeled counter."""
+        self._unlabeled().inc(amount)
+
+    @property
+    def value(self) -> float:
+        """Total of the unlabeled counter."""
+        return self._unlabeled().value
+
+
+class Gauge(Metric):
+    """Gauge metric family."""
+
+    type_name = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def set(self, value: float) -> None:
+        """Set the unlabeled gauge."""
+        self._unlabeled().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the unlabeled gauge."""
+        self._unlabeled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the unlabeled gauge."""
+        self._unlabeled().dec(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the unlabeled gauge from a callback at scrape time."""
+        self._unlabeled().set_function(function)
+
+    @property
+    def value(self) -> float:
+        """Value of the unlabeled gauge."""
+        return self._unlabeled().value
+
+
+class Histogram(Metric):
+    """Histogram metric family."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Label names
+            buckets: Sorted bucket upper bounds (+Inf is added automatically)
+        """
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record an observation on the unlabeled histogram."""
+        self._unlabeled().observe(value)
+
+    def time(self):
+        """Time a block on the unlabeled histogram."""
+        return self._unlabeled().time()
+
+    @property
+    def count(self) -> int:
+        """Observations of the unlabeled histogram."""
+        return self._unlabeled().count
+
+
+class MetricsRegistry:
+    """Registry of metric families."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def _register(self, metric_class: type, name: str, documentation: str, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = metric_class(name, documentation, labelnames, **kwargs)
+                self._metrics[name] = metric
+            elif type(metric) is not metric_class or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered differently")
+            return metric
+
+    def get(self, name: str) -> Optional[Metric]:
+        """Get a registered metric by name."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    pairs = []
+    for name, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return REGISTRY
+
+
+# ============================================================================
+# Application metrics
+# ============================================================================
+
+FETCH_DURATION = REGISTRY.histogram(
+    "mindweaver_fetch_http_duration_seconds",
+    "Time spent on HTTP feed requests",
+    ["status"],
+)
+FETCH_BYTES = REGISTRY.counter(
+    "mindweaver_fetch_bytes_total",
+    "Bytes of feed responses downloaded",
+)
+FETCH_RESULTS = REGISTRY.counter(
+    "mindweaver_fetch_results_total",
+    "Feed fetches by outcome",
+    ["outcome"],
+)
+PARSE_ENTRY_DURATION = REGISTRY.histogram(
+    "mindweaver_parse_entry_duration_seconds",
+    "Time spent normalizing one feed entry",
+)
+DEDUP_CHECKS = REGISTRY.counter(
+    "mindweaver_dedup_checks_total",
+    "Duplicate checks performed",
+    ["strategy"],
+)
+DEDUP_HITS = REGISTRY.counter(
+    "mindweaver_dedup_hits_total",
+    "Duplicates found by strategy and matched field",
+    ["strategy", "match"],
+)
+DB_FLUSH_DURATION = REGISTRY.histogram(
+    "mindweaver_db_flush_duration_seconds",
+    "Time spent flushing ORM sessions",
+)
+DB_GROUP_COMMIT_ROWS = REGISTRY.histogram(
+    "mindweaver_db_group_commit_rows",
+    "Rows written by one SQLite group commit",
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500),
+)
+FILTER_DURATION = REGISTRY.histogram(
+    "mindweaver_filter_evaluation_duration_seconds",
+    "Time spent evaluating filter rules against one entry",
+)
+LLM_REQUEST_DURATION = REGISTRY.histogram(
+    "mindweaver_llm_request_duration_seconds",
+    "LLM request latency",
+    ["model", "outcome"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0),
+)
+LLM_CACHE_REQUESTS = REGISTRY.counter(
+    "mindweaver_llm_cache_requests_total",
+    "LLM response cache lookups",
+    ["result"],
+)
+SCHEDULER_LAG = REGISTRY.histogram(
+    "mindweaver_scheduler_lag_seconds",
+    "Delay between a job's scheduled run time and its submission to the executor",
+)
+SCHEDULER_JOBS_IN_FLIGHT = REGISTRY.gauge(
+    "mindweaver_scheduler_jobs_in_flight",
+    "Scheduled jobs submitted to the executor and not yet finished",
+)
+PIPELINE_STAGE_DURATION = REGISTRY.histogram(
+    "mindweaver_pipeline_stage_duration_seconds",
+    "Time one feed fetch spent in each ingestion stage",
+    ["stage"],
+)
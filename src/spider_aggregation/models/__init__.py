@@ -22,6 +22,11 @@ from spider_aggregation.models.entry import (
     EntryResponse,
     EntryUpdate,
 )
+from spider_aggregation.models.entry_body import EntryBodyModel
+from spider_aggregation.models.entry_signature import EntryLSHBandModel, EntrySignatureModel
+from spider_aggregation.models.entry_stat import EntryStatModel
+from spider_aggregation.models.fetch_job import FETCH_JOB_ACTIVE_STATUSES, FetchJobModel
+from spider_aggregation.models.term_stat import CorpusStatModel, TermStatModel
 from spider_aggregation.models.filter_rule import (
     FilterRuleCreate,
     FilterRuleListResponse,
@@ -51,6 +56,10 @@ __all__ = [
     "EntryUpdate",
     "EntryResponse",
     "EntryListResponse",
+    "EntryBodyModel",
+    "EntrySignatureModel",
+    "EntryLSHBandModel",
+    "EntryStatModel",
     "FilterRuleModel",
     "FilterRuleCreate",
     "FilterRuleUpdate",
@@ -66,4 +75,8 @@ __all__ = [
     "DigestLogUpdate",
     "DigestLogResponse",
     "DigestLogListResponse",
+    "FetchJobModel",
+    "FETCH_JOB_ACTIVE_STATUSES",
+    "CorpusStatModel",
+    "TermStatModel",
 ]
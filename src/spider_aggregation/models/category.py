@@ -26,6 +26,9 @@ class CategoryModel(Base):
     color: Mapped[Optional[str]] = mapped_column(String(7), nullable=True)  # Hex color for UI
     icon: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # Icon name/class
     enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    retention_days: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True, comment="Days to keep entries of member feeds (NULL=global)"
+    )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -57,6 +60,9 @@ class CategoryBase(BaseModel):
     )
     icon: Optional[str] = Field(None, max_length=50, description="Icon name or class")
     enabled: bool = Field(default=True, description="Whether the category is enabled")
+    retention_days: Optional[int] = Field(
+        None, ge=0, description="Days to keep entries of member feeds (None=global, 0=forever)"
+    )
 
 
 class CategoryCreate(CategoryBase):
@@ -73,6 +79,7 @@ class CategoryUpdate(BaseModel):
     color: Optional[str] = Field(None, max_length=7, pattern="^#[0-9A-Fa-f]{6}$")
     icon: Optional[str] = Field(None, max_length=50)
     enabled: Optional[bool] = None
+    retention_days: Optional[int] = Field(None, ge=0)
 
 
 class CategoryResponse(CategoryBase):
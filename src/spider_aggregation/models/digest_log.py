@@ -29,10 +29,10 @@ class DigestLogModel(Base):
 
     # Send metadata
     sent_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False, index=True
+        DateTime, default=datetime.utcnow, nullable=False
     )
     status: Mapped[str] = mapped_column(
-        String(20), default="pending", nullable=False, index=True
+        String(20), default="pending", nullable=False
     )  # pending, success, failed
 
     # Content summary
@@ -9,6 +9,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, Index, Boolean
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from spider_aggregation.models.entry_body import EntryBodyModel
 from spider_aggregation.models.feed import Base, FeedModel
 
 if TYPE_CHECKING:
@@ -39,9 +40,11 @@ class EntryModel(Base):
     link: Mapped[str] = mapped_column(String(2048), nullable=False)
     author: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
-    # Content fields
+    # Content fields (the full content is stored compressed in entry_bodies)
     summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    body: Mapped[Optional[EntryBodyModel]] = relationship(
+        EntryBodyModel, uselist=False, cascade="all, delete-orphan", passive_deletes=True
+    )
 
     # Timestamps
     published_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, index=True)
@@ -60,6 +63,29 @@ class EntryModel(Base):
     reading_time_seconds: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
 
+    # Compact TextAnalysis of the content (JSON), when ingestion.persist_text_analysis is
+    # on; deferred, as only batch jobs read it
+    text_analysis: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
+
+    # Story clustering: ID of the cluster representative (the first entry of the story)
+    cluster_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("entries.id", ondelete="SET NULL"), nullable=True, index=True
+    )
+
+    @property
+    def content(self) -> Optional[str]:
+        """Full content, loaded from entry_bodies on first access."""
+        return self.body.text if self.body is not None else None
+
+    @content.setter
+    def content(self, value: Optional[str]) -> None:
+        if value is None:
+            self.body = None
+        elif self.body is None:
+            self.body = EntryBodyModel(text=value)
+        else:
+            self.body.text = value
+
     def __repr__(self) -> str:
         return f"<EntryModel(id={self.id}, title='{self.title}', link='{self.link}')>"
 
@@ -91,6 +117,9 @@ class EntryCreate(EntryBase):
     content_hash: Optional[str] = Field(
         None, max_length=64, description="Hash of content for deduplication"
     )
+    text_analysis: Optional[str] = Field(
+        None, description="Compact TextAnalysis of the content (JSON)"
+    )
 
 
 class EntryUpdate(BaseModel):
@@ -116,6 +145,7 @@ class EntryResponse(EntryBase):
     title_hash: str
     link_hash: str
     content_hash: Optional[str] = None
+    cluster_id: Optional[int] = None
 
 
 class EntryListResponse(BaseModel):
@@ -0,0 +1,55 @@
+"""
+Entry body model: the (compressed) full content of an entry.
+
+Bodies make up most of the database, so they live in their own table
+instead of on the entries rows that list, filter and digest queries scan.
+EntryModel.content reads and writes them through the ``body`` relationship;
+the text is compressed when the row is flushed (see
+storage.repositories.body_repo).
+"""
+
+from sqlalchemy import ForeignKey, Integer, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from spider_aggregation.models.feed import Base
+from spider_aggregation.utils.compression import decompress_text
+
+
+class EntryBodyModel(Base):
+    """SQLAlchemy ORM model for the body of an entry."""
+
+    __tablename__ = "entry_bodies"
+
+    entry_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
+    )
+    # Codec of data (see utils.compression.BODY_CODECS)
+    codec: Mapped[str] = mapped_column(String(16), nullable=False)
+    # Size of the uncompressed text in UTF-8 bytes
+    size: Mapped[int] = mapped_column(Integer, nullable=False)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    # Decompressed text, and whether it still has to be compressed into data
+    _text = None
+    pending = False
+
+    def __init__(self, text: str = "", **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.text = text
+
+    @property
+    def text(self) -> str:
+        """The uncompressed body text."""
+        if self._text is None:
+            self._text = decompress_text(self.codec, self.data)
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._text = value
+        # Compressed on flush; the empty codec marks the row as changed
+        self.pending = True
+        self.codec = ""
+
+    def __repr__(self) -> str:
+        return f"<EntryBodyModel(entry_id={self.entry_id}, codec='{self.codec}')>"
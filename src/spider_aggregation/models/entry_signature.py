@@ -0,0 +1,52 @@
+"""
+Near-duplicate index models.
+
+Stores MinHash signatures and LSH band keys for entries in side tables, so
+near-duplicate lookup is a handful of indexed bucket probes instead of a
+pairwise scan over the entries table.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from spider_aggregation.models.base import Base
+
+
+class EntrySignatureModel(Base):
+    """SQLAlchemy ORM model for an entry's MinHash signature."""
+
+    __tablename__ = "entry_signatures"
+
+    entry_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
+    )
+    feed_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+
+    # Hex-encoded MinHash signature (8 hex characters per value)
+    signature: Mapped[str] = mapped_column(Text, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<EntrySignatureModel(entry_id={self.entry_id}, feed_id={self.feed_id})>"
+
+
+class EntryLSHBandModel(Base):
+    """SQLAlchemy ORM model for one LSH band key of an entry signature."""
+
+    __tablename__ = "entry_lsh_bands"
+
+    __table_args__ = (Index("ix_entry_lsh_bands_band_bucket", "band", "bucket"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    entry_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("entries.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    feed_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    band: Mapped[int] = mapped_column(Integer, nullable=False)
+    bucket: Mapped[str] = mapped_column(String(16), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<EntryLSHBandModel(entry_id={self.entry_id}, band={self.band})>"
@@ -0,0 +1,47 @@
+"""
+Entry statistics rollup model.
+
+Holds pre-aggregated entry counts per feed, fetch day and language so that
+dashboard statistics are a scan over a few hundred rollup rows instead of a
+full scan of the entries table.
+"""
+
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from spider_aggregation.models.base import Base
+
+
+class EntryStatModel(Base):
+    """SQLAlchemy ORM model for one entry statistics rollup bucket."""
+
+    __tablename__ = "entry_stats"
+
+    __table_args__ = (
+        UniqueConstraint("feed_id", "day", "language", name="uq_entry_stats_feed_day_language"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    feed_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("feeds.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+
+    # UTC day of EntryModel.fetched_at
+    day: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+
+    # Entry language ("" for entries without a detected language)
+    language: Mapped[str] = mapped_column(String(10), default="", nullable=False)
+
+    entry_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Upper bound of published_at in the bucket (exact after reconciliation)
+    latest_published_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<EntryStatModel(feed_id={self.feed_id}, day={self.day}, "
+            f"language='{self.language}', entry_count={self.entry_count})>"
+        )
@@ -44,6 +44,11 @@ class FeedModel(Base):
     fetch_only_recent: Mapped[bool] = mapped_column(
         Boolean, default=False, nullable=False, comment="Only fetch entries from last 30 days"
     )
+    retention_days: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Days to keep entries (NULL=category or global policy, 0=forever)",
+    )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -56,6 +61,9 @@ class FeedModel(Base):
     fetch_error_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     last_error_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_fetch_timings: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, comment="JSON per-stage timing breakdown of the last fetch"
+    )
 
     # Metadata
     etag: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
@@ -111,6 +119,9 @@ class FeedBase(BaseModel):
     fetch_only_recent: bool = Field(
         default=False, description="Only fetch entries from last 30 days"
     )
+    retention_days: Optional[int] = Field(
+        default=None, ge=0, description="Days to keep entries (None=inherit, 0=forever)"
+    )
 
 
 class FeedCreate(FeedBase):
@@ -128,6 +139,7 @@ class FeedUpdate(BaseModel):
     fetch_interval_minutes: Optional[int] = Field(None, ge=10, le=10080)
     max_entries_per_fetch: Optional[int] = Field(default=None, ge=0, le=1000)
     fetch_only_recent: Optional[bool] = None
+    retention_days: Optional[int] = Field(default=None, ge=0)
 
 
 class FeedResponse(FeedBase):
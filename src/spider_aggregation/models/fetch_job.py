@@ -0,0 +1,61 @@
+"""
+Fetch job model for background fetch-all sweeps.
+
+A row tracks one sweep over the due feeds: its status, progress counters
+and cancellation flag. Progress is committed together with each batch of
+ingested feeds, so the row always matches what is stored.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from spider_aggregation.models.base import Base
+
+# Statuses of a sweep that has not finished yet
+FETCH_JOB_ACTIVE_STATUSES = ("pending", "running")
+
+
+class FetchJobModel(Base):
+    """SQLAlchemy ORM model for a fetch-all job."""
+
+    __tablename__ = "fetch_jobs"
+
+    __table_args__ = (Index("ix_fetch_jobs_status", "status"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    status: Mapped[str] = mapped_column(
+        String(20), default="pending", nullable=False
+    )  # pending, running, completed, failed, cancelled
+    cancel_requested: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+
+    # Progress
+    feeds_total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    feeds_done: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    feeds_failed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    entries_created: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # JSON array of {"feed_id", "error"} for the most recent feed failures
+    failures: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # Error that ended the job
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # Heartbeat, refreshed after every committed batch
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the job has not finished yet."""
+        return self.status in FETCH_JOB_ACTIVE_STATUSES
+
+    def __repr__(self) -> str:
+        return (
+            f"<FetchJobModel(id={self.id}, status='{self.status}', "
+            f"feeds_done={self.feeds_done}/{self.feeds_total})>"
+        )
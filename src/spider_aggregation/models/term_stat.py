@@ -0,0 +1,56 @@
+"""
+Corpus statistics models for keyword scoring.
+
+Keyword extraction scores terms with BM25, which needs the number of
+documents (and their average length) per language and the number of
+documents each term occurs in. Both are counted incrementally as entries are
+ingested, keyed by the language the keyword extractor detects.
+"""
+
+from sqlalchemy import Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from spider_aggregation.models.base import Base
+
+# Longest term counted; longer tokens are not useful keywords
+MAX_TERM_LENGTH = 100
+
+
+class CorpusStatModel(Base):
+    """SQLAlchemy ORM model for the document totals of one language."""
+
+    __tablename__ = "corpus_stats"
+
+    language: Mapped[str] = mapped_column(String(10), primary_key=True)
+
+    document_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Sum of the documents' term counts (for the average document length)
+    token_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<CorpusStatModel(language='{self.language}', "
+            f"document_count={self.document_count}, token_count={self.token_count})>"
+        )
+
+
+class TermStatModel(Base):
+    """SQLAlchemy ORM model for the document frequency of one term."""
+
+    __tablename__ = "term_stats"
+
+    __table_args__ = (UniqueConstraint("language", "term", name="uq_term_stats_language_term"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    language: Mapped[str] = mapped_column(String(10), nullable=False)
+    term: Mapped[str] = mapped_column(String(MAX_TERM_LENGTH), nullable=False)
+
+    # Number of documents containing the term
+    document_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<TermStatModel(language='{self.language}', term='{self.term}', "
+            f"document_count={self.document_count})>"
+        )
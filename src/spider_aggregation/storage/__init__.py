@@ -9,6 +9,15 @@ from spider_aggregation.storage.database import (
     get_session_factory,
     init_db,
 )
+from spider_aggregation.storage.group_commit import (
+    GroupCommitWriter,
+    get_group_commit_writer,
+)
+from spider_aggregation.storage.feed_cache import (
+    FeedMeta,
+    FeedMetadataCache,
+    get_feed_metadata_cache,
+)
 
 __all__ = [
     "DatabaseManager",
@@ -18,4 +27,9 @@ __all__ = [
     "get_session_factory",
     "init_db",
     "close_db",
+    "FeedMeta",
+    "FeedMetadataCache",
+    "get_feed_metadata_cache",
+    "GroupCommitWriter",
+    "get_group_commit_writer",
 ]
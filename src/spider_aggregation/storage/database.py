@@ -12,6 +12,18 @@ from sqlalchemy.orm import Session, sessionmaker
 from spider_aggregation.config import get_config
 from spider_aggregation.models import Base
 
+# Registers the mapper events that maintain the entry statistics rollup
+import spider_aggregation.storage.repositories.stats_repo  # noqa: F401
+
+# Registers the mapper events that compress entry bodies
+import spider_aggregation.storage.repositories.body_repo  # noqa: F401
+
+# Registers the session events that invalidate the feed metadata cache
+import spider_aggregation.storage.feed_cache  # noqa: F401
+
+# Registers the session events that time flushes for the metrics registry
+import spider_aggregation.storage.instrumentation  # noqa: F401
+
 if TYPE_CHECKING:
     from spider_aggregation.config import DatabaseConfig
 
@@ -48,7 +60,7 @@ def get_engine() -> Engine:
         _engine = create_engine(url, **engine_kwargs)
 
         # Set up dialect-specific events (e.g., SQLite PRAGMA)
-        dialect.setup_engine_events(_engine)
+        dialect.setup_engine_events(_engine, db_config)
 
     return _engine
 
@@ -224,13 +236,19 @@ class DatabaseManager:
                 # Create a minimal config for SQLite
                 from spider_aggregation.config import DatabaseConfig
 
-                db_config = DatabaseConfig(path=str(db_path), echo=False)
+                global_config = get_config().database
+                db_config = DatabaseConfig(
+                    path=str(db_path),
+                    echo=False,
+                    sqlite_profile=global_config.sqlite_profile,
+                    busy_timeout_ms=global_config.busy_timeout_ms,
+                )
                 dialect = get_dialect("sqlite")
 
                 url = dialect.build_url(db_config)
                 engine_kwargs = dialect.get_engine_kwargs(db_config)
                 self._engine = create_engine(url, **engine_kwargs)
-                dialect.setup_engine_events(self._engine)
+                dialect.setup_engine_events(self._engine, db_config)
             elif self._custom_db_config:
                 # Use custom config
                 from spider_aggregation.storage.dialects import get_dialect
@@ -239,7 +257,7 @@ class DatabaseManager:
                 url = dialect.build_url(self._custom_db_config)
                 engine_kwargs = dialect.get_engine_kwargs(self._custom_db_config)
                 self._engine = create_engine(url, **engine_kwargs)
-                dialect.setup_engine_events(self._engine)
+                dialect.setup_engine_events(self._engine, self._custom_db_config)
             else:
                 # Use global config
                 self._engine = get_engine()
@@ -2,8 +2,9 @@
 
 from abc import ABC, abstractmethod
 
-from sqlalchemy import Engine, event
+from sqlalchemy import Engine, Text, case, cast, event
 from sqlalchemy.pool import Pool
+from sqlalchemy.sql.elements import ColumnElement
 
 
 class BaseDialect(ABC):
@@ -72,11 +73,14 @@ class BaseDialect(ABC):
         """
         ...
 
-    def setup_engine_events(self, engine: Engine) -> None:
+    def setup_engine_events(
+        self, engine: Engine, config: "DatabaseConfig | None" = None  # noqa: F821
+    ) -> None:
         """Set up dialect-specific engine event listeners.
 
         Args:
             engine: SQLAlchemy engine instance
+            config: Database configuration the engine was created from
 
         Note:
             Base implementation does nothing. Subclasses can override
@@ -84,6 +88,21 @@ class BaseDialect(ABC):
         """
         pass
 
+    def run_maintenance(self, engine: Engine) -> dict:
+        """Run periodic housekeeping (statistics, log truncation).
+
+        Args:
+            engine: SQLAlchemy engine instance
+
+        Returns:
+            Dictionary describing what was done (empty if nothing)
+
+        Note:
+            Base implementation does nothing; the server databases maintain
+            themselves (autovacuum, InnoDB purge).
+        """
+        return {}
+
     def get_migration_kwargs(self) -> dict:
         """Get dialect-specific migration kwargs for Alembic.
 
@@ -139,6 +158,31 @@ class BaseDialect(ABC):
         """
         return False
 
+    def supports_window_functions(self, server_version: tuple | None) -> bool:
+        """Check if the database server supports window functions.
+
+        Args:
+            server_version: Server version tuple (e.g. ``dialect.server_version_info``)
+
+        Returns:
+            True if ``ROW_NUMBER() OVER (...)`` can be used
+        """
+        return False
+
+    def max_bind_parameters(self, server_version: tuple | None) -> int:
+        """Get the maximum number of bound parameters in one statement.
+
+        Bulk operations split ``IN (...)`` lists and multi-row inserts into
+        chunks below this limit.
+
+        Args:
+            server_version: Server version tuple (e.g. ``dialect.server_version_info``)
+
+        Returns:
+            Maximum number of parameters (conservative default of 999)
+        """
+        return 999
+
     @property
     def requires_cascade_type(self) -> bool:
         """Check if CASCADE requires type specification.
@@ -147,3 +191,19 @@ class BaseDialect(ABC):
             True if CASCADE needs explicit type (e.g., PostgreSQL)
         """
         return False
+
+    def body_text_expression(self, codec: ColumnElement, data: ColumnElement) -> ColumnElement:
+        """Build a SQL expression for the text of a stored entry body.
+
+        Used to search and excerpt entry content in SQL. The base
+        implementation can only read uncompressed ("none" codec) bodies and
+        yields NULL for compressed ones.
+
+        Args:
+            codec: entry_bodies.codec column
+            data: entry_bodies.data column
+
+        Returns:
+            Text expression
+        """
+        return case((codec == "none", cast(data, Text)))
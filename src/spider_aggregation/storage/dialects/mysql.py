@@ -124,6 +124,14 @@ class MySQLDialect(BaseDialect):
         """MySQL does not have native ARRAY support."""
         return False
 
+    def supports_window_functions(self, server_version: tuple | None) -> bool:
+        """MySQL 8.0+ supports window functions."""
+        return server_version is not None and tuple(server_version) >= (8, 0)
+
+    def max_bind_parameters(self, server_version: tuple | None) -> int:
+        """MySQL prepared statements allow 65535 parameters."""
+        return 65535
+
     @property
     def requires_cascade_type(self) -> bool:
         """MySQL CASCADE does not require type specification."""
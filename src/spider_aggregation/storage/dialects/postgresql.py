@@ -2,7 +2,9 @@
 
 from typing import TYPE_CHECKING
 
+from sqlalchemy import case, func
 from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql.elements import ColumnElement
 
 from spider_aggregation.storage.dialects.base import BaseDialect
 
@@ -123,7 +125,19 @@ class PostgreSQLDialect(BaseDialect):
         """PostgreSQL has native ARRAY support."""
         return True
 
+    def supports_window_functions(self, server_version: tuple | None) -> bool:
+        """PostgreSQL supports window functions in all supported versions."""
+        return True
+
+    def max_bind_parameters(self, server_version: tuple | None) -> int:
+        """PostgreSQL's wire protocol allows 65535 parameters; keep below drivers' int16 limits."""
+        return 32767
+
     @property
     def requires_cascade_type(self) -> bool:
         """PostgreSQL CASCADE requires explicit type specification."""
         return True
+
+    def body_text_expression(self, codec: ColumnElement, data: ColumnElement) -> ColumnElement:
+        """Decode uncompressed bodies with convert_from (a bytea cast would be hex)."""
+        return case((codec == "none", func.convert_from(data, "UTF8")))
@@ -1,17 +1,73 @@
 """SQLite dialect implementation."""
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Engine, event
+from sqlalchemy import Engine, event, func
 from sqlalchemy.pool import QueuePool, StaticPool
+from sqlalchemy.sql.elements import ColumnElement
 
 from spider_aggregation.storage.dialects.base import BaseDialect
+from spider_aggregation.utils.compression import decompress_text
 
 if TYPE_CHECKING:
     from spider_aggregation.config import DatabaseConfig
 
 
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """Connection PRAGMAs trading durability and memory for speed."""
+
+    # FULL syncs the WAL on every commit; NORMAL only at checkpoints (a power
+    # loss can drop the last commits, never corrupt); OFF leaves it to the OS
+    synchronous: str
+    # Page cache per connection in KiB
+    cache_size_kib: int
+    # Bytes of the file read through mmap instead of read() (0 disables)
+    mmap_size: int
+    # DEFAULT (files) or MEMORY for temporary tables and sort spills
+    temp_store: str
+    # WAL pages after which a commit triggers an automatic checkpoint
+    wal_autocheckpoint: int
+
+
+# Named profiles selectable with database.sqlite_profile
+SQLITE_PROFILES: dict[str, SQLiteProfile] = {
+    # SQLite's defaults: every commit is on disk before it returns
+    "durable": SQLiteProfile(
+        synchronous="FULL",
+        cache_size_kib=2048,
+        mmap_size=0,
+        temp_store="DEFAULT",
+        wal_autocheckpoint=1000,
+    ),
+    # Recommended for WAL mode: consistent after a crash, much cheaper commits
+    "balanced": SQLiteProfile(
+        synchronous="NORMAL",
+        cache_size_kib=64 * 1024,
+        mmap_size=256 * 1024 * 1024,
+        temp_store="MEMORY",
+        wal_autocheckpoint=1000,
+    ),
+    # Bulk imports and benchmarks: an OS crash or power loss may corrupt the file
+    "throughput": SQLiteProfile(
+        synchronous="OFF",
+        cache_size_kib=256 * 1024,
+        mmap_size=1024 * 1024 * 1024,
+        temp_store="MEMORY",
+        wal_autocheckpoint=10000,
+    ),
+}
+
+
+def _body_text(codec: str | None, data: bytes | None) -> str | None:
+    """SQL function body_text(codec, data): the text of an entry_bodies row."""
+    if data is None:
+        return None
+    return decompress_text(codec, data)
+
+
 class SQLiteDialect(BaseDialect):
     """SQLite database dialect.
 
@@ -22,6 +78,8 @@ class SQLiteDialect(BaseDialect):
     - Embedded database (no server required)
     - WAL mode for better concurrent read access
     - Foreign key constraints enabled
+    - Performance profiles (SQLITE_PROFILES) applied to every connection
+    - ``body_text(codec, data)`` SQL function decompressing entry bodies
     - StaticPool for single-threaded, QueuePool for multi-threaded
     """
 
@@ -73,7 +131,8 @@ class SQLiteDialect(BaseDialect):
             "echo": config.echo,
             "connect_args": {
                 "check_same_thread": False,  # Needed for SQLite
-                "timeout": 30,  # 30 second timeout for locks
+                # Busy timeout: how long to wait for the write lock
+                "timeout": config.busy_timeout_ms / 1000,
             },
             "poolclass": QueuePool,
             "pool_size": config.pool_size,
@@ -88,24 +147,94 @@ class SQLiteDialect(BaseDialect):
         """
         return QueuePool
 
-    def setup_engine_events(self, engine: Engine) -> None:
+    def setup_engine_events(
+        self, engine: Engine, config: Optional["DatabaseConfig"] = None
+    ) -> None:
         """Set up SQLite PRAGMA statements.
 
         Args:
             engine: SQLAlchemy engine
+            config: Database configuration selecting the performance profile
+                (default: "durable")
 
         Note:
-            Enables foreign keys and WAL mode for better concurrency.
+            Enables foreign keys and WAL mode for better concurrency. New
+            database files are created in incremental auto-vacuum mode so the
+            retention job can return freed pages to the filesystem (the
+            setting has no effect on existing files until a full VACUUM).
+
+            pysqlite's own transaction handling is disabled and every
+            SQLAlchemy transaction emits its own BEGIN (SQLAlchemy's documented
+            recipe): pysqlite only begins before DML, so a SAVEPOINT issued
+            first (``Session.begin_nested()``) opened a transaction of its own
+            that its RELEASE committed, out of reach of the outer rollback.
+            Outside a transaction the driver connection is in autocommit mode;
+            the ``sqlite_begin`` execution option (e.g. "IMMEDIATE") picks the
+            kind of transaction.
         """
+        profile = SQLITE_PROFILES[config.sqlite_profile if config else "durable"]
 
         @event.listens_for(engine, "connect")
         def set_sqlite_pragma(dbapi_conn, connection_record):
+            # Transactions begin in the "begin" listener below
+            dbapi_conn.isolation_level = None
             cursor = dbapi_conn.cursor()
             # Enable foreign key constraints
             cursor.execute("PRAGMA foreign_keys=ON")
+            # Only possible before the first table; on existing files the pragma
+            # would wait for the write lock, so leave them alone
+            if cursor.execute("PRAGMA page_count").fetchone()[0] == 0:
+                cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
             # Set WAL mode for better concurrent read access
             cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute(f"PRAGMA synchronous={profile.synchronous}")
+            # Negative values are KiB rather than pages
+            cursor.execute(f"PRAGMA cache_size=-{profile.cache_size_kib}")
+            cursor.execute(f"PRAGMA mmap_size={profile.mmap_size}")
+            cursor.execute(f"PRAGMA temp_store={profile.temp_store}")
+            cursor.execute(f"PRAGMA wal_autocheckpoint={profile.wal_autocheckpoint}")
+            cursor.close()
+            dbapi_conn.create_function("body_text", 2, _body_text, deterministic=True)
+
+        @event.listens_for(engine, "begin")
+        def begin_transaction(conn):
+            # Execution option sqlite_begin selects BEGIN DEFERRED / IMMEDIATE / EXCLUSIVE
+            mode = conn.get_execution_options().get("sqlite_begin")
+            conn.exec_driver_sql(f"BEGIN {mode}" if mode else "BEGIN")
+
+    def body_text_expression(self, codec: ColumnElement, data: ColumnElement) -> ColumnElement:
+        """Decompress bodies of any codec with the ``body_text`` connection function."""
+        return func.body_text(codec, data)
+
+    def run_maintenance(self, engine: Engine) -> dict:
+        """Refresh planner statistics and truncate the WAL.
+
+        ``PRAGMA optimize`` runs ANALYZE on the tables whose statistics are
+        stale; ``wal_checkpoint(TRUNCATE)`` copies the WAL back into the
+        database and resets it to zero bytes, which automatic (passive)
+        checkpoints never do while readers are active.
+
+        Args:
+            engine: SQLAlchemy engine
+
+        Returns:
+            Dictionary with the checkpoint outcome: busy (1 if readers or
+            writers prevented a full checkpoint), wal_frames and
+            checkpointed_frames
+        """
+        # The driver connection autocommits (see setup_engine_events), so the
+        # pragmas run outside a transaction
+        conn = engine.raw_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("PRAGMA optimize")
+            busy, wal_frames, checkpointed = cursor.execute(
+                "PRAGMA wal_checkpoint(TRUNCATE)"
+            ).fetchone()
             cursor.close()
+        finally:
+            conn.close()
+        return {"busy": busy, "wal_frames": wal_frames, "checkpointed_frames": checkpointed}
 
     def get_migration_kwargs(self) -> dict:
         """Get Alembic migration kwargs.
@@ -147,3 +276,13 @@ class SQLiteDialect(BaseDialect):
     def supports_array(self) -> bool:
         """SQLite does not support ARRAY types."""
         return False
+
+    def supports_window_functions(self, server_version: tuple | None) -> bool:
+        """SQLite 3.25+ supports window functions."""
+        return server_version is not None and tuple(server_version) >= (3, 25)
+
+    def max_bind_parameters(self, server_version: tuple | None) -> int:
+        """SQLite 3.32+ allows 32766 parameters (SQLITE_MAX_VARIABLE_NUMBER), older 999."""
+        if server_version is not None and tuple(server_version) >= (3, 32):
+            return 32766
+        return 999
@@ -0,0 +1,177 @@
+"""
+In-process cache of feed metadata.
+
+Pages such as the entry list only need each feed's ID and name (for filter
+dropdowns and labels), yet used to load every feed with its categories on
+every request. The cache keeps that metadata per database and is invalidated
+when a transaction that inserted, deleted or renamed a feed commits.
+
+The cache is per process: writes made by another process (e.g. the CLI) are
+picked up once the entries expire after ``ttl_seconds``.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from sqlalchemy import desc, event, inspect
+from sqlalchemy.orm import Session
+
+from spider_aggregation.models import FeedModel
+
+# Feed attributes held in the cache; changing any of them invalidates it
+CACHED_ATTRIBUTES = ("name", "url", "enabled")
+
+_DIRTY_KEY = "feed_metadata_dirty"
+
+
+@dataclass(frozen=True)
+class FeedMeta:
+    """Lightweight, session-independent feed metadata."""
+
+    id: int
+    name: Optional[str]
+    url: str
+    enabled: bool
+
+    @property
+    def display_name(self) -> str:
+        """Name to show for the feed (its URL when unnamed)."""
+        return self.name or self.url
+
+
+class FeedMetadataCache:
+    """Thread-safe cache of feed metadata keyed by database URL."""
+
+    def __init__(
+        self, ttl_seconds: float = 300.0, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Seconds before cached metadata is reloaded
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._feeds: dict[str, tuple[float, list[FeedMeta], dict[int, FeedMeta]]] = {}
+
+    def all(self, session: Session) -> list[FeedMeta]:
+        """Get metadata of all feeds, newest first.
+
+        Args:
+            session: Database session (used on a cache miss)
+
+        Returns:
+            List of FeedMeta
+        """
+        return self._load(session)[0]
+
+    def get(self, session: Session, feed_id: int) -> Optional[FeedMeta]:
+        """Get metadata of one feed.
+
+        Args:
+            session: Database session (used on a cache miss)
+            feed_id: Feed ID
+
+        Returns:
+            FeedMeta or None if the feed does not exist
+        """
+        return self._load(session)[1].get(feed_id)
+
+    def invalidate(self, database: Optional[str] = None) -> None:
+        """Drop cached metadata.
+
+        Args:
+            database: Database URL to invalidate (all databases if None)
+        """
+        with self._lock:
+            if database is None:
+                self._feeds.clear()
+            else:
+                self._feeds.pop(database, None)
+
+    def _load(self, session: Session) -> tuple[list[FeedMeta], dict[int, FeedMeta]]:
+        """Return cached metadata for the session's database, loading it on a miss."""
+        # Sessions with uncommitted feed changes read (and see) their own writes
+        database = None if session.info.get(_DIRTY_KEY) else _database_key(session)
+        now = self._clock()
+
+        if database is not None:
+            with self._lock:
+                cached = self._feeds.get(database)
+            if cached is not None and now - cached[0] < self.ttl_seconds:
+                return cached[1], cached[2]
+
+        rows = (
+            session.query(FeedModel.id, FeedModel.name, FeedModel.url, FeedModel.enabled)
+            .order_by(desc(FeedModel.created_at))
+            .all()
+        )
+        feeds = [FeedMeta(id=row[0], name=row[1], url=row[2], enabled=row[3]) for row in rows]
+        by_id = {feed.id: feed for feed in feeds}
+
+        if database is not None:
+            with self._lock:
+                self._feeds[database] = (now, feeds, by_id)
+        return feeds, by_id
+
+
+def _database_key(session: Session) -> Optional[str]:
+    """Identify the session's database, or None when it must not be cached.
+
+    In-memory SQLite databases share one URL but are distinct per
+    connection, so they are never cached.
+    """
+    bind = session.get_bind()
+    if bind.url.get_backend_name() == "sqlite" and bind.url.database in (None, "", ":memory:"):
+        return None
+    return bind.url.render_as_string(hide_password=True)
+
+
+_feed_cache: Optional[FeedMetadataCache] = None
+_feed_cache_lock = threading.Lock()
+
+
+def get_feed_metadata_cache() -> FeedMetadataCache:
+    """Get the process-wide feed metadata cache."""
+    global _feed_cache
+
+    with _feed_cache_lock:
+        if _feed_cache is None:
+            _feed_cache = FeedMetadataCache()
+    return _feed_cache
+
+
+@event.listens_for(Session, "after_flush")
+def _track_feed_changes(session: Session, flush_context) -> None:
+    """Remember whether the flush inserted, deleted or renamed a feed."""
+    if session.info.get(_DIRTY_KEY):
+        return
+    for instance in session.new | session.deleted:
+        if isinstance(instance, FeedModel):
+            session.info[_DIRTY_KEY] = True
+            return
+    for instance in session.dirty:
+        if isinstance(instance, FeedModel):
+            state = inspect(instance)
+            if any(state.attrs[key].history.has_changes() for key in CACHED_ATTRIBUTES):
+                session.info[_DIRTY_KEY] = True
+                return
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    """Invalidate the cache once feed changes are committed."""
+    if session.info.pop(_DIRTY_KEY, False):
+        database = _database_key(session)
+        if database is not None:
+            get_feed_metadata_cache().invalidate(database)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_feed_changes(session: Session) -> None:
+    """Discard tracked feed changes that were rolled back."""
+    session.info.pop(_DIRTY_KEY, None)
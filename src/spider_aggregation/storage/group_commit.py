@@ -0,0 +1,196 @@
+"""
+Single-writer group commits for SQLite.
+
+SQLite allows one writer at a time. When several threads (scheduler jobs, the
+fetch-all sweep) each commit their own transaction, they queue on the file
+lock, and a writer that waits longer than the busy timeout fails with
+``database is locked``.
+
+A GroupCommitWriter serializes the writes instead: threads submit work
+units (functions of a session) and wait on a future, while one writer thread
+applies the units in order and commits them together, every
+``group_commit_max_rows`` rows or ``group_commit_max_delay_ms`` milliseconds.
+Each unit runs inside a SAVEPOINT, so a failing unit is rolled back and
+reported to its submitter without affecting the rest of the group. Futures
+are resolved only after the group's COMMIT.
+
+Readers keep using the connection pool; other dialects have real row-level
+concurrency and keep writing directly (get_group_commit_writer returns None).
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Optional, TypeVar
+
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from spider_aggregation.config import get_config
+from spider_aggregation.logger import get_logger
+from spider_aggregation.metrics import DB_GROUP_COMMIT_ROWS
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Session.info key counting the rows flushed in the current group
+_ROWS_KEY = "group_commit_rows"
+
+
+class GroupCommitWriter:
+    """Apply submitted write units on one thread, committing them in groups.
+
+    The writer thread is started on the first submit and exits after
+    ``idle_seconds`` without work.
+
+    Example:
+        >>> writer = get_group_commit_writer(engine)
+        >>> future = writer.submit(lambda session: session.add(entry))
+        >>> future.result()  # returns once the group is committed
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        max_rows: int = 500,
+        max_delay_ms: int = 50,
+        idle_seconds: float = 30.0,
+    ):
+        """Initialize the writer.
+
+        Args:
+            engine: SQLite engine to write to
+            max_rows: Rows after which a group is committed
+            max_delay_ms: Time after a group's first unit at which it is committed
+            idle_seconds: Idle time after which the writer thread exits
+        """
+        self.engine = engine
+        self.max_rows = max_rows
+        self.max_delay = max_delay_ms / 1000
+        self.idle_seconds = idle_seconds
+
+        self._session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        event.listen(self._session_factory, "after_flush", _count_rows)
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, work: Callable[[Session], T]) -> "Future[T]":
+        """Queue a write unit.
+
+        ``work`` runs on the writer thread with the writer's session and must
+        not commit or roll back. Objects it loads belong to that session.
+
+        Args:
+            work: Function applying the writes to a session
+
+        Returns:
+            Future with the return value of ``work``, resolved after commit
+        """
+        future: Future = Future()
+        with self._lock:
+            self._queue.put((future, work))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="group-commit-writer", daemon=True
+                )
+                self._thread.start()
+        return future
+
+    def _run(self) -> None:
+        """Writer thread: commit groups until idle."""
+        while True:
+            try:
+                item = self._queue.get(timeout=self.idle_seconds)
+            except queue.Empty:
+                with self._lock:
+                    if self._queue.empty():
+                        self._thread = None
+                        return
+                continue
+            self._commit_group(item)
+
+    def _commit_group(self, first: tuple[Future, Callable[[Session], object]]) -> None:
+        """Apply ``first`` and the units queued behind it, then commit once."""
+        deadline = time.monotonic() + self.max_delay
+        session = self._session_factory()
+        session.info[_ROWS_KEY] = 0
+        applied: list[tuple[Future, object]] = []
+        try:
+            # Take the write lock up front: a deferred transaction that reads
+            # first fails with SQLITE_BUSY when upgrading instead of waiting
+            session.connection(execution_options={"sqlite_begin": "IMMEDIATE"})
+            item = first
+            while True:
+                future, work = item
+                if future.set_running_or_notify_cancel():
+                    try:
+                        with session.begin_nested():
+                            result = work(session)
+                    except Exception as e:
+                        future.set_exception(e)
+                    else:
+                        applied.append((future, result))
+
+                remaining = deadline - time.monotonic()
+                if session.info[_ROWS_KEY] >= self.max_rows or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            session.commit()
+        except Exception as e:
+            logger.exception(f"Group commit of {len(applied)} writes failed: {e}")
+            session.rollback()
+            if not first[0].done():
+                # BEGIN IMMEDIATE failed before the first unit ran
+                first[0].set_exception(e)
+            for future, _ in applied:
+                future.set_exception(e)
+        else:
+            DB_GROUP_COMMIT_ROWS.observe(session.info[_ROWS_KEY])
+            for future, result in applied:
+                future.set_result(result)
+        finally:
+            session.close()
+
+
+def _count_rows(session: Session, flush_context) -> None:
+    """Add the rows written by a flush to the group's count."""
+    session.info[_ROWS_KEY] += len(session.new) + len(session.dirty) + len(session.deleted)
+
+
+_writers: dict[str, GroupCommitWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_group_commit_writer(engine: Engine) -> Optional[GroupCommitWriter]:
+    """Get the group commit writer of a SQLite database.
+
+    Args:
+        engine: Engine of the database
+
+    Returns:
+        The database's writer (one per database file), or None for other
+        dialects, in-memory databases or when group commits are disabled
+    """
+    config = get_config().database
+    if engine.dialect.name != "sqlite" or not config.group_commit:
+        return None
+    # Every connection to an in-memory database is a separate database
+    if engine.url.database in (None, "", ":memory:"):
+        return None
+
+    key = engine.url.render_as_string(hide_password=False)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = GroupCommitWriter(
+                engine,
+                max_rows=config.group_commit_max_rows,
+                max_delay_ms=config.group_commit_max_delay_ms,
+            )
+    return writer
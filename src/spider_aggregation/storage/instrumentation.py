@@ -0,0 +1,29 @@
+"""
+Session event listeners feeding the metrics registry.
+
+Times every ORM flush (the point where pending inserts, updates and deletes
+are sent to the database) into ``mindweaver_db_flush_duration_seconds``.
+"""
+
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from spider_aggregation.metrics import DB_FLUSH_DURATION
+
+_STARTED_KEY = "flush_started"
+
+
+@event.listens_for(Session, "before_flush")
+def _flush_started(session: Session, flush_context, instances) -> None:
+    """Remember when the flush started."""
+    session.info[_STARTED_KEY] = time.perf_counter()
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _flush_finished(session: Session, flush_context) -> None:
+    """Observe the flush duration."""
+    started = session.info.pop(_STARTED_KEY, None)
+    if started is not None:
+        DB_FLUSH_DURATION.observe(time.perf_counter() - started)
@@ -37,6 +37,74 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
     session: "Session"
     model: type[ModelType]
 
+    # Large text attributes left out of each list projection: "list" for pages
+    # showing titles and summaries, "titles" for pages showing titles only
+    # ("body" holds the content)
+    LIST_PROJECTIONS: Dict[str, tuple[str, ...]] = {
+        "list": ("body",),
+        "titles": ("body", "summary"),
+    }
+
+    def _projection_options(self, projection: Optional[str]) -> list:
+        """Build loader options deferring the attributes a projection leaves out.
+
+        The deferred attributes raise on access instead of lazy loading them
+        one row at a time, so a caller touching one is caught immediately. The
+        feed's ID and name are joined in, since list views show the feed name
+        of every entry.
+
+        Args:
+            projection: Projection name (None loads all columns)
+
+        Returns:
+            List of loader options
+
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        from sqlalchemy import inspect
+        from sqlalchemy.orm import defer, joinedload, raiseload
+
+        from spider_aggregation.models import FeedModel
+
+        if projection is None:
+            return []
+        if projection not in self.LIST_PROJECTIONS:
+            raise ValueError(f"Unknown list projection: {projection!r}")
+        relationships = inspect(self.model).relationships
+        return [
+            (
+                raiseload(getattr(self.model, name))
+                if name in relationships
+                else defer(getattr(self.model, name), raiseload=True)
+            )
+            for name in self.LIST_PROJECTIONS[projection]
+        ] + [joinedload(self.model.feed).load_only(FeedModel.id, FeedModel.name)]
+
+    def _title_or_content_contains(self, query: str) -> Any:
+        """Build a filter matching entries whose title or content contains a string.
+
+        The content is matched in SQL through the dialect's body text
+        expression; bodies are only decompressed for rows whose title does
+        not match.
+
+        Args:
+            query: Search string
+
+        Returns:
+            SQL filter criterion
+        """
+        from sqlalchemy import exists
+
+        from spider_aggregation.models import EntryBodyModel
+        from spider_aggregation.storage.repositories.body_repo import body_text
+
+        content_match = exists().where(
+            EntryBodyModel.entry_id == self.model.id,
+            body_text(self.session).contains(query),
+        )
+        return self.model.title.contains(query) | content_match
+
     def _build_entry_category_query(self, category_id: int) -> "Select[tuple[ModelType]]":
         """Build base query for entry-category filtering via feeds.
 
@@ -131,6 +199,7 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
         offset: int = 0,
         order_by: str = "published_at",
         order_desc: bool = True,
+        projection: Optional[str] = None,
     ) -> list[ModelType]:
         """List entries by category ID (via feed relationship).
 
@@ -140,11 +209,13 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
             offset: Number of results to skip
             order_by: Field to order by
             order_desc: Sort in descending order
+            projection: List projection deferring large text columns (see LIST_PROJECTIONS)
 
         Returns:
             List of model instances
         """
         query = self._build_entry_category_query(category_id)
+        query = query.options(*self._projection_options(projection))
         query = self._apply_ordering(query, order_by, order_desc)
         return query.limit(limit).offset(offset).all()
 
@@ -155,6 +226,7 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
         offset: int = 0,
         order_by: str = "published_at",
         order_desc: bool = True,
+        projection: Optional[str] = None,
     ) -> list[ModelType]:
         """List entries by category name (via feed relationship).
 
@@ -164,11 +236,13 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
             offset: Number of results to skip
             order_by: Field to order by
             order_desc: Sort in descending order
+            projection: List projection deferring large text columns (see LIST_PROJECTIONS)
 
         Returns:
             List of model instances
         """
         query = self._build_entry_category_name_query(category_name)
+        query = query.options(*self._projection_options(projection))
         query = self._apply_ordering(query, order_by, order_desc)
         return query.limit(limit).offset(offset).all()
 
@@ -179,6 +253,7 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
         offset: int = 0,
         order_by: str = "published_at",
         order_desc: bool = True,
+        projection: Optional[str] = None,
     ) -> list[ModelType]:
         """List entries by multiple category IDs (entries from feeds in any category).
 
@@ -188,6 +263,7 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
             offset: Number of results to skip
             order_by: Field to order by
             order_desc: Sort in descending order
+            projection: List projection deferring large text columns (see LIST_PROJECTIONS)
 
         Returns:
             List of model instances
@@ -195,6 +271,7 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
         query = self._build_entry_categories_query(category_ids)
         if query is None:
             return []
+        query = query.options(*self._projection_options(projection))
         query = self._apply_ordering(query, order_by, order_desc)
         return query.limit(limit).offset(offset).all()
 
@@ -216,6 +293,7 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
         category_id: int,
         limit: int = 100,
         offset: int = 0,
+        projection: Optional[str] = None,
     ) -> list[ModelType]:
         """Search entries by title or content within a category.
 
@@ -224,12 +302,14 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
             category_id: Category ID
             limit: Maximum number of results
             offset: Number of results to skip
+            projection: List projection deferring large text columns (see LIST_PROJECTIONS)
 
         Returns:
             List of matching model instances
         """
         q = self._build_entry_category_query(category_id)
-        q = q.filter((self.model.title.contains(query)) | (self.model.content.contains(query)))
+        q = q.options(*self._projection_options(projection))
+        q = q.filter(self._title_or_content_contains(query))
         return q.order_by(desc(self.model.published_at)).limit(limit).offset(offset).all()
 
     def get_recent_by_category(
@@ -528,6 +608,161 @@ class CategoryRelationshipMixin:
             feed.updated_at = datetime.utcnow()
         self.session.flush()
 
+    def bulk_add_categories(self, feed_ids: list[int], category_ids: list[int]) -> int:
+        """Add categories to many feeds with set-based statements.
+
+        Unknown feed or category IDs and existing links are skipped. Feeds
+        already loaded in the session do not see the new links until they
+        are expired or reloaded.
+
+        Args:
+            feed_ids: Feed IDs
+            category_ids: Category IDs to add to every feed
+
+        Returns:
+            Number of feed-category links added
+        """
+        from sqlalchemy import insert, select
+
+        from spider_aggregation.models import feed_categories
+
+        category_ids = self._existing_category_ids(category_ids)
+        if not category_ids:
+            return 0
+
+        added = 0
+        for chunk in self._feed_id_chunks(feed_ids, reserved=len(category_ids)):
+            existing = set(
+                self.session.execute(
+                    select(feed_categories.c.feed_id, feed_categories.c.category_id).where(
+                        feed_categories.c.feed_id.in_(chunk),
+                        feed_categories.c.category_id.in_(category_ids),
+                    )
+                ).all()
+            )
+            rows = [
+                {"feed_id": feed_id, "category_id": category_id}
+                for feed_id in chunk
+                for category_id in category_ids
+                if (feed_id, category_id) not in existing
+            ]
+            if rows:
+                self.session.execute(insert(feed_categories), rows)
+                self._touch_feeds({row["feed_id"] for row in rows})
+                added += len(rows)
+        return added
+
+    def bulk_remove_categories(
+        self,
+        feed_ids: list[int],
+        category_ids: Optional[list[int]] = None,
+        keep: bool = False,
+    ) -> int:
+        """Remove categories from many feeds with set-based statements.
+
+        Args:
+            feed_ids: Feed IDs
+            category_ids: Category IDs to remove (all categories if empty)
+            keep: Remove every category except ``category_ids`` instead
+
+        Returns:
+            Number of feed-category links removed
+        """
+        from sqlalchemy import delete, select
+
+        from spider_aggregation.models import feed_categories
+
+        category_ids = list(dict.fromkeys(category_ids or []))
+        removed = 0
+        for chunk in self._feed_id_chunks(feed_ids, reserved=len(category_ids)):
+            criteria = [feed_categories.c.feed_id.in_(chunk)]
+            if category_ids:
+                column = feed_categories.c.category_id
+                criteria.append(column.not_in(category_ids) if keep else column.in_(category_ids))
+
+            touched = set(
+                self.session.execute(
+                    select(feed_categories.c.feed_id).where(*criteria).distinct()
+                ).scalars()
+            )
+            if touched:
+                removed += self.session.execute(delete(feed_categories).where(*criteria)).rowcount
+                self._touch_feeds(touched)
+        return removed
+
+    def bulk_set_categories(self, feed_ids: list[int], category_ids: list[int]) -> tuple[int, int]:
+        """Replace the categories of many feeds with set-based statements.
+
+        Args:
+            feed_ids: Feed IDs
+            category_ids: Category IDs every feed should have exactly
+
+        Returns:
+            Tuple of (links added, links removed)
+        """
+        category_ids = self._existing_category_ids(category_ids)
+        removed = self.bulk_remove_categories(feed_ids, category_ids, keep=True)
+        added = self.bulk_add_categories(feed_ids, category_ids)
+        return added, removed
+
+    def _existing_category_ids(self, category_ids: list[int]) -> list[int]:
+        """Filter category IDs down to existing categories."""
+        from sqlalchemy import select
+
+        from spider_aggregation.models import CategoryModel
+
+        if not category_ids:
+            return []
+        return list(
+            self.session.scalars(
+                select(CategoryModel.id)
+                .where(CategoryModel.id.in_(set(category_ids)))
+                .order_by(CategoryModel.id)
+            )
+        )
+
+    def _feed_id_chunks(self, feed_ids: list[int], reserved: int = 0):
+        """Split existing feed IDs into chunks within the bound parameter limit.
+
+        Args:
+            feed_ids: Feed IDs
+            reserved: Parameters used by the rest of the statement
+
+        Yields:
+            Lists of existing feed IDs
+        """
+        from spider_aggregation.models import FeedModel
+
+        from spider_aggregation.storage.repositories.base import (
+            RESERVED_BIND_PARAMETERS,
+            bind_parameter_limit,
+            chunked,
+        )
+
+        # Pending ORM changes must reach the database before the core statements
+        self.session.flush()
+        size = bind_parameter_limit(self.session) - RESERVED_BIND_PARAMETERS - reserved
+        for chunk in chunked(dict.fromkeys(feed_ids), max(size, 1)):
+            existing = [
+                feed_id
+                for (feed_id,) in self.session.query(FeedModel.id).filter(FeedModel.id.in_(chunk))
+            ]
+            if existing:
+                yield existing
+
+    def _touch_feeds(self, feed_ids: set[int]) -> None:
+        """Bump updated_at of feeds whose categories changed."""
+        from sqlalchemy import update
+
+        from spider_aggregation.models import FeedModel
+
+        self.session.execute(
+            update(FeedModel)
+            .where(FeedModel.id.in_(feed_ids))
+            .values(updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+
 
 class JSONFieldMixin(Generic[ModelType]):
     """Mixin for models with JSON fields requiring serialization.
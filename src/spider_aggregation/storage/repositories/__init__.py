@@ -1,17 +1,31 @@
 """Repository pattern implementations for data access."""
 
 from spider_aggregation.storage.repositories.base import BaseRepository
+from spider_aggregation.storage.repositories.body_repo import EntryBodyRepository
 from spider_aggregation.storage.repositories.mixins import CategoryQueryMixin
 from spider_aggregation.storage.repositories.entry_repo import EntryRepository
 from spider_aggregation.storage.repositories.feed_repo import FeedRepository
 from spider_aggregation.storage.repositories.filter_rule_repo import FilterRuleRepository
 from spider_aggregation.storage.repositories.category_repo import CategoryRepository
+from spider_aggregation.storage.repositories.signature_repo import EntrySignatureRepository
+from spider_aggregation.storage.repositories.stats_repo import EntryStatsRepository
+from spider_aggregation.storage.repositories.fetch_job_repo import FetchJobRepository
+from spider_aggregation.storage.repositories.term_stats_repo import (
+    CorpusSnapshot,
+    CorpusStatsRepository,
+)
 
 __all__ = [
     "BaseRepository",
     "CategoryQueryMixin",
     "EntryRepository",
+    "EntryBodyRepository",
     "FeedRepository",
     "FilterRuleRepository",
     "CategoryRepository",
+    "EntrySignatureRepository",
+    "EntryStatsRepository",
+    "FetchJobRepository",
+    "CorpusSnapshot",
+    "CorpusStatsRepository",
 ]
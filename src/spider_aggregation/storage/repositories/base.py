@@ -7,7 +7,7 @@ common database operations to eliminate code duplication across repositories.
 
 from abc import abstractmethod
 from datetime import datetime
-from typing import TypeVar, Generic, Optional, Type, Any
+from typing import TypeVar, Generic, Iterable, Iterator, Optional, Sequence, Type, Any
 
 from sqlalchemy import asc, desc
 from sqlalchemy.orm import Session
@@ -15,6 +15,49 @@ from sqlalchemy.orm import Session
 ModelType = TypeVar("ModelType")
 CreateSchemaType = TypeVar("CreateSchemaType")
 UpdateSchemaType = TypeVar("UpdateSchemaType")
+T = TypeVar("T")
+
+# Bound parameters kept free for the non-IN parts of bulk statements
+RESERVED_BIND_PARAMETERS = 16
+
+
+def bind_parameter_limit(session: Session) -> int:
+    """Get the maximum number of bound parameters per statement for a session.
+
+    Args:
+        session: SQLAlchemy Session instance
+
+    Returns:
+        Parameter limit of the bound database's dialect (999 if unknown)
+    """
+    from spider_aggregation.storage.dialects import get_dialect
+
+    sa_dialect = session.get_bind().dialect
+    try:
+        dialect = get_dialect(sa_dialect.name)
+    except ValueError:
+        return 999
+    return dialect.max_bind_parameters(sa_dialect.server_version_info)
+
+
+def chunked(values: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Split values into lists of at most ``size`` items.
+
+    Args:
+        values: Values to split
+        size: Maximum chunk length
+
+    Yields:
+        Consecutive chunks of values
+    """
+    chunk: list[T] = []
+    for value in values:
+        chunk.append(value)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
 
 class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
@@ -72,6 +115,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         offset: int = 0,
         order_by: str = "created_at",
         order_desc: bool = True,
+        options: Sequence[Any] = (),
         **filters: Any,
     ) -> list[ModelType]:
         """List records with optional filtering and pagination.
@@ -81,12 +125,13 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             offset: Number of results to skip
             order_by: Field to order by
             order_desc: Sort in descending order
+            options: Loader options for the query (e.g. defer() of large columns)
             **filters: Additional filter parameters (e.g., enabled_only=True)
 
         Returns:
             List of model instances
         """
-        query = self.session.query(self.model)
+        query = self.session.query(self.model).options(*options)
 
         # Apply filters if provided
         for key, value in filters.items():
@@ -165,6 +210,45 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         self.session.delete(obj)
         self.session.flush()
 
+    def id_chunks(self, ids: Iterable[int]) -> Iterator[list[int]]:
+        """Split record IDs into chunks that fit one ``IN (...)`` clause.
+
+        Duplicate IDs are dropped.
+
+        Args:
+            ids: Record IDs
+
+        Yields:
+            Lists of unique IDs within the dialect's bound parameter limit
+        """
+        size = bind_parameter_limit(self.session) - RESERVED_BIND_PARAMETERS
+        yield from chunked(dict.fromkeys(ids), max(size, 1))
+
+    def bulk_update_by_ids(self, ids: Iterable[int], **values: Any) -> int:
+        """Update columns of many records without loading them.
+
+        Runs one ``UPDATE ... WHERE id IN (...)`` per chunk of IDs. Instances
+        already loaded in the session are not refreshed.
+
+        Args:
+            ids: Record IDs
+            **values: Column values to set
+
+        Returns:
+            Number of records updated
+        """
+        if hasattr(self.model, "updated_at") and "updated_at" not in values:
+            values["updated_at"] = datetime.utcnow()
+
+        count = 0
+        for chunk in self.id_chunks(ids):
+            count += (
+                self.session.query(self.model)
+                .filter(self.model.id.in_(chunk))
+                .update(values, synchronize_session=False)
+            )
+        return count
+
     def exists(self, **filters: Any) -> bool:
         """Check if a record exists with the given filters.
 
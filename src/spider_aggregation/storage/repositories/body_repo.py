@@ -0,0 +1,99 @@
+"""
+Entry body repository and the mapper events compressing bodies on flush.
+
+EntryModel.content is stored in entry_bodies (see models.entry_body). Text
+assigned to a body is compressed with ``database.body_codec`` when the row
+is inserted or updated; rows keep the codec they were written with.
+"""
+
+from typing import Optional
+
+from sqlalchemy import Connection, event, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from spider_aggregation.config import get_config
+from spider_aggregation.models import EntryBodyModel
+from spider_aggregation.utils.compression import compress_text, decompress_text, resolve_codec
+
+
+@event.listens_for(EntryBodyModel, "before_insert")
+@event.listens_for(EntryBodyModel, "before_update")
+def _compress_body(mapper, connection: Connection, target: EntryBodyModel) -> None:
+    if not target.pending:
+        return
+    text = target.text
+    target.codec = resolve_codec(get_config().database.body_codec)
+    target.data = compress_text(text, target.codec)
+    target.size = len(text.encode("utf-8"))
+    target.pending = False
+
+
+def body_text(session: Session) -> ColumnElement:
+    """SQL expression for the text of entry_bodies rows on the session's database.
+
+    Args:
+        session: Session whose dialect builds the expression
+
+    Returns:
+        Text expression over EntryBodyModel columns (NULL where the database
+        cannot decompress the codec in SQL)
+    """
+    from spider_aggregation.storage.dialects import get_dialect
+
+    dialect = get_dialect(session.get_bind().dialect.name)
+    return dialect.body_text_expression(EntryBodyModel.codec, EntryBodyModel.data)
+
+
+def decode_body(codec: Optional[str], data: Optional[bytes]) -> Optional[str]:
+    """Decompress selected codec and data columns (None for entries without a body).
+
+    Args:
+        codec: entry_bodies.codec value
+        data: entry_bodies.data value
+
+    Returns:
+        Body text, or None
+    """
+    if data is None:
+        return None
+    return decompress_text(codec, data)
+
+
+class EntryBodyRepository:
+    """Repository reporting on the stored entry bodies."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize repository with a database session.
+
+        Args:
+            session: SQLAlchemy Session instance
+        """
+        self.session = session
+
+    def size_report(self) -> dict:
+        """Sizes of the stored bodies.
+
+        Returns:
+            Dictionary with bodies (row count), text_bytes (uncompressed
+            UTF-8 size), stored_bytes (compressed size), ratio
+            (stored/text) and codecs (row count per codec)
+        """
+        rows = self.session.execute(
+            select(
+                EntryBodyModel.codec,
+                func.count(),
+                func.sum(EntryBodyModel.size),
+                func.sum(func.length(EntryBodyModel.data)),
+            ).group_by(EntryBodyModel.codec)
+        ).all()
+
+        text_bytes = sum(int(row[2] or 0) for row in rows)
+        stored_bytes = sum(int(row[3] or 0) for row in rows)
+        return {
+            "bodies": sum(row[1] for row in rows),
+            "text_bytes": text_bytes,
+            "stored_bytes": stored_bytes,
+            "ratio": round(stored_bytes / text_bytes, 4) if text_bytes else None,
+            "codecs": {row[0]: row[1] for row in rows},
+        }
@@ -39,6 +39,7 @@ class CategoryRepository(
         color: Optional[str] = None,
         icon: Optional[str] = None,
         enabled: bool = True,
+        retention_days: Optional[int] = None,
     ) -> CategoryModel:
         """Create a new category.
 
@@ -48,6 +49,7 @@ class CategoryRepository(
             color: Optional hex color code (e.g., #ff5733)
             icon: Optional icon name or class
             enabled: Whether the category is enabled (default: True)
+            retention_days: Days to keep entries of member feeds (None for the global policy)
 
         Returns:
             Created CategoryModel instance
@@ -58,6 +60,7 @@ class CategoryRepository(
             color=color,
             icon=icon,
             enabled=enabled,
+            retention_days=retention_days,
         )
 
         self.session.add(category)
@@ -115,7 +118,8 @@ class CategoryRepository(
 
         Args:
             category: CategoryModel instance to update
-            **kwargs: Fields to update (name, description, color, icon, enabled)
+            **kwargs: Fields to update (name, description, color, icon, enabled,
+                retention_days)
 
         Returns:
             Updated CategoryModel instance
@@ -3,14 +3,17 @@ Entry repository for database operations.
 """
 
 from datetime import datetime, timedelta
-from typing import Optional
+from collections import namedtuple
+from typing import Iterator, Optional
 
-from sqlalchemy import asc, desc, func
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, asc, desc, func, or_, select
+from sqlalchemy.orm import Session, aliased
 
-from spider_aggregation.models import EntryModel, FeedModel
+from spider_aggregation.models import EntryBodyModel, EntryModel, FeedModel
 from spider_aggregation.models.entry import EntryCreate, EntryUpdate
 from spider_aggregation.storage.repositories.base import BaseRepository
+from spider_aggregation.storage.repositories.body_repo import body_text, decode_body
+from spider_aggregation.storage.repositories.stats_repo import EntryStatsRepository
 from spider_aggregation.storage.mixins import EntryCategoryQueryMixin, JSONFieldMixin
 
 
@@ -21,7 +24,9 @@ class EntryRepository(
 ):
     """Repository for Entry CRUD operations.
 
-    Inherits common CRUD operations from BaseRepository.
+    Inherits common CRUD operations from BaseRepository. Bulk deletes are
+    mirrored into the entry statistics rollup explicitly, since they bypass
+    the ORM events that maintain it.
     """
 
     def __init__(self, session: Session) -> None:
@@ -31,6 +36,7 @@ class EntryRepository(
             session: SQLAlchemy Session instance
         """
         super().__init__(session, EntryModel)
+        self.stats_repo = EntryStatsRepository(session)
 
     def get_json_fields(self) -> set[str]:
         """Return JSON field names for EntryModel."""
@@ -167,6 +173,8 @@ class EntryRepository(
         offset: int = 0,
         order_by: str = "published_at",
         order_desc: bool = True,
+        collapse_clusters: bool = False,
+        projection: Optional[str] = None,
     ) -> list[EntryModel]:
         """List entries with optional filtering.
 
@@ -176,31 +184,101 @@ class EntryRepository(
             offset: Number of results to skip
             order_by: Field to order by
             order_desc: Sort in descending order
+            collapse_clusters: Return only one representative entry per story cluster
+            projection: List projection deferring large text columns (see LIST_PROJECTIONS)
 
         Returns:
             List of EntryModel instances
         """
+        options = self._projection_options(projection)
+
+        if collapse_clusters:
+            query = self.session.query(EntryModel).filter(
+                self._cluster_representative_filter(feed_id)
+            )
+            if feed_id is not None:
+                query = query.filter(EntryModel.feed_id == feed_id)
+            query = self._apply_ordering(query.options(*options), order_by, order_desc)
+            return query.limit(limit).offset(offset).all()
+
         filters = {}
         if feed_id is not None:
             filters["feed_id"] = feed_id
         return super().list(
-            limit=limit, offset=offset, order_by=order_by, order_desc=order_desc, **filters
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            order_desc=order_desc,
+            options=options,
+            **filters,
         )
 
-    def count(self, feed_id: Optional[int] = None) -> int:
+    def count(self, feed_id: Optional[int] = None, collapse_clusters: bool = False) -> int:
         """Count entries.
 
         Args:
             feed_id: Filter by feed ID
+            collapse_clusters: Count each story cluster once
 
         Returns:
             Number of entries
         """
+        if collapse_clusters:
+            query = self.session.query(EntryModel).filter(
+                self._cluster_representative_filter(feed_id)
+            )
+            if feed_id is not None:
+                query = query.filter(EntryModel.feed_id == feed_id)
+            return query.count()
+
         filters = {}
         if feed_id is not None:
             filters["feed_id"] = feed_id
         return super().count(**filters)
 
+    @staticmethod
+    def _cluster_representative_filter(feed_id: Optional[int] = None):
+        """Build the filter matching unclustered entries and cluster representatives.
+
+        The representative of a cluster is its first (lowest ID) entry among
+        the filtered entries, so clusters whose first entry is filtered out
+        are still listed. The check is correlated to each candidate row (an
+        ix_entries_cluster_id probe for an earlier member) rather than a
+        MIN(id) per cluster over the whole table, so a listing page only
+        looks at the clusters of the rows it scans.
+
+        Args:
+            feed_id: Feed the listing is filtered by (None for all feeds)
+        """
+        earlier = aliased(EntryModel)
+        earlier_member = select(earlier.id).where(
+            earlier.cluster_id == EntryModel.cluster_id,
+            earlier.id < EntryModel.id,
+        )
+        if feed_id is not None:
+            earlier_member = earlier_member.where(earlier.feed_id == feed_id)
+        return or_(EntryModel.cluster_id.is_(None), ~earlier_member.exists())
+
+    def get_cluster_sizes(self, cluster_ids: list[int]) -> dict[int, int]:
+        """Count the members of story clusters.
+
+        Args:
+            cluster_ids: List of cluster IDs
+
+        Returns:
+            Dictionary mapping cluster ID to member count
+        """
+        if not cluster_ids:
+            return {}
+
+        rows = (
+            self.session.query(EntryModel.cluster_id, func.count(EntryModel.id))
+            .filter(EntryModel.cluster_id.in_(cluster_ids))
+            .group_by(EntryModel.cluster_id)
+            .all()
+        )
+        return dict(rows)
+
     def update(self, entry: EntryModel, entry_data: EntryUpdate) -> EntryModel:
         """Update an entry.
 
@@ -232,16 +310,29 @@ class EntryRepository(
         Returns:
             Number of entries deleted
         """
-        if not entry_ids:
-            return 0
-        count = (
-            self.session.query(EntryModel)
-            .filter(EntryModel.id.in_(entry_ids))
-            .delete(synchronize_session=False)
-        )
+        count = 0
+        for chunk in self.id_chunks(entry_ids):
+            self.stats_repo.record_delete(EntryModel.id.in_(chunk))
+            count += (
+                self.session.query(EntryModel)
+                .filter(EntryModel.id.in_(chunk))
+                .delete(synchronize_session=False)
+            )
         self.session.flush()
         return count
 
+    def bulk_update_enabled(self, entry_ids: list[int], enabled: bool) -> int:
+        """Set the enabled (unread) flag of many entries at once.
+
+        Args:
+            entry_ids: List of entry IDs
+            enabled: New value (False marks entries as read)
+
+        Returns:
+            Number of entries updated
+        """
+        return self.bulk_update_by_ids(entry_ids, enabled=enabled)
+
     def delete_by_feed(self, feed_id: int) -> int:
         """Delete all entries for a feed.
 
@@ -251,6 +342,7 @@ class EntryRepository(
         Returns:
             Number of entries deleted
         """
+        self.stats_repo.delete_by_feed(feed_id)
         count = self.session.query(EntryModel).filter(EntryModel.feed_id == feed_id).delete()
         self.session.flush()
         return count
@@ -261,6 +353,7 @@ class EntryRepository(
         feed_id: Optional[int] = None,
         limit: int = 100,
         offset: int = 0,
+        projection: Optional[str] = None,
     ) -> list[EntryModel]:
         """Search entries by title or content.
 
@@ -269,12 +362,15 @@ class EntryRepository(
             feed_id: Optional feed ID filter
             limit: Maximum number of results
             offset: Number of results to skip
+            projection: List projection deferring large text columns (see LIST_PROJECTIONS)
 
         Returns:
             List of matching EntryModel instances
         """
-        q = self.session.query(EntryModel).filter(
-            (EntryModel.title.contains(query)) | (EntryModel.content.contains(query))
+        q = (
+            self.session.query(EntryModel)
+            .options(*self._projection_options(projection))
+            .filter(self._title_or_content_contains(query))
         )
 
         if feed_id is not None:
@@ -308,6 +404,257 @@ class EntryRepository(
 
         return q.limit(limit).all()
 
+    def _supports_window_functions(self) -> bool:
+        """Check whether the bound database supports window functions."""
+        from spider_aggregation.storage.dialects import get_dialect
+
+        sa_dialect = self.session.get_bind().dialect
+        try:
+            dialect = get_dialect(sa_dialect.name)
+        except ValueError:
+            return False
+        return dialect.supports_window_functions(sa_dialect.server_version_info)
+
+    def iter_latest_per_feed(
+        self,
+        per_feed: int,
+        since: Optional[datetime] = None,
+        enabled_feeds_only: bool = True,
+        excerpt_length: int = 1000,
+        batch_size: int = 500,
+    ) -> Iterator[Row]:
+        """Stream the most recent entries of every feed in one query.
+
+        Uses ``ROW_NUMBER() OVER (PARTITION BY feed_id ORDER BY published_at DESC)``
+        where the database supports window functions, and falls back to one
+        query per feed otherwise. Only the columns needed for digests are
+        selected; ``excerpt`` is the summary (or content) cut to
+        ``excerpt_length + 1`` characters so callers can tell it was truncated.
+        Bodies are only read for the selected entries without a summary.
+
+        Args:
+            per_feed: Maximum number of entries per feed
+            since: Only include entries published at or after this time
+            enabled_feeds_only: Only include entries of enabled feeds
+            excerpt_length: Excerpt length in characters
+            batch_size: Rows fetched per round trip while streaming
+
+        Yields:
+            Rows with id, feed_id, title, link, excerpt, published_at and
+            cluster_id, grouped by feed and newest first within a feed
+        """
+        columns = (
+            EntryModel.id,
+            EntryModel.feed_id,
+            EntryModel.title,
+            EntryModel.link,
+            EntryModel.summary,
+            EntryModel.published_at,
+            EntryModel.cluster_id,
+        )
+
+        criteria = []
+        if since is not None:
+            criteria.append(EntryModel.published_at >= since)
+        if enabled_feeds_only:
+            enabled_ids = select(FeedModel.id).where(FeedModel.enabled.is_(True))
+            criteria.append(EntryModel.feed_id.in_(enabled_ids))
+
+        if not self._supports_window_functions():
+            yield from self._iter_latest_per_feed_fallback(
+                columns, criteria, per_feed, excerpt_length
+            )
+            return
+
+        row_number = (
+            func.row_number()
+            .over(partition_by=EntryModel.feed_id, order_by=desc(EntryModel.published_at))
+            .label("row_number")
+        )
+        ranked = select(*columns, row_number).where(*criteria).subquery()
+        stmt = (
+            select(
+                *(
+                    self._excerpt(ranked.c.id, ranked.c.summary, excerpt_length)
+                    if column.key == "summary"
+                    else ranked.c[column.key]
+                    for column in columns
+                )
+            )
+            .where(ranked.c.row_number <= per_feed)
+            .order_by(ranked.c.feed_id, ranked.c.row_number)
+            .execution_options(yield_per=batch_size)
+        )
+        yield from self.session.execute(stmt)
+
+    def _iter_latest_per_feed_fallback(
+        self, columns: tuple, criteria: list, per_feed: int, excerpt_length: int
+    ) -> Iterator[Row]:
+        """Per-feed query fallback for databases without window functions."""
+        columns = tuple(
+            (
+                self._excerpt(EntryModel.id, EntryModel.summary, excerpt_length)
+                if column.key == "summary"
+                else column
+            )
+            for column in columns
+        )
+        feed_ids = (
+            self.session.execute(
+                select(EntryModel.feed_id).where(*criteria).distinct().order_by(EntryModel.feed_id)
+            )
+            .scalars()
+            .all()
+        )
+        for feed_id in feed_ids:
+            yield from self.session.execute(
+                select(*columns)
+                .where(EntryModel.feed_id == feed_id, *criteria)
+                .order_by(desc(EntryModel.published_at))
+                .limit(per_feed)
+            )
+
+    def _excerpt(self, entry_id, summary, excerpt_length: int):
+        """Build the excerpt column of iter_latest_per_feed().
+
+        Args:
+            entry_id: Entry ID column
+            summary: Summary column
+            excerpt_length: Excerpt length in characters
+
+        Returns:
+            Labeled column with the summary (or body text) cut to
+            ``excerpt_length + 1`` characters
+        """
+        content = (
+            select(body_text(self.session))
+            .where(EntryBodyModel.entry_id == entry_id)
+            .scalar_subquery()
+        )
+        return func.substr(
+            func.coalesce(func.nullif(summary, ""), content), 1, excerpt_length + 1
+        ).label("excerpt")
+
+    # Entry columns included in exports (everything but the dedup hashes)
+    EXPORT_COLUMNS = (
+        "id",
+        "feed_id",
+        "title",
+        "link",
+        "author",
+        "summary",
+        "content",
+        "published_at",
+        "fetched_at",
+        "tags",
+        "language",
+        "reading_time_seconds",
+        "enabled",
+        "cluster_id",
+    )
+    ExportRow = namedtuple("ExportRow", EXPORT_COLUMNS)
+
+    def iter_for_export(
+        self,
+        feed_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        batch_size: int = 500,
+    ) -> Iterator[ExportRow]:
+        """Stream entries for export without loading them all into memory.
+
+        Rows are plain column tuples (no ORM identity map) fetched
+        ``batch_size`` at a time; on PostgreSQL and MySQL this uses a
+        server-side cursor. Bodies are joined in and decompressed per row.
+
+        Args:
+            feed_id: Only export entries of this feed
+            category_id: Only export entries of feeds in this category
+            since: Only export entries published at or after this time
+            until: Only export entries published before this time
+            limit: Maximum number of entries (None for all)
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            ExportRows with the EXPORT_COLUMNS, newest first
+        """
+        from spider_aggregation.models import feed_categories
+
+        stmt = select(
+            *(
+                getattr(EntryModel, name)
+                for name in self.EXPORT_COLUMNS
+                if name != "content"
+            ),
+            EntryBodyModel.codec,
+            EntryBodyModel.data,
+        ).outerjoin(EntryBodyModel, EntryBodyModel.entry_id == EntryModel.id)
+        if feed_id is not None:
+            stmt = stmt.where(EntryModel.feed_id == feed_id)
+        if category_id is not None:
+            stmt = stmt.where(
+                EntryModel.feed_id.in_(
+                    select(feed_categories.c.feed_id).where(
+                        feed_categories.c.category_id == category_id
+                    )
+                )
+            )
+        if since is not None:
+            stmt = stmt.where(EntryModel.published_at >= since)
+        if until is not None:
+            stmt = stmt.where(EntryModel.published_at < until)
+
+        stmt = stmt.order_by(desc(EntryModel.published_at), desc(EntryModel.id))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        for row in self.session.execute(stmt.execution_options(yield_per=batch_size)):
+            values = row._asdict()
+            values["content"] = decode_body(values.pop("codec"), values.pop("data"))
+            yield self.ExportRow(**values)
+
+    EntryText = namedtuple("EntryText", ("id", "title", "summary", "content", "text_analysis"))
+
+    def get_texts(self, entry_ids: list[int]) -> list[EntryText]:
+        """Load the texts of entries for batch processing.
+
+        Selects plain columns with the bodies joined in (no ORM instances),
+        one query per chunk of IDs.
+
+        Args:
+            entry_ids: Entry IDs (unknown IDs are skipped)
+
+        Returns:
+            EntryTexts with id, title, summary, content and text_analysis
+        """
+        texts = []
+        for chunk in self.id_chunks(entry_ids):
+            rows = self.session.execute(
+                select(
+                    EntryModel.id,
+                    EntryModel.title,
+                    EntryModel.summary,
+                    EntryModel.text_analysis,
+                    EntryBodyModel.codec,
+                    EntryBodyModel.data,
+                )
+                .outerjoin(EntryBodyModel, EntryBodyModel.entry_id == EntryModel.id)
+                .where(EntryModel.id.in_(chunk))
+            )
+            texts.extend(
+                self.EntryText(
+                    id=row.id,
+                    title=row.title,
+                    summary=row.summary,
+                    content=decode_body(row.codec, row.data),
+                    text_analysis=row.text_analysis,
+                )
+                for row in rows
+            )
+        return texts
+
     def get_stats(self, feed_id: Optional[int] = None) -> dict:
         """Get entry statistics.
 
@@ -357,12 +704,47 @@ class EntryRepository(
         """
         cutoff = datetime.utcnow() - timedelta(days=days)
 
-        q = self.session.query(EntryModel).filter(EntryModel.fetched_at < cutoff)
-
+        criteria = [EntryModel.fetched_at < cutoff]
         if feed_id is not None:
-            q = q.filter(EntryModel.feed_id == feed_id)
+            criteria.append(EntryModel.feed_id == feed_id)
+
+        self.stats_repo.record_delete(*criteria)
+        count = self.session.query(EntryModel).filter(*criteria).delete()
+        self.session.flush()
+        return count
+
+    def delete_chunk(self, *criteria, chunk_size: int = 500) -> int:
+        """Delete the lowest-ID chunk of entries matching the criteria.
+
+        The chunk is deleted as one ID range, so repeated calls in short
+        transactions work through a large delete without holding the write
+        lock for its whole duration.
+
+        Args:
+            *criteria: SQLAlchemy filter expressions on EntryModel
+            chunk_size: Maximum number of entries to delete
+
+        Returns:
+            Number of entries deleted (0 when nothing matches)
+        """
+        ids = [
+            row[0]
+            for row in self.session.query(EntryModel.id)
+            .filter(*criteria)
+            .order_by(EntryModel.id)
+            .limit(chunk_size)
+            .all()
+        ]
+        if not ids:
+            return 0
 
-        count = q.delete()
+        chunk_criteria = [*criteria, EntryModel.id.between(ids[0], ids[-1])]
+        self.stats_repo.record_delete(*chunk_criteria)
+        count = (
+            self.session.query(EntryModel)
+            .filter(*chunk_criteria)
+            .delete(synchronize_session=False)
+        )
         self.session.flush()
         return count
 
@@ -2,11 +2,12 @@
 Feed repository for database operations.
 """
 
+import json
 from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import asc, desc
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only, selectinload
 
 from spider_aggregation.models import FeedModel, CategoryModel
 from spider_aggregation.models.feed import FeedCreate, FeedUpdate
@@ -63,13 +64,32 @@ class FeedRepository(
             order_desc: Sort in descending order
 
         Returns:
-            List of FeedModel instances
+            List of FeedModel instances (with categories loaded)
         """
         filters = {}
         if enabled_only:
             filters["enabled"] = True
         return super().list(
-            limit=limit, offset=offset, order_by=order_by, order_desc=order_desc, **filters
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            order_desc=order_desc,
+            options=[selectinload(FeedModel.categories)],
+            **filters,
+        )
+
+    def list_enabled_brief(self) -> list[FeedModel]:
+        """List all enabled feeds with only id, name and url loaded.
+
+        Returns:
+            List of FeedModel instances, newest first
+        """
+        return (
+            self.session.query(FeedModel)
+            .options(load_only(FeedModel.id, FeedModel.name, FeedModel.url))
+            .filter(FeedModel.enabled.is_(True))
+            .order_by(desc(FeedModel.created_at))
+            .all()
         )
 
     def count(self, enabled_only: bool = False) -> int:
@@ -95,6 +115,7 @@ class FeedRepository(
         reset_errors: bool = False,
         etag: Optional[str] = None,
         last_modified: Optional[str] = None,
+        timings: Optional[dict] = None,
     ) -> FeedModel:
         """Update fetch information for a feed.
 
@@ -106,6 +127,7 @@ class FeedRepository(
             reset_errors: Reset error count to 0
             etag: ETag from HTTP response
             last_modified: Last-Modified from HTTP response
+            timings: Per-stage timing breakdown of the fetch
 
         Returns:
             Updated FeedModel instance
@@ -128,19 +150,22 @@ class FeedRepository(
         if last_modified:
             feed.last_modified = last_modified
 
+        if timings is not None:
+            feed.last_fetch_timings = json.dumps(timings)
+
         feed.updated_at = datetime.utcnow()
         self.session.flush()
         self.session.refresh(feed)
         return feed
 
-    def get_feeds_to_fetch(self, max_feeds: int = 50) -> list[FeedModel]:
+    def get_feeds_to_fetch(self, max_feeds: Optional[int] = 50) -> list[FeedModel]:
         """Get feeds that should be fetched.
 
         Returns enabled feeds sorted by last fetched time.
         Skips feeds that have exceeded their error threshold.
 
         Args:
-            max_feeds: Maximum number of feeds to return
+            max_feeds: Maximum number of feeds to return (None for all)
 
         Returns:
             List of FeedModel instances
@@ -0,0 +1,153 @@
+"""
+Fetch job repository for background fetch-all sweeps.
+"""
+
+import json
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import desc
+from sqlalchemy.orm import Session
+
+from spider_aggregation.models import FETCH_JOB_ACTIVE_STATUSES, FetchJobModel
+
+# Feed failures kept on a job row
+MAX_RECORDED_FAILURES = 50
+
+
+class FetchJobRepository:
+    """Repository for fetch job rows."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize repository with a database session.
+
+        Args:
+            session: SQLAlchemy Session instance
+        """
+        self.session = session
+
+    def create(self) -> FetchJobModel:
+        """Create a pending job.
+
+        Returns:
+            The flushed FetchJobModel (with its ID)
+        """
+        job = FetchJobModel(status="pending")
+        self.session.add(job)
+        self.session.flush()
+        return job
+
+    def get_by_id(self, job_id: int) -> Optional[FetchJobModel]:
+        """Get a job by ID.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            FetchJobModel or None
+        """
+        return self.session.get(FetchJobModel, job_id)
+
+    def get_active(self) -> Optional[FetchJobModel]:
+        """Get the most recent pending or running job.
+
+        Returns:
+            FetchJobModel or None if no sweep is in progress
+        """
+        return (
+            self.session.query(FetchJobModel)
+            .filter(FetchJobModel.status.in_(FETCH_JOB_ACTIVE_STATUSES))
+            .order_by(desc(FetchJobModel.id))
+            .first()
+        )
+
+    def list_recent(self, limit: int = 20) -> list[FetchJobModel]:
+        """List the most recent jobs, newest first.
+
+        Args:
+            limit: Maximum number of jobs
+
+        Returns:
+            List of FetchJobModel
+        """
+        return (
+            self.session.query(FetchJobModel).order_by(desc(FetchJobModel.id)).limit(limit).all()
+        )
+
+    def start(self, job: FetchJobModel, feeds_total: int) -> FetchJobModel:
+        """Mark a job as running.
+
+        Args:
+            job: FetchJobModel instance
+            feeds_total: Number of feeds the sweep will ingest
+
+        Returns:
+            Updated FetchJobModel
+        """
+        now = datetime.utcnow()
+        job.status = "running"
+        job.feeds_total = feeds_total
+        job.started_at = now
+        job.updated_at = now
+        return job
+
+    def record_progress(
+        self,
+        job: FetchJobModel,
+        feeds_done: int,
+        entries_created: int,
+        failures: list[dict],
+    ) -> FetchJobModel:
+        """Add the outcome of a batch of feeds to a job.
+
+        Args:
+            job: FetchJobModel instance
+            feeds_done: Feeds processed in the batch
+            entries_created: Entries created in the batch
+            failures: {"feed_id", "error"} of the batch's failed feeds
+
+        Returns:
+            Updated FetchJobModel
+        """
+        job.feeds_done += feeds_done
+        job.entries_created += entries_created
+        if failures:
+            job.feeds_failed += len(failures)
+            recorded = json.loads(job.failures) if job.failures else []
+            job.failures = json.dumps((recorded + failures)[-MAX_RECORDED_FAILURES:])
+        job.updated_at = datetime.utcnow()
+        return job
+
+    def finish(
+        self, job: FetchJobModel, status: str, error_message: Optional[str] = None
+    ) -> FetchJobModel:
+        """Mark a job as finished.
+
+        Args:
+            job: FetchJobModel instance
+            status: Final status ("completed", "failed" or "cancelled")
+            error_message: Error that ended the job
+
+        Returns:
+            Updated FetchJobModel
+        """
+        now = datetime.utcnow()
+        job.status = status
+        job.error_message = error_message
+        job.finished_at = now
+        job.updated_at = now
+        return job
+
+    def request_cancel(self, job: FetchJobModel) -> bool:
+        """Ask a pending or running job to stop after its current batch.
+
+        Args:
+            job: FetchJobModel instance
+
+        Returns:
+            True if the job was still active
+        """
+        if not job.is_active:
+            return False
+        job.cancel_requested = True
+        return True
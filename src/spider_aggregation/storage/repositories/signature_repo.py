@@ -0,0 +1,155 @@
+"""
+Entry signature repository for near-duplicate index operations.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+
+from spider_aggregation.models import EntryLSHBandModel, EntrySignatureModel
+from spider_aggregation.utils.hash_utils import (
+    decode_minhash_signature,
+    encode_minhash_signature,
+)
+
+
+class EntrySignatureRepository:
+    """Repository for the MinHash signature and LSH band side tables."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize repository with a database session.
+
+        Args:
+            session: SQLAlchemy Session instance
+        """
+        self.session = session
+
+    def get(self, entry_id: int) -> Optional[list[int]]:
+        """Get the stored signature of an entry.
+
+        Args:
+            entry_id: Entry ID
+
+        Returns:
+            MinHash signature or None if the entry is not indexed
+        """
+        row = self.session.get(EntrySignatureModel, entry_id)
+        return decode_minhash_signature(row.signature) if row else None
+
+    def save(
+        self,
+        entry_id: int,
+        feed_id: int,
+        signature: list[int],
+        bands: list[str],
+    ) -> None:
+        """Store (or replace) the signature and band keys of an entry.
+
+        Args:
+            entry_id: Entry ID
+            feed_id: Feed ID of the entry
+            signature: MinHash signature
+            bands: LSH band keys computed from the signature
+        """
+        self.delete_by_entry_ids([entry_id])
+
+        self.session.add(
+            EntrySignatureModel(
+                entry_id=entry_id,
+                feed_id=feed_id,
+                signature=encode_minhash_signature(signature),
+            )
+        )
+        self.session.add_all(
+            EntryLSHBandModel(entry_id=entry_id, feed_id=feed_id, band=band, bucket=bucket)
+            for band, bucket in enumerate(bands)
+        )
+        self.session.flush()
+
+    def find_candidates(
+        self,
+        bands: list[str],
+        feed_ids: Optional[list[int]] = None,
+        exclude_entry_id: Optional[int] = None,
+        limit: int = 50,
+        since: Optional[datetime] = None,
+    ) -> list[tuple[int, int, list[int]]]:
+        """Find entries sharing at least one LSH band key.
+
+        Candidates sharing the most bands (the likeliest near duplicates)
+        come first, newer entries first among equals, so the limit drops
+        the weakest matches of crowded buckets rather than the oldest ones.
+
+        Args:
+            bands: LSH band keys to probe
+            feed_ids: Optional list of feed IDs to restrict search
+            exclude_entry_id: Optional entry ID to leave out (e.g. the entry itself)
+            limit: Maximum number of candidates to return
+            since: Optional lower bound on the signature creation time
+
+        Returns:
+            List of (entry_id, feed_id, signature) tuples, best match first
+        """
+        if not bands:
+            return []
+
+        band_filter = or_(
+            *(
+                and_(EntryLSHBandModel.band == band, EntryLSHBandModel.bucket == bucket)
+                for band, bucket in enumerate(bands)
+            )
+        )
+
+        candidates = self.session.query(
+            EntryLSHBandModel.entry_id.label("entry_id"),
+            func.count().label("shared_bands"),
+        ).filter(band_filter)
+        if feed_ids:
+            candidates = candidates.filter(EntryLSHBandModel.feed_id.in_(feed_ids))
+        if exclude_entry_id is not None:
+            candidates = candidates.filter(EntryLSHBandModel.entry_id != exclude_entry_id)
+        candidates = candidates.group_by(EntryLSHBandModel.entry_id).subquery()
+
+        query = self.session.query(
+            EntrySignatureModel.entry_id,
+            EntrySignatureModel.feed_id,
+            EntrySignatureModel.signature,
+        ).join(candidates, candidates.c.entry_id == EntrySignatureModel.entry_id)
+        if since is not None:
+            query = query.filter(EntrySignatureModel.created_at >= since)
+
+        rows = (
+            query.order_by(candidates.c.shared_bands.desc(), EntrySignatureModel.entry_id.desc())
+            .limit(limit)
+            .all()
+        )
+
+        return [
+            (entry_id, feed_id, decode_minhash_signature(signature))
+            for entry_id, feed_id, signature in rows
+        ]
+
+    def delete_by_entry_ids(self, entry_ids: list[int]) -> int:
+        """Remove index rows for the given entries.
+
+        Args:
+            entry_ids: List of entry IDs
+
+        Returns:
+            Number of signatures deleted
+        """
+        if not entry_ids:
+            return 0
+
+        self.session.query(EntryLSHBandModel).filter(
+            EntryLSHBandModel.entry_id.in_(entry_ids)
+        ).delete(synchronize_session=False)
+        count = (
+            self.session.query(EntrySignatureModel)
+            .filter(EntrySignatureModel.entry_id.in_(entry_ids))
+            .delete(synchronize_session=False)
+        )
+        self.session.flush()
+        return count
@@ -0,0 +1,403 @@
+"""
+Entry statistics repository for the rollup table.
+
+The rollup is kept in step with the entries table by mapper events on
+EntryModel (ORM inserts, updates and deletes) and by EntryRepository for
+bulk deletes, which bypass the ORM. ``reconcile()`` rebuilds it from scratch
+to correct any drift (e.g. rows written with raw SQL). Removing entries
+from a bucket recomputes its ``latest_published_at`` from the entries left.
+"""
+
+from datetime import date, datetime
+from typing import Any, Optional, Union
+
+from sqlalchemy import Connection, case, delete, event, func, insert, inspect, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from spider_aggregation.models import EntryModel, EntryStatModel, feed_categories
+
+_UPSERT_INSERTS = {
+    "sqlite": sqlite_insert,
+    "postgresql": postgresql_insert,
+}
+
+_stats_table = EntryStatModel.__table__
+
+Executor = Union[Session, Connection]
+
+
+def _to_date(value: Any) -> date:
+    """Normalize a SQL ``date()`` result to a date (SQLite returns a string)."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return value
+
+
+def _bucket_day(fetched_at: Optional[datetime]) -> date:
+    """Get the rollup day of an entry fetch time."""
+    return (fetched_at or datetime.utcnow()).date()
+
+
+def _latest(new_value: Any) -> Any:
+    """Build the SQL expression keeping the later of two published_at values."""
+    current = _stats_table.c.latest_published_at
+    return case(
+        (current.is_(None), new_value),
+        (new_value > current, new_value),
+        else_=current,
+    )
+
+
+def _bucket_filter(feed_id: int, day: date, language: str) -> tuple:
+    """Build the filter selecting one rollup bucket."""
+    return (
+        _stats_table.c.feed_id == feed_id,
+        _stats_table.c.day == day,
+        _stats_table.c.language == language,
+    )
+
+
+def _adjust_bucket(
+    executor: Executor,
+    feed_id: int,
+    day: date,
+    language: str,
+    delta: int,
+    published_at: Optional[datetime] = None,
+) -> int:
+    """Adjust the count of an existing bucket.
+
+    Args:
+        executor: Session or Connection to execute on
+        feed_id: Feed ID
+        day: Fetch day
+        language: Entry language ("" if unknown)
+        delta: Count change (negative for deletions)
+        published_at: Latest published_at of added entries
+
+    Returns:
+        Number of buckets updated (0 or 1)
+    """
+    values: dict[str, Any] = {"entry_count": _stats_table.c.entry_count + delta}
+    if published_at is not None:
+        values["latest_published_at"] = _latest(published_at)
+
+    result = executor.execute(
+        update(_stats_table).where(*_bucket_filter(feed_id, day, language)).values(**values)
+    )
+    return result.rowcount
+
+
+def _refresh_latest(
+    executor: Executor, feed_id: int, day: date, language: str, *exclude: Any
+) -> None:
+    """Recompute the latest published_at of a bucket from its entries.
+
+    Args:
+        executor: Session or Connection to execute on
+        feed_id: Feed ID
+        day: Fetch day
+        language: Entry language ("" if unknown)
+        *exclude: Filter expressions on EntryModel keeping entries that are
+            about to be deleted out of the result
+    """
+    latest = (
+        select(func.max(EntryModel.published_at))
+        .where(
+            EntryModel.feed_id == feed_id,
+            func.date(EntryModel.fetched_at) == day,
+            func.coalesce(EntryModel.language, "") == language,
+            *exclude,
+        )
+        .scalar_subquery()
+    )
+    executor.execute(
+        update(_stats_table)
+        .where(*_bucket_filter(feed_id, day, language))
+        .values(latest_published_at=latest)
+    )
+
+
+def _add_to_bucket(
+    executor: Executor,
+    feed_id: int,
+    day: date,
+    language: str,
+    count: int,
+    published_at: Optional[datetime] = None,
+) -> None:
+    """Add entries to a bucket, creating it if needed.
+
+    Args:
+        executor: Session or Connection to execute on
+        feed_id: Feed ID
+        day: Fetch day
+        language: Entry language ("" if unknown)
+        count: Number of entries to add
+        published_at: Latest published_at of the added entries
+    """
+    values = {
+        "feed_id": feed_id,
+        "day": day,
+        "language": language,
+        "entry_count": count,
+        "latest_published_at": published_at,
+    }
+
+    bind = executor.get_bind() if isinstance(executor, Session) else executor
+    dialect_name = bind.dialect.name
+    if dialect_name in _UPSERT_INSERTS:
+        stmt = _UPSERT_INSERTS[dialect_name](_stats_table).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["feed_id", "day", "language"],
+            set_={
+                "entry_count": _stats_table.c.entry_count + stmt.excluded.entry_count,
+                "latest_published_at": _latest(stmt.excluded.latest_published_at),
+            },
+        )
+    elif dialect_name == "mysql":
+        stmt = mysql_insert(_stats_table).values(**values)
+        stmt = stmt.on_duplicate_key_update(
+            entry_count=_stats_table.c.entry_count + stmt.inserted.entry_count,
+            latest_published_at=_latest(stmt.inserted.latest_published_at),
+        )
+    else:
+        if _adjust_bucket(executor, feed_id, day, language, count, published_at):
+            return
+        stmt = insert(_stats_table).values(**values)
+
+    executor.execute(stmt)
+
+
+def _prune_buckets(executor: Executor) -> None:
+    """Drop buckets that no longer hold any entries."""
+    executor.execute(delete(_stats_table).where(_stats_table.c.entry_count <= 0))
+
+
+@event.listens_for(EntryModel, "after_insert")
+def _count_inserted_entry(mapper, connection: Connection, target: EntryModel) -> None:
+    """Count an entry inserted through the ORM."""
+    _add_to_bucket(
+        connection,
+        target.feed_id,
+        _bucket_day(target.fetched_at),
+        target.language or "",
+        1,
+        target.published_at,
+    )
+
+
+@event.listens_for(EntryModel, "after_delete")
+def _uncount_deleted_entry(mapper, connection: Connection, target: EntryModel) -> None:
+    """Uncount an entry deleted through the ORM."""
+    bucket = (target.feed_id, _bucket_day(target.fetched_at), target.language or "")
+    _adjust_bucket(connection, *bucket, -1)
+    if target.published_at is not None:
+        _refresh_latest(connection, *bucket)
+    _prune_buckets(connection)
+
+
+@event.listens_for(EntryModel, "after_update")
+def _move_updated_entry(mapper, connection: Connection, target: EntryModel) -> None:
+    """Move an entry whose feed, fetch day or language changed to its new bucket."""
+    state = inspect(target)
+    old_values = {}
+    for key in ("feed_id", "fetched_at", "language"):
+        history = state.attrs[key].history
+        if history.has_changes():
+            old_values[key] = history.deleted[0] if history.deleted else None
+    if not old_values:
+        return
+
+    old_bucket = (
+        old_values.get("feed_id", target.feed_id),
+        _bucket_day(old_values.get("fetched_at", target.fetched_at)),
+        old_values.get("language", target.language) or "",
+    )
+    new_bucket = (target.feed_id, _bucket_day(target.fetched_at), target.language or "")
+    if old_bucket == new_bucket:
+        return
+
+    _adjust_bucket(connection, *old_bucket, -1)
+    if target.published_at is not None:
+        _refresh_latest(connection, *old_bucket)
+    _add_to_bucket(connection, *new_bucket, 1, target.published_at)
+    _prune_buckets(connection)
+
+
+class EntryStatsRepository:
+    """Repository for the per feed/day/language entry statistics rollup."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize repository with a database session.
+
+        Args:
+            session: SQLAlchemy Session instance
+        """
+        self.session = session
+
+    @staticmethod
+    def _bucket_columns() -> tuple:
+        """Entry columns identifying a rollup bucket."""
+        return (
+            EntryModel.feed_id,
+            func.date(EntryModel.fetched_at),
+            func.coalesce(EntryModel.language, ""),
+        )
+
+    def record_delete(self, *criteria: Any) -> int:
+        """Uncount entries about to be removed by a bulk (non-ORM) delete.
+
+        Must be called before the delete, with the same filter criteria.
+
+        Args:
+            *criteria: SQLAlchemy filter expressions on EntryModel
+
+        Returns:
+            Number of entries uncounted
+        """
+        rows = (
+            self.session.query(
+                *self._bucket_columns(),
+                func.count(EntryModel.id),
+                func.max(EntryModel.published_at),
+            )
+            .filter(*criteria)
+            .group_by(*self._bucket_columns())
+            .all()
+        )
+
+        remaining = EntryModel.id.not_in(select(EntryModel.id).where(*criteria))
+        total = 0
+        for feed_id, day, language, count, latest in rows:
+            day = _to_date(day)
+            _adjust_bucket(self.session, feed_id, day, language, -count)
+            if latest is not None:
+                _refresh_latest(self.session, feed_id, day, language, remaining)
+            total += count
+
+        if total:
+            _prune_buckets(self.session)
+        return total
+
+    def delete_by_feed(self, feed_id: int) -> int:
+        """Remove all buckets of a feed.
+
+        Args:
+            feed_id: Feed ID
+
+        Returns:
+            Number of buckets deleted
+        """
+        return (
+            self.session.query(EntryStatModel)
+            .filter(EntryStatModel.feed_id == feed_id)
+            .delete(synchronize_session=False)
+        )
+
+    def get_summary(
+        self,
+        feed_ids: Optional[list[int]] = None,
+        since: Optional[date] = None,
+    ) -> dict:
+        """Get entry statistics from the rollup.
+
+        Args:
+            feed_ids: Optional list of feed IDs to restrict to
+            since: Optional first fetch day to include
+
+        Returns:
+            Dictionary with statistics:
+                - total: Total number of entries
+                - language_counts: Dict of language -> count
+                - most_recent: Most recent entry's published_at
+        """
+        query = self.session.query(
+            EntryStatModel.language,
+            func.sum(EntryStatModel.entry_count),
+            func.max(EntryStatModel.latest_published_at),
+        )
+        if feed_ids is not None:
+            query = query.filter(EntryStatModel.feed_id.in_(feed_ids))
+        if since is not None:
+            query = query.filter(EntryStatModel.day >= since)
+
+        return self._summarize(query.group_by(EntryStatModel.language).all())
+
+    def get_summary_by_category(self, category_id: int) -> dict:
+        """Get entry statistics for a category from the rollup.
+
+        Args:
+            category_id: Category ID
+
+        Returns:
+            Dictionary with the same keys as ``get_summary``
+        """
+        feed_ids = select(feed_categories.c.feed_id).where(
+            feed_categories.c.category_id == category_id
+        )
+        rows = (
+            self.session.query(
+                EntryStatModel.language,
+                func.sum(EntryStatModel.entry_count),
+                func.max(EntryStatModel.latest_published_at),
+            )
+            .filter(EntryStatModel.feed_id.in_(feed_ids))
+            .group_by(EntryStatModel.language)
+            .all()
+        )
+        return self._summarize(rows)
+
+    @staticmethod
+    def _summarize(rows: list) -> dict:
+        """Fold per-language rollup rows into a statistics dictionary."""
+        total = 0
+        language_counts = {}
+        most_recent = None
+        for language, count, latest in rows:
+            count = int(count or 0)
+            total += count
+            if language:
+                language_counts[language] = count
+            if latest is not None and (most_recent is None or latest > most_recent):
+                most_recent = latest
+
+        return {
+            "total": total,
+            "language_counts": language_counts,
+            "most_recent": most_recent,
+        }
+
+    def reconcile(self) -> dict:
+        """Rebuild the rollup from the entries table.
+
+        Returns:
+            Dictionary with the number of buckets written and the entry count
+            drift that was corrected (rebuilt total minus previous total)
+        """
+        previous_total = (
+            self.session.query(func.coalesce(func.sum(EntryStatModel.entry_count), 0)).scalar()
+        )
+
+        self.session.query(EntryStatModel).delete(synchronize_session=False)
+        source = select(
+            *self._bucket_columns(),
+            func.count(EntryModel.id),
+            func.max(EntryModel.published_at),
+        ).group_by(*self._bucket_columns())
+        self.session.execute(
+            insert(EntryStatModel).from_select(
+                ["feed_id", "day", "language", "entry_count", "latest_published_at"], source
+            )
+        )
+        self.session.flush()
+
+        buckets, total = self.session.query(
+            func.count(EntryStatModel.id), func.coalesce(func.sum(EntryStatModel.entry_count), 0)
+        ).one()
+        return {"buckets": buckets, "drift": int(total) - int(previous_total)}
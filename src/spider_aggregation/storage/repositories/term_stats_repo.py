@@ -0,0 +1,160 @@
+"""
+Corpus statistics repository for BM25 keyword scoring.
+
+Document totals and per-term document frequencies are added with one upsert
+per statement chunk as entries are ingested, and read back for all the terms
+of a batch of documents at once (``snapshot()``). Counts are not decremented
+when entries are deleted: the statistics describe everything ingested, which
+is what IDF needs, and do not have to match the current entries table.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from sqlalchemy import Table, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from spider_aggregation.models import CorpusStatModel, TermStatModel
+from spider_aggregation.models.term_stat import MAX_TERM_LENGTH
+from spider_aggregation.storage.repositories.base import (
+    RESERVED_BIND_PARAMETERS,
+    bind_parameter_limit,
+    chunked,
+)
+
+_UPSERT_INSERTS = {
+    "sqlite": sqlite_insert,
+    "postgresql": postgresql_insert,
+}
+
+_corpus_table = CorpusStatModel.__table__
+_terms_table = TermStatModel.__table__
+
+
+@dataclass
+class CorpusSnapshot:
+    """Corpus statistics of one language, restricted to the requested terms."""
+
+    language: str
+    documents: int = 0
+    tokens: int = 0
+    document_frequencies: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def average_length(self) -> float:
+        """Average number of terms per document."""
+        return self.tokens / self.documents if self.documents else 0.0
+
+
+class CorpusStatsRepository:
+    """Repository for the per-language document and term frequency counts."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize repository with a database session.
+
+        Args:
+            session: SQLAlchemy Session instance
+        """
+        self.session = session
+
+    def add_documents(self, language: str, documents: list[list[str]]) -> int:
+        """Count documents in the corpus statistics.
+
+        Args:
+            language: Language the documents' terms were extracted for
+            documents: Terms of each document (with repetitions)
+
+        Returns:
+            Number of distinct terms whose document frequency changed
+        """
+        if not documents:
+            return 0
+
+        frequencies: Counter[str] = Counter()
+        for terms in documents:
+            frequencies.update({term for term in terms if len(term) <= MAX_TERM_LENGTH})
+
+        self._upsert(
+            _corpus_table,
+            ["language"],
+            [
+                {
+                    "language": language,
+                    "document_count": len(documents),
+                    "token_count": sum(len(terms) for terms in documents),
+                }
+            ],
+            ("document_count", "token_count"),
+        )
+
+        # Sorted so concurrent writers lock rows in the same order
+        rows = [
+            {"language": language, "term": term, "document_count": count}
+            for term, count in sorted(frequencies.items())
+        ]
+        size = (bind_parameter_limit(self.session) - RESERVED_BIND_PARAMETERS) // 3
+        for chunk in chunked(rows, max(size, 1)):
+            self._upsert(_terms_table, ["language", "term"], chunk, ("document_count",))
+        return len(rows)
+
+    def snapshot(self, language: str, terms: Iterable[str]) -> CorpusSnapshot:
+        """Read the statistics needed to score the given terms.
+
+        Args:
+            language: Language of the terms
+            terms: Terms to look up (duplicates are ignored)
+
+        Returns:
+            CorpusSnapshot; terms never counted are absent from its frequencies
+        """
+        totals = self.session.execute(
+            select(_corpus_table.c.document_count, _corpus_table.c.token_count).where(
+                _corpus_table.c.language == language
+            )
+        ).first()
+        snapshot = CorpusSnapshot(language=language)
+        if totals is None:
+            return snapshot
+        snapshot.documents, snapshot.tokens = totals
+
+        size = bind_parameter_limit(self.session) - RESERVED_BIND_PARAMETERS
+        for chunk in chunked(dict.fromkeys(terms), max(size, 1)):
+            rows = self.session.execute(
+                select(_terms_table.c.term, _terms_table.c.document_count).where(
+                    _terms_table.c.language == language, _terms_table.c.term.in_(chunk)
+                )
+            )
+            snapshot.document_frequencies.update((term, count) for term, count in rows)
+        return snapshot
+
+    def _upsert(
+        self, table: Table, keys: list[str], rows: list[dict], counters: tuple[str, ...]
+    ) -> None:
+        """Insert rows, adding their counter columns to existing rows with the same keys."""
+        dialect_name = self.session.get_bind().dialect.name
+        if dialect_name in _UPSERT_INSERTS:
+            stmt = _UPSERT_INSERTS[dialect_name](table).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=keys,
+                set_={name: table.c[name] + stmt.excluded[name] for name in counters},
+            )
+            self.session.execute(stmt)
+        elif dialect_name == "mysql":
+            stmt = mysql_insert(table).values(rows)
+            stmt = stmt.on_duplicate_key_update(
+                {name: table.c[name] + stmt.inserted[name] for name in counters}
+            )
+            self.session.execute(stmt)
+        else:
+            for row in rows:
+                result = self.session.execute(
+                    update(table)
+                    .where(*(table.c[key] == row[key] for key in keys))
+                    .values({name: table.c[name] + row[name] for name in counters})
+                )
+                if not result.rowcount:
+                    self.session.execute(insert(table).values(row))
@@ -0,0 +1,274 @@
+"""
+Span-based tracing and opt-in profiling of the ingestion pipeline.
+
+A :class:`Trace` records the wall time one feed fetch spends in each stage
+(HTTP download, feedparser, entry parsing, dedup, filtering, storage).
+Stages that run once per entry accumulate, so the breakdown shows where the
+whole fetch went. The active trace lives in a context variable, which lets
+deep code such as ``FeedFetcher`` open spans without a trace argument being
+threaded through every call; without an active trace :func:`span` is a no-op.
+
+Profiling with cProfile is much more expensive and therefore only enabled
+explicitly (per request or with ``scripts/profile_feed.py``).
+"""
+
+import cProfile
+import io
+import marshal
+import pstats
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+from spider_aggregation.metrics import PIPELINE_STAGE_DURATION
+
+# Stage names used by the fetch pipeline, in execution order
+STAGE_HTTP = "http"
+STAGE_FEEDPARSER = "feedparser"
+STAGE_PARSE = "parse"
+STAGE_DEDUP = "dedup"
+STAGE_FILTER = "filter"
+STAGE_STORE = "store"
+STAGE_INDEX = "index"
+
+_current_trace: ContextVar[Optional["Trace"]] = ContextVar("current_trace", default=None)
+
+
+@dataclass
+class SpanStats:
+    """Accumulated time of one stage."""
+
+    seconds: float = 0.0
+    count: int = 0
+
+
+class Trace:
+    """Per-stage timing breakdown of one pipeline run."""
+
+    def __init__(self, name: str = "", clock: Callable[[], float] = time.perf_counter) -> None:
+        """Initialize the trace.
+
+        Args:
+            name: Label of the traced run (e.g. the feed URL)
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.name = name
+        self._clock = clock
+        self.started = clock()
+        self.finished: Optional[float] = None
+        self.stages: dict[str, SpanStats] = {}
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """Time a block and add it to ``stage``.
+
+        Args:
+            stage: Stage name
+        """
+        started = self._clock()
+        try:
+            yield
+        finally:
+            stats = self.stages.setdefault(stage, SpanStats())
+            stats.seconds += self._clock() - started
+            stats.count += 1
+
+    def finish(self) -> None:
+        """Stop the trace and export stage totals to the metrics registry."""
+        if self.finished is not None:
+            return
+        self.finished = self._clock()
+        for stage, stats in self.stages.items():
+            PIPELINE_STAGE_DURATION.labels(stage=stage).observe(stats.seconds)
+
+    @property
+    def total_seconds(self) -> float:
+        """Wall time from start to finish (or now, while running)."""
+        end = self.finished if self.finished is not None else self._clock()
+        return end - self.started
+
+    def to_dict(self) -> dict:
+        """Serialize the breakdown.
+
+        ``untracked_seconds`` is the part of the total not covered by any
+        stage (session setup, bookkeeping, retries' back-off).
+
+        Returns:
+            Dictionary with total, per-stage and untracked seconds
+        """
+        total = self.total_seconds
+        tracked = sum(stats.seconds for stats in self.stages.values())
+        return {
+            "total_seconds": round(total, 6),
+            "stages": {
+                stage: {"seconds": round(stats.seconds, 6), "count": stats.count}
+                for stage, stats in self.stages.items()
+            },
+            "untracked_seconds": round(max(total - tracked, 0.0), 6),
+        }
+
+
+@contextmanager
+def start_trace(name: str = "") -> Iterator[Trace]:
+    """Make a new trace the active one for the enclosed block.
+
+    Args:
+        name: Label of the traced run
+
+    Yields:
+        The active Trace (finished when the block exits)
+    """
+    trace = Trace(name)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+        trace.finish()
+
+
+@contextmanager
+def use_trace(trace: Trace) -> Iterator[Trace]:
+    """Make an existing trace the active one for the enclosed block.
+
+    Unlike :func:`start_trace` the trace is not finished on exit, so one
+    trace can follow a feed through pipeline stages in different threads.
+
+    Args:
+        trace: Trace to activate
+
+    Yields:
+        The trace
+    """
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+def current_trace() -> Optional[Trace]:
+    """Get the active trace, if any."""
+    return _current_trace.get()
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """Time a block as ``stage`` of the active trace (no-op without one).
+
+    Args:
+        stage: Stage name
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    with trace.span(stage):
+        yield
+
+
+# ============================================================================
+# Profiling
+# ============================================================================
+
+# Artifact formats: name -> (mimetype, file extension)
+PROFILE_FORMATS = {
+    "text": ("text/plain; charset=utf-8", "txt"),
+    "pstats": ("application/octet-stream", "prof"),
+}
+
+
+class PipelineProfiler:
+    """cProfile wrapper producing downloadable reports.
+
+    Example:
+        >>> profiler = PipelineProfiler()
+        >>> with profiler:
+        ...     run_pipeline()
+        >>> report = profiler.render("text")
+    """
+
+    def __init__(self, sort: str = "cumulative", limit: int = 60) -> None:
+        """Initialize the profiler.
+
+        Args:
+            sort: pstats sort key of the text report
+            limit: Number of functions listed in the text report
+        """
+        self.sort = sort
+        self.limit = limit
+        self._profile = cProfile.Profile()
+
+    def __enter__(self) -> "PipelineProfiler":
+        self._profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._profile.disable()
+
+    def text_report(self, header: str = "") -> str:
+        """Render the human-readable report.
+
+        Args:
+            header: Optional lines prepended to the report
+
+        Returns:
+            pstats listing sorted by ``sort``
+        """
+        buffer = io.StringIO()
+        if header:
+            buffer.write(header.rstrip("\n") + "\n\n")
+        stats = pstats.Stats(self._profile, stream=buffer)
+        stats.strip_dirs().sort_stats(self.sort).print_stats(self.limit)
+        return buffer.getvalue()
+
+    def pstats_dump(self) -> bytes:
+        """Serialize the raw stats (loadable with ``pstats`` or snakeviz).
+
+        Returns:
+            Bytes in the format written by ``pstats.Stats.dump_stats``
+        """
+        return marshal.dumps(pstats.Stats(self._profile).stats)
+
+    def render(self, profile_format: str, header: str = "") -> bytes:
+        """Render the report in one of :data:`PROFILE_FORMATS`.
+
+        Args:
+            profile_format: "text" or "pstats"
+            header: Header of the text report
+
+        Returns:
+            Report bytes
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        if profile_format == "text":
+            return self.text_report(header).encode("utf-8")
+        if profile_format == "pstats":
+            return self.pstats_dump()
+        raise ValueError(f"Unknown profile format: {profile_format}")
+
+
+def format_trace(trace: Trace) -> str:
+    """Format a trace as an aligned text table.
+
+    Args:
+        trace: Finished trace
+
+    Returns:
+        One line per stage plus the total
+    """
+    data = trace.to_dict()
+    total = data["total_seconds"] or 1e-9
+    lines = [f"Pipeline trace: {trace.name}".rstrip(": ")]
+    for stage, stats in data["stages"].items():
+        lines.append(
+            f"  {stage:<12} {stats['seconds']:>10.4f}s {stats['seconds'] / total:>6.1%}"
+            f"  x{stats['count']}"
+        )
+    lines.append(f"  {'untracked':<12} {data['untracked_seconds']:>10.4f}s")
+    lines.append(f"  {'total':<12} {data['total_seconds']:>10.4f}s")
+    return "\n".join(lines)
@@ -2,11 +2,16 @@
 
 from spider_aggregation.utils.hash_utils import (
     compute_content_hash,
+    compute_entry_signature,
     compute_link_hash,
+    compute_lsh_bands,
     compute_md5_hash,
+    compute_minhash_signature,
     compute_sha256_hash,
+    compute_shingles,
     compute_similarity_hash,
     compute_title_hash,
+    estimate_jaccard,
 )
 
 __all__ = [
@@ -16,4 +21,9 @@ __all__ = [
     "compute_title_hash",
     "compute_content_hash",
     "compute_similarity_hash",
+    "compute_shingles",
+    "compute_minhash_signature",
+    "compute_entry_signature",
+    "compute_lsh_bands",
+    "estimate_jaccard",
 ]
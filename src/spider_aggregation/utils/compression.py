@@ -0,0 +1,88 @@
+"""
+Compression of stored entry bodies.
+
+Entry bodies (``entry_bodies.data``) are stored as compressed UTF-8 with the
+name of the codec next to them, so the codec can be changed at any time
+without rewriting existing rows.
+
+Codecs:
+    none: Plain UTF-8
+    zlib: zlib (always available)
+    zstd: Zstandard via ``compression.zstd`` (Python 3.14+)
+"""
+
+import zlib
+
+try:
+    from compression import zstd
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstd = None
+    ZSTD_AVAILABLE = False
+
+BODY_CODECS = ("none", "zlib", "zstd")
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def resolve_codec(codec: str) -> str:
+    """Get the codec used for new bodies when ``codec`` is configured.
+
+    Args:
+        codec: Configured codec
+
+    Returns:
+        The codec, or zlib if it is zstd and zstd is not available
+    """
+    if codec == "zstd" and not ZSTD_AVAILABLE:
+        return "zlib"
+    return codec
+
+
+def compress_text(text: str, codec: str) -> bytes:
+    """Encode and compress text.
+
+    Args:
+        text: Text to compress
+        codec: Codec name (see BODY_CODECS; resolve it first)
+
+    Returns:
+        Compressed bytes
+
+    Raises:
+        ValueError: If the codec is unknown or not available
+    """
+    data = text.encode("utf-8")
+    if codec == "none":
+        return data
+    if codec == "zlib":
+        return zlib.compress(data, ZLIB_LEVEL)
+    if codec == "zstd" and ZSTD_AVAILABLE:
+        return zstd.compress(data, level=ZSTD_LEVEL)
+    raise ValueError(f"Unsupported body codec: {codec}")
+
+
+def decompress_text(codec: str, data: bytes) -> str:
+    """Decompress and decode text stored by compress_text().
+
+    Args:
+        codec: Codec the data was compressed with
+        data: Compressed bytes
+
+    Returns:
+        The text
+
+    Raises:
+        ValueError: If the codec is unknown or not available
+    """
+    if codec == "none":
+        raw = data
+    elif codec == "zlib":
+        raw = zlib.decompress(data)
+    elif codec == "zstd" and ZSTD_AVAILABLE:
+        raw = zstd.decompress(data)
+    else:
+        raise ValueError(f"Unsupported body codec: {codec}")
+    return bytes(raw).decode("utf-8")
@@ -1,12 +1,27 @@
 """
 Hash utility functions for content deduplication.
 
-Provides consistent hashing for links, titles, and content to detect duplicates.
+Provides consistent hashing for links, titles, and content to detect duplicates,
+plus MinHash signatures and LSH band keys for near-duplicate lookup.
 """
 
 import hashlib
+import re
 from typing import Optional
 
+# Mersenne prime used for the MinHash universal hash family
+_MINHASH_PRIME = (1 << 61) - 1
+_MINHASH_MAX = (1 << 32) - 1
+_MINHASH_COEFFICIENTS_CACHE: dict[int, list[tuple[int, int]]] = {}
+
+# Only the head of long articles is shingled for entry signatures
+SIMILARITY_TEXT_LENGTH = 4000
+
+# CJK characters are shingled one character at a time, other scripts by word
+_TOKEN_PATTERN = re.compile(
+    r"[\u4e00-\u9fff\u3040-\u30ff]|[^\W_\u4e00-\u9fff\u3040-\u30ff]+"
+)
+
 
 def compute_md5_hash(content: Optional[str]) -> Optional[str]:
     """Compute MD5 hash of content.
@@ -185,3 +200,177 @@ def compute_similarity_hash(content: Optional[str], length: int = 200) -> Option
         sample = normalized
 
     return compute_sha256_hash(sample)
+
+
+def compute_shingles(content: Optional[str], size: int = 3) -> set[str]:
+    """Split content into overlapping token shingles.
+
+    Latin text is tokenized into words and CJK text into single characters,
+    so both produce meaningful n-gram shingles.
+
+    Args:
+        content: Content to shingle
+        size: Number of tokens per shingle
+
+    Returns:
+        Set of shingle strings (empty if content is empty)
+    """
+    if not content:
+        return set()
+
+    tokens = _TOKEN_PATTERN.findall(str(content).lower())
+    if not tokens:
+        return set()
+
+    if len(tokens) <= size:
+        return {" ".join(tokens)}
+
+    return {" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def _minhash_coefficients(num_perm: int) -> list[tuple[int, int]]:
+    """Derive deterministic (a, b) coefficients for the MinHash hash family.
+
+    Coefficients are derived from a fixed seed so that signatures stored in
+    the database stay comparable across processes and restarts.
+
+    Args:
+        num_perm: Number of hash permutations
+
+    Returns:
+        List of (a, b) tuples
+    """
+    coefficients = _MINHASH_COEFFICIENTS_CACHE.get(num_perm)
+    if coefficients is None:
+        coefficients = []
+        for i in range(num_perm):
+            digest = hashlib.sha256(f"minhash-perm-{i}".encode("utf-8")).digest()
+            a = int.from_bytes(digest[:8], "big") % (_MINHASH_PRIME - 1) + 1
+            b = int.from_bytes(digest[8:16], "big") % _MINHASH_PRIME
+            coefficients.append((a, b))
+        _MINHASH_COEFFICIENTS_CACHE[num_perm] = coefficients
+    return coefficients
+
+
+def compute_minhash_signature(
+    content: Optional[str],
+    num_perm: int = 64,
+    shingle_size: int = 3,
+) -> Optional[list[int]]:
+    """Compute a MinHash signature for near-duplicate detection.
+
+    The fraction of equal positions between two signatures estimates the
+    Jaccard similarity of the underlying shingle sets.
+
+    Args:
+        content: Content to analyze (typically title + content)
+        num_perm: Number of hash permutations (signature length)
+        shingle_size: Number of tokens per shingle
+
+    Returns:
+        List of 32-bit integers, or None if content has no shingles
+    """
+    shingles = compute_shingles(content, size=shingle_size)
+    if not shingles:
+        return None
+
+    hashed = [
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+        for s in shingles
+    ]
+
+    signature = []
+    for a, b in _minhash_coefficients(num_perm):
+        signature.append(min(((a * h + b) % _MINHASH_PRIME) & _MINHASH_MAX for h in hashed))
+    return signature
+
+
+def compute_entry_signature(
+    title: Optional[str],
+    body: Optional[str],
+    num_perm: int = 64,
+) -> Optional[list[int]]:
+    """Compute the MinHash signature of an entry from its title and body.
+
+    Title and body are shingled together so that copies with a rewritten
+    headline or an appended tracking snippet still produce close signatures.
+
+    Args:
+        title: Entry title
+        body: Entry content or summary
+        num_perm: Number of hash permutations (signature length)
+
+    Returns:
+        MinHash signature, or None if the entry has no text
+    """
+    text = f"{title or ''}\n{body or ''}"
+    return compute_minhash_signature(text[:SIMILARITY_TEXT_LENGTH], num_perm=num_perm)
+
+
+def compute_lsh_bands(signature: list[int], bands: int = 16) -> list[str]:
+    """Split a MinHash signature into LSH band keys.
+
+    Two signatures become lookup candidates when any band key is equal.
+
+    Args:
+        signature: MinHash signature
+        bands: Number of bands (must divide the signature length)
+
+    Returns:
+        List of band keys as hexadecimal strings, one per band
+
+    Raises:
+        ValueError: If the signature length is not divisible by bands
+    """
+    if bands <= 0 or len(signature) % bands:
+        raise ValueError(
+            f"Signature length {len(signature)} is not divisible into {bands} bands"
+        )
+
+    rows = len(signature) // bands
+    keys = []
+    for band in range(bands):
+        chunk = signature[band * rows : (band + 1) * rows]
+        raw = b"".join(value.to_bytes(4, "big") for value in chunk)
+        keys.append(hashlib.blake2b(raw, digest_size=8).hexdigest())
+    return keys
+
+
+def estimate_jaccard(signature_a: list[int], signature_b: list[int]) -> float:
+    """Estimate Jaccard similarity from two MinHash signatures.
+
+    Args:
+        signature_a: First signature
+        signature_b: Second signature
+
+    Returns:
+        Estimated similarity between 0.0 and 1.0
+    """
+    if not signature_a or len(signature_a) != len(signature_b):
+        return 0.0
+    matches = sum(1 for a, b in zip(signature_a, signature_b) if a == b)
+    return matches / len(signature_a)
+
+
+def encode_minhash_signature(signature: list[int]) -> str:
+    """Encode a MinHash signature as a compact hexadecimal string.
+
+    Args:
+        signature: MinHash signature
+
+    Returns:
+        Hex string with 8 characters per signature value
+    """
+    return "".join(f"{value:08x}" for value in signature)
+
+
+def decode_minhash_signature(encoded: str) -> list[int]:
+    """Decode a signature produced by encode_minhash_signature.
+
+    Args:
+        encoded: Hex-encoded signature
+
+    Returns:
+        MinHash signature
+    """
+    return [int(encoded[i : i + 8], 16) for i in range(0, len(encoded), 8)]
@@ -2,8 +2,33 @@
 Main entry point for mind-weaver web application.
 """
 
+import socket
+import threading
+import time
+
 from spider_aggregation.web.app import create_app
 from spider_aggregation.config import get_config
+from spider_aggregation.core import warm_up
+
+# How long the warm-up thread waits for the server to accept connections
+WARM_UP_WAIT_SECONDS = 30
+
+
+def _warm_up_when_listening(host: str, port: int) -> None:
+    """Import the lazily loaded libraries once the server accepts connections.
+
+    Runs in a daemon thread so startup is not delayed and the imports do not
+    compete with binding the socket.
+    """
+    connect_host = "127.0.0.1" if host in ("0.0.0.0", "") else host
+    deadline = time.monotonic() + WARM_UP_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((connect_host, port), timeout=1).close()
+            break
+        except OSError:
+            time.sleep(0.2)
+    warm_up()
 
 
 def main():
@@ -24,6 +49,12 @@ def main():
 """)
 
     app = create_app(debug=config.web.debug)
+    threading.Thread(
+        target=_warm_up_when_listening,
+        args=(config.web.host, config.web.port),
+        name="warm-up",
+        daemon=True,
+    ).start()
     app.run(
         host=config.web.host,
         port=config.web.port,
@@ -167,11 +167,10 @@ def create_app(
         db_manager = DatabaseManager(db_path)
 
         with db_manager.session() as session:
+            from spider_aggregation.storage.feed_cache import get_feed_metadata_cache
             from spider_aggregation.storage.repositories.entry_repo import EntryRepository
-            from spider_aggregation.storage.repositories.feed_repo import FeedRepository
 
             entry_repo = EntryRepository(session)
-            feed_repo = FeedRepository(session)
 
             # Get entries
             if search_query:
@@ -180,6 +179,7 @@ def create_app(
                     feed_id=feed_id,
                     limit=page_size,
                     offset=(page - 1) * page_size,
+                    projection="list",
                 )
                 total = len(entries)  # Approximate
             else:
@@ -189,13 +189,12 @@ def create_app(
                     offset=(page - 1) * page_size,
                     order_by="published_at",
                     order_desc=True,
+                    projection="list",
                 )
                 total = entry_repo.count(feed_id=feed_id)
 
-            # Get feeds for filter dropdown
-            feeds = feed_repo.list(limit=1000)
-            # Convert to dicts to avoid DetachedInstanceError
-            feeds_data = [feed_to_dict(f) for f in feeds]
+            # Feeds for the filter dropdown (cached, session-independent)
+            feeds_data = get_feed_metadata_cache().all(session)
 
             # Parse tags for display and expunge entries from session
             for entry in entries:
@@ -349,6 +348,13 @@ def create_app(
     # Scheduler Management - Set scheduler instance for blueprints
     # ========================================================================
 
+    @app.route("/metrics")
+    def metrics():
+        """Expose metrics in the Prometheus text format."""
+        from spider_aggregation.metrics import CONTENT_TYPE, get_metrics_registry
+
+        return Response(get_metrics_registry().render(), content_type=CONTENT_TYPE)
+
     @app.before_request
     def initialize_scheduler():
         """Initialize scheduler before first request if needed."""
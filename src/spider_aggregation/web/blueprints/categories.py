@@ -114,6 +114,25 @@ class CategoryBlueprint(CRUDBlueprint):
         """
         if not data.get("name"):
             return False, "分类名称为必填项"
+        return self._validate_retention_days(data)
+
+    @staticmethod
+    def _validate_retention_days(data: dict) -> tuple[bool, str]:
+        """Validate the optional retention_days field.
+
+        Args:
+            data: Request data
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        retention_days = data.get("retention_days")
+        if retention_days is not None and (
+            not isinstance(retention_days, int)
+            or isinstance(retention_days, bool)
+            or retention_days < 0
+        ):
+            return False, "保留天数必须为非负整数"
         return True, ""
 
     def check_exists(self, repository, data: dict) -> bool:
@@ -164,6 +183,7 @@ class CategoryBlueprint(CRUDBlueprint):
                     color=data.get("color"),
                     icon=data.get("icon"),
                     enabled=data.get("enabled", True),
+                    retention_days=data.get("retention_days"),
                 )
                 return api_response(
                     success=True,
@@ -183,6 +203,10 @@ class CategoryBlueprint(CRUDBlueprint):
         logger = get_logger(__name__)
         data = request.get_json()
 
+        is_valid, error_msg = self._validate_retention_days(data or {})
+        if not is_valid:
+            return api_response(success=False, error=error_msg, status=400)
+
         db_manager = DatabaseManager(self.db_path)
 
         with db_manager.session() as session:
@@ -267,12 +291,11 @@ class CategoryBlueprint(CRUDBlueprint):
             API response with category entry statistics
         """
         from spider_aggregation.storage.database import DatabaseManager
-        from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+        from spider_aggregation.storage.repositories.stats_repo import EntryStatsRepository
 
         db_manager = DatabaseManager(self.db_path)
 
         with db_manager.session() as session:
-            entry_repo = EntryRepository(session)
             category_repo = self._get_repository(session)
 
             # Verify category exists
@@ -280,6 +303,6 @@ class CategoryBlueprint(CRUDBlueprint):
             if not category:
                 return api_response(success=False, error="未找到分类", status=404)
 
-            stats = entry_repo.get_stats_by_category(category_id)
+            stats = EntryStatsRepository(session).get_summary_by_category(category_id)
 
         return api_response(success=True, data=stats)
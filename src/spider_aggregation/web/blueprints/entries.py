@@ -6,11 +6,12 @@ This module contains all entry-related API endpoints.
 
 from flask import request
 from spider_aggregation.web.blueprints.base import CRUDBlueprint
-from spider_aggregation.web.serializers import api_response
+from spider_aggregation.web.serializers import api_response, entry_to_list_dict
 from spider_aggregation.logger import get_logger
 from spider_aggregation.storage.repositories.entry_repo import EntryRepository
 from spider_aggregation.storage.repositories.feed_repo import FeedRepository
 from spider_aggregation.storage.repositories.category_repo import CategoryRepository
+from spider_aggregation.storage.repositories.stats_repo import EntryStatsRepository
 from spider_aggregation.models.entry import EntryCreate, EntryUpdate
 from sqlalchemy import func
 
@@ -53,6 +54,10 @@ class EntryBlueprint(CRUDBlueprint):
         self.blueprint.add_url_rule(
             "/batch/summarize", view_func=self._batch_summarize, methods=["POST"]
         )
+        # Batch job status
+        self.blueprint.add_url_rule(
+            "/batch/jobs/<job_id>", view_func=self._batch_job_status, methods=["GET"]
+        )
         # Get entries by category
         self.blueprint.add_url_rule(
             "/by-category/<int:category_id>", view_func=self._by_category, methods=["GET"]
@@ -180,14 +185,7 @@ class EntryBlueprint(CRUDBlueprint):
 
         with db_manager.session() as session:
             repo = self._get_repository(session)
-            from spider_aggregation.models.entry import EntryUpdate
-
-            count = 0
-            for entry_id in entry_ids:
-                entry = repo.get_by_id(entry_id)
-                if entry:
-                    repo.update(entry, EntryUpdate(enabled=False))
-                    count += 1
+            count = repo.bulk_update_enabled(entry_ids, enabled=False)
 
         return api_response(
             success=True, data={"updated_count": count}, message=f"成功标记 {count} 条条目为已读"
@@ -203,6 +201,8 @@ class EntryBlueprint(CRUDBlueprint):
             q: Search query (optional)
             order_by: Field to order by (default: published_at)
             order_direction: asc or desc (default: desc)
+            collapse: "true" to return one entry per story cluster with its
+                member count in ``cluster_size`` (default: false)
 
         Returns:
             API response with paginated entries
@@ -215,6 +215,7 @@ class EntryBlueprint(CRUDBlueprint):
         search_query = request.args.get("q", "")
         order_by = request.args.get("order_by", "published_at")
         order_direction = request.args.get("order_direction", "desc")
+        collapse = request.args.get("collapse", "false").lower() == "true"
 
         db_manager = DatabaseManager(self.db_path)
 
@@ -228,6 +229,7 @@ class EntryBlueprint(CRUDBlueprint):
                     feed_id=feed_id,
                     limit=page_size,
                     offset=(page - 1) * page_size,
+                    projection="list",
                 )
                 total = len(entries)  # Approximate for search
             else:
@@ -238,16 +240,26 @@ class EntryBlueprint(CRUDBlueprint):
                     offset=(page - 1) * page_size,
                     order_by=order_by,
                     order_desc=(order_direction == "desc"),
+                    collapse_clusters=collapse,
+                    projection="list",
+                )
+                total = repo.count(feed_id=feed_id, collapse_clusters=collapse)
+
+            cluster_sizes = {}
+            if collapse:
+                cluster_sizes = repo.get_cluster_sizes(
+                    [entry.cluster_id for entry in entries if entry.cluster_id is not None]
                 )
-                total = repo.count(feed_id=feed_id)
 
             # Serialize entries with additional fields
             data = []
             for entry in entries:
-                entry_dict = self.serialize(entry)
+                entry_dict = entry_to_list_dict(entry)
                 # Add feed_name for display
                 if entry.feed:
                     entry_dict["feed_name"] = entry.feed.name
+                if collapse:
+                    entry_dict["cluster_size"] = cluster_sizes.get(entry.cluster_id, 1)
                 data.append(entry_dict)
 
         # Return response with total count for pagination
@@ -303,96 +315,76 @@ class EntryBlueprint(CRUDBlueprint):
         )
 
     def _batch_extract_keywords(self):
-        """Batch extract keywords for entries.
+        """Start a background job extracting keywords for entries.
 
         Request body:
             {"entry_ids": [1, 2, 3, ...]}
 
         Returns:
-            API response with number of entries updated
+            API response (202) with the job to poll at /batch/jobs/<job_id>
         """
-        from spider_aggregation.storage.database import DatabaseManager
-        from spider_aggregation.core.services import KeywordService
-
-        data = request.get_json()
-        entry_ids = data.get("entry_ids", [])
-
-        if not entry_ids:
-            return api_response(success=False, error="entry_ids为必填项", status=400)
-
-        db_manager = DatabaseManager(self.db_path)
-        keyword_service = KeywordService()
-
-        with db_manager.session() as session:
-            repo = self._get_repository(session)
-            updated_count = 0
+        return self._start_batch_job("extract_keywords", "已创建关键词提取任务")
 
-            for entry_id in entry_ids:
-                entry = repo.get_by_id(entry_id)
-                if entry:
-                    # Extract keywords from title and content
-                    text = f"{entry.title or ''} {entry.content or ''}"
-                    keywords = keyword_service.extract(text)
+    def _batch_summarize(self):
+        """Start a background job summarizing entries.
 
-                    if keywords:
-                        # Update entry with keywords (store in tags for now)
-                        import json
-                        from spider_aggregation.models.entry import EntryUpdate
+        Summaries run concurrently within the LLM rate limit budgets and are
+        committed in batches.
 
-                        update_data = EntryUpdate(tags=keywords)
-                        repo.update(entry, update_data)
-                        updated_count += 1
+        Request body:
+            {"entry_ids": [1, 2, 3, ...]}
 
-        return api_response(
-            success=True,
-            data={"success": updated_count, "failed": len(entry_ids) - updated_count},
-            message=f"成功为 {updated_count} 条条目提取关键词",
-        )
+        Returns:
+            API response (202) with the job to poll at /batch/jobs/<job_id>
+        """
+        return self._start_batch_job("summarize", "已创建批量摘要任务")
 
-    def _batch_summarize(self):
-        """Batch summarize entries.
+    def _start_batch_job(self, kind: str, message: str):
+        """Enqueue a batch job over the requested entries.
 
-        Request body:
-            {"entry_ids": [1, 2, 3, ...]}
+        Args:
+            kind: BatchEntryProcessor method to run ("summarize" or "extract_keywords")
+            message: Success message
 
         Returns:
-            API response with number of entries updated
+            API response with the job state
         """
+        from spider_aggregation.application.batch_jobs import (
+            BatchEntryProcessor,
+            get_batch_job_manager,
+        )
         from spider_aggregation.storage.database import DatabaseManager
-        from spider_aggregation.core.services import SummarizerService
 
-        data = request.get_json()
+        data = request.get_json() or {}
         entry_ids = data.get("entry_ids", [])
 
         if not entry_ids:
             return api_response(success=False, error="entry_ids为必填项", status=400)
 
-        db_manager = DatabaseManager(self.db_path)
-        summarizer_service = SummarizerService()
+        processor = BatchEntryProcessor(DatabaseManager(self.db_path))
+        run = getattr(processor, kind)
+        job = get_batch_job_manager().submit(
+            kind, len(entry_ids), lambda job: run(job, entry_ids)
+        )
 
-        with db_manager.session() as session:
-            repo = self._get_repository(session)
-            updated_count = 0
+        return api_response(success=True, data=job.to_dict(), message=message, status=202)
 
-            for entry_id in entry_ids:
-                entry = repo.get_by_id(entry_id)
-                if entry and (entry.content or entry.summary):
-                    # Generate summary
-                    text = entry.content or entry.summary
-                    summary = summarizer_service.summarize(text)
+    def _batch_job_status(self, job_id: str):
+        """Get the state of a batch job.
+
+        Args:
+            job_id: Job ID returned when the job was created
 
-                    if summary:
-                        from spider_aggregation.models.entry import EntryUpdate
+        Returns:
+            API response with job status and success/failed counts
+        """
+        from spider_aggregation.application.batch_jobs import get_batch_job_manager
 
-                        update_data = EntryUpdate(summary=summary)
-                        repo.update(entry, update_data)
-                        updated_count += 1
+        job = get_batch_job_manager().get(job_id)
+        if job is None:
+            return api_response(success=False, error="任务不存在", status=404)
 
-        return api_response(
-            success=True,
-            data={"success": updated_count, "failed": len(entry_ids) - updated_count},
-            message=f"成功为 {updated_count} 条条目生成摘要",
-        )
+        return api_response(success=True, data=job.to_dict())
 
     def _by_category(self, category_id: int):
         """Get entries by category ID.
@@ -422,9 +414,10 @@ class EntryBlueprint(CRUDBlueprint):
                 offset=(page - 1) * page_size,
                 order_by="published_at",
                 order_desc=True,
+                projection="list",
             )
             total = repo.count_by_category(category_id)
-            data = [self.serialize(e) for e in entries]
+            data = [entry_to_list_dict(e) for e in entries]
 
         return api_response(
             success=True,
@@ -464,9 +457,10 @@ class EntryBlueprint(CRUDBlueprint):
                 offset=(page - 1) * page_size,
                 order_by="published_at",
                 order_desc=True,
+                projection="list",
             )
             # Note: total count by category name would require a separate query
-            data = [self.serialize(e) for e in entries]
+            data = [entry_to_list_dict(e) for e in entries]
 
         return api_response(
             success=True,
@@ -509,8 +503,9 @@ class EntryBlueprint(CRUDBlueprint):
                 category_id,
                 limit=page_size,
                 offset=(page - 1) * page_size,
+                projection="list",
             )
-            data = [self.serialize(e) for e in entries]
+            data = [entry_to_list_dict(e) for e in entries]
 
         return api_response(
             success=True,
@@ -536,7 +531,6 @@ class EntryBlueprint(CRUDBlueprint):
         db_manager = DatabaseManager(self.db_path)
 
         with db_manager.session() as session:
-            entry_repo = self._get_repository(session)
             category_repo = CategoryRepository(session)
 
             # Verify category exists
@@ -544,7 +538,7 @@ class EntryBlueprint(CRUDBlueprint):
             if not category:
                 return api_response(success=False, error="未找到分类", status=404)
 
-            stats = entry_repo.get_stats_by_category(category_id)
+            stats = EntryStatsRepository(session).get_summary_by_category(category_id)
 
         return api_response(
             success=True, data={"category_id": category_id, "category_name": category.name, **stats}
@@ -4,10 +4,9 @@ Feed API blueprint.
 This module contains all feed-related API endpoints.
 """
 
-from flask import request
+from flask import Response, request
 from spider_aggregation.web.blueprints.base import CRUDBlueprint
 from spider_aggregation.web.serializers import api_response
-from spider_aggregation.logger import get_logger
 from spider_aggregation.storage.repositories.feed_repo import FeedRepository
 from spider_aggregation.models import FeedCreate, FeedUpdate
 
@@ -30,6 +29,10 @@ class FeedBlueprint(CRUDBlueprint):
         self.blueprint.add_url_rule(
             "/<int:feed_id>/fetch", view_func=self._fetch_feed, methods=["POST"]
         )
+        # Assign categories to many feeds at once
+        self.blueprint.add_url_rule(
+            "/batch/categories", view_func=self._batch_categories, methods=["POST"]
+        )
         # Get categories for a feed
         self.blueprint.add_url_rule(
             "/<int:feed_id>/categories", view_func=self._get_categories, methods=["GET"]
@@ -99,21 +102,67 @@ class FeedBlueprint(CRUDBlueprint):
     def _fetch_feed(self, feed_id: int):
         """Manually trigger a fetch for a specific feed.
 
+        Every stage of the pipeline is traced and the breakdown is returned
+        and stored with the feed. With ``?profile=text`` (or ``pstats``) the
+        fetch also runs under cProfile and the report is returned as a
+        downloadable file instead of the JSON response.
+
+        Args:
+            feed_id: Feed ID
+
+        Returns:
+            API response, or the profile report
+        """
+        from spider_aggregation.tracing import (
+            PROFILE_FORMATS,
+            PipelineProfiler,
+            format_trace,
+            start_trace,
+        )
+
+        profile_format = request.args.get("profile", "").lower()
+        if not profile_format or profile_format == "false":
+            return self._run_fetch(feed_id)
+
+        if profile_format == "true":
+            profile_format = "text"
+        if profile_format not in PROFILE_FORMATS:
+            return api_response(
+                success=False, error=f"不支持的分析格式: {profile_format}", status=400
+            )
+
+        profiler = PipelineProfiler()
+        with start_trace(f"feed {feed_id}") as trace, profiler:
+            response, status = self._run_fetch(feed_id)
+        if status == 404:
+            return response, status
+
+        payload = response.get_json()
+        outcome = payload["message"] or payload["error"]
+        header = f"Fetch of feed {feed_id}: HTTP {status}, {outcome}\n{format_trace(trace)}"
+        mimetype, extension = PROFILE_FORMATS[profile_format]
+        return Response(
+            profiler.render(profile_format, header=header),
+            mimetype=mimetype,
+            headers={
+                "Content-Disposition": (
+                    f"attachment; filename=profile-feed-{feed_id}.{extension}"
+                )
+            },
+        )
+
+    def _run_fetch(self, feed_id: int):
+        """Fetch a feed and store its new entries under the active trace.
+
         Args:
             feed_id: Feed ID
 
         Returns:
             API response
         """
+        from spider_aggregation.application.ingestion import IngestionPipeline
         from spider_aggregation.storage.database import DatabaseManager
-        from spider_aggregation.core.services import (
-            FetcherService,
-            ParserService,
-            DeduplicatorService,
-            FilterService,
-        )
 
-        logger = get_logger(__name__)
         db_manager = DatabaseManager(self.db_path)
 
         with db_manager.session() as session:
@@ -123,75 +172,21 @@ class FeedBlueprint(CRUDBlueprint):
             if not feed:
                 return api_response(success=False, error="未找到订阅源", status=404)
 
-            # Use Service Facades for all core operations
-            fetcher = FetcherService(session=session)
-            parser = ParserService()
-            deduplicator = DeduplicatorService(session=session)
-            filter_service = FilterService()
+            result = IngestionPipeline(session).ingest(feed)
 
-            from spider_aggregation.storage.repositories.entry_repo import EntryRepository
-            from spider_aggregation.storage.repositories.filter_rule_repo import (
-                FilterRuleRepository,
-            )
-
-            entry_repo = EntryRepository(session)
-            filter_rule_repo = FilterRuleRepository(session)
-
-            # Fetch
-            fetch_result = fetcher.fetch_feed(
-                url=feed.url,
-                feed_id=feed.id,
-                etag=feed.etag,
-                last_modified=feed.last_modified,
-                max_entries=feed.max_entries_per_fetch,
-            )
-
-            if not fetch_result.success:
-                repo.update_fetch_info(feed, increment_error=True, last_error=fetch_result.error)
+            if not result.success:
                 return api_response(
-                    success=False, error=fetch_result.error or "获取订阅源失败", status=500
+                    success=False, error=result.error or "获取订阅源失败", status=500
                 )
 
-            # Parse entries
-            entries_created = 0
-            for entry_data in fetch_result.entries:
-                parsed = parser.parse_entry(entry_data, feed_id=feed.id)
-
-                # Check for duplicates
-                duplicate = deduplicator.check_duplicate(parsed, entry_repo, feed_id=feed.id)
-
-                if duplicate.is_duplicate:
-                    continue
-
-                # Apply filter rules
-                filter_result = filter_service.apply(parsed, filter_rule_repo)
-                if not filter_result.allowed:
-                    continue
-
-                # Create entry
-                from spider_aggregation.models import EntryCreate
-
-                entry_create = EntryCreate(**parsed)
-                entry_repo.create(entry_create)
-                entries_created += 1
-
-            # Update fetch info
-            from datetime import datetime
-
-            repo.update_fetch_info(
-                feed,
-                last_fetched_at=datetime.utcnow(),
-                reset_errors=True,
-                etag=fetch_result.etag,
-                last_modified=fetch_result.last_modified,
-            )
-
-            logger.info(f"Manually fetched feed {feed.id}: {entries_created} new entries")
-
             return api_response(
                 success=True,
-                data={"entries_created": entries_created, "feed": self.serialize(feed)},
-                message=f"成功获取 {entries_created} 条新内容",
+                data={
+                    "entries_created": result.entries_created,
+                    "timings": result.timings,
+                    "feed": self.serialize(feed),
+                },
+                message=f"成功获取 {result.entries_created} 条新内容",
             )
 
     def _get_categories(self, feed_id: int):
@@ -220,6 +215,48 @@ class FeedBlueprint(CRUDBlueprint):
 
         return api_response(success=True, data=data)
 
+    def _batch_categories(self):
+        """Add, remove or replace categories of many feeds.
+
+        Request body:
+            {"feed_ids": [1, 2, ...], "category_ids": [3, ...], "mode": "add"}
+            mode is one of add (default), remove or replace.
+
+        Returns:
+            API response with the number of links added and removed
+        """
+        from spider_aggregation.storage.database import DatabaseManager
+
+        data = request.get_json(silent=True) or {}
+        feed_ids = data.get("feed_ids", [])
+        category_ids = data.get("category_ids", [])
+        mode = data.get("mode", "add")
+
+        if not feed_ids:
+            return api_response(success=False, error="feed_ids为必填项", status=400)
+        if mode not in ("add", "remove", "replace"):
+            return api_response(success=False, error="mode必须为add、remove或replace", status=400)
+        if mode != "replace" and not category_ids:
+            return api_response(success=False, error="category_ids为必填项", status=400)
+
+        db_manager = DatabaseManager(self.db_path)
+
+        with db_manager.session() as session:
+            repo = self._get_repository(session)
+            added = removed = 0
+            if mode == "add":
+                added = repo.bulk_add_categories(feed_ids, category_ids)
+            elif mode == "remove":
+                removed = repo.bulk_remove_categories(feed_ids, category_ids)
+            else:
+                added, removed = repo.bulk_set_categories(feed_ids, category_ids)
+
+        return api_response(
+            success=True,
+            data={"added_count": added, "removed_count": removed},
+            message=f"分类已更新：新增 {added} 个，移除 {removed} 个",
+        )
+
     def _set_categories(self, feed_id: int):
         """Set categories for a feed (replaces existing categories).
 
@@ -6,7 +6,7 @@ This module contains all scheduler management API endpoints.
 
 from flask import request
 
-from spider_aggregation.web.serializers import api_response
+from spider_aggregation.web.serializers import api_response, fetch_job_to_dict
 from spider_aggregation.web.scheduler_manager import get_scheduler_manager
 from spider_aggregation.logger import get_logger
 
@@ -32,6 +32,14 @@ class SchedulerBlueprint:
         self.blueprint.add_url_rule("/start", view_func=self._start, methods=["POST"])
         self.blueprint.add_url_rule("/stop", view_func=self._stop, methods=["POST"])
         self.blueprint.add_url_rule("/fetch-all", view_func=self._fetch_all, methods=["POST"])
+        self.blueprint.add_url_rule(
+            "/fetch-all/jobs/<int:job_id>", view_func=self._fetch_job_status, methods=["GET"]
+        )
+        self.blueprint.add_url_rule(
+            "/fetch-all/jobs/<int:job_id>/cancel",
+            view_func=self._cancel_fetch_job,
+            methods=["POST"],
+        )
         self.blueprint.add_url_rule(
             "/digest/trigger", view_func=self._trigger_digest, methods=["POST"]
         )
@@ -137,140 +145,77 @@ class SchedulerBlueprint:
             return api_response(success=False, error="调度器停止失败", status=500)
 
     def _fetch_all(self):
-        """Manually trigger fetch for all enabled feeds.
+        """Start a background job fetching all due feeds.
+
+        Feeds are ingested and committed in batches; poll the job at
+        /fetch-all/jobs/<job_id>. While a job is pending or running, the
+        existing job is returned instead of starting another one.
 
         Returns:
-            API response with fetch results
+            API response (202) with the new job, or (200) with the running one
         """
-        from spider_aggregation.storage.database import DatabaseManager
-        from spider_aggregation.core.services import (
-            FetcherService,
-            ParserService,
-            DeduplicatorService,
-            FilterService,
-        )
+        from spider_aggregation.application.fetch_jobs import get_fetch_job_manager
 
-        logger = get_logger(__name__)
-        db_manager = DatabaseManager(self.db_path)
+        job_id, created = get_fetch_job_manager().start(self.db_path)
+        job = self._load_fetch_job(job_id)
 
-        with db_manager.session() as session:
-            from spider_aggregation.storage.repositories.feed_repo import FeedRepository
-            from spider_aggregation.storage.repositories.entry_repo import EntryRepository
-            from spider_aggregation.storage.repositories.filter_rule_repo import (
-                FilterRuleRepository,
-            )
+        if not created:
+            return api_response(success=True, data=job, message="已有抓取任务正在运行")
+        return api_response(success=True, data=job, message="已创建抓取任务", status=202)
 
-            feed_repo = FeedRepository(session)
-            entry_repo = EntryRepository(session)
-            filter_rule_repo = FilterRuleRepository(session)
-
-            # Use Service Facades for all core operations
-            fetcher = FetcherService(session=session)
-            parser = ParserService()
-            deduplicator = DeduplicatorService(session=session)
-            filter_service = FilterService()
-
-            # Get feeds to fetch
-            feeds = feed_repo.get_feeds_to_fetch()
-
-            results = []
-            total_entries_created = 0
-
-            for feed in feeds:
-                try:
-                    # Fetch
-                    fetch_result = fetcher.fetch_feed(
-                        url=feed.url,
-                        feed_id=feed.id,
-                        etag=feed.etag,
-                        last_modified=feed.last_modified,
-                        max_entries=feed.max_entries_per_fetch,
-                    )
-
-                    if not fetch_result.success:
-                        feed_repo.update_fetch_info(
-                            feed, increment_error=True, last_error=fetch_result.error
-                        )
-                        results.append(
-                            {
-                                "feed_id": feed.id,
-                                "feed_name": feed.name,
-                                "success": False,
-                                "error": fetch_result.error,
-                            }
-                        )
-                        continue
-
-                    # Parse and store entries
-                    entries_created = 0
-                    for entry_data in fetch_result.entries:
-                        parsed = parser.parse_entry(entry_data, feed_id=feed.id)
-
-                        # Check for duplicates
-                        duplicate = deduplicator.check_duplicate(
-                            parsed, entry_repo, feed_id=feed.id
-                        )
-
-                        if duplicate.is_duplicate:
-                            continue
-
-                        # Apply filter rules
-                        filter_result = filter_service.apply(parsed, filter_rule_repo)
-                        if not filter_result.allowed:
-                            continue
-
-                        # Create entry
-                        from spider_aggregation.models import EntryCreate
-
-                        entry_create = EntryCreate(**parsed)
-                        entry_repo.create(entry_create)
-                        entries_created += 1
-
-                    # Update fetch info
-                    from datetime import datetime
-
-                    feed_repo.update_fetch_info(
-                        feed,
-                        last_fetched_at=datetime.utcnow(),
-                        reset_errors=True,
-                        etag=fetch_result.etag,
-                        last_modified=fetch_result.last_modified,
-                    )
-
-                    total_entries_created += entries_created
-                    results.append(
-                        {
-                            "feed_id": feed.id,
-                            "feed_name": feed.name,
-                            "success": True,
-                            "entries_created": entries_created,
-                            "http_status": fetch_result.http_status,
-                        }
-                    )
+    def _fetch_job_status(self, job_id: int):
+        """Get the progress of a fetch-all job.
 
-                except Exception as e:
-                    logger.error(f"Error fetching feed {feed.id}: {e}")
-                    results.append(
-                        {
-                            "feed_id": feed.id,
-                            "feed_name": feed.name,
-                            "success": False,
-                            "error": str(e),
-                        }
-                    )
+        Args:
+            job_id: Job ID returned when the job was created
+
+        Returns:
+            API response with status, feed and entry counters and recent failures
+        """
+        job = self._load_fetch_job(job_id)
+        if job is None:
+            return api_response(success=False, error="任务不存在", status=404)
 
-        logger.info(f"Manual fetch all completed: {total_entries_created} entries created")
+        return api_response(success=True, data=job)
+
+    def _cancel_fetch_job(self, job_id: int):
+        """Cancel a fetch-all job after its current batch.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            API response with the job state
+        """
+        from spider_aggregation.application.fetch_jobs import get_fetch_job_manager
+
+        requested = get_fetch_job_manager().cancel(self.db_path, job_id)
+        if requested is None:
+            return api_response(success=False, error="任务不存在", status=404)
+        if not requested:
+            return api_response(success=False, error="任务已结束", status=400)
 
         return api_response(
-            success=True,
-            data={
-                "feeds_fetched": len(feeds),
-                "total_entries_created": total_entries_created,
-                "results": results,
-            },
-            message=f"成功获取 {len(feeds)} 个订阅源，共创建 {total_entries_created} 条新内容",
+            success=True, data=self._load_fetch_job(job_id), message="已请求取消抓取任务"
         )
 
+    def _load_fetch_job(self, job_id: int):
+        """Load a fetch job as a dictionary.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Serialized job or None if unknown
+        """
+        from spider_aggregation.storage.database import DatabaseManager
+        from spider_aggregation.storage.repositories.fetch_job_repo import FetchJobRepository
+
+        db_manager = DatabaseManager(self.db_path)
+        with db_manager.session() as session:
+            job = FetchJobRepository(session).get_by_id(job_id)
+            return fetch_job_to_dict(job) if job else None
+
     def _trigger_digest(self):
         """Manually trigger digest generation and sending.
 
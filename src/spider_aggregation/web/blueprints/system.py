@@ -5,7 +5,12 @@ This module contains statistics, dashboard, and system management API endpoints.
 """
 
 from flask import request, jsonify
-from spider_aggregation.web.serializers import api_response, entry_to_dict, feed_to_dict
+from spider_aggregation.web.serializers import (
+    api_response,
+    entry_to_dict,
+    entry_to_list_dict,
+    feed_to_dict,
+)
 
 
 class SystemBlueprint:
@@ -37,6 +42,13 @@ class SystemBlueprint:
         )
         # System cleanup
         self.blueprint.add_url_rule("/system/cleanup", view_func=self._cleanup, methods=["POST"])
+        self.blueprint.add_url_rule(
+            "/system/retention", view_func=self._run_retention, methods=["POST"]
+        )
+        # Statistics rollup reconciliation
+        self.blueprint.add_url_rule(
+            "/system/stats/reconcile", view_func=self._reconcile_stats, methods=["POST"]
+        )
         # Export entries
         self.blueprint.add_url_rule(
             "/system/export/entries", view_func=self._export_entries, methods=["GET"]
@@ -55,6 +67,13 @@ class SystemBlueprint:
         self.blueprint.add_url_rule(
             "/system/config/llm/test", view_func=self._test_llm, methods=["POST"]
         )
+        # LLM response cache - Stats and clear
+        self.blueprint.add_url_rule(
+            "/system/llm-cache", view_func=self._llm_cache_stats, methods=["GET"]
+        )
+        self.blueprint.add_url_rule(
+            "/system/llm-cache", view_func=self._clear_llm_cache, methods=["DELETE"]
+        )
         # Configuration - Update Email
         self.blueprint.add_url_rule(
             "/system/config/email", view_func=self._update_email_config, methods=["PUT"]
@@ -76,6 +95,9 @@ class SystemBlueprint:
     def _stats(self):
         """Get overall statistics.
 
+        Entry totals and language counts come from the statistics rollup
+        rather than scanning the entries table.
+
         Returns:
             API response with system statistics
         """
@@ -84,6 +106,7 @@ class SystemBlueprint:
         from spider_aggregation.storage.repositories.feed_repo import FeedRepository
         from spider_aggregation.storage.repositories.filter_rule_repo import FilterRuleRepository
         from spider_aggregation.storage.repositories.category_repo import CategoryRepository
+        from spider_aggregation.storage.repositories.stats_repo import EntryStatsRepository
 
         db_manager = DatabaseManager(self.db_path)
 
@@ -93,7 +116,7 @@ class SystemBlueprint:
             rule_repo = FilterRuleRepository(session)
             cat_repo = CategoryRepository(session)
 
-            entry_stats = entry_repo.get_stats()
+            entry_stats = EntryStatsRepository(session).get_summary()
             feed_count = feed_repo.count()
             enabled_feed_count = feed_repo.count(enabled_only=True)
             rule_count = rule_repo.count()
@@ -143,11 +166,12 @@ class SystemBlueprint:
                 limit=limit,
                 order_by="fetched_at",
                 order_desc=True,
+                projection="titles",
             )
 
             data = []
             for e in entries:
-                d = entry_to_dict(e)
+                d = entry_to_list_dict(e, include_summary=False)
                 d["feed_name"] = e.feed.name if e.feed else None
                 data.append(d)
 
@@ -192,63 +216,135 @@ class SystemBlueprint:
     def _cleanup(self):
         """Clean up old entries.
 
+        Entries are deleted in chunks with short transactions, and the freed
+        space is reclaimed afterwards.
+
         Request body:
             {"days": 90}  # Number of days to keep
 
         Returns:
             API response with cleanup results
         """
+        from spider_aggregation.application.retention import RetentionEngine
         from spider_aggregation.storage.database import DatabaseManager
-        from spider_aggregation.storage.repositories.entry_repo import EntryRepository
 
-        data = request.get_json() or {}
+        data = request.get_json(silent=True) or {}
         days = data.get("days", 90)
 
         db_manager = DatabaseManager(self.db_path)
+        result = RetentionEngine(db_manager).purge_older_than(days)
 
-        with db_manager.session() as session:
-            entry_repo = EntryRepository(session)
-            deleted_count = entry_repo.cleanup_old_entries(days=days)
+        return api_response(
+            success=True,
+            data=result.to_dict(),
+            message=f"已清理 {result.deleted} 篇旧文章",
+        )
+
+    def _run_retention(self):
+        """Apply the per-feed and per-category retention policies now.
+
+        Returns:
+            API response with the number of deleted entries and reclaimed bytes
+        """
+        from spider_aggregation.application.retention import RetentionEngine
+        from spider_aggregation.storage.database import DatabaseManager
+
+        db_manager = DatabaseManager(self.db_path)
+        result = RetentionEngine(db_manager).run()
 
         return api_response(
             success=True,
-            data={"deleted_count": deleted_count},
-            message=f"已清理 {deleted_count} 篇旧文章",
+            data=result.to_dict(),
+            message=f"已按保留策略清理 {result.deleted} 篇文章",
         )
 
+    def _reconcile_stats(self):
+        """Rebuild the entry statistics rollup from the entries table.
+
+        Returns:
+            API response with the number of buckets and corrected drift
+        """
+        from spider_aggregation.storage.database import DatabaseManager
+        from spider_aggregation.storage.repositories.stats_repo import EntryStatsRepository
+
+        db_manager = DatabaseManager(self.db_path)
+
+        with db_manager.session() as session:
+            result = EntryStatsRepository(session).reconcile()
+
+        return api_response(success=True, data=result, message="统计数据已重建")
+
     def _export_entries(self):
-        """Export entries as JSON file.
+        """Stream entries as a file download.
+
+        Entries are read in batches and encoded as they are sent, so memory
+        use stays flat regardless of the export size.
 
         Query params:
+            format: Export format: json (default), ndjson or csv
             feed_id: Optional feed ID to filter
-            limit: Maximum entries to export (default: 1000)
+            category_id: Optional category ID to filter
+            since: Only entries published at or after this ISO date/time
+            until: Only entries published before this ISO date/time
+            limit: Maximum entries to export (default: all)
+            gzip: Compress the file with gzip (default: false)
 
         Returns:
-            JSON file response
+            Streaming file response
         """
-        from spider_aggregation.storage.database import DatabaseManager
-        from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+        from datetime import datetime
 
-        feed_id = request.args.get("feed_id", type=int)
-        limit = request.args.get("limit", 1000, type=int)
-
-        db_manager = DatabaseManager(self.db_path)
+        from flask import Response, stream_with_context
 
-        with db_manager.session() as session:
-            entry_repo = EntryRepository(session)
-            entries = entry_repo.list(
-                feed_id=feed_id,
-                limit=limit,
-                order_by="published_at",
-                order_desc=True,
+        from spider_aggregation.storage.database import DatabaseManager
+        from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+        from spider_aggregation.web.export import EXPORT_FORMATS, encode_chunks
+
+        export_format = request.args.get("format", "json").lower()
+        if export_format not in EXPORT_FORMATS:
+            return api_response(
+                success=False,
+                error=f"不支持的导出格式: {export_format}",
+                status=400,
             )
 
-            data = [entry_to_dict(e) for e in entries]
-
-        response = jsonify(data)
-        response.headers["Content-Disposition"] = "attachment; filename=entries.json"
-        response.headers["Content-Type"] = "application/json"
-        return response
+        filters = {
+            "feed_id": request.args.get("feed_id", type=int),
+            "category_id": request.args.get("category_id", type=int),
+            "limit": request.args.get("limit", type=int),
+        }
+        for name in ("since", "until"):
+            value = request.args.get(name)
+            try:
+                filters[name] = datetime.fromisoformat(value) if value else None
+            except ValueError:
+                return api_response(success=False, error=f"无效的日期: {name}", status=400)
+
+        compress = request.args.get("gzip", "false").lower() == "true"
+        encoder, mimetype, extension = EXPORT_FORMATS[export_format]
+        db_path = self.db_path
+
+        def records():
+            db_manager = DatabaseManager(db_path)
+            with db_manager.session() as session:
+                for row in EntryRepository(session).iter_for_export(**filters):
+                    yield entry_to_dict(row)
+
+        if export_format == "csv":
+            chunks = encoder(records(), list(EntryRepository.EXPORT_COLUMNS))
+        else:
+            chunks = encoder(records())
+
+        filename = f"entries.{extension}"
+        if compress:
+            filename += ".gz"
+            mimetype = "application/gzip"
+
+        return Response(
+            stream_with_context(encode_chunks(chunks, compress=compress)),
+            mimetype=mimetype,
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
+        )
 
     def _export_feeds(self):
         """Export feeds as JSON file.
@@ -388,6 +484,8 @@ class SystemBlueprint:
                 api_key=api_key,
                 api_base=api_base,
                 model=model,
+                # A cached answer would not prove the connection works
+                use_cache=False,
             )
 
             # Simple test call
@@ -401,6 +499,34 @@ class SystemBlueprint:
         except Exception as e:
             return api_response(success=False, error=str(e))
 
+    def _llm_cache_stats(self):
+        """Get LLM response cache statistics.
+
+        Returns:
+            API response with entry count, hits, misses, evictions and hit rate
+        """
+        from spider_aggregation.core.llm_client import get_llm_cache
+
+        cache = get_llm_cache()
+        if cache is None:
+            return api_response(success=True, data={"enabled": False})
+
+        return api_response(success=True, data={"enabled": True, **cache.get_stats()})
+
+    def _clear_llm_cache(self):
+        """Clear the LLM response cache.
+
+        Returns:
+            API response
+        """
+        from spider_aggregation.core.llm_client import get_llm_cache
+
+        cache = get_llm_cache()
+        if cache is not None:
+            cache.clear()
+
+        return api_response(success=True, message="LLM 缓存已清空")
+
     def _update_email_config(self):
         """Update Email configuration.
 
@@ -547,7 +673,7 @@ class SystemBlueprint:
             data={
                 "scheduler_interval": 60,
                 "max_workers": 3,
-                "entry_retention_days": 0,
+                "entry_retention_days": config.retention.default_days,
                 "max_content_length": 500000,
                 "auto_fetch_content": False,
                 "enable_summarization": config.llm.enabled if hasattr(config, "llm") else False,
@@ -629,14 +755,22 @@ class SystemBlueprint:
         """Get database file size.
 
         Returns:
-            API response with database size in bytes
+            API response with database size in bytes and the sizes of the
+            stored entry bodies (see EntryBodyRepository.size_report)
         """
         from spider_aggregation.config import get_config
         from pathlib import Path
+        from spider_aggregation.storage.database import DatabaseManager
+        from spider_aggregation.storage.repositories.body_repo import EntryBodyRepository
 
         config = get_config()
         db_path = Path(config.database.path)
 
         size = db_path.stat().st_size if db_path.exists() else 0
 
-        return api_response(success=True, data={"size": size, "path": str(db_path)})
+        with DatabaseManager(self.db_path).session() as session:
+            bodies = EntryBodyRepository(session).size_report()
+
+        return api_response(
+            success=True, data={"size": size, "path": str(db_path), "bodies": bodies}
+        )
@@ -0,0 +1,124 @@
+"""
+Streaming encoders for data exports.
+
+Each encoder turns an iterator of dictionaries into an iterator of text
+chunks, so an export is written to the client as it is read from the
+database and memory use does not grow with the number of rows.
+"""
+
+import csv
+import io
+import json
+import zlib
+from typing import Callable, Iterable, Iterator
+
+# Bytes buffered before a chunk is sent to the client
+CHUNK_SIZE = 64 * 1024
+
+# Gzip container (zlib wbits 16 + 15)
+GZIP_WBITS = 31
+
+
+def iter_json_array(records: Iterable[dict]) -> Iterator[str]:
+    """Encode records as a JSON array written incrementally.
+
+    Args:
+        records: Records to encode
+
+    Yields:
+        JSON text chunks
+    """
+    yield "["
+    first = True
+    for record in records:
+        yield ("" if first else ",") + json.dumps(record, ensure_ascii=False)
+        first = False
+    yield "]"
+
+
+def iter_ndjson(records: Iterable[dict]) -> Iterator[str]:
+    """Encode records as newline-delimited JSON.
+
+    Args:
+        records: Records to encode
+
+    Yields:
+        One JSON line per record
+    """
+    for record in records:
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def iter_csv(records: Iterable[dict], fieldnames: list[str]) -> Iterator[str]:
+    """Encode records as CSV with a header row.
+
+    List values (e.g. tags) are written as JSON.
+
+    Args:
+        records: Records to encode
+        fieldnames: Columns to write, in order
+
+    Yields:
+        CSV text chunks
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+    writer.writeheader()
+
+    for record in records:
+        writer.writerow(
+            {
+                key: json.dumps(value, ensure_ascii=False) if isinstance(value, list) else value
+                for key, value in record.items()
+            }
+        )
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
+
+
+def encode_chunks(chunks: Iterable[str], compress: bool = False) -> Iterator[bytes]:
+    """Encode text chunks as UTF-8, batching small chunks and optionally gzipping.
+
+    Args:
+        chunks: Text chunks
+        compress: Gzip the output on the fly
+
+    Yields:
+        Byte chunks of roughly CHUNK_SIZE
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, GZIP_WBITS) if compress else None
+    pending: list[bytes] = []
+    pending_size = 0
+
+    def flush() -> bytes:
+        data = b"".join(pending)
+        pending.clear()
+        return compressor.compress(data) if compressor else data
+
+    for chunk in chunks:
+        data = chunk.encode("utf-8")
+        pending.append(data)
+        pending_size += len(data)
+        if pending_size >= CHUNK_SIZE:
+            pending_size = 0
+            out = flush()
+            if out:
+                yield out
+
+    out = flush()
+    if compressor:
+        out += compressor.flush()
+    if out:
+        yield out
+
+
+# Export format -> (encoder factory, MIME type, file extension)
+EXPORT_FORMATS: dict[str, tuple[Callable[..., Iterator[str]], str, str]] = {
+    "json": (iter_json_array, "application/json", "json"),
+    "ndjson": (iter_ndjson, "application/x-ndjson", "ndjson"),
+    "csv": (iter_csv, "text/csv", "csv"),
+}
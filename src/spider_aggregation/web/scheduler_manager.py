@@ -8,13 +8,16 @@ eliminating the need for global variables.
 from typing import Optional
 
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from flask import Flask
 
 from spider_aggregation.config import get_config
 from spider_aggregation.core.scheduler import FeedScheduler
 from spider_aggregation.logger import get_logger
-from spider_aggregation.application import create_digest_service
+from spider_aggregation.application import RetentionEngine, create_digest_service
 from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.dialects import get_dialect
+from spider_aggregation.storage.repositories.stats_repo import EntryStatsRepository
 
 logger = get_logger(__name__)
 
@@ -115,8 +118,9 @@ class SchedulerManager:
         try:
             self._scheduler.start()
             logger.info("Scheduler started successfully")
-            # Setup digest jobs after scheduler starts
+            # Setup digest and maintenance jobs after scheduler starts
             self.setup_digest_jobs()
+            self.setup_maintenance_jobs()
             return True
         except Exception as e:
             logger.error(f"Failed to start scheduler: {e}")
@@ -267,6 +271,112 @@ class SchedulerManager:
 
         return True
 
+    def setup_maintenance_jobs(self) -> bool:
+        """Setup periodic database maintenance jobs based on config.
+
+        Returns:
+            True if jobs were set up successfully
+        """
+        if self._scheduler is None:
+            logger.error("Cannot setup maintenance jobs: scheduler not initialized")
+            return False
+
+        config = get_config()
+        success = True
+
+        interval_hours = config.scheduler.stats_reconcile_interval_hours
+        if interval_hours <= 0:
+            logger.info("Statistics reconciliation is disabled, skipping job setup")
+        else:
+            try:
+                self._scheduler.scheduler.add_job(
+                    func=self._reconcile_stats_job,
+                    trigger=IntervalTrigger(hours=interval_hours),
+                    id="maintenance_stats_reconcile",
+                    name="Statistics Rollup Reconciliation",
+                    replace_existing=True,
+                )
+                logger.info(f"Added statistics reconciliation job every {interval_hours}h")
+            except Exception as e:
+                logger.error(f"Failed to add statistics reconciliation job: {e}")
+                success = False
+
+        interval_minutes = config.scheduler.db_maintenance_interval_minutes
+        if interval_minutes <= 0:
+            logger.info("Database maintenance is disabled, skipping job setup")
+        else:
+            try:
+                self._scheduler.scheduler.add_job(
+                    func=self._db_maintenance_job,
+                    trigger=IntervalTrigger(minutes=interval_minutes),
+                    id="maintenance_database",
+                    name="Database Optimize and Checkpoint",
+                    replace_existing=True,
+                )
+                logger.info(f"Added database maintenance job every {interval_minutes}min")
+            except Exception as e:
+                logger.error(f"Failed to add database maintenance job: {e}")
+                success = False
+
+        if not config.retention.enabled:
+            logger.info("Retention is disabled, skipping job setup")
+        else:
+            try:
+                self._scheduler.scheduler.add_job(
+                    func=self._retention_job,
+                    trigger=CronTrigger.from_crontab(config.retention.schedule),
+                    id="maintenance_retention",
+                    name="Entry Retention",
+                    replace_existing=True,
+                )
+                logger.info(f"Added retention job with schedule: {config.retention.schedule}")
+            except Exception as e:
+                logger.error(f"Failed to add retention job: {e}")
+                success = False
+
+        return success
+
+    def _reconcile_stats_job(self) -> None:
+        """Job function for rebuilding the entry statistics rollup."""
+        if self._db_manager is None:
+            logger.error("Cannot reconcile statistics: no database manager")
+            return
+
+        try:
+            with self._db_manager.session() as session:
+                result = EntryStatsRepository(session).reconcile()
+            logger.info(
+                f"Statistics rollup reconciled: {result['buckets']} buckets, "
+                f"drift {result['drift']:+d} entries"
+            )
+        except Exception as e:
+            logger.exception(f"Error in statistics reconciliation job: {e}")
+
+    def _db_maintenance_job(self) -> None:
+        """Job function for refreshing planner statistics and truncating the WAL."""
+        if self._db_manager is None:
+            logger.error("Cannot run database maintenance: no database manager")
+            return
+
+        try:
+            engine = self._db_manager.engine
+            result = get_dialect(engine.dialect.name).run_maintenance(engine)
+            if result:
+                logger.info(f"Database maintenance finished: {result}")
+        except Exception as e:
+            logger.exception(f"Error in database maintenance job: {e}")
+
+    def _retention_job(self) -> None:
+        """Job function for applying entry retention policies."""
+        if self._db_manager is None:
+            logger.error("Cannot apply retention: no database manager")
+            return
+
+        try:
+            RetentionEngine(self._db_manager).run()
+        except Exception as e:
+            logger.exception(f"Error in retention job: {e}")
+
     def _generate_digest_job(self) -> None:
         """Job function for generating and sending digest."""
         if self._db_manager is None:
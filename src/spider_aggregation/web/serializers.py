@@ -57,12 +57,16 @@ def feed_to_dict(feed) -> dict:
         "fetch_interval_minutes": feed.fetch_interval_minutes,
         "max_entries_per_fetch": feed.max_entries_per_fetch,
         "fetch_only_recent": feed.fetch_only_recent,
+        "retention_days": feed.retention_days,
         "created_at": serialize_datetime(feed.created_at),
         "updated_at": serialize_datetime(feed.updated_at),
         "last_fetched_at": serialize_datetime(feed.last_fetched_at),
         "fetch_error_count": feed.fetch_error_count,
         "last_error": feed.last_error,
         "last_error_at": serialize_datetime(feed.last_error_at),
+        "last_fetch_timings": (
+            json.loads(feed.last_fetch_timings) if feed.last_fetch_timings else None
+        ),
         "categories": [category_to_dict(c) for c in feed.categories] if feed.categories else [],
     }
 
@@ -91,9 +95,42 @@ def entry_to_dict(entry) -> dict:
         "language": entry.language,
         "reading_time_seconds": entry.reading_time_seconds,
         "enabled": getattr(entry, "enabled", True),
+        "cluster_id": getattr(entry, "cluster_id", None),
     }
 
 
+def entry_to_list_dict(entry, include_summary: bool = True) -> dict:
+    """Convert Entry model to a lightweight dictionary for list views.
+
+    Leaves out the entry content so it can be used with entries loaded
+    through a list projection (see EntryRepository.LIST_PROJECTIONS).
+
+    Args:
+        entry: EntryModel instance
+        include_summary: Include the summary (False for the "titles" projection)
+
+    Returns:
+        Dictionary representation without content
+    """
+    data = {
+        "id": entry.id,
+        "feed_id": entry.feed_id,
+        "title": entry.title,
+        "link": entry.link,
+        "author": entry.author,
+        "published_at": serialize_datetime(entry.published_at),
+        "fetched_at": serialize_datetime(entry.fetched_at),
+        "tags": parse_json_tags(entry.tags),
+        "language": entry.language,
+        "reading_time_seconds": entry.reading_time_seconds,
+        "enabled": getattr(entry, "enabled", True),
+        "cluster_id": getattr(entry, "cluster_id", None),
+    }
+    if include_summary:
+        data["summary"] = entry.summary
+    return data
+
+
 def filter_rule_to_dict(rule) -> dict:
     """Convert FilterRule model to dictionary.
 
@@ -133,12 +170,39 @@ def category_to_dict(category, feed_count: int = None) -> dict:
         "color": category.color,
         "icon": category.icon,
         "enabled": category.enabled,
+        "retention_days": category.retention_days,
         "created_at": serialize_datetime(category.created_at),
         "updated_at": serialize_datetime(category.updated_at),
         "feed_count": feed_count if feed_count is not None else 0,
     }
 
 
+def fetch_job_to_dict(job) -> dict:
+    """Convert FetchJob model to dictionary.
+
+    Args:
+        job: FetchJobModel instance
+
+    Returns:
+        Dictionary representation
+    """
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "cancel_requested": job.cancel_requested,
+        "feeds_total": job.feeds_total,
+        "feeds_done": job.feeds_done,
+        "feeds_failed": job.feeds_failed,
+        "entries_created": job.entries_created,
+        "failures": json.loads(job.failures) if job.failures else [],
+        "error": job.error_message,
+        "created_at": serialize_datetime(job.created_at),
+        "started_at": serialize_datetime(job.started_at),
+        "updated_at": serialize_datetime(job.updated_at),
+        "finished_at": serialize_datetime(job.finished_at),
+    }
+
+
 def api_response(
     success: bool = True,
     data: Any = None,
@@ -190,6 +254,7 @@ class SerializerRegistry:
     _serializers: dict[str, Callable] = {
         "feed": feed_to_dict,
         "entry": entry_to_dict,
+        "entry_list": entry_to_list_dict,
         "category": category_to_dict,
         "filter_rule": filter_rule_to_dict,
     }
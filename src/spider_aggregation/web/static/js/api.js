@@ -288,6 +288,12 @@ const API = {
         trigger() {
             return API.post('/api/scheduler/fetch-all');
         },
+        getFetchJob(jobId) {
+            return API.get(`/api/scheduler/fetch-all/jobs/${jobId}`);
+        },
+        cancelFetchJob(jobId) {
+            return API.post(`/api/scheduler/fetch-all/jobs/${jobId}/cancel`);
+        },
         triggerDigest() {
             return API.post('/api/scheduler/digest/trigger');
         },
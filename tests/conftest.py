@@ -1,6 +1,9 @@
 """Shared pytest fixtures for all tests."""
 
+from contextlib import contextmanager
+
 import pytest
+from sqlalchemy import Engine, event
 from sqlalchemy.orm import Session
 
 from spider_aggregation.storage.database import DatabaseManager
@@ -59,3 +62,60 @@ def client():
         except OSError:
             pass
 
+
+
+class QueryCounter:
+    """SQL statements executed on any engine while counting."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        """Number of statements executed."""
+        return len(self.statements)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        # Connection setup PRAGMAs and the SQLite dialect's BEGIN are not
+        # queries of the code under test
+        if not statement.lstrip().upper().startswith(("PRAGMA", "BEGIN")):
+            self.statements.append(statement)
+
+
+@contextmanager
+def count_queries():
+    """Count the SQL statements executed inside the block.
+
+    Listens on every engine, so it also covers engines the web app creates
+    per request.
+
+    Yields:
+        QueryCounter
+    """
+    counter = QueryCounter()
+    event.listen(Engine, "before_cursor_execute", counter._record)
+    try:
+        yield counter
+    finally:
+        event.remove(Engine, "before_cursor_execute", counter._record)
+
+
+@pytest.fixture
+def assert_max_queries():
+    """Assert a block executes at most ``limit`` SQL statements.
+
+    Example:
+        >>> with assert_max_queries(3):
+        ...     client.get("/api/entries")
+    """
+
+    @contextmanager
+    def _assert_max_queries(limit: int):
+        with count_queries() as counter:
+            yield counter
+        assert counter.count <= limit, (
+            f"Expected at most {limit} queries, got {counter.count}:\n"
+            + "\n".join(counter.statements)
+        )
+
+    return _assert_max_queries
@@ -0,0 +1,70 @@
+"""Offline LLM client test double."""
+
+import threading
+import time
+from typing import Callable, Optional
+
+from spider_aggregation.core.llm_client import BaseLLMClient, LLMResponse, estimate_tokens
+
+
+class FakeLLMClient(BaseLLMClient):
+    """Offline LLM client for tests.
+
+    Returns a deterministic response without any network access. By default
+    the response echoes the first lines of the prompt; pass ``responder`` to
+    compute it from the prompt instead. All calls are recorded in ``calls``.
+    """
+
+    def __init__(
+        self,
+        api_key: str = "",
+        api_base: Optional[str] = None,
+        model: str = "fake",
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        timeout_seconds: int = 60,
+        responder: Optional[Callable[[str, Optional[str]], str]] = None,
+        latency_seconds: float = 0.0,
+    ) -> None:
+        super().__init__(
+            api_key=api_key,
+            api_base=api_base,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout_seconds=timeout_seconds,
+        )
+        self.responder = responder
+        self.latency_seconds = latency_seconds
+        self.calls: list[tuple[str, Optional[str]]] = []
+        self._lock = threading.Lock()
+
+    def _init_client(self) -> None:
+        """No underlying client is needed."""
+        self._client = self
+
+    def chat(self, prompt: str, system_prompt: Optional[str] = None) -> LLMResponse:
+        """Return a deterministic response for the prompt."""
+        with self._lock:
+            self.calls.append((prompt, system_prompt))
+
+        started = time.perf_counter()
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+
+        try:
+            if self.responder:
+                content = self.responder(prompt, system_prompt)
+            else:
+                content = "\n".join(prompt.strip().splitlines()[:3])
+        except Exception as e:
+            return self._observe(started, LLMResponse(success=False, error=str(e)))
+
+        return self._observe(
+            started,
+            LLMResponse(
+                success=True,
+                content=content,
+                tokens_used=estimate_tokens(prompt) + estimate_tokens(content),
+            ),
+        )
@@ -0,0 +1,260 @@
+"""Unit tests for background batch jobs over entries."""
+
+import json
+import time
+from datetime import datetime
+
+import pytest
+
+from spider_aggregation.application.batch_jobs import (
+    BatchEntryProcessor,
+    BatchJob,
+    BatchJobManager,
+)
+from spider_aggregation.core.llm_client import RateLimitError
+from spider_aggregation.core.llm_scheduler import LLMRequestScheduler
+from spider_aggregation.models import EntryModel
+from spider_aggregation.models.entry import EntryCreate
+from spider_aggregation.models.feed import FeedCreate
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+from spider_aggregation.utils.hash_utils import compute_link_hash, compute_title_hash
+
+
+class FakeSummarizerService:
+    """Summarizer service stand-in recording calls."""
+
+    uses_llm = True
+    max_tokens = 150
+
+    def __init__(self, fail_on: tuple = ()) -> None:
+        self.fail_on = fail_on
+        self.calls = 0
+
+    def summarize(self, content: str):
+        self.calls += 1
+        if any(marker in content for marker in self.fail_on):
+            raise RateLimitError("429")
+        return f"summary: {content[:10]}"
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    """Create a file database shared by the job threads."""
+    manager = DatabaseManager(str(tmp_path / "jobs.db"))
+    manager.init_db()
+    yield manager
+    manager.close()
+
+
+def _create_entries(db_manager: DatabaseManager, count: int) -> list[int]:
+    with db_manager.session() as session:
+        feed = FeedRepository(session).create(FeedCreate(url="https://example.com/feed"))
+        repo = EntryRepository(session)
+        ids = []
+        for n in range(count):
+            link = f"https://example.com/{n}"
+            entry = repo.create(
+                EntryCreate(
+                    feed_id=feed.id,
+                    title=f"Entry {n}",
+                    link=link,
+                    content=f"Content {n} " + "text " * 30,
+                    published_at=datetime(2026, 1, 1),
+                    link_hash=compute_link_hash(link),
+                    title_hash=compute_title_hash(f"Entry {n}"),
+                )
+            )
+            ids.append(entry.id)
+    return ids
+
+
+class TestBatchEntryProcessor:
+    """Tests for BatchEntryProcessor."""
+
+    def test_summarize_commits_in_batches(self, file_db: DatabaseManager, monkeypatch):
+        """Test summaries are written in batches of the commit size."""
+        ids = _create_entries(file_db, 7)
+        processor = BatchEntryProcessor(file_db, commit_batch_size=3)
+        commits = []
+        original_commit = processor._commit
+
+        def record_commit(values):
+            commits.append(len(values))
+            original_commit(values)
+
+        monkeypatch.setattr(processor, "_commit", record_commit)
+        job = BatchJob(id="job", kind="summarize", total=8)
+
+        processor.summarize(
+            job,
+            ids + [9999],
+            summarizer_service=FakeSummarizerService(),
+            scheduler=LLMRequestScheduler(max_concurrency=4),
+        )
+
+        assert job.succeeded == 7
+        assert job.failed == 1
+        assert commits == [3, 3, 1]
+        with file_db.session() as session:
+            summaries = [row[0] for row in session.query(EntryModel.summary).all()]
+        assert all(s.startswith("summary: Content") for s in summaries)
+
+    def test_texts_loaded_per_commit_batch(self, file_db: DatabaseManager, monkeypatch):
+        """Test entry contents are loaded one commit batch at a time, not per job."""
+        ids = _create_entries(file_db, 7)
+        loads = []
+        get_texts = EntryRepository.get_texts
+
+        def record_load(self, entry_ids):
+            loads.append(len(entry_ids))
+            return get_texts(self, entry_ids)
+
+        monkeypatch.setattr(EntryRepository, "get_texts", record_load)
+        job = BatchJob(id="job", kind="summarize", total=7)
+
+        BatchEntryProcessor(file_db, commit_batch_size=3).summarize(
+            job,
+            ids,
+            summarizer_service=FakeSummarizerService(),
+            scheduler=LLMRequestScheduler(max_concurrency=4),
+        )
+
+        assert loads == [3, 3, 1]
+        assert job.succeeded == 7
+
+    def test_rate_limited_items_fail_after_retries(self, file_db: DatabaseManager):
+        """Test items still rate limited after retries count as failed."""
+        ids = _create_entries(file_db, 3)
+        service = FakeSummarizerService(fail_on=("Content 1 ",))
+        scheduler = LLMRequestScheduler(max_retries=2, sleep=lambda seconds: None)
+        job = BatchJob(id="job", kind="summarize", total=3)
+
+        BatchEntryProcessor(file_db).summarize(
+            job, ids, summarizer_service=service, scheduler=scheduler
+        )
+
+        assert job.succeeded == 2
+        assert job.failed == 1
+        assert service.calls == 2 + 3
+
+    def test_local_summaries_are_batched(self, file_db: DatabaseManager):
+        """Test local summarizers get one summarize_batch call per commit batch."""
+
+        class FakeLocalSummarizerService:
+            uses_llm = False
+
+            def __init__(self):
+                self.batches = []
+
+            def summarize_batch(self, contents):
+                self.batches.append(len(contents))
+                return [None if "Content 1 " in c else f"local: {c[:9]}" for c in contents]
+
+        ids = _create_entries(file_db, 5)
+        service = FakeLocalSummarizerService()
+        job = BatchJob(id="job", kind="summarize", total=6)
+
+        BatchEntryProcessor(file_db, commit_batch_size=2).summarize(
+            job, ids + [9999], summarizer_service=service
+        )
+
+        assert service.batches == [2, 2, 1]
+        assert job.succeeded == 4
+        assert job.failed == 2
+        with file_db.session() as session:
+            summary = session.get(EntryModel, ids[0]).summary
+        assert summary == "local: Content 0"
+
+    def test_extract_keywords(self, file_db: DatabaseManager):
+        """Test keywords are stored as JSON tags."""
+
+        class FakeKeywordService:
+            def extract_batch(self, texts, session=None):
+                return [["alpha", "beta"] for _ in texts]
+
+        ids = _create_entries(file_db, 2)
+        job = BatchJob(id="job", kind="extract_keywords", total=2)
+
+        BatchEntryProcessor(file_db).extract_keywords(
+            job, ids, keyword_service=FakeKeywordService()
+        )
+
+        assert job.succeeded == 2
+        with file_db.session() as session:
+            tags = [row[0] for row in session.query(EntryModel.tags).all()]
+        assert tags == [json.dumps(["alpha", "beta"])] * 2
+
+
+class TestBatchJobManager:
+    """Tests for BatchJobManager."""
+
+    @staticmethod
+    def _wait(job: BatchJob) -> None:
+        for _ in range(200):
+            if job.status in ("completed", "failed"):
+                return
+            time.sleep(0.01)
+
+    def test_job_runs_in_background(self):
+        """Test submitted jobs run to completion on a thread."""
+        manager = BatchJobManager()
+
+        def target(job):
+            job.succeeded = job.total
+
+        job = manager.submit("summarize", 5, target)
+        self._wait(job)
+
+        assert manager.get(job.id) is job
+        assert job.status == "completed"
+        assert job.to_dict()["success"] == 5
+        assert job.finished_at is not None
+
+    def test_job_failure_recorded(self):
+        """Test an exception in the job marks it failed."""
+        manager = BatchJobManager()
+
+        def target(job):
+            raise RuntimeError("database unavailable")
+
+        job = manager.submit("summarize", 1, target)
+        self._wait(job)
+
+        assert job.status == "failed"
+        assert job.error == "database unavailable"
+
+
+class TestBatchJobAPI:
+    """Tests for the batch job endpoints."""
+
+    def test_batch_summarize_returns_job(self, client):
+        """Test POST /api/entries/batch/summarize enqueues a pollable job."""
+        db_manager = DatabaseManager(client.application.config["DB_PATH"])
+        ids = _create_entries(db_manager, 2)
+
+        response = client.post("/api/entries/batch/summarize", json={"entry_ids": ids})
+        data = json.loads(response.data)
+
+        assert response.status_code == 202
+        job_id = data["data"]["job_id"]
+        assert data["data"]["total"] == 2
+
+        for _ in range(200):
+            status = json.loads(client.get(f"/api/entries/batch/jobs/{job_id}").data)["data"]
+            if status["status"] in ("completed", "failed"):
+                break
+            time.sleep(0.01)
+        assert status["status"] == "completed"
+        assert status["processed"] == 2
+
+    def test_batch_requires_entry_ids(self, client):
+        """Test an empty request is rejected."""
+        response = client.post("/api/entries/batch/extract-keywords", json={"entry_ids": []})
+        assert response.status_code == 400
+
+    def test_unknown_job(self, client):
+        """Test polling an unknown job returns 404."""
+        response = client.get("/api/entries/batch/jobs/unknown")
+        assert response.status_code == 404
@@ -0,0 +1,126 @@
+"""
+Unit tests for the benchmark suite helpers.
+"""
+
+import httpx
+import pytest
+
+from benchmarks.corpus import CorpusConfig, SyntheticCorpus
+from benchmarks.feed_server import SyntheticFeedServer
+from benchmarks import sqlite_profiles
+from benchmarks.harness import BenchmarkResult, compare, latency_summary, write_results
+
+
+class TestSyntheticCorpus:
+    """Test cases for SyntheticCorpus."""
+
+    def test_render_is_deterministic(self):
+        """Test the same seed renders identical documents."""
+        config = CorpusConfig(feeds=4, entries_per_feed=5, seed=7)
+
+        first = [SyntheticCorpus(config).render(feed) for feed in range(4)]
+        second = [SyntheticCorpus(config).render(feed) for feed in range(4)]
+
+        assert first == second
+
+    def test_publish_changes_validators(self):
+        """Test publishing new entries changes the document and its ETag."""
+        corpus = SyntheticCorpus(CorpusConfig(feeds=1, entries_per_feed=3))
+        before = corpus.render(0)
+
+        corpus.publish(0, 2)
+        after = corpus.render(0)
+
+        assert after.etag != before.etag
+        assert after.body != before.body
+
+    def test_invalid_config(self):
+        """Test invalid corpus settings are rejected."""
+        with pytest.raises(ValueError):
+            CorpusConfig(etag_mode="sometimes")
+
+
+class TestSyntheticFeedServer:
+    """Test cases for SyntheticFeedServer."""
+
+    def test_conditional_requests(self):
+        """Test matching validators are answered with 304."""
+        config = CorpusConfig(feeds=2, entries_per_feed=3)
+        with SyntheticFeedServer(config) as server, httpx.Client() as client:
+            url = server.feed_url(0)
+            response = client.get(url)
+            assert response.status_code == 200
+            etag = response.headers["ETag"]
+
+            assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+            server.publish(0)
+            assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
+            assert client.get(server.base_url + "/feeds/9.rss").status_code == 404
+
+        assert server.requests == 3
+        assert server.not_modified == 1
+
+    def test_unconditional_mode(self):
+        """Test "unconditional" mode always sends the full document."""
+        config = CorpusConfig(feeds=1, entries_per_feed=3, etag_mode="unconditional")
+        with SyntheticFeedServer(config) as server, httpx.Client() as client:
+            etag = client.get(server.feed_url(0)).headers["ETag"]
+            response = client.get(server.feed_url(0), headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+
+
+class TestHarness:
+    """Test cases for the result helpers."""
+
+    def test_latency_summary(self):
+        """Test percentiles are reported in milliseconds."""
+        summary = latency_summary([i / 1000 for i in range(1, 101)])
+
+        assert summary["p50_ms"] == pytest.approx(50, abs=1)
+        assert summary["max_ms"] == pytest.approx(100)
+
+    def test_compare_flags_regressions(self, tmp_path):
+        """Test latency increases and throughput drops are regressions."""
+        base = write_results(
+            tmp_path / "base.json",
+            {},
+            [BenchmarkResult("ingest.cold", {"wall_s": 1.0, "entries_per_s": 100.0})],
+        )
+        head = write_results(
+            tmp_path / "head.json",
+            {},
+            [
+                BenchmarkResult("ingest.cold", {"wall_s": 1.05, "entries_per_s": 80.0}),
+                BenchmarkResult("ingest.new", {"wall_s": 1.0}),
+            ],
+        )
+
+        comparisons = {item.metric: item for item in compare(base, head)}
+
+        assert set(comparisons) == {"wall_s", "entries_per_s"}
+        assert not comparisons["wall_s"].regressed(0.10)
+        assert comparisons["entries_per_s"].regressed(0.10)
+
+
+class TestSQLiteProfiles:
+    """Test cases for the SQLite profile suite."""
+
+    def test_every_profile_is_measured(self, monkeypatch):
+        """Test each profile reports insert and read throughput."""
+        monkeypatch.setattr(sqlite_profiles, "READS", 20)
+
+        results = sqlite_profiles.run(CorpusConfig(feeds=3, entries_per_feed=5), rows=30, repeat=1)
+
+        assert [result.name for result in results] == [
+            "sqlite.durable",
+            "sqlite.balanced",
+            "sqlite.throughput",
+        ]
+        for result in results:
+            assert set(result.metrics) == {
+                "insert_rows_per_s",
+                "point_reads_per_s",
+                "page_reads_per_s",
+            }
+            assert all(value > 0 for value in result.metrics.values())
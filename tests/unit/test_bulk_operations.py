@@ -0,0 +1,176 @@
+"""Unit tests for set-based bulk repository operations."""
+
+import json
+
+import pytest
+
+from spider_aggregation.models import EntryModel
+from spider_aggregation.models.entry import EntryCreate
+from spider_aggregation.models.feed import FeedCreate
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.dialects import get_dialect
+from spider_aggregation.storage.repositories import base
+from spider_aggregation.storage.repositories.base import chunked
+from spider_aggregation.storage.repositories.category_repo import CategoryRepository
+from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+from spider_aggregation.storage.repositories.stats_repo import EntryStatsRepository
+from spider_aggregation.utils.hash_utils import compute_link_hash, compute_title_hash
+from tests.conftest import count_queries
+
+
+def _create_entries(session, count: int) -> list[int]:
+    feed = FeedRepository(session).create(FeedCreate(url="https://example.com/bulk"))
+    repo = EntryRepository(session)
+    ids = []
+    for n in range(count):
+        link = f"https://example.com/bulk/{n}"
+        entry = repo.create(
+            EntryCreate(
+                feed_id=feed.id,
+                title=f"Entry {n}",
+                link=link,
+                link_hash=compute_link_hash(link),
+                title_hash=compute_title_hash(link),
+            )
+        )
+        ids.append(entry.id)
+    return ids
+
+
+def _feed_category_ids(session, feed_id: int) -> set[int]:
+    session.expire_all()
+    feed = FeedRepository(session).get_by_id(feed_id)
+    return {category.id for category in feed.categories}
+
+
+@pytest.fixture
+def small_param_limit(monkeypatch):
+    """Force tiny chunks so chunking is exercised with few rows."""
+    monkeypatch.setattr(base, "bind_parameter_limit", lambda session: 20)
+
+
+class TestChunking:
+    """Tests for chunk helpers and dialect parameter limits."""
+
+    def test_chunked(self):
+        """Test values are split into bounded chunks."""
+        assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(chunked([], 2)) == []
+
+    def test_dialect_limits(self):
+        """Test each dialect reports its bound parameter limit."""
+        assert get_dialect("sqlite").max_bind_parameters((3, 31)) == 999
+        assert get_dialect("sqlite").max_bind_parameters((3, 45, 1)) == 32766
+        assert get_dialect("postgresql").max_bind_parameters(None) == 32767
+        assert get_dialect("mysql").max_bind_parameters((8, 0)) == 65535
+
+
+class TestBulkUpdateEnabled:
+    """Tests for EntryRepository.bulk_update_enabled."""
+
+    def test_updates_in_chunks(self, db_session, small_param_limit):
+        """Test one UPDATE per chunk and the affected count."""
+        ids = _create_entries(db_session, 10)
+        repo = EntryRepository(db_session)
+
+        with count_queries() as queries:
+            count = repo.bulk_update_enabled(ids + [999999, ids[0]], enabled=False)
+
+        assert count == 10
+        assert queries.count == 3  # 11 unique IDs in chunks of 4
+        db_session.expire_all()
+        assert repo.count() == 10
+        assert db_session.query(EntryModel).filter(EntryModel.enabled.is_(True)).count() == 0
+
+    def test_delete_by_ids_in_chunks(self, db_session, small_param_limit):
+        """Test bulk deletes are chunked and keep the stats rollup in sync."""
+        ids = _create_entries(db_session, 10)
+
+        assert EntryRepository(db_session).delete_by_ids(ids[:7]) == 7
+        assert EntryRepository(db_session).count() == 3
+        assert EntryStatsRepository(db_session).reconcile()["drift"] == 0
+
+
+class TestBulkCategories:
+    """Tests for bulk feed-category assignment."""
+
+    @pytest.fixture
+    def feeds_and_categories(self, db_session):
+        feed_repo = FeedRepository(db_session)
+        cat_repo = CategoryRepository(db_session)
+        feeds = [feed_repo.create(FeedCreate(url=f"https://example.com/{n}")) for n in range(6)]
+        categories = [cat_repo.create(name=f"分类{n}") for n in range(3)]
+        return [f.id for f in feeds], [c.id for c in categories]
+
+    def test_add_skips_existing_and_unknown(
+        self, db_session, feeds_and_categories, small_param_limit
+    ):
+        """Test adding links only inserts missing pairs."""
+        feed_ids, cat_ids = feeds_and_categories
+        repo = FeedRepository(db_session)
+
+        assert repo.bulk_add_categories(feed_ids[:2], cat_ids[:1]) == 2
+        assert repo.bulk_add_categories(feed_ids + [999], cat_ids[:2] + [999]) == 10
+        assert _feed_category_ids(db_session, feed_ids[0]) == set(cat_ids[:2])
+
+    def test_remove_and_set(self, db_session, feeds_and_categories, small_param_limit):
+        """Test removing and replacing categories across feeds."""
+        feed_ids, cat_ids = feeds_and_categories
+        repo = FeedRepository(db_session)
+        repo.bulk_add_categories(feed_ids, cat_ids[:2])
+
+        assert repo.bulk_remove_categories(feed_ids[:3], cat_ids[:1]) == 3
+        assert repo.bulk_set_categories(feed_ids, [cat_ids[2]]) == (6, 9)
+        assert _feed_category_ids(db_session, feed_ids[5]) == {cat_ids[2]}
+
+        assert repo.bulk_set_categories(feed_ids[:1], []) == (0, 1)
+        assert _feed_category_ids(db_session, feed_ids[0]) == set()
+
+
+class TestBatchAPI:
+    """Tests for the batch mutation endpoints."""
+
+    def test_batch_mark_read(self, client, assert_max_queries):
+        """Test mark-read updates entries without loading them one by one."""
+        db_manager = DatabaseManager(client.application.config["DB_PATH"])
+        with db_manager.session() as session:
+            ids = _create_entries(session, 50)
+
+        with assert_max_queries(1):
+            response = client.post("/api/entries/batch/mark-read", json={"ids": ids})
+
+        assert json.loads(response.data)["data"]["updated_count"] == 50
+
+    def test_batch_categories(self, client):
+        """Test assigning and replacing categories of many feeds."""
+        db_manager = DatabaseManager(client.application.config["DB_PATH"])
+        with db_manager.session() as session:
+            feed_ids = [
+                FeedRepository(session).create(FeedCreate(url=f"https://example.com/{n}")).id
+                for n in range(3)
+            ]
+            cat_ids = [CategoryRepository(session).create(name=f"批量{n}").id for n in range(2)]
+
+        response = client.post(
+            "/api/feeds/batch/categories", json={"feed_ids": feed_ids, "category_ids": cat_ids}
+        )
+        assert json.loads(response.data)["data"] == {"added_count": 6, "removed_count": 0}
+
+        response = client.post(
+            "/api/feeds/batch/categories",
+            json={"feed_ids": feed_ids, "category_ids": cat_ids[:1], "mode": "replace"},
+        )
+        assert json.loads(response.data)["data"] == {"added_count": 0, "removed_count": 3}
+
+        categories = json.loads(client.get(f"/api/feeds/{feed_ids[0]}/categories").data)["data"]
+        assert [c["id"] for c in categories] == cat_ids[:1]
+
+    @pytest.mark.parametrize(
+        "body",
+        [{"category_ids": [1]}, {"feed_ids": [1]}, {"feed_ids": [1], "mode": "toggle"}],
+    )
+    def test_batch_categories_validation(self, client, body):
+        """Test missing IDs and unknown modes are rejected."""
+        response = client.post("/api/feeds/batch/categories", json=body)
+        assert response.status_code == 400
@@ -0,0 +1,209 @@
+"""Unit tests for cross-feed story clustering."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from spider_aggregation.core.clusterer import StoryClusterer
+from spider_aggregation.core.services.clustering_service import ClusteringService
+from spider_aggregation.models import EntrySignatureModel
+from spider_aggregation.models.entry import EntryCreate
+from spider_aggregation.models.feed import FeedCreate
+from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+from spider_aggregation.utils.hash_utils import compute_link_hash, compute_title_hash
+
+STORY_CONTENT = (
+    "The central bank raised its benchmark interest rate by a quarter point on "
+    "Wednesday, the third increase this year, citing persistent inflation in housing "
+    "and services. The governor said further moves would depend on incoming data and "
+    "that the labour market remained tight. Markets had largely expected the decision, "
+    "and bond yields were little changed after the announcement."
+)
+
+OTHER_CONTENT = (
+    "A new species of tree frog was discovered in the cloud forests of the northern "
+    "highlands by a team of field biologists, who recorded its unusual whistling call "
+    "during a month-long survey of remote river valleys."
+)
+
+
+def _create_feed(db_session: Session, url: str):
+    return FeedRepository(db_session).create(FeedCreate(url=url, name=url))
+
+
+def _create_entry(db_session: Session, feed_id: int, link: str, title: str, content: str):
+    return EntryRepository(db_session).create(
+        EntryCreate(
+            feed_id=feed_id,
+            title=title,
+            link=link,
+            content=content,
+            link_hash=compute_link_hash(link),
+            title_hash=compute_title_hash(title),
+        )
+    )
+
+
+class TestStoryClusterer:
+    """Tests for StoryClusterer."""
+
+    def test_first_entry_starts_cluster(self, db_session: Session):
+        """Test an entry with no similar candidates becomes its own cluster."""
+        feed = _create_feed(db_session, "https://a.example.com/feed.xml")
+        entry = _create_entry(
+            db_session, feed.id, "https://a.example.com/1", "Central bank raises rates",
+            STORY_CONTENT,
+        )
+
+        clusterer = StoryClusterer(db_session)
+        assert clusterer.assign(entry) == entry.id
+        assert entry.cluster_id == entry.id
+        assert clusterer.get_stats()["created"] == 1
+
+    def test_related_entry_joins_cluster_across_feeds(self, db_session: Session):
+        """Test the same story from another feed joins the existing cluster."""
+        feed_a = _create_feed(db_session, "https://a.example.com/feed.xml")
+        feed_b = _create_feed(db_session, "https://b.example.com/feed.xml")
+        clusterer = StoryClusterer(db_session)
+
+        first = _create_entry(
+            db_session, feed_a.id, "https://a.example.com/1", "Central bank raises rates",
+            STORY_CONTENT,
+        )
+        clusterer.assign(first)
+
+        second = _create_entry(
+            db_session, feed_b.id, "https://b.example.com/9",
+            "Central bank lifts rates again", STORY_CONTENT + " Analysts expect one more hike.",
+        )
+        assert clusterer.assign(second) == first.id
+        assert clusterer.get_stats()["joined"] == 1
+
+    def test_unrelated_entry_not_clustered(self, db_session: Session):
+        """Test unrelated stories end up in separate clusters."""
+        feed = _create_feed(db_session, "https://a.example.com/feed.xml")
+        clusterer = StoryClusterer(db_session)
+
+        first = _create_entry(
+            db_session, feed.id, "https://a.example.com/1", "Central bank raises rates",
+            STORY_CONTENT,
+        )
+        clusterer.assign(first)
+        other = _create_entry(
+            db_session, feed.id, "https://a.example.com/2", "New tree frog discovered",
+            OTHER_CONTENT,
+        )
+
+        assert clusterer.assign(other) == other.id
+
+    def test_window_excludes_old_entries(self, db_session: Session):
+        """Test entries indexed outside the time window are not candidates."""
+        feed = _create_feed(db_session, "https://a.example.com/feed.xml")
+        clusterer = StoryClusterer(db_session, window_hours=24)
+
+        first = _create_entry(
+            db_session, feed.id, "https://a.example.com/1", "Central bank raises rates",
+            STORY_CONTENT,
+        )
+        clusterer.assign(first)
+        db_session.query(EntrySignatureModel).update(
+            {EntrySignatureModel.created_at: datetime.utcnow() - timedelta(hours=48)}
+        )
+
+        second = _create_entry(
+            db_session, feed.id, "https://a.example.com/2", "Central bank raises rates",
+            STORY_CONTENT,
+        )
+        assert clusterer.assign(second) == second.id
+
+
+class TestClusteringService:
+    """Tests for the ClusteringService facade."""
+
+    def test_failed_assign_leaves_session_usable(self, db_session: Session, monkeypatch):
+        """Test a flush error while clustering only rolls back the clustering writes."""
+        feed = _create_feed(db_session, "https://a.example.com/feed.xml")
+        entry = _create_entry(
+            db_session, feed.id, "https://a.example.com/1", "Central bank raises rates",
+            STORY_CONTENT,
+        )
+        service = ClusteringService(db_session)
+
+        def conflicting_assign(target):
+            # Violates the entry_signatures primary key at flush time
+            db_session.add(EntrySignatureModel(entry_id=target.id, feed_id=feed.id, signature="1"))
+            db_session.add(EntrySignatureModel(entry_id=target.id, feed_id=feed.id, signature="2"))
+            db_session.flush()
+
+        monkeypatch.setattr(service._clusterer, "assign", conflicting_assign)
+
+        assert service.assign(entry) is None
+        other = _create_entry(
+            db_session, feed.id, "https://a.example.com/2", "New tree frog discovered",
+            OTHER_CONTENT,
+        )
+        assert other.id is not None
+        assert db_session.query(EntrySignatureModel).count() == 0
+
+
+class TestClusteredListing:
+    """Tests for cluster-aware entry listing."""
+
+    def _create_cluster(self, db_session: Session):
+        feed_a = _create_feed(db_session, "https://a.example.com/feed.xml")
+        feed_b = _create_feed(db_session, "https://b.example.com/feed.xml")
+        clusterer = StoryClusterer(db_session)
+
+        entries = [
+            _create_entry(
+                db_session, feed_a.id, "https://a.example.com/1", "Central bank raises rates",
+                STORY_CONTENT,
+            ),
+            _create_entry(
+                db_session, feed_b.id, "https://b.example.com/1", "Central bank raises rates",
+                STORY_CONTENT + " Update follows.",
+            ),
+            _create_entry(
+                db_session, feed_b.id, "https://b.example.com/2", "New tree frog discovered",
+                OTHER_CONTENT,
+            ),
+        ]
+        for entry in entries:
+            clusterer.assign(entry)
+        return entries
+
+    def test_collapse_clusters_lists_representatives(self, db_session: Session):
+        """Test collapsed listing returns one entry per cluster."""
+        first, _, other = self._create_cluster(db_session)
+        repo = EntryRepository(db_session)
+
+        assert repo.count() == 3
+        assert repo.count(collapse_clusters=True) == 2
+        listed = repo.list(collapse_clusters=True, order_by="id", order_desc=False)
+        assert [e.id for e in listed] == [first.id, other.id]
+        assert repo.get_cluster_sizes([first.id, other.id]) == {first.id: 2, other.id: 1}
+
+    def test_collapse_within_feed_keeps_members_of_outside_clusters(self, db_session: Session):
+        """Test a feed's member is listed when its cluster's first entry is in another feed."""
+        first, second, other = self._create_cluster(db_session)
+        repo = EntryRepository(db_session)
+
+        assert second.cluster_id == first.id
+        listed = repo.list(
+            feed_id=second.feed_id, collapse_clusters=True, order_by="id", order_desc=False
+        )
+        assert [e.id for e in listed] == [second.id, other.id]
+        assert repo.count(feed_id=second.feed_id, collapse_clusters=True) == 2
+        assert repo.count(feed_id=first.feed_id, collapse_clusters=True) == 1
+
+    def test_deleting_representative_releases_members(self, db_session: Session):
+        """Test members stay visible when the representative is deleted."""
+        first, second, _ = self._create_cluster(db_session)
+        repo = EntryRepository(db_session)
+
+        repo.delete_by_ids([first.id])
+        db_session.expire_all()
+
+        assert repo.count(collapse_clusters=True) == 2
+        assert repo.get_by_id(second.id).cluster_id is None
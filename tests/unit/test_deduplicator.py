@@ -17,10 +17,16 @@ from spider_aggregation.storage.repositories.feed_repo import FeedRepository
 from spider_aggregation.utils.hash_utils import (
     compute_content_hash,
     compute_link_hash,
+    compute_lsh_bands,
     compute_md5_hash,
+    compute_minhash_signature,
     compute_sha256_hash,
+    compute_shingles,
     compute_similarity_hash,
     compute_title_hash,
+    decode_minhash_signature,
+    encode_minhash_signature,
+    estimate_jaccard,
 )
 
 
@@ -150,6 +156,46 @@ class TestHashUtils:
         assert compute_similarity_hash("") is None
         assert compute_similarity_hash(None) is None
 
+    def test_compute_shingles(self):
+        """Test word and CJK character shingling."""
+        assert compute_shingles("The quick brown fox") == {"the quick brown", "quick brown fox"}
+        assert compute_shingles("Hi there") == {"hi there"}
+        assert "中 文 测" in compute_shingles("中文测试")
+        assert compute_shingles("") == set()
+        assert compute_shingles(None) == set()
+
+    def test_compute_minhash_signature(self):
+        """Test MinHash signature estimates Jaccard similarity."""
+        text = "Apple announces the new phone with a faster chip and a better camera at its event"
+        signature = compute_minhash_signature(text, num_perm=64)
+
+        assert len(signature) == 64
+        # Deterministic across calls
+        assert signature == compute_minhash_signature(text, num_perm=64)
+
+        similar = compute_minhash_signature(text + " via Reuters", num_perm=64)
+        different = compute_minhash_signature("Rust compiler release notes", num_perm=64)
+
+        assert estimate_jaccard(signature, similar) > 0.7
+        assert estimate_jaccard(signature, different) < 0.2
+        assert compute_minhash_signature("") is None
+
+    def test_compute_lsh_bands(self):
+        """Test LSH band keys from a signature."""
+        signature = compute_minhash_signature("one two three four five six", num_perm=64)
+        bands = compute_lsh_bands(signature, bands=16)
+
+        assert len(bands) == 16
+        assert bands == compute_lsh_bands(list(signature), bands=16)
+
+        with pytest.raises(ValueError):
+            compute_lsh_bands(signature, bands=10)
+
+    def test_signature_encoding_roundtrip(self):
+        """Test signature hex encoding."""
+        signature = compute_minhash_signature("encode this signature please", num_perm=32)
+        assert decode_minhash_signature(encode_minhash_signature(signature)) == signature
+
 
 class TestDeduplicator:
     """Tests for Deduplicator."""
@@ -920,3 +966,195 @@ class TestDeduplicatorExtended:
 
             # Should NOT match (title checking disabled, link is different)
             assert result.is_duplicate is False
+
+
+class TestNearDuplicateStrategy:
+    """Tests for the MinHash LSH near-duplicate strategy."""
+
+    BASE_CONTENT = (
+        "The city council approved a new transit plan on Tuesday that adds three bus "
+        "rapid transit lines, extends light rail service to the airport and funds "
+        "protected bike lanes across downtown over the next five years. Officials said "
+        "the first construction contracts will be awarded this spring, with the airport "
+        "extension expected to open before the end of the decade. Residents who spoke at "
+        "the meeting mostly supported the plan but asked for more frequent night service."
+    )
+
+    def _create_indexed_entry(self, db_session: Session, dedup: Deduplicator, feed_id: int):
+        """Create an entry and add it to the near-duplicate index."""
+        from spider_aggregation.models.entry import EntryCreate
+        from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+
+        entry = EntryRepository(db_session).create(
+            EntryCreate(
+                feed_id=feed_id,
+                title="City council approves new transit plan",
+                link="https://example.com/transit",
+                content=self.BASE_CONTENT,
+                link_hash=compute_link_hash("https://example.com/transit"),
+                title_hash=compute_title_hash("City council approves new transit plan"),
+            )
+        )
+        assert dedup.index_entry(entry) is True
+        return entry
+
+    def _create_feed(self, db_session: Session, url: str):
+        from spider_aggregation.models.feed import FeedCreate
+
+        return FeedRepository(db_session).create(FeedCreate(url=url, name=url))
+
+    def test_near_duplicate_detected(self, db_session: Session):
+        """Test a rewritten title with a tracking snippet is caught."""
+        feed = self._create_feed(db_session, "https://example.com/feed.xml")
+        dedup = Deduplicator(session=db_session, strategy=DedupStrategy.NEAR_DUPLICATE)
+        existing = self._create_indexed_entry(db_session, dedup, feed.id)
+
+        entry = {
+            "title": "City council approves new transit plan (updated)",
+            "link": "https://example.com/transit?id=2",
+            "content": self.BASE_CONTENT + " Read more at example.com",
+        }
+        result = dedup.check_duplicate(entry, feed_id=feed.id)
+
+        assert result.is_duplicate is True
+        assert "Near duplicate" in result.reason
+        assert result.existing_entry.id == existing.id
+        assert result.similarity >= dedup.similarity_threshold
+        assert dedup.get_stats()["near_duplicate_matches"] == 1
+
+    def test_unrelated_entry_not_duplicate(self, db_session: Session):
+        """Test unrelated content passes the near-duplicate check."""
+        feed = self._create_feed(db_session, "https://example.com/feed.xml")
+        dedup = Deduplicator(session=db_session, strategy=DedupStrategy.NEAR_DUPLICATE)
+        self._create_indexed_entry(db_session, dedup, feed.id)
+
+        entry = {
+            "title": "Local team wins championship",
+            "link": "https://example.com/sports",
+            "content": "The home team won the final game in overtime after a late goal.",
+        }
+        result = dedup.check_duplicate(entry, feed_id=feed.id)
+
+        assert result.is_duplicate is False
+
+    def test_threshold_respected(self, db_session: Session):
+        """Test matches below title_similarity_threshold are rejected."""
+        feed = self._create_feed(db_session, "https://example.com/feed.xml")
+        dedup = Deduplicator(session=db_session, strategy=DedupStrategy.NEAR_DUPLICATE)
+        self._create_indexed_entry(db_session, dedup, feed.id)
+
+        entry = {
+            "title": "City council approves new transit plan (updated)",
+            "link": "https://example.com/transit?id=2",
+            "content": self.BASE_CONTENT + " Read more at example.com",
+        }
+        with patch.object(dedup, "similarity_threshold", 1.0):
+            assert dedup.check_duplicate(entry, feed_id=feed.id).is_duplicate is False
+
+    def test_near_duplicate_across_feeds(self, db_session: Session):
+        """Test a syndicated copy in another feed is caught on ingest."""
+        feed_a = self._create_feed(db_session, "https://a.example.com/feed.xml")
+        feed_b = self._create_feed(db_session, "https://b.example.com/feed.xml")
+        dedup = Deduplicator(session=db_session, strategy=DedupStrategy.NEAR_DUPLICATE)
+        existing = self._create_indexed_entry(db_session, dedup, feed_a.id)
+
+        entry = {
+            "title": "Council approves new transit plan",
+            "link": "https://b.example.com/story",
+            "content": self.BASE_CONTENT,
+        }
+
+        result = dedup.check_duplicate(entry, feed_id=feed_b.id)
+        assert result.is_duplicate is True
+        assert result.existing_entry.id == existing.id
+
+        result = dedup.check_duplicate_across_feeds(entry)
+        assert result.is_duplicate is True
+        assert result.existing_entry.id == existing.id
+
+    def test_near_duplicate_scope_can_be_one_feed(self, db_session: Session):
+        """Test near_duplicate_across_feeds=False limits the probe to the feed."""
+        feed_a = self._create_feed(db_session, "https://a.example.com/feed.xml")
+        feed_b = self._create_feed(db_session, "https://b.example.com/feed.xml")
+        dedup = Deduplicator(session=db_session, strategy=DedupStrategy.NEAR_DUPLICATE)
+        self._create_indexed_entry(db_session, dedup, feed_a.id)
+
+        entry = {
+            "title": "Council approves new transit plan",
+            "link": "https://b.example.com/story",
+            "content": self.BASE_CONTENT,
+        }
+        with patch.object(dedup, "near_duplicate_across_feeds", False):
+            assert dedup.check_duplicate(entry, feed_id=feed_b.id).is_duplicate is False
+            assert dedup.check_duplicate(entry, feed_id=feed_a.id).is_duplicate is True
+
+    def test_index_entry_other_strategy_is_noop(self, db_session: Session):
+        """Test entries are only indexed for the near-duplicate strategy."""
+        from spider_aggregation.models.entry import EntryCreate
+        from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+        from spider_aggregation.storage.repositories.signature_repo import (
+            EntrySignatureRepository,
+        )
+
+        feed = self._create_feed(db_session, "https://example.com/feed.xml")
+        entry = EntryRepository(db_session).create(
+            EntryCreate(
+                feed_id=feed.id,
+                title="Title",
+                link="https://example.com/a",
+                content=self.BASE_CONTENT,
+                link_hash=compute_link_hash("https://example.com/a"),
+                title_hash=compute_title_hash("Title"),
+            )
+        )
+
+        dedup = Deduplicator(session=db_session, strategy=DedupStrategy.MEDIUM)
+        assert dedup.index_entry(entry) is False
+        assert EntrySignatureRepository(db_session).get(entry.id) is None
+
+    def test_deleting_entry_removes_index_rows(self, db_session: Session):
+        """Test index rows are removed with their entry."""
+        from spider_aggregation.models import EntryLSHBandModel
+        from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+
+        feed = self._create_feed(db_session, "https://example.com/feed.xml")
+        dedup = Deduplicator(session=db_session, strategy=DedupStrategy.NEAR_DUPLICATE)
+        existing = self._create_indexed_entry(db_session, dedup, feed.id)
+
+        assert db_session.query(EntryLSHBandModel).count() == dedup.lsh_bands
+
+        EntryRepository(db_session).delete_by_ids([existing.id])
+
+        assert db_session.query(EntryLSHBandModel).count() == 0
+
+    def test_candidates_ranked_by_shared_bands(self, db_session: Session):
+        """Test the candidate limit keeps the entries sharing the most bands."""
+        from spider_aggregation.models.entry import EntryCreate
+        from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+        from spider_aggregation.storage.repositories.signature_repo import (
+            EntrySignatureRepository,
+        )
+
+        feed = self._create_feed(db_session, "https://example.com/feed.xml")
+        entry_repo = EntryRepository(db_session)
+        signature_repo = EntrySignatureRepository(db_session)
+        bands = [f"band-{n}" for n in range(8)]
+        entry_ids = []
+        for n in range(4):
+            link = f"https://example.com/{n}"
+            entry = entry_repo.create(
+                EntryCreate(
+                    feed_id=feed.id,
+                    title=f"Entry {n}",
+                    link=link,
+                    link_hash=compute_link_hash(link),
+                    title_hash=compute_title_hash(f"Entry {n}"),
+                )
+            )
+            # The oldest entry shares every band, newer ones a single crowded band
+            signature_repo.save(entry.id, feed.id, [n], bands if n == 0 else bands[:1])
+            entry_ids.append(entry.id)
+
+        candidates = signature_repo.find_candidates(bands, limit=2)
+
+        assert [candidate[0] for candidate in candidates] == [entry_ids[0], entry_ids[3]]
@@ -3,6 +3,7 @@
 import pytest
 
 from spider_aggregation.config import DatabaseConfig
+from spider_aggregation.storage.database import DatabaseManager
 from spider_aggregation.storage.dialects import (
     BaseDialect,
     MySQLDialect,
@@ -128,6 +129,44 @@ class TestSQLiteDialect:
         dialect = SQLiteDialect()
         assert dialect.supports_json is True
 
+    @pytest.mark.parametrize(
+        "profile,synchronous,temp_store",
+        [("durable", 2, 0), ("balanced", 1, 2), ("throughput", 0, 2)],
+    )
+    def test_profile_applied_on_connect(self, tmp_path, profile, synchronous, temp_store):
+        """Test the configured profile's PRAGMAs are set on every connection."""
+        config = DatabaseConfig(path=str(tmp_path / "profile.db"), sqlite_profile=profile)
+        with DatabaseManager(db_config=config) as db_manager:
+            with db_manager.engine.connect() as conn:
+
+                def pragma(name):
+                    return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+                assert pragma("journal_mode") == "wal"
+                assert pragma("foreign_keys") == 1
+                assert pragma("synchronous") == synchronous
+                assert pragma("temp_store") == temp_store
+
+    def test_run_maintenance_truncates_wal(self, tmp_path):
+        """Test maintenance checkpoints the WAL back to zero bytes."""
+        path = tmp_path / "maintenance.db"
+        with DatabaseManager(str(path)) as db_manager:
+            db_manager.init_db()
+            wal = path.with_name(path.name + "-wal")
+            assert wal.stat().st_size > 0
+
+            result = SQLiteDialect().run_maintenance(db_manager.engine)
+
+            assert result["busy"] == 0
+            assert wal.stat().st_size == 0
+
+    def test_supports_window_functions(self):
+        """Test window function support depends on the SQLite version."""
+        dialect = SQLiteDialect()
+        assert dialect.supports_window_functions((3, 45, 1)) is True
+        assert dialect.supports_window_functions((3, 24, 0)) is False
+        assert dialect.supports_window_functions(None) is False
+
     def test_supports_array(self):
         """Test ARRAY support."""
         dialect = SQLiteDialect()
@@ -246,6 +285,11 @@ class TestPostgreSQLDialect:
         dialect = PostgreSQLDialect()
         assert dialect.supports_json is True
 
+    def test_supports_window_functions(self):
+        """Test window function support."""
+        dialect = PostgreSQLDialect()
+        assert dialect.supports_window_functions((16, 2)) is True
+
     def test_supports_array(self):
         """Test ARRAY support."""
         dialect = PostgreSQLDialect()
@@ -330,6 +374,12 @@ class TestMySQLDialect:
         dialect = MySQLDialect()
         assert dialect.supports_json is True
 
+    def test_supports_window_functions(self):
+        """Test window function support requires MySQL 8.0."""
+        dialect = MySQLDialect()
+        assert dialect.supports_window_functions((8, 0, 36)) is True
+        assert dialect.supports_window_functions((5, 7, 44)) is False
+
     def test_supports_array(self):
         """Test ARRAY support."""
         dialect = MySQLDialect()
@@ -364,6 +414,16 @@ class TestDatabaseConfig:
         with pytest.raises(ValueError, match="Invalid database type"):
             DatabaseConfig(type="oracle")
 
+    def test_sqlite_profile_defaults_to_durable(self):
+        """Test SQLite keeps synchronous=FULL unless a faster profile is chosen."""
+        assert DatabaseConfig().sqlite_profile == "durable"
+
+    def test_sqlite_profile_validation(self):
+        """Test unknown SQLite profiles are rejected."""
+        assert DatabaseConfig(sqlite_profile="Throughput").sqlite_profile == "throughput"
+        with pytest.raises(ValueError, match="Invalid SQLite profile"):
+            DatabaseConfig(sqlite_profile="turbo")
+
     def test_port_validation(self):
         """Test port validation."""
         with pytest.raises(ValueError, match="Port must be between"):
@@ -0,0 +1,163 @@
+"""Unit tests for digest entry collection."""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from spider_aggregation.application.digest_service import DigestService
+from spider_aggregation.models.entry import EntryCreate
+from spider_aggregation.models.feed import FeedCreate, FeedUpdate
+from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+from spider_aggregation.utils.hash_utils import compute_link_hash, compute_title_hash
+from tests.fixtures.llm import FakeLLMClient
+
+
+def _create_entry(repo: EntryRepository, feed_id: int, n: int, hours_ago: float, **kwargs):
+    link = f"https://example.com/{feed_id}/{n}"
+    return repo.create(
+        EntryCreate(
+            feed_id=feed_id,
+            title=f"Feed {feed_id} entry {n}",
+            link=link,
+            published_at=datetime.utcnow() - timedelta(hours=hours_ago),
+            link_hash=compute_link_hash(link),
+            title_hash=compute_title_hash(f"Feed {feed_id} entry {n}"),
+            **kwargs,
+        )
+    )
+
+
+@pytest.fixture
+def digest_data(db_session: Session):
+    """Create two enabled feeds and one disabled feed with entries."""
+    feed_repo = FeedRepository(db_session)
+    entry_repo = EntryRepository(db_session)
+
+    feeds = [
+        feed_repo.create(FeedCreate(url=f"https://example.com/{i}/feed", name=f"Feed {i}"))
+        for i in range(3)
+    ]
+    feed_repo.update(feeds[2], FeedUpdate(enabled=False))
+
+    for feed in feeds:
+        for n in range(4):
+            _create_entry(entry_repo, feed.id, n, hours_ago=n + 1, summary=f"Summary {n}")
+        # Too old for the digest window
+        _create_entry(entry_repo, feed.id, 99, hours_ago=100)
+
+    return feeds
+
+
+class TestCollectEntries:
+    """Tests for DigestService._collect_entries."""
+
+    @pytest.mark.parametrize("window_functions", [True, False])
+    def test_latest_entries_per_enabled_feed(
+        self, db_session: Session, digest_data, window_functions: bool
+    ):
+        """Test both the ranked query and the per-feed fallback."""
+        service = DigestService(db_session, entries_per_feed=2, max_age_hours=24)
+
+        with patch.object(
+            EntryRepository, "_supports_window_functions", return_value=window_functions
+        ):
+            feed_entries = service._collect_entries()
+
+        assert {fe.feed.id for fe in feed_entries} == {digest_data[0].id, digest_data[1].id}
+        for fe in feed_entries:
+            assert [e.title for e in fe.entries] == [
+                f"Feed {fe.feed.id} entry 0",
+                f"Feed {fe.feed.id} entry 1",
+            ]
+            assert fe.entries[0].excerpt == "Summary 0"
+
+    def test_single_entries_query(self, db_session: Session, digest_data):
+        """Test entry collection does not issue one query per feed."""
+        service = DigestService(db_session, entries_per_feed=2, max_age_hours=24)
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            service._collect_entries()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        entry_queries = [s for s in statements if "FROM entries" in s]
+        assert len(entry_queries) == 1
+        assert "row_number()" in entry_queries[0].lower()
+
+    def test_excerpt_truncated(self, db_session: Session):
+        """Test long content is cut to the excerpt length plus one character."""
+        feed = FeedRepository(db_session).create(FeedCreate(url="https://example.com/feed"))
+        _create_entry(EntryRepository(db_session), feed.id, 1, hours_ago=1, content="x" * 5000)
+
+        feed_entries = DigestService(db_session, max_age_hours=24)._collect_entries()
+
+        excerpt = feed_entries[0].entries[0].excerpt
+        assert len(excerpt) == DigestService.EXCERPT_LENGTH + 1
+
+    def test_story_clusters_collapsed(self, db_session: Session):
+        """Test entries of the same story cluster appear once across feeds."""
+        feed_repo = FeedRepository(db_session)
+        entry_repo = EntryRepository(db_session)
+        feed_a = feed_repo.create(FeedCreate(url="https://a.example.com/feed"))
+        feed_b = feed_repo.create(FeedCreate(url="https://b.example.com/feed"))
+
+        first = _create_entry(entry_repo, feed_a.id, 1, hours_ago=1)
+        second = _create_entry(entry_repo, feed_b.id, 1, hours_ago=2)
+        first.cluster_id = first.id
+        second.cluster_id = first.id
+        db_session.flush()
+
+        feed_entries = DigestService(db_session, max_age_hours=24)._collect_entries()
+
+        entries = [e for fe in feed_entries for e in fe.entries]
+        assert len(entries) == 1
+        assert entries[0].cluster_id == first.id
+        assert feed_entries[0].cluster_sizes == {entries[0].id: 2}
+        prompt = DigestService(db_session)._build_aggregation_prompt(feed_entries)
+        assert "相关报道: 2 篇" in prompt
+
+
+class TestGenerateSummary:
+    """Tests for DigestService._generate_summary."""
+
+    def test_large_digest_uses_map_reduce(self, db_session: Session, monkeypatch):
+        """Test a digest over the token budget is summarized in chunks."""
+        feed_repo = FeedRepository(db_session)
+        entry_repo = EntryRepository(db_session)
+        for i in range(10):
+            feed = feed_repo.create(FeedCreate(url=f"https://example.com/{i}/feed"))
+            for n in range(2):
+                _create_entry(entry_repo, feed.id, n, hours_ago=1, content="内容" * 400)
+
+        client = FakeLLMClient(responder=lambda prompt, system: "分段总结")
+        service = DigestService(db_session, llm_client=client, max_age_hours=24)
+        monkeypatch.setattr(service.config.llm, "enabled", True)
+        monkeypatch.setattr(service.digest_config, "token_budget", 3000)
+
+        response = service._generate_summary(service._collect_entries())
+
+        assert response.success is True
+        assert len(client.calls) > 2
+        assert client.calls[-1][1] == DigestService.AGGREGATION_SYSTEM_PROMPT
+
+    def test_small_digest_single_call(self, db_session: Session, digest_data, monkeypatch):
+        """Test a digest within the budget is summarized in one call."""
+        client = FakeLLMClient()
+        service = DigestService(db_session, llm_client=client, max_age_hours=24)
+        monkeypatch.setattr(service.config.llm, "enabled", True)
+
+        response = service._generate_summary(service._collect_entries())
+
+        assert response.success is True
+        assert len(client.calls) == 1
+        assert client.calls[0][0].startswith("请将以下RSS订阅文章进行聚合总结")
@@ -0,0 +1,184 @@
+"""Unit tests for token-budgeted map-reduce digest summarization."""
+
+import threading
+import time
+
+import pytest
+
+from spider_aggregation.application.digest_summarizer import MapReduceSummarizer
+from spider_aggregation.core.llm_client import (
+    LLMClientFactory,
+    estimate_tokens,
+    truncate_to_tokens,
+)
+from tests.fixtures.llm import FakeLLMClient
+
+
+def _sections(count: int, size: int = 400) -> list[str]:
+    return [f"### Article {i}\n" + "word " * size for i in range(count)]
+
+
+class TestTokenEstimation:
+    """Tests for the local token estimator."""
+
+    def test_estimate_tokens(self):
+        """Test CJK characters count as one token and other text as a quarter."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcdefgh") == 2
+        assert estimate_tokens("聚合总结") == 4
+        assert estimate_tokens("总结 abcd") == 2 + 2
+
+    def test_truncate_to_tokens(self):
+        """Test truncated text fits the budget and is marked."""
+        text = "word " * 1000
+        truncated = truncate_to_tokens(text, 100)
+
+        assert estimate_tokens(truncated) <= 100
+        assert truncated.endswith("...")
+        assert truncate_to_tokens("short", 100) == "short"
+
+
+class TestFakeLLMClient:
+    """Tests for the offline LLM client."""
+
+    def test_records_calls(self):
+        """Test calls are recorded and answered deterministically."""
+        client = FakeLLMClient(responder=lambda prompt, system: f"summary of {len(prompt)}")
+
+        response = client.chat("hello", system_prompt="system")
+
+        assert response.success is True
+        assert response.content == "summary of 5"
+        assert client.calls == [("hello", "system")]
+
+    def test_not_a_configurable_provider(self):
+        """Test the test double cannot be selected from configuration."""
+        with pytest.raises(ValueError, match="Unknown provider"):
+            LLMClientFactory.create(provider="fake", api_key="key")
+        with pytest.raises(ValueError, match="API key is required"):
+            LLMClientFactory.create(provider="fake", api_key="")
+
+
+class TestMapReduceSummarizer:
+    """Tests for MapReduceSummarizer."""
+
+    def test_pack_respects_budget(self):
+        """Test chunks stay under the budget and keep section order."""
+        sections = _sections(10, size=100)
+        chunks = MapReduceSummarizer.pack(sections, budget=300)
+
+        assert [s for chunk in chunks for s in chunk] == sections
+        for chunk in chunks:
+            assert sum(estimate_tokens(s) + 1 for s in chunk) <= 300
+
+    def test_pack_truncates_oversized_section(self):
+        """Test a section larger than the budget gets its own truncated chunk."""
+        chunks = MapReduceSummarizer.pack(["small", "word " * 2000, "small"], budget=200)
+
+        assert len(chunks) == 3
+        assert estimate_tokens(chunks[1][0]) <= 200
+
+    def test_single_call_within_budget(self):
+        """Test small inputs are summarized in one call with the final prompt."""
+        client = FakeLLMClient()
+        summarizer = MapReduceSummarizer(client, system_prompt="final", token_budget=6000)
+
+        response = summarizer.summarize(_sections(3, size=10), single_prompt="the prompt")
+
+        assert response.success is True
+        assert client.calls == [("the prompt", "final")]
+
+    def test_map_reduce(self):
+        """Test large inputs are split into chunks and merged in a final call."""
+        client = FakeLLMClient(responder=lambda prompt, system: "partial")
+        summarizer = MapReduceSummarizer(client, system_prompt="final", token_budget=1000)
+        sections = _sections(20)
+
+        response = summarizer.summarize(sections)
+
+        assert response.success is True
+        map_calls = [c for c in client.calls if c[1] == MapReduceSummarizer.MAP_SYSTEM_PROMPT]
+        assert len(map_calls) > 1
+        assert client.calls[-1][1] == "final"
+        for prompt, system in client.calls:
+            assert estimate_tokens(prompt) + estimate_tokens(system) <= 1000
+        # Every article reached a chunk prompt
+        for i in range(20):
+            assert any(f"### Article {i}\n" in prompt for prompt, _ in map_calls)
+        assert response.tokens_used == sum(
+            estimate_tokens(prompt) + estimate_tokens("partial") for prompt, _ in client.calls
+        )
+
+    def test_concurrency_limit(self):
+        """Test chunk summaries run in parallel up to the concurrency limit."""
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def responder(prompt, system):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+            return "partial"
+
+        client = FakeLLMClient(responder=responder)
+        summarizer = MapReduceSummarizer(
+            client, system_prompt="final", token_budget=1000, max_concurrency=3
+        )
+
+        assert summarizer.summarize(_sections(20)).success is True
+        assert max(peak) == 3
+
+    def test_hierarchical_reduce(self):
+        """Test partial summaries too large for one call are merged in rounds."""
+        client = FakeLLMClient(responder=lambda prompt, system: "summary " * 150)
+        summarizer = MapReduceSummarizer(client, system_prompt="final", token_budget=800)
+
+        response = summarizer.summarize(_sections(30))
+
+        assert response.success is True
+        assert client.calls[-1][1] == "final"
+        merge_calls = [c for c in client.calls if "分段总结（" in c[0]]
+        assert merge_calls
+        for prompt, system in client.calls:
+            assert estimate_tokens(prompt) + estimate_tokens(system) <= 800
+
+    def test_failed_chunk_skipped(self):
+        """Test one failing chunk does not fail the whole summary."""
+
+        def responder(prompt, system):
+            if "### Article 0\n" in prompt:
+                raise RuntimeError("timeout")
+            return "partial"
+
+        client = FakeLLMClient(responder=responder)
+        summarizer = MapReduceSummarizer(client, system_prompt="final", token_budget=1000)
+
+        response = summarizer.summarize(_sections(20))
+
+        assert response.success is True
+
+    def test_all_chunks_failed(self):
+        """Test the summary fails when no chunk succeeds."""
+
+        def responder(prompt, system):
+            raise RuntimeError("timeout")
+
+        client = FakeLLMClient(responder=responder)
+        summarizer = MapReduceSummarizer(client, system_prompt="final", token_budget=1000)
+
+        response = summarizer.summarize(_sections(20))
+
+        assert response.success is False
+        assert response.error == "timeout"
+
+    def test_empty_input(self):
+        """Test empty input is rejected without any call."""
+        client = FakeLLMClient()
+        summarizer = MapReduceSummarizer(client, system_prompt="final")
+
+        assert summarizer.summarize([]).success is False
+        assert client.calls == []
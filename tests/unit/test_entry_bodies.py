@@ -0,0 +1,216 @@
+"""Unit tests for compressed entry bodies."""
+
+import json
+
+import pytest
+from sqlalchemy import select, text
+
+from spider_aggregation.config import DatabaseConfig, get_config
+from spider_aggregation.models import EntryBodyModel, EntryModel
+from spider_aggregation.models.entry import EntryCreate, EntryUpdate
+from spider_aggregation.models.feed import FeedCreate
+from spider_aggregation.storage.repositories.body_repo import EntryBodyRepository
+from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+from spider_aggregation.utils.compression import (
+    ZSTD_AVAILABLE,
+    compress_text,
+    decompress_text,
+    resolve_codec,
+)
+from spider_aggregation.utils.hash_utils import compute_link_hash, compute_title_hash
+
+ARTICLE = "正文内容 with a searchable needle. " + "Repeated article text. " * 200
+
+
+def _create_entry(session, n: int = 0, content=ARTICLE, summary=None) -> EntryModel:
+    feed = FeedRepository(session).get_by_url("https://example.com/feed")
+    if feed is None:
+        feed = FeedRepository(session).create(FeedCreate(url="https://example.com/feed"))
+    link = f"https://example.com/{n}"
+    return EntryRepository(session).create(
+        EntryCreate(
+            feed_id=feed.id,
+            title=f"Entry {n}",
+            link=link,
+            summary=summary,
+            content=content,
+            link_hash=compute_link_hash(link),
+            title_hash=compute_title_hash(f"Entry {n}"),
+        )
+    )
+
+
+class TestCompression:
+    """Tests for the body codecs."""
+
+    @pytest.mark.parametrize("codec", ["none", "zlib", "zstd"])
+    def test_round_trip(self, codec):
+        """Test text survives compression with every available codec."""
+        codec = resolve_codec(codec)
+        data = compress_text(ARTICLE, codec)
+
+        assert decompress_text(codec, data) == ARTICLE
+        if codec != "none":
+            assert len(data) < len(ARTICLE.encode("utf-8")) / 5
+
+    def test_zstd_falls_back_to_zlib(self):
+        """Test zstd resolves to zlib where compression.zstd is missing."""
+        assert resolve_codec("zstd") == ("zstd" if ZSTD_AVAILABLE else "zlib")
+        assert resolve_codec("none") == "none"
+
+    def test_default_codec_per_database(self):
+        """Test bodies are compressed by default only on SQLite."""
+        assert DatabaseConfig().body_codec == "zlib"
+        assert DatabaseConfig(type="postgresql").body_codec == "none"
+        assert DatabaseConfig(type="mysql").body_codec == "none"
+
+    def test_unknown_codec(self):
+        """Test unknown codecs are rejected."""
+        with pytest.raises(ValueError):
+            compress_text("text", "lz4")
+        with pytest.raises(ValueError):
+            decompress_text("lz4", b"text")
+
+    def test_config_validation(self):
+        """Test the configured codec is normalized and validated."""
+        assert DatabaseConfig(body_codec=" ZSTD ").body_codec == "zstd"
+        assert DatabaseConfig(type="postgresql", body_codec="none").body_codec == "none"
+        with pytest.raises(ValueError):
+            DatabaseConfig(body_codec="lz4")
+
+    @pytest.mark.parametrize("codec", ["zlib", "zstd"])
+    def test_compression_requires_sqlite(self, codec):
+        """Test compressed codecs are rejected where SQL cannot read them."""
+        with pytest.raises(ValueError, match="requires SQLite"):
+            DatabaseConfig(type="postgresql", body_codec=codec)
+        with pytest.raises(ValueError, match="requires SQLite"):
+            DatabaseConfig(type="mysql", body_codec=codec)
+
+
+class TestEntryBodies:
+    """Tests for storing entry content in entry_bodies."""
+
+    def test_content_stored_compressed(self, db_session):
+        """Test content is written compressed to entry_bodies, not to entries."""
+        entry = _create_entry(db_session)
+
+        row = db_session.execute(
+            text("SELECT codec, size, data FROM entry_bodies WHERE entry_id = :id"),
+            {"id": entry.id},
+        ).one()
+        columns = [r[1] for r in db_session.execute(text("PRAGMA table_info(entries)"))]
+
+        assert "content" not in columns
+        assert row.codec == "zlib"
+        assert row.size == len(ARTICLE.encode("utf-8"))
+        assert len(row.data) < row.size
+        assert decompress_text(row.codec, row.data) == ARTICLE
+
+    def test_configured_codec(self, db_session, monkeypatch):
+        """Test new bodies use the configured codec."""
+        monkeypatch.setattr(get_config().database, "body_codec", "none")
+
+        entry = _create_entry(db_session)
+
+        assert entry.body.codec == "none"
+        assert entry.body.data == ARTICLE.encode("utf-8")
+
+    def test_content_loaded_lazily(self, db_session):
+        """Test loading an entry does not load its body until content is read."""
+        entry_id = _create_entry(db_session).id
+        db_session.expunge_all()
+
+        entry = db_session.get(EntryModel, entry_id)
+
+        assert "body" not in entry.__dict__
+        assert entry.content == ARTICLE
+
+    def test_update_and_clear_content(self, db_session):
+        """Test content updates rewrite the body and None removes it."""
+        repo = EntryRepository(db_session)
+        entry = _create_entry(db_session)
+
+        repo.update(entry, EntryUpdate(content="新的正文"))
+        db_session.expunge_all()
+        entry = db_session.get(EntryModel, entry.id)
+        assert entry.content == "新的正文"
+        assert entry.body.size == len("新的正文".encode("utf-8"))
+
+        entry.content = None
+        db_session.flush()
+        assert db_session.scalar(select(EntryBodyModel).filter_by(entry_id=entry.id)) is None
+
+        no_body = _create_entry(db_session, 1, content=None)
+        assert no_body.body is None
+        assert no_body.content is None
+
+    def test_bodies_deleted_with_entries(self, db_session):
+        """Test bulk entry deletes cascade to entry_bodies."""
+        repo = EntryRepository(db_session)
+        ids = [_create_entry(db_session, n).id for n in range(3)]
+
+        repo.delete_by_ids(ids[:2])
+
+        remaining = db_session.scalars(select(EntryBodyModel.entry_id)).all()
+        assert remaining == [ids[2]]
+
+    def test_search_matches_compressed_content(self, db_session):
+        """Test search still finds words that only appear in the content."""
+        repo = EntryRepository(db_session)
+        entry = _create_entry(db_session)
+        _create_entry(db_session, 1, content="unrelated")
+
+        assert [e.id for e in repo.search("searchable needle")] == [entry.id]
+        assert [e.id for e in repo.search("Entry 1")] != []
+        assert repo.search("missing words") == []
+
+    def test_export_and_texts_include_content(self, db_session):
+        """Test export rows and batch texts carry the decompressed content."""
+        repo = EntryRepository(db_session)
+        entry = _create_entry(db_session)
+        empty = _create_entry(db_session, 1, content=None)
+
+        rows = {row.id: row for row in repo.iter_for_export()}
+        texts = {row.id: row for row in repo.get_texts([entry.id, empty.id, 9999])}
+
+        assert rows[entry.id].content == ARTICLE
+        assert rows[empty.id].content is None
+        assert rows[entry.id]._fields == EntryRepository.EXPORT_COLUMNS
+        assert texts[entry.id].content == ARTICLE
+        assert texts.keys() == {entry.id, empty.id}
+
+    def test_excerpt_falls_back_to_content(self, db_session):
+        """Test digest excerpts use the content of entries without a summary."""
+        repo = EntryRepository(db_session)
+        _create_entry(db_session)
+        _create_entry(db_session, 1, summary="Short summary")
+
+        excerpts = {
+            row.title: row.excerpt
+            for row in repo.iter_latest_per_feed(per_feed=5, excerpt_length=20)
+        }
+
+        assert excerpts == {"Entry 0": ARTICLE[:21], "Entry 1": "Short summary"}
+
+    def test_size_report(self, db_session):
+        """Test the size report sums text and stored bytes per codec."""
+        for n in range(2):
+            _create_entry(db_session, n)
+
+        report = EntryBodyRepository(db_session).size_report()
+
+        assert report["bodies"] == 2
+        assert report["codecs"] == {"zlib": 2}
+        assert report["text_bytes"] == 2 * len(ARTICLE.encode("utf-8"))
+        assert 0 < report["stored_bytes"] < report["text_bytes"]
+        assert report["ratio"] == round(report["stored_bytes"] / report["text_bytes"], 4)
+
+
+def test_db_size_reports_bodies(client):
+    """Test GET /api/settings/db-size includes the body size report."""
+    response = client.get("/api/settings/db-size")
+    data = json.loads(response.data)["data"]
+
+    assert response.status_code == 200
+    assert data["bodies"]["bodies"] == 0
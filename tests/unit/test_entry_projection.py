@@ -0,0 +1,132 @@
+"""Unit tests for list projections deferring heavy entry columns."""
+
+import json
+import re
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+
+from spider_aggregation.models.entry import EntryCreate
+from spider_aggregation.models.feed import FeedCreate
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.repositories.category_repo import CategoryRepository
+from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+from spider_aggregation.utils.hash_utils import compute_link_hash, compute_title_hash
+
+
+def _create_entries(session, feed_id: int, count: int = 3) -> None:
+    repo = EntryRepository(session)
+    for n in range(count):
+        link = f"https://example.com/{feed_id}/{n}"
+        repo.create(
+            EntryCreate(
+                feed_id=feed_id,
+                title=f"Entry {n}",
+                link=link,
+                summary=f"Summary {n}",
+                content="body " * 1000,
+                link_hash=compute_link_hash(link),
+                title_hash=compute_title_hash(f"Entry {n}"),
+            )
+        )
+    session.flush()
+
+
+@pytest.fixture
+def projection_data(db_session):
+    """Create a categorized feed with entries."""
+    feed = FeedRepository(db_session).create(FeedCreate(url="https://example.com/feed"))
+    cat_repo = CategoryRepository(db_session)
+    category = cat_repo.create(name="投影")
+    cat_repo.add_feed_to_category(feed, category)
+    _create_entries(db_session, feed.id)
+    db_session.expunge_all()
+    return {"feed_id": feed.id, "category_id": category.id}
+
+
+class TestEntryProjections:
+    """Tests for EntryRepository list projections."""
+
+    def test_list_projection_omits_content(self, db_session, projection_data):
+        """Test the list projection never selects content and raises on access."""
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            entries = EntryRepository(db_session).list(limit=10, projection="list")
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        assert len(entries) == 3
+        assert entries[0].summary.startswith("Summary")
+        assert not any(re.search(r"entries\.content\b", sql) for sql in statements)
+        with pytest.raises(InvalidRequestError):
+            entries[0].content
+
+    def test_titles_projection_omits_summary(self, db_session, projection_data):
+        """Test the titles projection also defers summary."""
+        entries = EntryRepository(db_session).search("Entry", projection="titles")
+
+        assert entries
+        assert entries[0].title.startswith("Entry")
+        with pytest.raises(InvalidRequestError):
+            entries[0].summary
+
+    def test_category_queries_accept_projection(self, db_session, projection_data):
+        """Test category list queries apply the projection."""
+        entries = EntryRepository(db_session).list_by_category(
+            projection_data["category_id"], projection="list"
+        )
+
+        assert len(entries) == 3
+        with pytest.raises(InvalidRequestError):
+            entries[0].content
+
+    def test_unknown_projection(self, db_session):
+        """Test unknown projection names are rejected."""
+        with pytest.raises(ValueError):
+            EntryRepository(db_session).list(projection="everything")
+
+
+class TestEntryListAPI:
+    """Tests for list endpoints returning the lightweight entry shape."""
+
+    @pytest.fixture
+    def api_data(self, client):
+        db_manager = DatabaseManager(client.application.config["DB_PATH"])
+        with db_manager.session() as session:
+            feed = FeedRepository(session).create(
+                FeedCreate(url="https://example.com/api", name="API Feed")
+            )
+            category = CategoryRepository(session).create(name="接口")
+            CategoryRepository(session).add_feed_to_category(feed, category)
+            _create_entries(session, feed.id)
+            return {"category_id": category.id}
+
+    def test_entries_list(self, client, api_data):
+        """Test /api/entries returns summaries but not content."""
+        item = json.loads(client.get("/api/entries").data)["data"][0]
+        assert "content" not in item
+        assert item["summary"].startswith("Summary")
+        assert item["feed_name"] == "API Feed"
+
+    def test_entries_by_category(self, client, api_data):
+        """Test category entry lists omit content."""
+        response = client.get(f"/api/entries/by-category/{api_data['category_id']}")
+        items = json.loads(response.data)["data"]["entries"]
+
+        assert len(items) == 3
+        assert all("content" not in item for item in items)
+
+    def test_single_entry_keeps_content(self, client, api_data):
+        """Test the entry detail endpoint still returns content."""
+        items = json.loads(client.get("/api/entries").data)["data"]
+        detail = json.loads(client.get(f"/api/entries/{items[0]['id']}").data)["data"]
+
+        assert detail["content"].startswith("body")
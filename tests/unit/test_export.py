@@ -0,0 +1,148 @@
+"""Unit tests for streaming entry exports."""
+
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from spider_aggregation.models.entry import EntryCreate
+from spider_aggregation.models.feed import FeedCreate
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.repositories.category_repo import CategoryRepository
+from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+from spider_aggregation.utils.hash_utils import compute_link_hash, compute_title_hash
+from spider_aggregation.web.export import encode_chunks, iter_csv, iter_json_array
+
+
+def _create_entry(repo: EntryRepository, feed_id: int, n: int, published_at: datetime):
+    link = f"https://example.com/{feed_id}/{n}"
+    return repo.create(
+        EntryCreate(
+            feed_id=feed_id,
+            title=f"Entry {feed_id}-{n}",
+            link=link,
+            content=f"Content, with \"quotes\"\nand lines {n}",
+            published_at=published_at,
+            tags=["news", "tech"],
+            link_hash=compute_link_hash(link),
+            title_hash=compute_title_hash(f"Entry {feed_id}-{n}"),
+        )
+    )
+
+
+@pytest.fixture
+def export_data(client):
+    """Create two feeds (one categorized) with entries on different days."""
+    db_manager = DatabaseManager(client.application.config["DB_PATH"])
+    with db_manager.session() as session:
+        feed_repo = FeedRepository(session)
+        cat_repo = CategoryRepository(session)
+        entry_repo = EntryRepository(session)
+
+        feed_a = feed_repo.create(FeedCreate(url="https://example.com/a"))
+        feed_b = feed_repo.create(FeedCreate(url="https://example.com/b"))
+        category = cat_repo.create(name="导出分类")
+        cat_repo.add_feed_to_category(feed_b, category)
+
+        for day in range(1, 4):
+            _create_entry(entry_repo, feed_a.id, day, datetime(2026, 3, day))
+        for day in range(1, 3):
+            _create_entry(entry_repo, feed_b.id, day, datetime(2026, 3, day, 12))
+
+        return {"feed_a": feed_a.id, "feed_b": feed_b.id, "category": category.id}
+
+
+class TestExportEncoders:
+    """Tests for the streaming encoders."""
+
+    def test_json_array(self):
+        """Test the incremental JSON array is valid JSON."""
+        records = [{"id": 1}, {"id": 2}]
+        assert json.loads("".join(iter_json_array(records))) == records
+        assert json.loads("".join(iter_json_array([]))) == []
+
+    def test_csv_lists_as_json(self):
+        """Test list values are written as JSON in CSV cells."""
+        text = "".join(iter_csv([{"id": 1, "tags": ["a", "b"]}], ["id", "tags"]))
+        rows = list(csv.DictReader(io.StringIO(text)))
+        assert rows == [{"id": "1", "tags": '["a", "b"]'}]
+
+    def test_encode_chunks_gzip(self):
+        """Test gzipped output decompresses to the joined chunks."""
+        chunks = [f"line {n}\n" for n in range(20000)]
+        encoded = list(encode_chunks(chunks, compress=True))
+        assert len(encoded) > 1 or len(encoded[0]) < sum(map(len, chunks))
+        assert gzip.decompress(b"".join(encoded)).decode() == "".join(chunks)
+
+
+class TestExportEntriesAPI:
+    """Tests for GET /api/system/export/entries."""
+
+    def test_default_json(self, client, export_data):
+        """Test the default export is a JSON array of all entries, newest first."""
+        response = client.get("/api/system/export/entries")
+
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert "entries.json" in response.headers["Content-Disposition"]
+        data = json.loads(response.data)
+        assert len(data) == 5
+        published = [entry["published_at"] for entry in data]
+        assert published == sorted(published, reverse=True)
+        assert data[0]["tags"] == ["news", "tech"]
+
+    def test_ndjson(self, client, export_data):
+        """Test NDJSON writes one entry per line."""
+        response = client.get("/api/system/export/entries?format=ndjson&limit=3")
+
+        assert response.mimetype == "application/x-ndjson"
+        lines = response.data.decode().splitlines()
+        assert len(lines) == 3
+        assert all("title" in json.loads(line) for line in lines)
+
+    def test_csv(self, client, export_data):
+        """Test CSV has a header row and round-trips multiline content."""
+        response = client.get(
+            f"/api/system/export/entries?format=csv&feed_id={export_data['feed_a']}"
+        )
+
+        assert response.mimetype == "text/csv"
+        rows = list(csv.DictReader(io.StringIO(response.data.decode())))
+        assert len(rows) == 3
+        assert rows[0]["content"].startswith('Content, with "quotes"\nand lines')
+        assert json.loads(rows[0]["tags"]) == ["news", "tech"]
+        assert "link_hash" not in rows[0]
+
+    def test_category_and_date_filters(self, client, export_data):
+        """Test category and published date range filters."""
+        response = client.get(
+            f"/api/system/export/entries?category_id={export_data['category']}"
+        )
+        data = json.loads(response.data)
+        assert {entry["feed_id"] for entry in data} == {export_data["feed_b"]}
+
+        response = client.get(
+            "/api/system/export/entries?since=2026-03-02&until=2026-03-03"
+        )
+        data = json.loads(response.data)
+        assert len(data) == 2
+        assert all(entry["published_at"].startswith("2026-03-02") for entry in data)
+
+    def test_gzip(self, client, export_data):
+        """Test gzip=true compresses the download."""
+        response = client.get("/api/system/export/entries?format=ndjson&gzip=true")
+
+        assert response.mimetype == "application/gzip"
+        assert "entries.ndjson.gz" in response.headers["Content-Disposition"]
+        lines = gzip.decompress(response.data).decode().splitlines()
+        assert len(lines) == 5
+
+    @pytest.mark.parametrize("query", ["format=xml", "since=yesterday"])
+    def test_invalid_parameters(self, client, query):
+        """Test unknown formats and invalid dates are rejected."""
+        response = client.get(f"/api/system/export/entries?{query}")
+        assert response.status_code == 400
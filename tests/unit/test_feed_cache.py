@@ -0,0 +1,155 @@
+"""Unit tests for the feed metadata cache and N+1-free entry listings."""
+
+import pytest
+
+from spider_aggregation.models.entry import EntryCreate
+from spider_aggregation.models.feed import FeedCreate, FeedUpdate
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.feed_cache import FeedMetadataCache, get_feed_metadata_cache
+from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+from spider_aggregation.utils.hash_utils import compute_link_hash, compute_title_hash
+from tests.conftest import count_queries
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    """Create a file database (in-memory databases are never cached)."""
+    manager = DatabaseManager(str(tmp_path / "feeds.db"))
+    manager.init_db()
+    yield manager
+    get_feed_metadata_cache().invalidate()
+    manager.close()
+
+
+def _create_feeds_with_entries(db_manager: DatabaseManager, feeds: int, per_feed: int) -> None:
+    with db_manager.session() as session:
+        entry_repo = EntryRepository(session)
+        for f in range(feeds):
+            feed = FeedRepository(session).create(
+                FeedCreate(url=f"https://example.com/{f}", name=f"Feed {f}")
+            )
+            for n in range(per_feed):
+                link = f"https://example.com/{f}/{n}"
+                entry_repo.create(
+                    EntryCreate(
+                        feed_id=feed.id,
+                        title=f"Entry {f}-{n}",
+                        link=link,
+                        content="body",
+                        link_hash=compute_link_hash(link),
+                        title_hash=compute_title_hash(link),
+                    )
+                )
+
+
+class TestFeedMetadataCache:
+    """Tests for FeedMetadataCache."""
+
+    def test_hit_after_first_load(self, file_db: DatabaseManager):
+        """Test metadata is loaded once and served from memory afterwards."""
+        _create_feeds_with_entries(file_db, feeds=2, per_feed=0)
+        cache = get_feed_metadata_cache()
+
+        with file_db.session() as session:
+            assert [feed.name for feed in cache.all(session)] == ["Feed 1", "Feed 0"]
+            with count_queries() as queries:
+                feed = cache.get(session, 1)
+            assert queries.count == 0
+            assert feed.display_name == "Feed 0"
+
+    def test_invalidated_on_commit(self, file_db: DatabaseManager):
+        """Test renaming, adding and deleting feeds invalidates the cache."""
+        _create_feeds_with_entries(file_db, feeds=1, per_feed=0)
+        cache = get_feed_metadata_cache()
+        with file_db.session() as session:
+            cache.all(session)
+
+        with file_db.session() as session:
+            repo = FeedRepository(session)
+            repo.update(repo.get_by_id(1), FeedUpdate(name="Renamed"))
+            # Uncommitted changes are not cached
+            assert cache.get(session, 1).name == "Renamed"
+        with file_db.session() as session:
+            assert cache.get(session, 1).name == "Renamed"
+
+        with file_db.session() as session:
+            FeedRepository(session).create(FeedCreate(url="https://example.com/new"))
+        with file_db.session() as session:
+            assert len(cache.all(session)) == 2
+
+        with file_db.session() as session:
+            repo = FeedRepository(session)
+            repo.delete(repo.get_by_id(1))
+        with file_db.session() as session:
+            assert cache.get(session, 1) is None
+
+    def test_fetch_bookkeeping_keeps_cache(self, file_db: DatabaseManager):
+        """Test updates to uncached attributes do not invalidate the cache."""
+        _create_feeds_with_entries(file_db, feeds=1, per_feed=0)
+        cache = get_feed_metadata_cache()
+        with file_db.session() as session:
+            cache.all(session)
+
+        with file_db.session() as session:
+            repo = FeedRepository(session)
+            repo.update_fetch_info(repo.get_by_id(1), increment_error=True, last_error="boom")
+
+        with file_db.session() as session, count_queries() as queries:
+            cache.all(session)
+        assert queries.count == 0
+
+    def test_ttl_expiry(self, file_db: DatabaseManager):
+        """Test entries are reloaded after the TTL."""
+        now = [0.0]
+        cache = FeedMetadataCache(ttl_seconds=10, clock=lambda: now[0])
+        with file_db.session() as session:
+            assert cache.all(session) == []
+            now[0] = 11.0
+            with count_queries() as queries:
+                cache.all(session)
+            assert queries.count == 1
+
+    def test_in_memory_database_not_cached(self, db_session):
+        """Test in-memory databases always read through."""
+        cache = FeedMetadataCache()
+        cache.all(db_session)
+        with count_queries() as queries:
+            cache.all(db_session)
+        assert queries.count == 1
+
+
+class TestListQueryCounts:
+    """Entry listings run a constant number of queries regardless of size."""
+
+    def test_entries_api(self, client, assert_max_queries):
+        """Test /api/entries loads feed names without a query per entry."""
+        _create_feeds_with_entries(
+            DatabaseManager(client.application.config["DB_PATH"]), feeds=5, per_feed=4
+        )
+
+        with assert_max_queries(2):
+            response = client.get("/api/entries?page_size=20")
+        names = {entry["feed_name"] for entry in response.get_json()["data"]}
+        assert names == {f"Feed {f}" for f in range(5)}
+
+    def test_dashboard_activity(self, client, assert_max_queries):
+        """Test the dashboard activity feed runs a single query."""
+        _create_feeds_with_entries(
+            DatabaseManager(client.application.config["DB_PATH"]), feeds=5, per_feed=2
+        )
+
+        with assert_max_queries(1):
+            response = client.get("/api/dashboard/activity?limit=10")
+        assert all(entry["feed_name"] for entry in response.get_json()["data"])
+
+    def test_index_page(self, client, assert_max_queries):
+        """Test the index page does not load feeds one category set at a time."""
+        _create_feeds_with_entries(
+            DatabaseManager(client.application.config["DB_PATH"]), feeds=5, per_feed=2
+        )
+
+        with assert_max_queries(3):
+            response = client.get("/")
+        assert response.status_code == 200
+        assert "Feed 4" in response.get_data(as_text=True)
@@ -0,0 +1,154 @@
+"""Unit tests for background fetch-all jobs."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from spider_aggregation.application.fetch_jobs import FetchJobManager
+from spider_aggregation.application.ingestion import IngestionPipeline
+from spider_aggregation.config import get_config
+from spider_aggregation.models import EntryModel, FetchJobModel
+from spider_aggregation.models.feed import FeedCreate
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+from spider_aggregation.storage.repositories.fetch_job_repo import FetchJobRepository
+
+RSS = (
+    '<?xml version="1.0"?><rss version="2.0"><channel><title>{name}</title>'
+    "<item><title>{name} one</title><link>https://example.com/{name}/1</link></item>"
+    "<item><title>{name} two</title><link>https://example.com/{name}/2</link></item>"
+    "</channel></rss>"
+)
+
+
+@pytest.fixture
+def feed_server(monkeypatch):
+    """Serve /<name> as a two-entry RSS feed; /missing is a 404."""
+    real_client = httpx.Client
+
+    def handler(request):
+        name = request.url.path.strip("/")
+        if name == "missing":
+            return httpx.Response(404)
+        return httpx.Response(200, content=RSS.format(name=name))
+
+    def client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr("spider_aggregation.core.fetcher.httpx.Client", client)
+
+
+@pytest.fixture
+def db_path(client):
+    """Path of the test app's database."""
+    return client.application.config["DB_PATH"]
+
+
+def _create_feeds(db_path, names):
+    with DatabaseManager(db_path).session() as session:
+        repo = FeedRepository(session)
+        for name in names:
+            repo.create(FeedCreate(url=f"https://example.com/{name}"))
+
+
+def _wait(client, job_id, timeout=10.0):
+    """Poll a job until it leaves the pending/running states."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(f"/api/scheduler/fetch-all/jobs/{job_id}").get_json()["data"]
+        if job["status"] not in ("pending", "running"):
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"fetch job {job_id} did not finish")
+
+
+class TestFetchAllJob:
+    """Tests for the fetch-all job endpoints."""
+
+    def test_job_runs_in_background(self, client, db_path, feed_server, monkeypatch):
+        """Test the sweep ingests every feed, batch by batch, and reports progress."""
+        monkeypatch.setattr(get_config().ingestion, "sweep_batch_size", 2)
+        _create_feeds(db_path, ["a", "b", "missing"])
+
+        response = client.post("/api/scheduler/fetch-all")
+        assert response.status_code == 202
+        job = _wait(client, response.get_json()["data"]["job_id"])
+
+        assert job["status"] == "completed"
+        assert job["feeds_total"] == job["feeds_done"] == 3
+        assert job["entries_created"] == 4
+        assert job["feeds_failed"] == 1
+        assert "404" in job["failures"][0]["error"]
+        assert job["finished_at"] is not None
+        with DatabaseManager(db_path).session() as session:
+            assert session.query(EntryModel).count() == 4
+
+    def test_trigger_is_deduplicated_and_cancellable(
+        self, client, db_path, feed_server, monkeypatch
+    ):
+        """Test a second trigger returns the running job and cancel stops it between batches."""
+        monkeypatch.setattr(get_config().ingestion, "sweep_batch_size", 1)
+        _create_feeds(db_path, ["a", "b", "c"])
+
+        started, release = threading.Event(), threading.Event()
+        pipeline_run = IngestionPipeline.run
+
+        def gated_run(self, feeds):
+            started.set()
+            release.wait(5)
+            return pipeline_run(self, feeds)
+
+        monkeypatch.setattr(IngestionPipeline, "run", gated_run)
+
+        job_id = client.post("/api/scheduler/fetch-all").get_json()["data"]["job_id"]
+        assert started.wait(5)
+
+        again = client.post("/api/scheduler/fetch-all")
+        assert again.status_code == 200
+        assert again.get_json()["data"]["job_id"] == job_id
+
+        cancel = client.post(f"/api/scheduler/fetch-all/jobs/{job_id}/cancel")
+        assert cancel.status_code == 200
+        assert cancel.get_json()["data"]["cancel_requested"] is True
+        release.set()
+
+        job = _wait(client, job_id)
+        assert job["status"] == "cancelled"
+        assert job["feeds_done"] == 1
+        assert job["entries_created"] == 2
+
+        assert client.post(f"/api/scheduler/fetch-all/jobs/{job_id}/cancel").status_code == 400
+        rerun = client.post("/api/scheduler/fetch-all")
+        assert rerun.status_code == 202
+        # Let the new job finish before the test database goes away
+        assert _wait(client, rerun.get_json()["data"]["job_id"])["status"] == "completed"
+
+    def test_unknown_job(self, client):
+        """Test unknown jobs return 404."""
+        assert client.get("/api/scheduler/fetch-all/jobs/999").status_code == 404
+        assert client.post("/api/scheduler/fetch-all/jobs/999/cancel").status_code == 404
+
+
+class TestFetchJobManager:
+    """Tests for FetchJobManager."""
+
+    def test_stale_job_is_abandoned(self, client, db_path, feed_server):
+        """Test a job left running by another process does not block new sweeps forever."""
+        with DatabaseManager(db_path).session() as session:
+            stale = FetchJobRepository(session).create()
+            stale.status = "running"
+            stale.updated_at = datetime.utcnow() - timedelta(days=1)
+            stale_id = stale.id
+
+        job_id, created = FetchJobManager().start(db_path)
+
+        assert created is True
+        assert job_id != stale_id
+        assert _wait(client, job_id)["status"] == "completed"
+        with DatabaseManager(db_path).session() as session:
+            stale = session.get(FetchJobModel, stale_id)
+            assert stale.status == "failed"
+            assert stale.error_message is not None
@@ -269,6 +269,28 @@ class TestFeedFetcher:
         assert result.http_status == 304
         assert result.etag == "abc123"
 
+    def test_fetch_feed_not_modified_real_response(self, mock_feed, monkeypatch):
+        """Test a real 304 response is not treated as an HTTP error and retried."""
+        mock_feed.etag = '"abc123"'
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("If-None-Match"))
+            return httpx.Response(304, headers={"ETag": '"abc123"'})
+
+        real_client = httpx.Client
+        monkeypatch.setattr(
+            "spider_aggregation.core.fetcher.httpx.Client",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+        )
+
+        fetcher = FeedFetcher(max_retries=3)
+        result = fetcher.fetch_feed(mock_feed)
+
+        assert result.success is True
+        assert result.http_status == 304
+        assert seen == ['"abc123"']
+
     def test_fetch_multiple(self, mock_feed):
         """Test fetching multiple feeds."""
         fetcher = FeedFetcher()
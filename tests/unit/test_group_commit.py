@@ -0,0 +1,127 @@
+"""Unit tests for SQLite group commits."""
+
+import threading
+
+import pytest
+from sqlalchemy import event
+
+from spider_aggregation.config import get_config
+from spider_aggregation.models import CategoryModel
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.group_commit import GroupCommitWriter, get_group_commit_writer
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    """A file-backed SQLite database."""
+    manager = DatabaseManager(str(tmp_path / "writer.db"))
+    manager.init_db()
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def commits(file_db):
+    """Count the COMMITs on the database's engine."""
+    counted = []
+    event.listen(file_db.engine, "commit", lambda conn: counted.append(1))
+    return counted
+
+
+def _add_category(name):
+    def work(session):
+        session.add(CategoryModel(name=name))
+        session.flush()
+        return name
+
+    return work
+
+
+def _category_names(db):
+    with db.session() as session:
+        return sorted(category.name for category in session.query(CategoryModel))
+
+
+class TestGroupCommitWriter:
+    """Tests for GroupCommitWriter."""
+
+    def test_units_from_threads_share_one_commit(self, file_db, commits):
+        """Test units submitted together are committed by one transaction."""
+        writer = GroupCommitWriter(file_db.engine, max_rows=4, max_delay_ms=5000)
+        futures = []
+        threads = [
+            threading.Thread(target=lambda n=n: futures.append(writer.submit(_add_category(n))))
+            for n in "abcd"
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(future.result(timeout=5) for future in futures) == ["a", "b", "c", "d"]
+        assert len(commits) == 1
+        assert _category_names(file_db) == ["a", "b", "c", "d"]
+
+    def test_delay_bounds_a_group(self, file_db, commits):
+        """Test a group is committed after max_delay_ms even if below max_rows."""
+        writer = GroupCommitWriter(file_db.engine, max_rows=1000, max_delay_ms=10)
+
+        assert writer.submit(_add_category("a")).result(timeout=5) == "a"
+        assert writer.submit(_add_category("b")).result(timeout=5) == "b"
+        assert len(commits) == 2
+
+    def test_failing_unit_is_rolled_back_alone(self, file_db):
+        """Test a unit's error reaches its submitter and does not undo the others."""
+        writer = GroupCommitWriter(file_db.engine, max_rows=3, max_delay_ms=5000)
+
+        def fail(session):
+            session.add(CategoryModel(name="lost"))
+            session.flush()
+            raise ValueError("bad unit")
+
+        ok = writer.submit(_add_category("a"))
+        failed = writer.submit(fail)
+        duplicate = writer.submit(_add_category("a"))
+        last = writer.submit(_add_category("b"))
+
+        assert ok.result(timeout=5) == "a"
+        with pytest.raises(ValueError, match="bad unit"):
+            failed.result(timeout=5)
+        with pytest.raises(Exception, match="UNIQUE"):
+            duplicate.result(timeout=5)
+        assert last.result(timeout=5) == "b"
+        assert _category_names(file_db) == ["a", "b"]
+
+    def test_thread_exits_when_idle(self, file_db):
+        """Test the writer thread stops when idle and restarts on submit."""
+        writer = GroupCommitWriter(file_db.engine, max_delay_ms=0, idle_seconds=0.01)
+
+        writer.submit(_add_category("a")).result(timeout=5)
+        thread = writer._thread
+        if thread is not None:
+            thread.join(timeout=5)
+        assert writer._thread is None
+
+        assert writer.submit(_add_category("b")).result(timeout=5) == "b"
+        assert _category_names(file_db) == ["a", "b"]
+
+
+class TestGetGroupCommitWriter:
+    """Tests for get_group_commit_writer."""
+
+    def test_one_writer_per_database(self, file_db, tmp_path):
+        """Test engines of the same file share a writer."""
+        other = DatabaseManager(str(tmp_path / "writer.db"))
+        try:
+            writer = get_group_commit_writer(file_db.engine)
+            assert writer is not None
+            assert get_group_commit_writer(other.engine) is writer
+        finally:
+            other.close()
+
+    def test_direct_writes(self, file_db, db_manager, monkeypatch):
+        """Test in-memory databases and disabled group commits write directly."""
+        assert get_group_commit_writer(db_manager.engine) is None
+
+        monkeypatch.setattr(get_config().database, "group_commit", False)
+        assert get_group_commit_writer(file_db.engine) is None
@@ -0,0 +1,65 @@
+"""Import-time regression tests.
+
+Heavy optional libraries (jieba, trafilatura, readability-lxml, NLTK) must be
+imported on first use, not when the web app or the ingestion path is loaded.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from spider_aggregation.core import warm_up
+
+# Modules that must not be imported at startup
+HEAVY_MODULES = ("jieba", "trafilatura", "readability", "nltk")
+
+# Generous budget for the cumulative import time of an entry point; jieba
+# alone used to add ~0.85s
+IMPORT_BUDGET_SECONDS = 3.0
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Import ``module`` in a fresh interpreter and parse ``-X importtime``.
+
+    Returns:
+        Cumulative import time in microseconds by module name
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    "module", ["spider_aggregation.web.app", "spider_aggregation.application.ingestion"]
+)
+def test_entry_point_imports_are_light(module):
+    """Test entry points load no heavy library and stay within the budget."""
+    times = _import_times(module)
+
+    heavy = sorted(name for name in times if name.split(".")[0] in HEAVY_MODULES)
+    assert heavy == []
+    assert times[module] / 1_000_000 < IMPORT_BUDGET_SECONDS
+
+
+def test_warm_up_loads_lazy_libraries():
+    """Test warm_up imports the libraries that are available."""
+    loaded = warm_up()
+
+    if "jieba" in loaded:
+        assert "jieba.analyse" in sys.modules
+    if "trafilatura" in loaded:
+        assert "trafilatura" in sys.modules
@@ -0,0 +1,242 @@
+"""Unit tests for the streaming ingestion pipeline."""
+
+import threading
+
+import httpx
+import pytest
+
+from spider_aggregation.application.ingestion import IngestionPipeline
+from spider_aggregation.core.scheduler import FeedScheduler
+from spider_aggregation.models import EntryModel, FeedModel
+from spider_aggregation.models.feed import FeedCreate
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+
+
+def _rss(name: str, items: int) -> str:
+    entries = "".join(
+        f"<item><title>{name} entry {n}</title><link>https://example.com/{name}/{n}</link>"
+        f"<description>Body {n} of {name}</description></item>"
+        for n in range(items)
+    )
+    return (
+        f'<?xml version="1.0"?><rss version="2.0"><channel><title>{name}</title>'
+        f"{entries}</channel></rss>"
+    )
+
+
+@pytest.fixture
+def feed_server(monkeypatch):
+    """Serve /<name>/<items> as RSS from an in-process transport; /missing is a 404.
+
+    Returns the names of the threads that made requests.
+    """
+    real_client = httpx.Client
+    threads = []
+
+    def handler(request):
+        threads.append(threading.current_thread().name)
+        name, _, items = request.url.path.strip("/").partition("/")
+        if name == "missing":
+            return httpx.Response(404)
+        return httpx.Response(200, content=_rss(name, int(items)))
+
+    def client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr("spider_aggregation.core.fetcher.httpx.Client", client)
+    return threads
+
+
+def _create_feeds(session, paths):
+    repo = FeedRepository(session)
+    return [repo.create(FeedCreate(url=f"https://example.com{path}")) for path in paths]
+
+
+class TestIngestionPipeline:
+    """Tests for IngestionPipeline."""
+
+    def test_run_concurrent(self, db_session, feed_server):
+        """Test stages run in worker threads and results keep the input order."""
+        feeds = _create_feeds(db_session, [f"/feed{n}/{n + 1}" for n in range(6)])
+
+        pipeline = IngestionPipeline(db_session, fetch_workers=3, parse_workers=2, queue_size=1)
+        results = pipeline.run(feeds)
+
+        assert [result.feed_id for result in results] == [feed.id for feed in feeds]
+        assert [result.entries_created for result in results] == [1, 2, 3, 4, 5, 6]
+        assert db_session.query(EntryModel).count() == 21
+        assert all(name.startswith("ingest-fetch") for name in feed_server)
+        for feed, result in zip(feeds, results):
+            assert feed.last_fetched_at is not None
+            assert result.timings["stages"]["parse"]["count"] == result.entries_created
+
+    def test_failed_feed_does_not_stop_others(self, db_session, feed_server):
+        """Test a failing feed is reported and counted while the rest are stored."""
+        feeds = _create_feeds(db_session, ["/one/2", "/missing", "/two/3"])
+
+        results = IngestionPipeline(db_session, fetch_workers=2).run(feeds)
+
+        assert [result.success for result in results] == [True, False, True]
+        assert results[1].http_status == 404
+        assert feeds[1].fetch_error_count == 1
+        assert "404" in feeds[1].last_error
+        assert db_session.query(EntryModel).count() == 5
+
+    def test_store_error_is_isolated(self, db_session, feed_server, monkeypatch):
+        """Test an exception in the store stage fails only that feed."""
+        feeds = _create_feeds(db_session, ["/one/1", "/bad/1", "/two/1"])
+        pipeline = IngestionPipeline(db_session, fetch_workers=2)
+        store_entries = pipeline._store_entries
+
+        def flaky(feed, parsed_entries):
+            if "bad" in feed.url:
+                raise RuntimeError("disk full")
+            return store_entries(feed, parsed_entries)
+
+        monkeypatch.setattr(pipeline, "_store_entries", flaky)
+        results = pipeline.run(feeds)
+
+        assert [result.success for result in results] == [True, False, True]
+        assert results[1].error == "RuntimeError: disk full"
+
+    def test_flush_error_rolls_back_only_that_feed(self, db_session, feed_server, monkeypatch):
+        """Test a failed flush discards the feed's entries and the run goes on."""
+        feeds = _create_feeds(db_session, ["/one/1", "/bad/2", "/two/1"])
+        pipeline = IngestionPipeline(db_session, fetch_workers=2)
+        store_entries = pipeline._store_entries
+
+        def conflicting(feed, parsed_entries):
+            created = store_entries(feed, parsed_entries)
+            if "bad" in feed.url:
+                stored = db_session.query(EntryModel).filter_by(feed_id=feed.id).first()
+                # Violates the unique link_hash index at flush time
+                db_session.add(
+                    EntryModel(
+                        feed_id=feed.id,
+                        title="Copy",
+                        link=stored.link,
+                        link_hash=stored.link_hash,
+                        title_hash=stored.title_hash,
+                    )
+                )
+                db_session.flush()
+            return created
+
+        monkeypatch.setattr(pipeline, "_store_entries", conflicting)
+        results = pipeline.run(feeds)
+
+        assert [result.success for result in results] == [True, False, True]
+        assert results[1].error.startswith("IntegrityError")
+        assert db_session.query(EntryModel).filter_by(feed_id=feeds[1].id).count() == 0
+        assert db_session.query(EntryModel).count() == 2
+        assert feeds[1].fetch_error_count == 1
+
+    def test_feed_savepoints_stay_in_session_transaction(self, tmp_path, feed_server):
+        """Test entries stored on a fresh session are undone by its rollback."""
+        db = DatabaseManager(str(tmp_path / "store.db"))
+        db.init_db()
+        with db.session() as session:
+            feed_ids = [feed.id for feed in _create_feeds(session, ["/one/2", "/two/1"])]
+
+        with db.session() as session:
+            feeds = [session.get(FeedModel, feed_id) for feed_id in feed_ids]
+            results = IngestionPipeline(session, fetch_workers=0).run(feeds)
+            assert [result.entries_created for result in results] == [2, 1]
+            session.rollback()
+
+        with db.session() as session:
+            assert session.query(EntryModel).count() == 0
+        db.close()
+
+    def test_inline_matches_concurrent(self, db_session, feed_server):
+        """Test fetch_workers=0 runs in the calling thread with the same outcome."""
+        feeds = _create_feeds(db_session, ["/one/2", "/two/3"])
+
+        results = IngestionPipeline(db_session, fetch_workers=0).run(feeds)
+
+        assert [result.entries_created for result in results] == [2, 3]
+        assert set(feed_server) == {threading.current_thread().name}
+
+    def test_refetch_skips_duplicates(self, db_session, feed_server):
+        """Test a second run stores nothing new."""
+        feeds = _create_feeds(db_session, ["/one/2", "/two/3"])
+        pipeline = IngestionPipeline(db_session, fetch_workers=2)
+
+        pipeline.run(feeds)
+        results = pipeline.run(feeds)
+
+        assert [result.entries_created for result in results] == [0, 0]
+        assert [result.entries_count for result in results] == [2, 3]
+
+    def test_new_entries_are_counted_in_corpus_stats(self, db_session, feed_server):
+        """Test the texts of stored entries go to the corpus statistics once per feed."""
+        feeds = _create_feeds(db_session, ["/one/2", "/two/1"])
+        pipeline = IngestionPipeline(db_session, fetch_workers=0)
+        recorded = []
+        pipeline.keywords.record_documents = lambda texts, session: recorded.append(texts)
+
+        pipeline.run(feeds)
+        pipeline.run(feeds)
+
+        assert recorded == [
+            ["one entry 0 Body 0 of one", "one entry 1 Body 1 of one"],
+            ["two entry 0 Body 0 of two"],
+        ]
+
+
+class TestScheduledIngestion:
+    """Tests for scheduler jobs running through the pipeline."""
+
+    def test_scheduled_job_stores_entries(self, db_session, feed_server):
+        """Test a scheduled feed job persists the fetched entries."""
+        feed = _create_feeds(db_session, ["/sched/4"])[0]
+
+        result = FeedScheduler(session=db_session)._fetch_feed_wrapper(feed.id)
+
+        assert result.success is True
+        assert result.entries_created == 4
+        assert db_session.query(EntryModel).filter_by(feed_id=feed.id).count() == 4
+
+    def test_batch_job_runs_one_pipeline(self, db_session, feed_server):
+        """Test a batch job ingests all feeds and reports unknown IDs."""
+        feeds = _create_feeds(db_session, ["/a/1", "/b/2"])
+        scheduler = FeedScheduler(session=db_session)
+
+        results = scheduler._fetch_feeds_wrapper([feeds[0].id, 999, feeds[1].id])
+
+        assert [result.entries_created for result in results] == [1, 0, 2]
+        assert results[1].error == "Feed not found"
+        assert scheduler.stats.successful_executions == 2
+        assert scheduler.stats.failed_executions == 1
+
+    def test_concurrent_jobs_use_group_commit_writer(self, tmp_path, feed_server, monkeypatch):
+        """Test jobs running in parallel store their entries through the SQLite writer."""
+        db = DatabaseManager(str(tmp_path / "jobs.db"))
+        db.init_db()
+        with db.session() as session:
+            feeds = _create_feeds(session, [f"/job{n}/3" for n in range(6)])
+            feed_ids = [feed.id for feed in feeds]
+        scheduler = FeedScheduler(db_manager=db)
+        store_threads = set()
+        store = IngestionPipeline._store
+
+        def record_thread(self, job):
+            store_threads.add(threading.current_thread().name)
+            return store(self, job)
+
+        monkeypatch.setattr(IngestionPipeline, "_store", record_thread)
+        workers = [
+            threading.Thread(target=scheduler._fetch_feed_wrapper, args=(feed_id,))
+            for feed_id in feed_ids
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert store_threads == {"group-commit-writer"}
+        assert scheduler.stats.successful_executions == 6
+        with db.session() as session:
+            assert session.query(EntryModel).count() == 18
+        db.close()
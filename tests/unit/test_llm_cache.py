@@ -0,0 +1,148 @@
+"""Unit tests for the LLM response cache."""
+
+import json
+import time
+
+import pytest
+
+from spider_aggregation.core import llm_client
+from spider_aggregation.core.llm_client import (
+    CachedLLMClient,
+    LLMClientFactory,
+    LLMResponse,
+    LLMResponseCache,
+)
+from tests.fixtures.llm import FakeLLMClient
+
+
+@pytest.fixture
+def cache():
+    """Create an in-memory response cache."""
+    cache = LLMResponseCache(":memory:", ttl_seconds=3600, max_entries=100)
+    yield cache
+    cache.close()
+
+
+class TestLLMResponseCache:
+    """Tests for LLMResponseCache."""
+
+    def test_key_covers_request_parameters(self):
+        """Test every keyed parameter changes the fingerprint."""
+        base = ("openai", "gpt-4o-mini", 0.7, "system", "prompt")
+        key = LLMResponseCache.make_key(*base)
+
+        assert key == LLMResponseCache.make_key(*base)
+        for i, value in enumerate(("zhipuai", "gpt-4o", 0.2, "other", "other")):
+            changed = list(base)
+            changed[i] = value
+            assert LLMResponseCache.make_key(*changed) != key
+
+    def test_hit_and_miss_counters(self, cache: LLMResponseCache):
+        """Test lookups are counted as hits or misses."""
+        key = cache.make_key("openai", "m", 0.7, None, "prompt")
+
+        assert cache.get(key) is None
+        cache.set(key, LLMResponse(success=True, content="answer", tokens_used=42))
+        cached = cache.get(key)
+
+        assert cached.content == "answer"
+        assert cached.cached is True
+        assert cached.tokens_used == 0
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_failed_responses_not_cached(self, cache: LLMResponseCache):
+        """Test errors are never served from the cache."""
+        key = cache.make_key("openai", "m", 0.7, None, "prompt")
+        cache.set(key, LLMResponse(success=False, error="timeout"))
+
+        assert cache.get(key) is None
+
+    def test_ttl_expiry(self, cache: LLMResponseCache, monkeypatch):
+        """Test expired responses are treated as misses and removed."""
+        key = cache.make_key("openai", "m", 0.7, None, "prompt")
+        cache.set(key, LLMResponse(success=True, content="answer"))
+
+        later = time.time() + 7200
+        monkeypatch.setattr(llm_client.time, "time", lambda: later)
+
+        assert cache.get(key) is None
+        assert cache.get_stats()["entries"] == 0
+        assert cache.evictions == 1
+
+    def test_size_eviction_keeps_recently_used(self, monkeypatch):
+        """Test the least recently used responses are evicted beyond max_entries."""
+        cache = LLMResponseCache(":memory:", max_entries=2)
+        clock = iter(range(1000, 2000))
+        monkeypatch.setattr(llm_client.time, "time", lambda: next(clock))
+
+        keys = [cache.make_key("openai", "m", 0.7, None, f"p{i}") for i in range(3)]
+        cache.set(keys[0], LLMResponse(success=True, content="0"))
+        cache.set(keys[1], LLMResponse(success=True, content="1"))
+        cache.get(keys[0])
+        cache.set(keys[2], LLMResponse(success=True, content="2"))
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]).content == "0"
+        assert cache.get(keys[2]).content == "2"
+        assert cache.evictions == 1
+
+    def test_persists_on_disk(self, tmp_path):
+        """Test responses survive reopening the cache file."""
+        path = str(tmp_path / "cache" / "llm.db")
+        key = LLMResponseCache.make_key("openai", "m", 0.7, None, "prompt")
+
+        first = LLMResponseCache(path)
+        first.set(key, LLMResponse(success=True, content="answer"))
+        first.close()
+
+        second = LLMResponseCache(path)
+        assert second.get(key).content == "answer"
+        second.close()
+
+
+class TestCachedLLMClient:
+    """Tests for CachedLLMClient."""
+
+    def test_repeated_prompt_served_from_cache(self, cache: LLMResponseCache):
+        """Test the wrapped client is only called once per distinct request."""
+        fake = FakeLLMClient(responder=lambda prompt, system: f"re: {prompt}")
+        client = CachedLLMClient(fake, cache, provider="fake")
+
+        first = client.chat("hello", system_prompt="system")
+        second = client.chat("hello", system_prompt="system")
+        client.chat("hello", system_prompt="other")
+
+        assert first.content == second.content == "re: hello"
+        assert second.cached is True
+        assert len(fake.calls) == 2
+
+    def test_factory_wraps_with_shared_cache(self, cache: LLMResponseCache, monkeypatch):
+        """Test factory clients use the shared cache unless disabled."""
+        monkeypatch.setattr(llm_client, "_llm_cache", cache)
+
+        client = LLMClientFactory.create(provider="openai", api_key="key")
+        assert isinstance(client, CachedLLMClient)
+        assert client.cache is cache
+
+        uncached = LLMClientFactory.create(provider="openai", api_key="key", use_cache=False)
+        assert not isinstance(uncached, CachedLLMClient)
+
+    def test_api_cache_stats(self, client, cache: LLMResponseCache, monkeypatch):
+        """Test GET and DELETE /api/system/llm-cache."""
+        monkeypatch.setattr(llm_client, "_llm_cache", cache)
+        key = cache.make_key("openai", "m", 0.7, None, "prompt")
+        cache.set(key, LLMResponse(success=True, content="answer"))
+        cache.get(key)
+
+        data = json.loads(client.get("/api/system/llm-cache").data)
+        assert data["data"]["enabled"] is True
+        assert data["data"]["entries"] == 1
+        assert data["data"]["hits"] == 1
+
+        response = client.delete("/api/system/llm-cache")
+        assert response.status_code == 200
+        assert cache.get_stats()["entries"] == 0
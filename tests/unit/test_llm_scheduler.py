@@ -0,0 +1,171 @@
+"""Unit tests for the rate-aware LLM request scheduler."""
+
+import threading
+import time
+
+import pytest
+
+from spider_aggregation.core.llm_client import RateLimitError, is_rate_limit_error
+from spider_aggregation.core.llm_scheduler import LLMRequestScheduler
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep advances time."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimitDetection:
+    """Tests for is_rate_limit_error."""
+
+    def test_detects_rate_limits(self):
+        """Test 429 status codes and messages are recognized."""
+
+        class ApiError(Exception):
+            status_code = 429
+
+        assert is_rate_limit_error(RateLimitError())
+        assert is_rate_limit_error(ApiError("Too many requests"))
+        assert is_rate_limit_error("Error code: 429")
+        assert is_rate_limit_error(Exception("Rate limit reached for requests"))
+        assert not is_rate_limit_error(ValueError("bad request"))
+        assert not is_rate_limit_error(None)
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "HTTP 429",
+            "HTTP/1.1 429 Too Many Requests",
+            "Client error '429 Too Many Requests' for url 'https://api.example.com'",
+            "status_code=429",
+        ],
+    )
+    def test_detects_429_statuses(self, message):
+        """Test 429 is recognized next to an HTTP status."""
+        assert is_rate_limit_error(message)
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "Error code: 400 - prompt has 14291 tokens",
+            "Request req_429abc failed",
+            "Not found: https://api.example.com/v1/models/429",
+            "context length 4096 exceeded by 429 tokens",
+        ],
+    )
+    def test_ignores_other_429s(self, message):
+        """Test a 429 in IDs, counts or URLs is not taken for a rate limit."""
+        assert not is_rate_limit_error(message)
+
+
+class TestLLMRequestScheduler:
+    """Tests for LLMRequestScheduler."""
+
+    def test_requests_per_minute(self):
+        """Test requests beyond the per-minute budget wait for the window."""
+        clock = FakeClock()
+        scheduler = LLMRequestScheduler(requests_per_minute=2, clock=clock, sleep=clock.sleep)
+
+        for _ in range(3):
+            scheduler.call(lambda: None)
+
+        assert clock.now == pytest.approx(60.0)
+        assert scheduler.get_stats()["throttled_seconds"] == pytest.approx(60.0)
+
+    def test_tokens_per_minute(self):
+        """Test requests wait until enough tokens leave the window."""
+        clock = FakeClock()
+        scheduler = LLMRequestScheduler(tokens_per_minute=1000, clock=clock, sleep=clock.sleep)
+
+        scheduler.call(lambda: None, tokens=600)
+        clock.now = 10.0
+        scheduler.call(lambda: None, tokens=300)
+        scheduler.call(lambda: None, tokens=500)
+
+        # The first request (600 tokens) must leave the window at t=60
+        assert clock.now == pytest.approx(60.0)
+
+    def test_oversized_request_runs_alone(self):
+        """Test a request larger than the token budget is not blocked forever."""
+        clock = FakeClock()
+        scheduler = LLMRequestScheduler(tokens_per_minute=100, clock=clock, sleep=clock.sleep)
+
+        scheduler.call(lambda: "ok", tokens=500)
+
+        assert clock.sleeps == []
+
+    def test_retries_rate_limited_requests(self):
+        """Test 429 errors are retried with exponential backoff."""
+        clock = FakeClock()
+        scheduler = LLMRequestScheduler(
+            max_retries=3, retry_backoff_seconds=1.0, clock=clock, sleep=clock.sleep
+        )
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise Exception("Error code: 429 - rate limit")
+            return "ok"
+
+        assert scheduler.call(flaky) == "ok"
+        assert len(attempts) == 3
+        assert clock.sleeps[0] == pytest.approx(1.0, rel=0.1)
+        assert clock.sleeps[1] == pytest.approx(2.0, rel=0.1)
+        assert scheduler.retries == 2
+
+    def test_gives_up_after_max_retries(self):
+        """Test persistent rate limiting raises RateLimitError."""
+        clock = FakeClock()
+        scheduler = LLMRequestScheduler(max_retries=2, clock=clock, sleep=clock.sleep)
+
+        def limited():
+            raise Exception("429 Too Many Requests")
+
+        with pytest.raises(RateLimitError):
+            scheduler.call(limited)
+        assert scheduler.retries == 2
+
+    def test_other_errors_not_retried(self):
+        """Test non rate limit errors propagate immediately."""
+        scheduler = LLMRequestScheduler(max_retries=3)
+        attempts = []
+
+        def broken():
+            attempts.append(1)
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            scheduler.call(broken)
+        assert len(attempts) == 1
+
+    def test_concurrency_limit(self):
+        """Test submitted requests run in parallel up to the limit."""
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def work(n):
+            with lock:
+                active.append(n)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(n)
+            return n
+
+        with LLMRequestScheduler(max_concurrency=3) as scheduler:
+            futures = [scheduler.submit(work, n) for n in range(9)]
+            results = [f.result() for f in futures]
+
+        assert results == list(range(9))
+        assert max(peak) == 3
@@ -0,0 +1,166 @@
+"""Unit tests for the metrics registry and its instrumentation."""
+
+import threading
+
+import pytest
+
+from spider_aggregation import metrics
+from spider_aggregation.core.deduplicator import DedupStrategy, Deduplicator
+from spider_aggregation.core.parser import ContentParser
+from spider_aggregation.metrics import MetricsRegistry
+from spider_aggregation.models.entry import EntryCreate
+from spider_aggregation.models.feed import FeedCreate
+from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+from spider_aggregation.utils.hash_utils import compute_link_hash, compute_title_hash
+from tests.fixtures.llm import FakeLLMClient
+
+
+class TestMetricsRegistry:
+    """Tests for counters, gauges, histograms and text exposition."""
+
+    def test_counter_across_threads(self):
+        """Test per-thread cells add up to the exact total."""
+        counter = MetricsRegistry().counter("test_total", "Test counter")
+
+        def work():
+            for _ in range(10000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.value == 80000
+
+    def test_finished_threads_are_folded(self):
+        """Test cells of finished threads are merged instead of kept per thread."""
+        registry = MetricsRegistry()
+        counter = registry.counter("test_total", "Test counter")
+        histogram = registry.histogram("test_seconds", "Test histogram", buckets=(1.0,))
+
+        def work():
+            counter.inc()
+            histogram.observe(0.5)
+
+        for _ in range(200):
+            thread = threading.Thread(target=work)
+            thread.start()
+            thread.join()
+
+        # New threads fold the finished ones, scrapes fold the last
+        assert len(counter._default._cells._cells) == 1
+        assert counter.value == 200
+        assert histogram.count == 200
+        assert len(counter._default._cells._cells) == 0
+        assert len(histogram._default._cells._cells) == 0
+
+    def test_histogram_buckets(self):
+        """Test observations land in cumulative buckets."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("test_seconds", "Test histogram", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        text = registry.render()
+        assert 'test_seconds_bucket{le="0.1"} 2' in text
+        assert 'test_seconds_bucket{le="1"} 3' in text
+        assert 'test_seconds_bucket{le="+Inf"} 4' in text
+        assert "test_seconds_count 4" in text
+        assert "test_seconds_sum 2.65" in text
+
+    def test_labels_and_escaping(self):
+        """Test labelled children render with escaped values."""
+        registry = MetricsRegistry()
+        counter = registry.counter("test_hits_total", "Hits\nby kind", ["kind"])
+        counter.labels(kind='a"b').inc(2)
+        counter.labels("c").inc()
+
+        text = registry.render()
+        assert "# HELP test_hits_total Hits\\nby kind" in text
+        assert "# TYPE test_hits_total counter" in text
+        assert 'test_hits_total{kind="a\\"b"} 2' in text
+        assert 'test_hits_total{kind="c"} 1' in text
+
+        with pytest.raises(ValueError):
+            counter.labels(other="x")
+        with pytest.raises(ValueError):
+            counter.inc()
+
+    def test_gauge(self):
+        """Test gauges can be set, moved and computed at scrape time."""
+        registry = MetricsRegistry()
+        gauge = registry.gauge("test_depth", "Test gauge")
+        gauge.set(5)
+        gauge.dec(2)
+        assert gauge.value == 3
+
+        gauge.set_function(lambda: 7)
+        assert "test_depth 7" in registry.render()
+
+    def test_register_is_idempotent(self):
+        """Test registering the same metric twice returns it, conflicts raise."""
+        registry = MetricsRegistry()
+        counter = registry.counter("test_total", "Test")
+        assert registry.counter("test_total", "Test") is counter
+        with pytest.raises(ValueError):
+            registry.gauge("test_total", "Test")
+
+
+class TestInstrumentation:
+    """Tests for hot-path instrumentation."""
+
+    def test_parse_and_llm_latency(self):
+        """Test entry parsing and LLM requests are timed."""
+        parse_count = metrics.PARSE_ENTRY_DURATION.count
+        ContentParser().parse_entry({"title": "Title", "link": "https://example.com/1"})
+        assert metrics.PARSE_ENTRY_DURATION.count == parse_count + 1
+
+        llm = metrics.LLM_REQUEST_DURATION.labels(model="fake", outcome="success")
+        llm_count = llm.count
+        FakeLLMClient().chat("hello")
+        assert llm.count == llm_count + 1
+
+    def test_dedup_hits_and_flush_time(self, db_session):
+        """Test duplicate hits are counted by strategy and flushes are timed."""
+        flushes = metrics.DB_FLUSH_DURATION.count
+        feed = FeedRepository(db_session).create(FeedCreate(url="https://example.com/feed"))
+        link = "https://example.com/a"
+        EntryRepository(db_session).create(
+            EntryCreate(
+                feed_id=feed.id,
+                title="Title",
+                link=link,
+                link_hash=compute_link_hash(link),
+                title_hash=compute_title_hash("Title"),
+            )
+        )
+        assert metrics.DB_FLUSH_DURATION.count >= flushes + 2
+
+        hits = metrics.DEDUP_HITS.labels(strategy="medium", match="link")
+        before = hits.value
+        dedup = Deduplicator(db_session, strategy=DedupStrategy.MEDIUM)
+        assert dedup.check_duplicate({"link": link, "title": "Other"}, feed.id).is_duplicate
+        assert hits.value == before + 1
+        assert dedup.get_stats()["link_matches"] == 1
+
+    def test_metrics_endpoint(self, client):
+        """Test /metrics serves the Prometheus text format."""
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.content_type.startswith("text/plain; version=0.0.4")
+        text = response.get_data(as_text=True)
+        for name in (
+            "mindweaver_fetch_http_duration_seconds",
+            "mindweaver_fetch_bytes_total",
+            "mindweaver_parse_entry_duration_seconds",
+            "mindweaver_dedup_hits_total",
+            "mindweaver_db_flush_duration_seconds",
+            "mindweaver_filter_evaluation_duration_seconds",
+            "mindweaver_llm_request_duration_seconds",
+            "mindweaver_scheduler_lag_seconds",
+        ):
+            assert f"# TYPE {name}" in text
@@ -0,0 +1,90 @@
+"""Unit tests for the shared NLP resources."""
+
+import sys
+
+import pytest
+
+from spider_aggregation.config import get_config
+from spider_aggregation.core import nlp_resources
+from spider_aggregation.core.keyword_extractor import KeywordExtractor
+from spider_aggregation.core.nlp_resources import ENGLISH_STOPWORDS, get_nlp_resources
+
+TEXT = """
+Python is a high-level programming language. Python is widely used for web development,
+data science, and artificial intelligence. Developers choose Python for their projects.
+"""
+
+
+@pytest.fixture
+def fresh_resources(monkeypatch):
+    """Reload the NLP resources for the test and restore the shared ones afterwards."""
+    monkeypatch.setattr(nlp_resources, "_resources", None)
+
+
+@pytest.fixture
+def no_nltk(monkeypatch, fresh_resources):
+    """Make NLTK unimportable."""
+    monkeypatch.setitem(sys.modules, "nltk", None)
+
+
+class TestNLPResources:
+    """Tests for get_nlp_resources."""
+
+    def test_resources_are_shared(self):
+        """Test every extractor uses the same process-wide resources."""
+        assert get_nlp_resources() is get_nlp_resources()
+
+    def test_offline_fallback(self, no_nltk):
+        """Test the builtin tokenizer and stopwords are used without NLTK."""
+        resources = get_nlp_resources()
+
+        assert resources.source == {
+            "tokenizer": "builtin",
+            "stopwords": "builtin",
+            "lemmatizer": "none",
+        }
+        assert resources.stopwords is ENGLISH_STOPWORDS
+        tokens = resources.tokenize("data-science in 2024, café")
+        assert tokens == ["data", "science", "in", "café"]
+
+        keywords = KeywordExtractor(max_keywords=5).extract(TEXT, language="en")
+        assert keywords[0] == "python"
+        assert "is" not in keywords
+
+    def test_no_download_by_default(self, fresh_resources, monkeypatch):
+        """Test missing NLTK data is not downloaded unless enabled."""
+        nltk = pytest.importorskip("nltk")
+        downloads = []
+        monkeypatch.setattr(nltk, "download", lambda package, **kw: downloads.append(package))
+        monkeypatch.setattr(nltk.data, "find", lambda resource: (_ for _ in ()).throw(LookupError))
+
+        assert get_nlp_resources().source["stopwords"] == "builtin"
+        assert downloads == []
+
+        monkeypatch.setattr(nlp_resources, "_resources", None)
+        monkeypatch.setattr(get_config().keyword_extractor, "nltk_download", True)
+        get_nlp_resources()
+        assert downloads == ["punkt_tab", "stopwords", "wordnet"]
+
+    def test_lemma_cache_is_bounded(self, fresh_resources, monkeypatch):
+        """Test lemmas are memoized in an LRU cache of the configured size."""
+        monkeypatch.setattr(get_config().keyword_extractor, "lemma_cache_size", 2)
+        lemmatize = get_nlp_resources().lemmatize
+
+        for token in ["cats", "cats", "dogs", "birds"]:
+            lemmatize(token)
+
+        info = lemmatize.cache_info()
+        assert info.maxsize == 2
+        assert info.hits == 1
+        assert info.currsize == 2
+
+    def test_preload_runs_once(self):
+        """Test preload loads the resources and jieba in one background thread."""
+        thread = nlp_resources.preload()
+        assert nlp_resources.preload() is thread
+
+        thread.join(timeout=30)
+        assert nlp_resources._resources is not None
+        if nlp_resources.JIEBA_AVAILABLE:
+            assert nlp_resources._jieba_analyse is not None
@@ -222,6 +222,17 @@ class TestContentParser:
         entry = {}
         assert parser._detect_language(entry) is None
 
+    def test_language_detected_from_summary(self):
+        """Test parsed entries take the language of the summary, not the content."""
+        parser = ContentParser()
+
+        result = parser.parse_entry(
+            {"summary": "An English teaser", "content": "<p>这是一篇中文文章</p>"}
+        )
+
+        assert result["language"] == "en"
+        assert result["content"] == "这是一篇中文文章"
+
     def test_calculate_reading_time(self):
         """Test reading time calculation."""
         parser = ContentParser()
@@ -0,0 +1,212 @@
+"""Unit tests for the entry retention engine."""
+
+import base64
+import json
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func
+
+from spider_aggregation.application.retention import RetentionEngine
+from spider_aggregation.models import EntryModel
+from spider_aggregation.models.entry import EntryCreate
+from spider_aggregation.models.feed import FeedCreate
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.repositories.category_repo import CategoryRepository
+from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+from spider_aggregation.storage.repositories.stats_repo import EntryStatsRepository
+from spider_aggregation.utils.hash_utils import compute_link_hash, compute_title_hash
+
+NOW = datetime(2026, 6, 1)
+
+# 20000 characters that stay large when the body is compressed
+BIG_CONTENT = base64.b64encode(random.Random(0).randbytes(15000)).decode()
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    """Create a file database (vacuum needs a real file)."""
+    manager = DatabaseManager(str(tmp_path / "retention.db"))
+    manager.init_db()
+    yield manager
+    manager.close()
+
+
+def _create_feed(session, url: str, retention_days=None):
+    return FeedRepository(session).create(FeedCreate(url=url, retention_days=retention_days))
+
+
+def _create_entries(session, feed_id: int, count: int, age_days: int, content: str = "text"):
+    repo = EntryRepository(session)
+    for n in range(count):
+        link = f"https://example.com/{feed_id}/{age_days}/{n}"
+        entry = repo.create(
+            EntryCreate(
+                feed_id=feed_id,
+                title=f"Entry {n}",
+                link=link,
+                content=content,
+                link_hash=compute_link_hash(link),
+                title_hash=compute_title_hash(link),
+            )
+        )
+        entry.fetched_at = NOW - timedelta(days=age_days)
+    session.flush()
+
+
+def _count_entries(db_manager: DatabaseManager, feed_id: int) -> int:
+    with db_manager.session() as session:
+        return (
+            session.query(func.count(EntryModel.id)).filter(EntryModel.feed_id == feed_id).scalar()
+        )
+
+
+class TestResolvePolicies:
+    """Tests for RetentionEngine.resolve_policies."""
+
+    def test_feed_category_and_default_precedence(self, file_db: DatabaseManager):
+        """Test feed overrides win, then the longest category policy, then the default."""
+        with file_db.session() as session:
+            cat_repo = CategoryRepository(session)
+            short = cat_repo.create(name="short", retention_days=7)
+            long = cat_repo.create(name="long", retention_days=30)
+
+            own = _create_feed(session, "https://example.com/own", retention_days=3)
+            both = _create_feed(session, "https://example.com/both")
+            forever = _create_feed(session, "https://example.com/forever", retention_days=0)
+            plain = _create_feed(session, "https://example.com/plain")
+            for feed in (own, both, forever):
+                cat_repo.add_feed_to_category(feed, short)
+            cat_repo.add_feed_to_category(both, long)
+
+            policies = RetentionEngine(file_db, default_days=90).resolve_policies(session)
+
+            assert [(p.days, p.feed_ids) for p in policies] == [
+                (3, [own.id]),
+                (30, [both.id]),
+                (90, [plain.id]),
+            ]
+
+    def test_default_zero_keeps_unconfigured_feeds(self, file_db: DatabaseManager):
+        """Test feeds without any policy are kept forever by default."""
+        with file_db.session() as session:
+            _create_feed(session, "https://example.com/plain")
+            assert RetentionEngine(file_db, default_days=0).resolve_policies(session) == []
+
+
+class TestRetentionEngine:
+    """Tests for chunked deletion and space reclamation."""
+
+    def test_run_deletes_expired_entries_in_chunks(self, file_db: DatabaseManager):
+        """Test only expired entries are removed, in bounded chunks with pauses."""
+        with file_db.session() as session:
+            short_id = _create_feed(session, "https://example.com/short", retention_days=10).id
+            kept_id = _create_feed(session, "https://example.com/kept", retention_days=0).id
+            _create_entries(session, short_id, 5, age_days=20)
+            _create_entries(session, short_id, 2, age_days=1)
+            _create_entries(session, kept_id, 3, age_days=400)
+
+        pauses = []
+        engine = RetentionEngine(
+            file_db, default_days=0, chunk_size=2, vacuum="none", sleep=pauses.append
+        )
+        result = engine.run(now=NOW)
+
+        assert result.deleted == 5
+        assert result.chunks == 3
+        assert len(pauses) == 2
+        assert _count_entries(file_db, short_id) == 2
+        assert _count_entries(file_db, kept_id) == 3
+        with file_db.session() as session:
+            assert EntryStatsRepository(session).reconcile()["drift"] == 0
+
+    def test_purge_older_than(self, file_db: DatabaseManager):
+        """Test the manual cleanup ignores policies and honours the feed filter."""
+        with file_db.session() as session:
+            first_id = _create_feed(session, "https://example.com/a", retention_days=0).id
+            second_id = _create_feed(session, "https://example.com/b").id
+            _create_entries(session, first_id, 3, age_days=100)
+            _create_entries(session, second_id, 3, age_days=100)
+
+        engine = RetentionEngine(file_db, vacuum="none", sleep=lambda seconds: None)
+        result = engine.purge_older_than(90, feed_id=first_id, now=NOW)
+
+        assert result.deleted == 3
+        assert _count_entries(file_db, first_id) == 0
+        assert _count_entries(file_db, second_id) == 3
+
+    def test_incremental_vacuum_reclaims_space(self, file_db: DatabaseManager):
+        """Test new databases shrink after a purge with incremental vacuum."""
+        with file_db.session() as session:
+            feed = _create_feed(session, "https://example.com/big", retention_days=1)
+            _create_entries(session, feed.id, 50, age_days=5, content=BIG_CONTENT)
+
+        result = RetentionEngine(file_db, vacuum="incremental").run(now=NOW)
+
+        assert result.deleted == 50
+        assert result.reclaimed_bytes > 50 * 20000 * 0.5
+
+    def test_full_vacuum_converts_existing_database(self, tmp_path):
+        """Test full mode converts a database created without auto-vacuum."""
+        import sqlite3
+
+        path = tmp_path / "legacy.db"
+        # Created without auto-vacuum, as databases were before
+        conn = sqlite3.connect(path)
+        conn.execute("PRAGMA auto_vacuum=NONE")
+        conn.execute("CREATE TABLE placeholder (id INTEGER)")
+        conn.close()
+
+        db_manager = DatabaseManager(str(path))
+        db_manager.init_db()
+        try:
+            with db_manager.session() as session:
+                feed = _create_feed(session, "https://example.com/big", retention_days=1)
+                _create_entries(session, feed.id, 30, age_days=5, content=BIG_CONTENT)
+
+            incremental = RetentionEngine(db_manager, vacuum="incremental")
+            assert incremental.reclaim_space() == 0
+
+            result = RetentionEngine(db_manager, vacuum="full").run(now=NOW)
+            assert result.reclaimed_bytes > 30 * 20000 * 0.5
+
+            with db_manager.engine.connect() as conn:
+                assert conn.exec_driver_sql("PRAGMA auto_vacuum").scalar() == 2
+        finally:
+            db_manager.close()
+
+
+class TestRetentionAPI:
+    """Tests for the retention endpoints."""
+
+    def test_run_retention(self, client):
+        """Test POST /api/system/retention applies feed policies."""
+        db_manager = DatabaseManager(client.application.config["DB_PATH"])
+        with db_manager.session() as session:
+            feed = _create_feed(session, "https://example.com/feed", retention_days=1)
+            _create_entries(session, feed.id, 2, age_days=5)
+
+        response = client.post("/api/system/retention")
+        data = json.loads(response.data)
+
+        assert response.status_code == 200
+        assert data["data"]["deleted_count"] == 2
+        assert "reclaimed_bytes" in data["data"]
+
+    def test_cleanup_reports_deleted_count(self, client):
+        """Test POST /api/system/cleanup keeps its response shape."""
+        response = client.post("/api/system/cleanup", json={"days": 30})
+        data = json.loads(response.data)
+
+        assert response.status_code == 200
+        assert data["data"]["deleted_count"] == 0
+
+    def test_category_retention_days_validated(self, client):
+        """Test categories accept non-negative retention_days only."""
+        response = client.post("/api/categories", json={"name": "保留", "retention_days": 14})
+        assert json.loads(response.data)["data"]["retention_days"] == 14
+
+        response = client.post("/api/categories", json={"name": "无效", "retention_days": -1})
+        assert response.status_code == 400
@@ -0,0 +1,200 @@
+"""Unit tests for the entry statistics rollup."""
+
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from spider_aggregation.models import EntryModel, EntryStatModel
+from spider_aggregation.models.entry import EntryCreate, EntryUpdate
+from spider_aggregation.models.feed import FeedCreate
+from spider_aggregation.storage.repositories.category_repo import CategoryRepository
+from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+from spider_aggregation.storage.repositories.stats_repo import EntryStatsRepository
+from spider_aggregation.utils.hash_utils import compute_link_hash, compute_title_hash
+
+
+def _create_entry(repo: EntryRepository, feed_id: int, n: int, language: str = "en"):
+    link = f"https://example.com/{feed_id}/{n}"
+    return repo.create(
+        EntryCreate(
+            feed_id=feed_id,
+            title=f"Entry {n}",
+            link=link,
+            language=language,
+            published_at=datetime(2026, 1, 1) + timedelta(hours=n),
+            link_hash=compute_link_hash(link),
+            title_hash=compute_title_hash(f"Entry {n}"),
+        )
+    )
+
+
+class TestEntryStatsRepository:
+    """Tests for EntryStatsRepository."""
+
+    def test_insert_updates_rollup(self, db_session: Session):
+        """Test stored entries are counted per language."""
+        feed = FeedRepository(db_session).create(FeedCreate(url="https://example.com/feed"))
+        repo = EntryRepository(db_session)
+        _create_entry(repo, feed.id, 1, "en")
+        _create_entry(repo, feed.id, 2, "en")
+        latest = _create_entry(repo, feed.id, 3, "zh")
+
+        summary = EntryStatsRepository(db_session).get_summary()
+
+        assert summary["total"] == 3
+        assert summary["language_counts"] == {"en": 2, "zh": 1}
+        assert summary["most_recent"] == latest.published_at
+        assert db_session.query(EntryStatModel).count() == 2
+
+    def test_summary_matches_live_stats(self, db_session: Session):
+        """Test the rollup agrees with the live entry statistics."""
+        feed_repo = FeedRepository(db_session)
+        feed_a = feed_repo.create(FeedCreate(url="https://a.example.com/feed"))
+        feed_b = feed_repo.create(FeedCreate(url="https://b.example.com/feed"))
+        repo = EntryRepository(db_session)
+        for n in range(5):
+            _create_entry(repo, feed_a.id, n, "en" if n % 2 else "zh")
+        _create_entry(repo, feed_b.id, 9, None)
+
+        summary = EntryStatsRepository(db_session).get_summary()
+        live = repo.get_stats()
+
+        assert summary == live
+        assert EntryStatsRepository(db_session).get_summary([feed_b.id])["total"] == 1
+
+    def test_delete_decrements_and_prunes(self, db_session: Session):
+        """Test deletes are uncounted and empty buckets are removed."""
+        feed = FeedRepository(db_session).create(FeedCreate(url="https://example.com/feed"))
+        repo = EntryRepository(db_session)
+        first = _create_entry(repo, feed.id, 1, "en")
+        second = _create_entry(repo, feed.id, 2, "zh")
+        third = _create_entry(repo, feed.id, 3, "zh")
+
+        repo.delete_by_ids([first.id, second.id])
+        stats_repo = EntryStatsRepository(db_session)
+        assert stats_repo.get_summary()["language_counts"] == {"zh": 1}
+
+        repo.delete(third)
+        assert stats_repo.get_summary()["total"] == 0
+        assert db_session.query(EntryStatModel).count() == 0
+
+    def test_delete_recomputes_latest_published(self, db_session: Session):
+        """Test deleting the newest entries moves the latest published date back."""
+        feed = FeedRepository(db_session).create(FeedCreate(url="https://example.com/feed"))
+        repo = EntryRepository(db_session)
+        first = _create_entry(repo, feed.id, 1)
+        second = _create_entry(repo, feed.id, 2)
+        third = _create_entry(repo, feed.id, 3)
+        stats_repo = EntryStatsRepository(db_session)
+
+        repo.delete_by_ids([third.id])
+        assert stats_repo.get_summary()["most_recent"] == second.published_at
+
+        repo.delete(second)
+        assert stats_repo.get_summary()["most_recent"] == first.published_at
+
+    def test_cleanup_and_delete_by_feed(self, db_session: Session):
+        """Test bulk deletes keep the rollup in step."""
+        feed = FeedRepository(db_session).create(FeedCreate(url="https://example.com/feed"))
+        repo = EntryRepository(db_session)
+        old = _create_entry(repo, feed.id, 1)
+        _create_entry(repo, feed.id, 2)
+
+        old.fetched_at = datetime.utcnow() - timedelta(days=200)
+        db_session.flush()
+
+        assert repo.cleanup_old_entries(days=90) == 1
+        assert EntryStatsRepository(db_session).get_summary()["total"] == 1
+
+        repo.delete_by_feed(feed.id)
+        assert EntryStatsRepository(db_session).get_summary()["total"] == 0
+
+    def test_language_update_moves_bucket(self, db_session: Session):
+        """Test changing an entry's language moves it to another bucket."""
+        feed = FeedRepository(db_session).create(FeedCreate(url="https://example.com/feed"))
+        repo = EntryRepository(db_session)
+        entry = _create_entry(repo, feed.id, 1, "en")
+        other = _create_entry(repo, feed.id, 2, "en")
+
+        repo.update(entry, EntryUpdate(language="zh"))
+        other.language = "fr"
+        db_session.flush()
+
+        summary = EntryStatsRepository(db_session).get_summary()
+        assert summary["language_counts"] == {"zh": 1, "fr": 1}
+
+    def test_reconcile_corrects_drift(self, db_session: Session):
+        """Test reconciliation counts rows written with raw SQL."""
+        feed = FeedRepository(db_session).create(FeedCreate(url="https://example.com/feed"))
+        repo = EntryRepository(db_session)
+        _create_entry(repo, feed.id, 1)
+        db_session.execute(
+            insert(EntryModel.__table__).values(
+                feed_id=feed.id,
+                title="Raw",
+                link="https://example.com/raw",
+                language="fr",
+                fetched_at=datetime.utcnow(),
+                enabled=True,
+                link_hash=compute_link_hash("https://example.com/raw"),
+                title_hash=compute_title_hash("Raw"),
+            )
+        )
+
+        stats_repo = EntryStatsRepository(db_session)
+        assert stats_repo.get_summary()["total"] == 1
+
+        result = stats_repo.reconcile()
+
+        assert result["drift"] == 1
+        assert stats_repo.get_summary()["language_counts"] == {"en": 1, "fr": 1}
+
+    def test_summary_by_category(self, db_session: Session):
+        """Test category statistics only include the category's feeds."""
+        feed_repo = FeedRepository(db_session)
+        cat_repo = CategoryRepository(db_session)
+        repo = EntryRepository(db_session)
+        cat = cat_repo.create(name="技术博客")
+        feed_in = feed_repo.create(FeedCreate(url="https://a.example.com/feed"))
+        feed_out = feed_repo.create(FeedCreate(url="https://b.example.com/feed"))
+        cat_repo.add_feed_to_category(feed_in, cat)
+        _create_entry(repo, feed_in.id, 1, "en")
+        _create_entry(repo, feed_out.id, 2, "zh")
+
+        summary = EntryStatsRepository(db_session).get_summary_by_category(cat.id)
+
+        assert summary["total"] == 1
+        assert summary["language_counts"] == {"en": 1}
+
+
+class TestStatsAPI:
+    """Tests for stats endpoints backed by the rollup."""
+
+    def test_api_stats(self, client):
+        """Test GET /api/stats reads totals from the rollup."""
+        from spider_aggregation.storage.database import DatabaseManager
+
+        db_manager = DatabaseManager(client.application.config["DB_PATH"])
+        with db_manager.session() as session:
+            feed = FeedRepository(session).create(FeedCreate(url="https://example.com/feed"))
+            repo = EntryRepository(session)
+            _create_entry(repo, feed.id, 1, "en")
+            _create_entry(repo, feed.id, 2, "zh")
+
+        response = client.get("/api/stats")
+        data = json.loads(response.data)
+
+        assert response.status_code == 200
+        assert data["data"]["total_entries"] == 2
+        assert data["data"]["language_counts"] == {"en": 1, "zh": 1}
+
+    def test_api_reconcile(self, client):
+        """Test POST /api/system/stats/reconcile rebuilds the rollup."""
+        response = client.post("/api/system/stats/reconcile")
+        data = json.loads(response.data)
+
+        assert response.status_code == 200
+        assert data["data"] == {"buckets": 0, "drift": 0}
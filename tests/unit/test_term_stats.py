@@ -0,0 +1,110 @@
+"""Unit tests for corpus statistics and BM25 keyword scoring."""
+
+import pytest
+
+from spider_aggregation.core.keyword_extractor import KeywordExtractor
+from spider_aggregation.core.services import KeywordService
+from spider_aggregation.models import CorpusStatModel, TermStatModel
+from spider_aggregation.storage.repositories.term_stats_repo import CorpusStatsRepository
+
+# Every document shares the generic words; each has one distinctive topic
+GENERIC = "software update release version support users team feature " * 2
+TOPICS = ["kubernetes", "postgres", "rustlang", "webassembly", "graphql"]
+
+
+def _document(topic: str) -> str:
+    return f"{GENERIC} {topic} integration"
+
+
+@pytest.fixture
+def corpus(db_session):
+    """Corpus statistics repository on the test session."""
+    return CorpusStatsRepository(db_session)
+
+
+@pytest.fixture
+def extractor():
+    """English keyword extractor switching to BM25 after three documents."""
+    return KeywordExtractor(max_keywords=3, language="en", corpus_min_documents=3)
+
+
+class TestCorpusStatsRepository:
+    """Tests for CorpusStatsRepository."""
+
+    def test_counts_are_incremental(self, db_session, corpus):
+        """Test documents add to the totals and to each term's document frequency once."""
+        corpus.add_documents("en", [["alpha", "beta", "alpha"], ["beta"]])
+        corpus.add_documents("en", [["beta", "gamma"]])
+        corpus.add_documents("zh", [["人工智能"]])
+
+        totals = db_session.get(CorpusStatModel, "en")
+        assert (totals.document_count, totals.token_count) == (3, 6)
+        frequencies = {
+            row.term: row.document_count
+            for row in db_session.query(TermStatModel).filter_by(language="en")
+        }
+        assert frequencies == {"alpha": 1, "beta": 3, "gamma": 1}
+
+    def test_snapshot_reads_only_requested_terms(self, corpus):
+        """Test a snapshot carries the language totals and the requested terms."""
+        corpus.add_documents("en", [["alpha", "beta"], ["beta", "gamma"]])
+
+        snapshot = corpus.snapshot("en", ["beta", "gamma", "missing", "beta"])
+
+        assert snapshot.documents == 2
+        assert snapshot.average_length == 2.0
+        assert snapshot.document_frequencies == {"beta": 2, "gamma": 1}
+        assert corpus.snapshot("fr", ["beta"]).documents == 0
+
+
+class TestBM25Scoring:
+    """Tests for KeywordExtractor.extract_batch with corpus statistics."""
+
+    def test_corpus_idf_ranks_distinctive_terms_first(self, extractor, corpus):
+        """Test terms frequent across the corpus lose to the document's own topic."""
+        documents = [_document(topic) for topic in TOPICS]
+        assert extractor.record_documents(documents, corpus) == len(TOPICS)
+
+        keywords = extractor.extract_batch(documents, corpus=corpus)
+
+        assert [found[0] for found in keywords] == TOPICS
+        # Without corpus statistics the repeated generic words win
+        assert extractor.extract(documents[0])[0] != "kubernetes"
+
+    def test_statistics_are_read_once_per_language(self, extractor, corpus, monkeypatch):
+        """Test a batch reads one snapshot per language."""
+        extractor.record_documents([_document(topic) for topic in TOPICS], corpus)
+        snapshots = []
+        original = corpus.snapshot
+
+        def record_snapshot(language, terms):
+            snapshots.append(language)
+            return original(language, terms)
+
+        monkeypatch.setattr(corpus, "snapshot", record_snapshot)
+
+        extractor.extract_batch([_document(topic) for topic in TOPICS] + ["short"], corpus=corpus)
+
+        assert snapshots == ["en"]
+
+    def test_small_corpus_scores_per_document(self, extractor, corpus):
+        """Test languages below corpus_min_documents keep per-document scoring."""
+        documents = [_document(topic) for topic in TOPICS[:2]]
+        extractor.record_documents(documents, corpus)
+
+        assert extractor.extract_batch(documents, corpus=corpus) == [
+            extractor.extract(text) for text in documents
+        ]
+
+
+class TestKeywordServiceCorpus:
+    """Tests for the KeywordService corpus statistics methods."""
+
+    def test_record_and_extract_batch(self, db_session):
+        """Test the service counts documents and extracts with the session's statistics."""
+        service = KeywordService(max_keywords=3, language="en")
+        texts = [_document(topic) for topic in TOPICS] * 5
+
+        assert service.record_documents(texts, db_session) == len(texts)
+        assert db_session.get(CorpusStatModel, "en").document_count == len(texts)
+        assert [found[0] for found in service.extract_batch(texts[:2], db_session)] == TOPICS[:2]
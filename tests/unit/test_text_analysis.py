@@ -0,0 +1,152 @@
+"""Unit tests for the shared text analysis."""
+
+import json
+import re
+
+import pytest
+
+from spider_aggregation.config import get_config
+from spider_aggregation.core import text_analysis
+from spider_aggregation.core.parser import ContentParser
+from spider_aggregation.core.text_analysis import TextAnalysis, analyze_text
+
+
+def split_sentences_by_regex(text: str) -> list[str]:
+    """Sentence splitting as the summarizer did it before the shared analysis."""
+    parts = re.split(r"([。！？\n]+)", text)
+    result = [
+        (parts[i] + parts[i + 1]).strip()
+        for i in range(0, len(parts) - 1, 2)
+        if (parts[i] + parts[i + 1]).strip()
+    ]
+    if len(parts) % 2 == 1 and parts[-1].strip():
+        result.append(parts[-1].strip())
+    if len(result) <= 1:
+        result = [s.strip() for s in re.split(r"[.!?]+\s+", text) if s.strip()]
+    return result
+
+
+@pytest.fixture
+def empty_cache(monkeypatch):
+    """Give the test its own analysis cache."""
+    monkeypatch.setattr(text_analysis, "_cache", type(text_analysis._cache)())
+
+
+class TestTextAnalysis:
+    """Tests for TextAnalysis."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "人工智能正在改变世界。机器学习是其核心！你了解吗？",
+            "第一行\n\n第二行。  第三句",
+            "First sentence. Second one! Third?  Fourth",
+            "  Only one sentence without an end  ",
+            "Mixed 中文句子。 And an English tail. Done",
+            "",
+        ],
+    )
+    def test_sentences_match_regex_split(self, text):
+        """Test sentence splitting matches the previous regex splitting."""
+        assert TextAnalysis(text).sentences == split_sentences_by_regex(text)
+
+    def test_language(self):
+        """Test language detection from the script."""
+        assert TextAnalysis("これは日本語です").language == "ja"
+        assert TextAnalysis("这是中文内容").language == "zh"
+        assert TextAnalysis("This is English").language == "en"
+        assert TextAnalysis("12345 !!!").language is None
+
+    def test_cjk_ratio(self):
+        """Test the share of CJK characters."""
+        assert TextAnalysis("中文ab").cjk_ratio == 0.5
+        assert TextAnalysis("").cjk_ratio == 0.0
+
+    def test_reading_time(self):
+        """Test reading time is estimated from the word count."""
+        assert TextAnalysis("word " * 400).reading_time_seconds == 120
+        assert TextAnalysis("short").reading_time_seconds == text_analysis.MIN_READING_SECONDS
+        assert TextAnalysis("").reading_time_seconds == 0
+
+    def test_compact_round_trip(self):
+        """Test the compact form restores the analysis without recomputing it."""
+        text = "人工智能正在改变世界。机器学习是其核心！"
+        analysis = TextAnalysis(text)
+        compact = analysis.to_compact()
+
+        restored = TextAnalysis.from_compact(text, compact)
+
+        assert json.loads(compact)["v"] == text_analysis.COMPACT_VERSION
+        assert restored.__dict__.keys() >= {"language", "cjk_ratio", "word_count"}
+        assert restored.language == analysis.language
+        assert restored.word_count == analysis.word_count
+        assert restored.sentences == analysis.sentences
+
+    def test_from_compact_rejects_other_versions(self):
+        """Test compact forms of another version are rejected."""
+        with pytest.raises(ValueError):
+            TextAnalysis.from_compact("text", json.dumps({"v": 99}))
+
+
+class TestAnalyzeText:
+    """Tests for analyze_text."""
+
+    def test_returns_cached_analysis(self, empty_cache):
+        """Test the same text yields the same analysis object."""
+        assert analyze_text("Some text") is analyze_text("Some text")
+        assert analyze_text(None) is analyze_text("")
+
+    def test_cache_is_bounded(self, empty_cache, monkeypatch):
+        """Test the least recently used analysis is evicted."""
+        monkeypatch.setattr(text_analysis, "CACHE_SIZE", 2)
+        first = analyze_text("one")
+        analyze_text("two")
+        analyze_text("three")
+
+        assert analyze_text("one") is not first
+
+    def test_uses_compact_form(self, empty_cache):
+        """Test a stored compact form is used instead of analyzing again."""
+        text = "First. Second."
+        compact = json.dumps(
+            {"v": 1, "language": "en", "cjk_ratio": 0, "words": 2, "sentences": [0, 5]}
+        )
+
+        assert analyze_text(text, compact=compact).sentences == ["First"]
+
+    def test_ignores_invalid_compact_form(self, empty_cache):
+        """Test an unusable compact form falls back to analyzing the text."""
+        analysis = analyze_text("First. Second.", compact="not json")
+
+        assert analysis.sentences == ["First", "Second."]
+
+
+class TestParserTextAnalysis:
+    """Tests for the parser's use of the text analysis."""
+
+    RAW_ENTRY = {
+        "title": "标题",
+        "link": "https://example.com/a",
+        "content": [{"value": "人工智能正在改变世界。机器学习是其核心！"}],
+    }
+
+    def test_not_persisted_by_default(self):
+        """Test entries carry no stored analysis unless enabled."""
+        parsed = ContentParser().parse_entry(self.RAW_ENTRY)
+
+        assert parsed["reading_time_seconds"] == 10
+        assert parsed["text_analysis"] is None
+
+    def test_persisted_when_enabled(self, monkeypatch):
+        """Test the compact analysis of the content is stored when enabled."""
+        monkeypatch.setattr(get_config().ingestion, "persist_text_analysis", True)
+
+        parsed = ContentParser().parse_entry(self.RAW_ENTRY)
+
+        restored = TextAnalysis.from_compact(parsed["content"], parsed["text_analysis"])
+
+        assert restored.language == "zh"
+        assert restored.sentences == [
+            "人工智能正在改变世界。",
+            "机器学习是其核心！",
+        ]
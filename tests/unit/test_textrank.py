@@ -0,0 +1,119 @@
+"""Unit tests for TextRank summarization."""
+
+import pytest
+
+from spider_aggregation.core import summarizer as summarizer_module
+from spider_aggregation.core.summarizer import TEXTRANK_AVAILABLE, Summarizer
+
+requires_numpy = pytest.mark.skipif(not TEXTRANK_AVAILABLE, reason="numpy not installed")
+
+# Three sentences about one topic among unrelated filler sentences
+ARTICLE = " ".join(
+    [
+        "The weather report mentioned light rain over the northern hills today.",
+        "Rust compilers check memory safety at compile time for systems code.",
+        "A local bakery started selling rye bread with caraway seeds this week.",
+        "Memory safety in systems code is what the Rust compiler checks first.",
+        "The museum extended its opening hours during the summer holidays.",
+        "Compile time checks give systems code memory safety without a collector.",
+        "Several cyclists crossed the old bridge before sunrise on Sunday.",
+    ]
+)
+
+
+@requires_numpy
+class TestTextRankSummarizer:
+    """Tests for TextRankSummarizer."""
+
+    @pytest.fixture
+    def summarizer(self):
+        from spider_aggregation.core.textrank import TextRankSummarizer
+
+        return TextRankSummarizer(max_sentences=3, top_k=3)
+
+    def test_selects_central_sentences_in_order(self, summarizer):
+        """Test the mutually similar sentences are selected, in article order."""
+        result = summarizer.summarize(ARTICLE)
+
+        assert result.success
+        assert result.method == "textrank"
+        assert result.summary == (
+            "Rust compilers check memory safety at compile time for systems code "
+            "Memory safety in systems code is what the Rust compiler checks first "
+            "Compile time checks give systems code memory safety without a collector"
+        )
+
+    def test_chinese_sentences(self, summarizer):
+        """Test Chinese text is ranked by character bigrams."""
+        text = (
+            "今天的天气预报说北方山区有小雨。"
+            "机器学习模型需要大量训练数据才能取得好效果。"
+            "附近的面包店本周开始出售黑麦面包。"
+            "训练数据的质量决定了机器学习模型的效果。"
+            "博物馆在暑假期间延长了开放时间。"
+            "没有足够的训练数据，机器学习模型很难取得效果。"
+        )
+
+        result = summarizer.summarize(text)
+
+        assert result.summary.split(" ") == [
+            "机器学习模型需要大量训练数据才能取得好效果。",
+            "训练数据的质量决定了机器学习模型的效果。",
+            "没有足够的训练数据，机器学习模型很难取得效果。",
+        ]
+
+    def test_short_sentences_are_not_selected(self, summarizer):
+        """Test sentences below the minimum length are never selected."""
+        text = "Rust memory. " + ARTICLE
+
+        assert not summarizer.summarize(text).summary.startswith("Rust memory")
+
+    def test_short_texts(self, summarizer):
+        """Test short inputs fail and texts with few sentences are returned whole."""
+        assert not summarizer.summarize("Too short.").success
+        assert not summarizer.summarize(None).success
+
+        text = "First sentence of a short article is here. " * 2 + "Third one is the last."
+        result = summarizer.summarize(text)
+        assert result.success
+        assert result.summary == " ".join(summarizer._split_sentences(text))
+
+    def test_batch_matches_single_summaries(self, summarizer):
+        """Test ranking many texts together gives each text's own summary."""
+        texts = [ARTICLE, None, ARTICLE.replace("Rust", "Zig"), "Too short."]
+
+        batch = summarizer.summarize_batch(texts)
+
+        assert [r.summary for r in batch] == [summarizer.summarize(t).summary for t in texts]
+        assert [r.success for r in batch] == [True, False, True, False]
+
+    def test_graph_is_top_k(self, summarizer):
+        """Test each sentence links to at most top_k neighbours (both ways)."""
+        sentences = summarizer._split_sentences(ARTICLE * 20)
+        sources, targets, weights = summarizer._edges(sentences)
+
+        assert len(sources) <= 2 * summarizer.top_k * len(sentences)
+        assert (weights > 0).all()
+        assert (sources != targets).all()
+
+
+class TestSummarizerTextRank:
+    """Tests for the textrank method of Summarizer."""
+
+    @requires_numpy
+    def test_textrank_method(self):
+        """Test the textrank method uses TextRank for single and batch calls."""
+        summarizer = Summarizer(method="textrank")
+
+        assert summarizer.summarize(ARTICLE).method == "textrank"
+        assert [r.method for r in summarizer.summarize_batch([ARTICLE])] == ["textrank"]
+        assert summarizer.summarize(ARTICLE, method="extractive").method == "extractive"
+
+    def test_falls_back_without_numpy(self, monkeypatch):
+        """Test the textrank method falls back to extractive without NumPy."""
+        monkeypatch.setattr(summarizer_module, "TEXTRANK_AVAILABLE", False)
+
+        summarizer = Summarizer(method="textrank")
+
+        assert summarizer.method == "extractive"
+        assert summarizer.summarize_batch([ARTICLE])[0].method == "extractive"
@@ -0,0 +1,158 @@
+"""Unit tests for pipeline tracing and profiling."""
+
+import json
+import marshal
+
+import httpx
+import pytest
+
+from spider_aggregation import metrics
+from spider_aggregation.application.ingestion import IngestionPipeline
+from spider_aggregation.core.fetcher import FeedFetcher
+from spider_aggregation.models.feed import FeedCreate
+from spider_aggregation.storage.database import DatabaseManager
+from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+from spider_aggregation.tracing import (
+    PipelineProfiler,
+    Trace,
+    current_trace,
+    format_trace,
+    span,
+    start_trace,
+)
+
+RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Traced</title>
+<item><title>Alpha</title><link>https://example.com/a</link><description>First</description></item>
+<item><title>Beta</title><link>https://example.com/b</link><description>Second</description></item>
+</channel></rss>"""
+
+PIPELINE_STAGES = {"http", "feedparser", "parse", "dedup", "filter", "store", "index"}
+
+
+@pytest.fixture
+def feed_server(monkeypatch):
+    """Serve RSS from an in-process transport instead of the network."""
+    real_client = httpx.Client
+
+    def client(**kwargs):
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=RSS, headers={"ETag": '"v1"'})
+        )
+        return real_client(transport=transport, **kwargs)
+
+    monkeypatch.setattr("spider_aggregation.core.fetcher.httpx.Client", client)
+
+
+class TestTrace:
+    """Tests for Trace, spans and the active-trace context."""
+
+    def test_spans_accumulate(self):
+        """Test repeated spans add up per stage."""
+        now = [0.0]
+        trace = Trace("feed", clock=lambda: now[0])
+        for _ in range(3):
+            with trace.span("parse"):
+                now[0] += 0.5
+        with trace.span("store"):
+            now[0] += 1.0
+        now[0] += 0.25
+        trace.finish()
+
+        assert trace.to_dict() == {
+            "total_seconds": 2.75,
+            "stages": {
+                "parse": {"seconds": 1.5, "count": 3},
+                "store": {"seconds": 1.0, "count": 1},
+            },
+            "untracked_seconds": 0.25,
+        }
+        assert "parse" in format_trace(trace)
+
+    def test_active_trace(self):
+        """Test module-level spans target the active trace and are no-ops otherwise."""
+        with span("dedup"):
+            pass
+        assert current_trace() is None
+
+        stage = metrics.PIPELINE_STAGE_DURATION.labels(stage="dedup")
+        observed = stage.count
+        with start_trace("outer") as trace:
+            with span("dedup"):
+                pass
+            assert current_trace() is trace
+        assert current_trace() is None
+        assert trace.stages["dedup"].count == 1
+        assert stage.count == observed + 1
+
+
+class TestProfiler:
+    """Tests for PipelineProfiler reports."""
+
+    def test_reports(self):
+        """Test text and pstats reports describe the profiled code."""
+        profiler = PipelineProfiler()
+        with profiler:
+            sorted(range(1000), key=lambda n: -n)
+
+        text = profiler.render("text", header="Header line").decode("utf-8")
+        assert text.startswith("Header line\n")
+        assert "sorted" in text
+        assert any("sorted" in key[2] for key in marshal.loads(profiler.render("pstats")))
+        with pytest.raises(ValueError):
+            profiler.render("html")
+
+
+class TestPipelineTimings:
+    """Tests for timings recorded by the fetch pipeline."""
+
+    def test_ingest_records_every_stage(self, db_session, feed_server):
+        """Test the pipeline times each stage and stores the breakdown on the feed."""
+        feed = FeedRepository(db_session).create(FeedCreate(url="https://example.com/rss"))
+
+        result = IngestionPipeline(db_session).ingest(feed)
+
+        assert result.entries_created == 2
+        assert set(result.timings["stages"]) == PIPELINE_STAGES
+        assert result.timings["stages"]["parse"]["count"] == 2
+        assert json.loads(feed.last_fetch_timings) == result.timings
+
+    def test_scheduled_fetch_records_fetch_stages(self, db_session, feed_server):
+        """Test a bare FeedFetcher fetch traces itself."""
+        feed = FeedRepository(db_session).create(FeedCreate(url="https://example.com/rss"))
+
+        result = FeedFetcher(session=db_session).fetch_feed(feed)
+
+        assert set(result.timings["stages"]) == {"http", "feedparser"}
+        assert set(json.loads(feed.last_fetch_timings)["stages"]) == {"http", "feedparser"}
+
+    def test_fetch_endpoint(self, client, feed_server):
+        """Test the manual fetch returns timings and the feed keeps them."""
+        with DatabaseManager(client.application.config["DB_PATH"]).session() as session:
+            feed_id = FeedRepository(session).create(FeedCreate(url="https://example.com/rss")).id
+
+        data = client.post(f"/api/feeds/{feed_id}/fetch").get_json()["data"]
+
+        assert data["entries_created"] == 2
+        assert set(data["timings"]["stages"]) == PIPELINE_STAGES
+        assert data["feed"]["last_fetch_timings"] == data["timings"]
+
+    def test_fetch_endpoint_profile(self, client, feed_server):
+        """Test profiling returns the report as a download."""
+        with DatabaseManager(client.application.config["DB_PATH"]).session() as session:
+            feed_id = FeedRepository(session).create(FeedCreate(url="https://example.com/rss")).id
+
+        response = client.post(f"/api/feeds/{feed_id}/fetch?profile=text")
+        assert response.status_code == 200
+        assert response.headers["Content-Disposition"] == (
+            f"attachment; filename=profile-feed-{feed_id}.txt"
+        )
+        text = response.get_data(as_text=True)
+        assert "Pipeline trace" in text
+        assert "ingestion.py" in text
+
+        response = client.post(f"/api/feeds/{feed_id}/fetch?profile=pstats")
+        assert marshal.loads(response.data)
+
+        assert client.post(f"/api/feeds/{feed_id}/fetch?profile=html").status_code == 400
+        assert client.post("/api/feeds/999/fetch?profile=text").status_code == 404